@@ -2,6 +2,7 @@ import os
 
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_process_init
 
 # os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings._base')
 
@@ -13,6 +14,7 @@ else:
 app = Celery("config")
 app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks()
+app.autodiscover_tasks(["repo.records.posts", "repo.interactions.report"])  # 앱 하위 패키지의 tasks 모듈
 
 app.conf.beat_schedule = {
     "cache-top-posts": {  # 매주 월요일 00:00 인기 게시글 캐시 업데이트
@@ -23,4 +25,20 @@ app.conf.beat_schedule = {
         "task": "repo.beans.tasks.cache_top_beans",
         "schedule": crontab(hour=0, minute=0),
     },
+    "purge-tombstones-daily": {  # 매일 04:00 보관 기간이 지난 변경 피드 삭제 기록 정리
+        "task": "repo.records.tasks.purge_tombstones",
+        "schedule": crontab(hour=4, minute=0),
+    },
+    "collect-orphan-photos-daily": {  # 매일 04:30 게시글, 시음기록에 연결되지 않은 사진과 파일 정리
+        "task": "repo.records.tasks.collect_orphan_photos",
+        "schedule": crontab(hour=4, minute=30),
+    },
 }
+
+
+@worker_process_init.connect
+def reset_worker_process_clients(**kwargs):
+    """prefork 워커 프로세스 시작 시 부모에서 복사된 클라이언트 초기화 (DB 연결은 celery Django fixup이 처리)"""
+    from repo.common.prefork import reset_clients
+
+    reset_clients()
@@ -0,0 +1,103 @@
+"""
+gunicorn 운영 설정 (gunicorn -c python:config.gunicorn config.wsgi.prod:application)
+- 워커/스레드 수는 컨테이너에 할당된 CPU, 메모리(cgroup 제한 우선)로 계산하고 GUNICORN_* 환경변수로 덮어쓸 수 있음
+- preload_app: 추천 모델 등 앱을 마스터에서 한 번만 로드하고 워커는 copy-on-write로 공유
+  fork 직전 마스터의 DB 연결을 닫고, fork 이후 워커에서 DB 풀, Redis, FCM, S3, StatsD 클라이언트를 새로 만듦
+- max_requests + jitter: 워커를 주기적으로 재시작해 메모리 누수를 막고, 워커들이 동시에 재시작하지 않도록 분산
+"""
+
+import math
+import os
+
+WORKER_MEMORY_MB = int(os.environ.get("GUNICORN_WORKER_MEMORY_MB", 400))  # 워커 1개 예상 메모리 (preload 공유분 제외)
+MEMORY_RESERVED_MB = int(os.environ.get("GUNICORN_MEMORY_RESERVED_MB", 512))  # 마스터(preload), celery 등 몫으로 남길 메모리
+CONCURRENCY_PER_CPU = 4  # DB, Redis, S3 대기가 많은 I/O 위주 API라 CPU당 동시 처리 요청 수를 코어 수보다 크게 설정
+MAX_THREADS = 8
+
+
+def read_cgroup_file(path: str) -> str | None:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def get_cpu_count() -> int:
+    """사용 가능한 CPU 수 (cgroup v2 cpu.max, v1 cfs quota 제한 우선)"""
+    cpu_count = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+
+    quota, period = None, None
+    cpu_max = read_cgroup_file("/sys/fs/cgroup/cpu.max")
+    if cpu_max:
+        quota, period = cpu_max.split()
+    else:
+        quota, period = read_cgroup_file("/sys/fs/cgroup/cpu/cpu.cfs_quota_us"), read_cgroup_file("/sys/fs/cgroup/cpu/cpu.cfs_period_us")
+    if quota and period and quota not in ("max", "-1"):
+        cpu_count = min(cpu_count, math.ceil(int(quota) / int(period)))
+    return max(1, cpu_count)
+
+
+def get_memory_mb() -> int:
+    """사용 가능한 메모리 MB (cgroup v2 memory.max, v1 limit_in_bytes 제한 우선)"""
+    memory = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    limit = read_cgroup_file("/sys/fs/cgroup/memory.max") or read_cgroup_file("/sys/fs/cgroup/memory/memory.limit_in_bytes")
+    if limit and limit != "max":
+        memory = min(memory, int(limit))  # v1 제한이 없으면 매우 큰 값이므로 min으로 처리
+    return memory // (1024 * 1024)
+
+
+def compute_workers(cpu_count: int, memory_mb: int) -> int:
+    """
+    워커 프로세스 수: CPU 기준 (2 * CPU + 1)과 메모리 기준 중 작은 값
+    """
+    by_memory = (memory_mb - MEMORY_RESERVED_MB) // WORKER_MEMORY_MB
+    return max(1, min(2 * cpu_count + 1, by_memory))
+
+
+def compute_threads(cpu_count: int, workers: int) -> int:
+    """
+    워커당 스레드 수: CPU당 목표 동시 처리 수를 워커에 나눠 배정 (2 ~ MAX_THREADS)
+    - 메모리가 부족해 워커 수가 줄면 스레드로 동시 처리 수를 보충
+    """
+    return max(2, min(MAX_THREADS, math.ceil(cpu_count * CONCURRENCY_PER_CPU / workers)))
+
+
+cpu_count = get_cpu_count()
+workers = int(os.environ.get("GUNICORN_WORKERS", 0)) or compute_workers(cpu_count, get_memory_mb())
+threads = int(os.environ.get("GUNICORN_THREADS", 0)) or compute_threads(cpu_count, workers)
+worker_class = "gthread"
+
+# 커넥션 풀 사용 시 워커당 스레드 수만큼 연결이 필요 (settings 로드 전에 기본값 지정)
+os.environ.setdefault("DB_POOL_MAX_SIZE", str(threads))
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+preload_app = os.environ.get("GUNICORN_PRELOAD", "true").lower() == "true"
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", 2000))
+max_requests_jitter = int(os.environ.get("GUNICORN_MAX_REQUESTS_JITTER", max_requests // 10))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 30))
+graceful_timeout = 30
+keepalive = 5  # nginx upstream keepalive 연결 유지
+worker_tmp_dir = "/dev/shm"  # 컨테이너 overlay 파일 시스템에서 heartbeat 파일 쓰기 지연 방지
+accesslog = "-"
+errorlog = "-"
+
+
+def on_starting(server):
+    server.log.info(f"gunicorn workers={workers} threads={threads} cpu={cpu_count} preload={preload_app}")
+
+
+def pre_fork(server, worker):
+    """fork 직전 마스터가 앱 로드 중 연 DB 연결 종료 (자식과 소켓을 공유하지 않도록)"""
+    if server.cfg.preload_app:
+        from repo.common.prefork import close_connections
+
+        close_connections()
+
+
+def post_fork(server, worker):
+    """fork 이후 워커에서 마스터로부터 복사된 클라이언트를 버리고 새로 생성하도록 초기화"""
+    if server.cfg.preload_app:
+        from repo.common.prefork import reset_clients
+
+        reset_clients()
@@ -62,6 +62,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "repo.common.middleware.compression.CompressionMiddleware",  # 응답 본문을 다루는 다른 미들웨어보다 앞에 위치
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -70,6 +71,8 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "allauth.account.middleware.AccountMiddleware",  # allauth
     "repo.common.middleware.performance.PerformanceMiddleware",
+    "repo.common.middleware.replica.PrimaryStickyMiddleware",
+    "repo.common.middleware.request_time.RequestTimeMiddleware",
 ]
 
 # jwt 권한 인증 관련
@@ -80,8 +83,44 @@ REST_FRAMEWORK = {
     "EXCEPTION_HANDLER": "repo.common.exception.handler.custom_exception_handler",
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 12,
+    "DEFAULT_RENDERER_CLASSES": (
+        "repo.common.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "repo.common.parsers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
 }
 
+# 응답 압축 (repo.common.middleware.compression)
+COMPRESSION_MIN_LENGTH = 1024
+BROTLI_QUALITY = 5
+
+# 요청 지표 수집 (repo.common.instrumentation)
+METRICS_SAMPLE_RATE = env.float("METRICS_SAMPLE_RATE", 0.1)
+METRICS_STATSD_HOST = env.str("METRICS_STATSD_HOST", None)
+METRICS_STATSD_PORT = env.int("METRICS_STATSD_PORT", 8125)
+SERVER_TIMING_ENABLED = env.bool("SERVER_TIMING_ENABLED", False)
+
+# DB 연결 관리 (repo.common.db_pool)
+DB_POOL_ENABLED = env.bool("DB_POOL_ENABLED", False)  # 프로세스 단위 커넥션 풀 사용 (요청마다 풀에서 꺼내고 반납)
+DB_POOL_MAX_SIZE = env.int("DB_POOL_MAX_SIZE", 10)
+DB_POOL_TIMEOUT = env.float("DB_POOL_TIMEOUT", 5)
+DB_POOL_RECYCLE = env.int("DB_POOL_RECYCLE", 1800)
+DB_CONN_MAX_AGE = 0 if DB_POOL_ENABLED else env.int("DB_CONN_MAX_AGE", 60)  # 영구 연결 유지 시간(초), 풀 사용 시 0
+MYSQL_CONNECTION_SETTINGS = {
+    "ENGINE": "repo.common.backends.mysql_pool" if DB_POOL_ENABLED else "django.db.backends.mysql",
+    "CONN_MAX_AGE": DB_CONN_MAX_AGE,
+    "CONN_HEALTH_CHECKS": True,  # 재사용하는 연결은 요청 첫 쿼리 전에 끊김 여부 확인
+}
+
+# 읽기 복제본 DB 라우팅 (repo.common.db_router)
+DATABASE_ROUTERS = ["repo.common.db_router.PrimaryReplicaRouter"]
+REPLICA_DATABASES = []  # 환경별 설정에서 복제본 alias 추가
+REPLICA_STICKY_SECONDS = env.int("REPLICA_STICKY_SECONDS", 10)
+
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
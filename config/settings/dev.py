@@ -3,6 +3,7 @@ import pymysql
 from ._base import *
 
 DEBUG = True
+SERVER_TIMING_ENABLED = True
 ALLOWED_HOSTS = ["*"]
 WSGI_APPLICATION = "config.wsgi.dev.application"
 INSTALLED_APPS += ["debug_toolbar"]
@@ -13,7 +14,7 @@ INTERNAL_IPS = ["127.0.0.1"]  # django debug toolbar 사용 시 필요
 pymysql.install_as_MySQLdb()
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.mysql",
+        **MYSQL_CONNECTION_SETTINGS,
         "NAME": env.str("LOCAL_MYSQL_DATABASE"),
         "USER": env.str("LOCAL_MYSQL_USER"),
         "PASSWORD": env.str("LOCAL_MYSQL_PASSWORD"),
@@ -21,6 +22,14 @@ DATABASES = {
         "PORT": env.int("LOCAL_MYSQL_PORT", 3306),
     }
 }
+# 로컬 복제본 (미설정 시 같은 DB를 가리켜 라우팅만 확인, 테스트에서는 default를 그대로 사용)
+DATABASES["replica"] = {
+    **DATABASES["default"],
+    "HOST": env.str("LOCAL_MYSQL_REPLICA_HOST", DATABASES["default"]["HOST"]),
+    "PORT": env.int("LOCAL_MYSQL_REPLICA_PORT", DATABASES["default"]["PORT"]),
+    "TEST": {"MIRROR": "default"},
+}
+REPLICA_DATABASES = ["replica"]
 
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 MEDIA_URL = "/media/"
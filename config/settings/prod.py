@@ -23,7 +23,7 @@ X_FRAME_OPTIONS = "DENY"
 pymysql.install_as_MySQLdb()
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.mysql",
+        **MYSQL_CONNECTION_SETTINGS,
         "NAME": env.str("PROD_MYSQL_DATABASE"),
         "USER": env.str("PROD_MYSQL_USER"),
         "PASSWORD": env.str("PROD_MYSQL_PASSWORD"),
@@ -31,6 +31,10 @@ DATABASES = {
         "PORT": env.int("PROD_MYSQL_PORT"),
     }
 }
+# 읽기 복제본 (PROD_MYSQL_REPLICA_HOSTS=host1,host2 형식, 미설정 시 primary만 사용)
+for i, replica_host in enumerate(env.list("PROD_MYSQL_REPLICA_HOSTS", default=[])):
+    DATABASES[f"replica_{i}"] = {**DATABASES["default"], "HOST": replica_host}
+REPLICA_DATABASES = [alias for alias in DATABASES if alias.startswith("replica_")]
 
 # AWS
 AWS_STORAGE_BUCKET_NAME = env.str("AWS_STORAGE_BUCKET_NAME", default="")
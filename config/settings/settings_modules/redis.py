@@ -9,8 +9,10 @@ CACHES = {
         "BACKEND": "django_redis.cache.RedisCache",
         "LOCATION": f"redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}",
         "OPTIONS": {
-            "CLIENT_CLASS": "django_redis.client.DefaultClient",
-            "SERIALIZER": "django_redis.serializers.json.JSONSerializer",
+            "CLIENT_CLASS": "repo.common.instrumentation.InstrumentedRedisClient",  # 캐시 hit/miss, Redis 시간 요청 지표 기록
+            "SERIALIZER": "repo.common.cache_serializers.FastJSONSerializer",
+            # 압축 전 저장된 값은 해제 실패 시 원본 그대로 사용하므로 기존 캐시와 호환
+            "COMPRESSOR": "django_redis.compressors.zlib.ZlibCompressor",
         },
     }
 }
@@ -23,3 +25,10 @@ CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = "Asia/Seoul"
 CELERY_ENABLE_UTC = False
+
+# 큐별로 워커를 나눠 동시 처리 수, prefetch 설정 (docker/supervisord.celery.conf)
+CELERY_TASK_DEFAULT_QUEUE = "default"
+CELERY_TASK_ROUTES = {
+    "repo.notifications.tasks.*": {"queue": "notifications"},  # FCM 호출 대기 위주, 짧은 작업
+    "repo.interactions.report.tasks.*": {"queue": "reports"},  # 오래 걸리는 보고서 생성
+}
@@ -0,0 +1,390 @@
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator
+from uuid import uuid4
+
+from django.core.files.storage import Storage, default_storage
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from faker import Faker
+
+from repo.admins.keys import (
+    BEAN_TYPE,
+    BEV_TYPE,
+    bean_info_keys,
+    bean_taste_keys,
+    bean_taste_review_keys,
+    is_official_keys,
+)
+from repo.admins.utils import (
+    build_user_detail,
+    create_memory_file,
+    generate_unique_emails,
+    index_profile_photos,
+    index_review_photos,
+)
+from repo.beans.models import Bean, BeanTaste, BeanTasteReview
+from repo.common.bucket import create_unique_filename
+from repo.common.image_pipeline import PhotoUploadPipeline
+from repo.common.querysets import bulk_create_with_pk
+from repo.profiles.models import CustomUser, UserDetail
+from repo.records.models import Photo, Post, TastedRecord
+
+logger = logging.getLogger(__name__)
+
+POST_SUBJECT_CHOICES = {v: k for k, v in Post.SUBJECT_TYPE_CHOICES}
+STAT_LABELS = {
+    "users": "명의 작성자",
+    "beans": "개의 원두",
+    "tasted_records": "개의 시음기록",
+    "posts": "개의 게시글",
+    "photos": "개의 사진",
+}
+
+
+class ImportProgress:
+    """
+    일괄 등록 진행 상황 (재시작 시 마지막으로 커밋된 청크 다음 행부터 이어서 처리)
+    - 청크 트랜잭션 커밋 후에만 저장하므로 중단되어도 같은 행이 두 번 등록되지 않음
+    """
+
+    def __init__(self, path: str | None, source: str):
+        self.path = path
+        self.source = source
+        self.next_row = 0
+        self.failed_rows = []
+
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("source") == source:  # 다른 파일의 진행 상황은 무시
+                self.next_row = data["next_row"]
+                self.failed_rows = data["failed_rows"]
+
+    def save(self, next_row: int, failed_rows: list[int] = ()) -> None:
+        self.next_row = next_row
+        self.failed_rows.extend(failed_rows)
+        if not self.path:
+            return
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"source": self.source, "next_row": self.next_row, "failed_rows": self.failed_rows}, f)
+
+
+class BulkImporter:
+    """
+    관리자 CSV 일괄 등록
+    - 작성자, 원두는 청크 단위 집합 쿼리(IN)로 조회 후 없는 것만 bulk_create
+    - 원두 리뷰, 시음기록, 사진은 청크 단위 트랜잭션에서 bulk_create
+    - 사진은 워커 풀에서 동시 업로드 (DB 저장 전에 업로드, 실패한 행은 건너뛰고 failed_rows에 기록)
+    - dry_run이면 조회만 하고 생성, 업로드 수만 집계
+    """
+
+    def __init__(
+        self,
+        progress: ImportProgress,
+        chunk_size: int = 500,
+        workers: int = 8,
+        dry_run: bool = False,
+        faker: Faker = None,
+        log: Callable[[str], None] = None,
+        storage: Storage = None,
+    ):
+        self.progress = progress
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self.dry_run = dry_run
+        self.faker = faker or Faker(locale="ko_KR")
+        self.log = log or logger.info
+        self.stats = {"users": 0, "beans": 0, "tasted_records": 0, "posts": 0, "photos": 0, "failed": 0}
+        self.storage = storage or default_storage
+        self.photo_pipeline = PhotoUploadPipeline(storage=self.storage)
+
+    # 청크 처리
+
+    def iter_chunks(self, rows: list[dict]) -> Iterator[tuple[int, list[dict]]]:
+        """진행 상황 이후 행부터 (시작 행 index, 청크) 반환"""
+        if self.progress.next_row:
+            self.log(f"{self.progress.next_row}행까지 처리된 진행 상황에서 이어서 등록합니다.")
+        for start in range(self.progress.next_row, len(rows), self.chunk_size):
+            yield start, rows[start : start + self.chunk_size]
+
+    def commit_chunk(self, start: int, chunk: list[dict], failed_rows: list[int]) -> None:
+        self.stats["failed"] += len(failed_rows)
+        if not self.dry_run:
+            self.progress.save(start + len(chunk), failed_rows)
+        self.log(f"{start + len(chunk)}행 처리 완료")
+
+    # 작성자
+
+    def ensure_users(self, nicknames: set[str], profile_photos_dir_path: str = None) -> dict[str, int]:
+        """
+        닉네임별 사용자 id 반환 (없는 사용자는 프로필 사진 업로드 후 일괄 생성)
+        Returns:
+            dict[str, int]: {닉네임: 사용자 id} (dry_run이면 기존 사용자만)
+        """
+        user_ids = dict(CustomUser.objects.filter(nickname__in=nicknames).values_list("nickname", "id"))
+        missing = sorted(nicknames - user_ids.keys())
+        self.stats["users"] += len(missing)
+        if not missing or self.dry_run:
+            return user_ids
+
+        profile_images = self.upload_profile_photos(index_profile_photos(profile_photos_dir_path, set(missing)))
+        emails = generate_unique_emails(self.faker, len(missing))
+        users = [
+            CustomUser(
+                nickname=nickname,
+                gender=self.faker.random_element(elements=["남", "여"]),
+                birth=self.faker.random_int(min=1970, max=2010),
+                email=email,
+                login_type=self.faker.random_element(elements=["naver", "kakao", "apple"]),
+                profile_image=profile_images.get(nickname),
+            )
+            for nickname, email in zip(missing, emails)
+        ]
+
+        with transaction.atomic():
+            CustomUser.objects.bulk_create(users, batch_size=self.chunk_size)
+            created = dict(CustomUser.objects.filter(nickname__in=missing).values_list("nickname", "id"))
+            UserDetail.objects.bulk_create(
+                [build_user_detail(user_id, self.faker) for user_id in created.values()], batch_size=self.chunk_size
+            )
+
+        self.log(f"작성자 {len(created)}명 생성")
+        return user_ids | created
+
+    def upload_profile_photos(self, photo_paths: dict[str, str]) -> dict[str, str]:
+        """프로필 사진 동시 업로드 (실패한 사진은 프로필 사진 없이 생성)"""
+        field = CustomUser._meta.get_field("profile_image")
+
+        def upload(photo_path: str) -> str:
+            name = field.generate_filename(None, create_unique_filename(os.path.basename(photo_path), is_main=True))
+            return self.storage.save(name, create_memory_file(photo_path, os.path.basename(photo_path)))
+
+        return {nickname: name for nickname, name in self.run_concurrently(upload, photo_paths).items() if name}
+
+    # 원두
+
+    def resolve_beans(self, beans_data: list[dict]) -> list[int | None]:
+        """
+        원두 데이터별 원두 id 반환 (식별값 기준, 없는 원두는 일괄 생성)
+        Returns:
+            list[int | None]: beans_data 순서의 원두 id (dry_run이면 새 원두는 None)
+        """
+        fingerprints = [Bean.make_fingerprint(bean_data) for bean_data in beans_data]
+        unique_fingerprints = set(fingerprints)
+        bean_ids = dict(Bean.objects.filter(fingerprint__in=unique_fingerprints).values_list("fingerprint", "id"))
+
+        # 식별값이 없는 기존 원두는 원두명으로 후보를 조회해 식별값 계산
+        names = {bean_data["name"] for bean_data, fingerprint in zip(beans_data, fingerprints) if fingerprint not in bean_ids}
+        if names:
+            for bean in Bean.objects.filter(fingerprint__isnull=True, name__in=names).only("id", *Bean.FINGERPRINT_FIELDS):
+                fingerprint = Bean.make_fingerprint({field: getattr(bean, field) for field in Bean.FINGERPRINT_FIELDS})
+                if fingerprint in unique_fingerprints:
+                    bean_ids.setdefault(fingerprint, bean.id)
+
+        missing = {}
+        for bean_data, fingerprint in zip(beans_data, fingerprints):
+            if fingerprint not in bean_ids:
+                missing.setdefault(fingerprint, bean_data)
+        self.stats["beans"] += len(missing)
+
+        if missing and not self.dry_run:
+            new_beans = [Bean(fingerprint=fingerprint, **bean_data) for fingerprint, bean_data in missing.items()]
+            Bean.objects.bulk_create(new_beans, batch_size=self.chunk_size, ignore_conflicts=True)  # 동시에 생성된 원두는 무시 후 재조회
+            bean_ids |= dict(Bean.objects.filter(fingerprint__in=missing.keys()).values_list("fingerprint", "id"))
+
+        return [bean_ids.get(fingerprint) for fingerprint in fingerprints]
+
+    # 사진
+
+    def run_concurrently(self, func: Callable, items: dict) -> dict:
+        """
+        워커 풀에서 동시 실행
+        Returns:
+            dict: {key: 결과} (실패한 항목은 None)
+        """
+        results = {}
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="admin-import") as executor:
+            futures = {key: executor.submit(func, value) for key, value in items.items()}
+            for key, future in futures.items():
+                try:
+                    results[key] = future.result()
+                except Exception as e:
+                    logger.error(f"업로드 실패: {key} - {str(e)}")
+                    results[key] = None
+        return results
+
+    def upload_review_photos(self, photo_paths: dict[int, list[str]]) -> dict[int, list[dict[str, str]] | None]:
+        """시음기록 행별 사진 동시 업로드 (원본, 썸네일, 중간 크기)"""
+        if self.dry_run:
+            return photo_paths
+
+        def upload(paths: list[str]) -> list[dict[str, str]]:
+            return self.photo_pipeline.store([create_memory_file(path, os.path.basename(path)) for path in paths])
+
+        return self.run_concurrently(upload, photo_paths)
+
+    # 등록
+
+    def import_tasted_records(self, rows: list[dict], photos_dir_path: str, profile_photos_dir_path: str = None) -> dict:
+        """
+        시음기록 일괄 등록 (원두 + 원두 리뷰 + 시음기록 + 사진)
+        - 사진 파일명: review_{행 번호(1부터)}_{사진 순서}.jpg, 사진이 없거나 업로드에 실패한 행은 등록하지 않음
+        """
+        photo_index = index_review_photos(photos_dir_path)
+        user_ids = self.ensure_users({row["작성자"] for row in rows}, profile_photos_dir_path)
+
+        for start, chunk in self.iter_chunks(rows):
+            row_numbers = range(start + 1, start + len(chunk) + 1)
+            uploaded = self.upload_review_photos({idx: photo_index[idx] for idx in row_numbers if idx in photo_index})
+            valid_rows = [(idx, row) for idx, row in zip(row_numbers, chunk) if uploaded.get(idx)]
+            failed_rows = [idx for idx in row_numbers if not uploaded.get(idx)]
+
+            bean_ids = self.resolve_beans([self.build_bean_data(row) for _, row in valid_rows])
+            self.stats["tasted_records"] += len(valid_rows)
+            self.stats["photos"] += sum(len(uploaded[idx]) for idx, _ in valid_rows)
+
+            if not self.dry_run:
+                try:
+                    self.create_tasted_records(valid_rows, bean_ids, user_ids, uploaded)
+                except Exception:
+                    # 등록하지 못한 청크의 사진 정리 후 중단 (진행 상황은 이전 청크까지 저장됨)
+                    self.photo_pipeline.delete_files(
+                        [name for names in uploaded.values() if names for photo in names for name in photo.values()]
+                    )
+                    raise
+            self.commit_chunk(start, chunk, failed_rows)
+
+        return self.stats
+
+    @transaction.atomic
+    def create_tasted_records(self, valid_rows: list[tuple[int, dict]], bean_ids: list[int], user_ids: dict, uploaded: dict) -> None:
+        reviews = [
+            BeanTasteReview(**{key: row[value] for value, key in bean_taste_review_keys.items()}, batch_key=uuid4().hex)
+            for _, row in valid_rows
+        ]
+        bulk_create_with_pk(BeanTasteReview, reviews, key_field="batch_key", batch_size=self.chunk_size)
+
+        tasted_records = [
+            TastedRecord(
+                author_id=user_ids[row["작성자"]],
+                bean_id=bean_id,
+                taste_review=review,
+                star=review.star,  # bulk_create는 save()를 거치지 않으므로 별점 복사본 직접 설정
+                content=row["시음 내용"],
+                tag=row["태그"],
+                is_private=False,
+            )
+            for (_, row), bean_id, review in zip(valid_rows, bean_ids, reviews)
+        ]
+        # 맛&평가는 시음기록마다 하나이므로 사진 연결에 필요한 시음기록 id를 taste_review_id로 다시 조회
+        bulk_create_with_pk(TastedRecord, tasted_records, key_field="taste_review_id", batch_size=self.chunk_size)
+
+        photos = [
+            Photo(tasted_record_id=tasted_record.id, **names)
+            for (idx, _), tasted_record in zip(valid_rows, tasted_records)
+            for names in uploaded[idx]
+        ]
+        Photo.objects.bulk_create(photos, batch_size=self.chunk_size)
+
+    def import_posts(self, rows: list[dict], profile_photos_dir_path: str = None) -> dict:
+        """게시글 일괄 등록"""
+        user_ids = self.ensure_users({row["작성자"] for row in rows}, profile_photos_dir_path)
+
+        for start, chunk in self.iter_chunks(rows):
+            self.stats["posts"] += len(chunk)
+            if not self.dry_run:
+                posts = [
+                    Post(
+                        author_id=user_ids[row["작성자"]],
+                        subject=POST_SUBJECT_CHOICES[row["주제"]],
+                        title=row["제목"],
+                        content=row["내용"],
+                        tag=row["태그"],
+                    )
+                    for row in chunk
+                ]
+                with transaction.atomic():
+                    Post.objects.bulk_create(posts, batch_size=self.chunk_size)
+            self.commit_chunk(start, chunk, [])
+
+        return self.stats
+
+    def import_official_beans(self, rows: list[dict]) -> dict:
+        """공식 원두 일괄 등록 (원두 + 기본 맛, 이미 있는 원두는 건너뜀)"""
+        for start, chunk in self.iter_chunks(rows):
+            beans_data = []
+            for row in chunk:
+                bean_data = {key: row[value] for value, key in is_official_keys.items() if row.get(value) is not None}
+                bean_data["bean_type"] = BEAN_TYPE[bean_data["bean_type"]]
+                bean_data["is_official"] = True
+                beans_data.append(bean_data)
+
+            with transaction.atomic():
+                bean_ids = self.resolve_beans(beans_data)
+                if not self.dry_run:
+                    bean_tastes = [
+                        BeanTaste(bean_id=bean_id, **{key: row[value] or None for value, key in bean_taste_keys.items()})
+                        for row, bean_id in zip(chunk, bean_ids)
+                    ]
+                    BeanTaste.objects.bulk_create(
+                        bean_tastes, batch_size=self.chunk_size, ignore_conflicts=True
+                    )  # 기본 맛이 있는 원두는 건너뜀
+            self.commit_chunk(start, chunk, [])
+
+        return self.stats
+
+    @staticmethod
+    def build_bean_data(row: dict) -> dict:
+        bean_data = {key: row[value] for value, key in bean_info_keys.items()}
+        bean_data["bean_type"] = BEAN_TYPE[bean_data["bean_type"]]
+        bean_data["bev_type"] = BEV_TYPE.get(bean_data["bev_type"])
+        return bean_data
+
+
+def add_import_arguments(parser, file_path: str, profile_photos_dir_path: str = "") -> None:
+    """CSV 일괄 등록 커맨드 공통 옵션"""
+    parser.add_argument(
+        "--file",
+        default=file_path,
+        help="등록할 CSV 파일 경로",
+    )
+    parser.add_argument(
+        "--profile-photos-dir",
+        default=profile_photos_dir_path,
+        help="새 작성자 프로필 사진 디렉토리 (파일명에 닉네임 포함)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        default=500,
+        type=int,
+        help="청크(트랜잭션) 단위 행 수",
+    )
+    parser.add_argument(
+        "--workers",
+        default=8,
+        type=int,
+        help="사진 동시 업로드 워커 수",
+    )
+    parser.add_argument(
+        "--progress-file",
+        help="진행 상황 저장 파일 (중단 후 재실행 시 이어서 등록)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="생성, 업로드 없이 등록될 데이터 수만 확인",
+    )
+
+
+def write_import_result(command: BaseCommand, stats: dict, dry_run: bool, progress: ImportProgress) -> None:
+    prefix = "[dry-run] 생성 예정: " if dry_run else ""
+    for key, label in STAT_LABELS.items():
+        if stats[key]:
+            command.stdout.write(command.style.SUCCESS(f"{prefix}{stats[key]}{label} 생성 성공."))
+    if stats["failed"]:
+        command.stdout.write(
+            command.style.WARNING(f"{stats['failed']}개 행 등록 실패 (사진 없음 또는 업로드 실패): {progress.failed_rows}")
+        )
@@ -49,3 +49,7 @@ bean_taste_keys = {
     "쓴맛": "bitterness",
     "단맛": "sweetness",
 }
+
+# CSV 값 -> 모델 값
+BEAN_TYPE = {"싱글 오리진": "single", "블렌드": "blend"}
+BEV_TYPE = {"콜드": True, "핫": False}
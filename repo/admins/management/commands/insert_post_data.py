@@ -1,57 +1,31 @@
-from datetime import datetime
-
-import pandas as pd
 from django.core.management.base import BaseCommand
-from faker import Faker
 
-from repo.admins.utils import (
-    create_user_and_user_detail,
-    pre_process_create_user,
+from repo.admins.importer import (
+    BulkImporter,
+    ImportProgress,
+    add_import_arguments,
+    write_import_result,
 )
-from repo.profiles.models import CustomUser
-from repo.records.models import Post
+from repo.admins.utils import read_csv_rows
 
-DATETIME_NOW = datetime.now()
 FILE_PATH = ""  # 게시글 데이터 파일 경로
 PROFILE_PHOTOS_DIR_PATH = ""  # 프로필 사진 데이터 파일 경로
-POST_SUBJECT_CHOICES = {v: k for k, v in Post.SUBJECT_TYPE_CHOICES}
 
 
 class Command(BaseCommand):
     help = "게시글 더미 데이터를 생성"
 
-    def handle(self, *args, **kwargs):
-        faker = Faker(locale="ko_KR")
-
-        # 1. 작성자 생성 (없으면 미리 생성)
-        create_user_cnt = pre_process_create_user(FILE_PATH, faker, PROFILE_PHOTOS_DIR_PATH)
-
-        # 2. 게시글 생성
-        post_cnt = create_post(FILE_PATH, faker)
-
-        self.stdout.write(self.style.SUCCESS(f"{create_user_cnt}명의 작성자 생성 성공."))
-        self.stdout.write(self.style.SUCCESS(f"{post_cnt}개의 게시글 생성 성공."))
+    def add_arguments(self, parser):
+        add_import_arguments(parser, FILE_PATH, PROFILE_PHOTOS_DIR_PATH)
 
-
-def create_post(file_path: str, faker: Faker) -> int:
-    df = pd.read_csv(file_path)
-
-    posts = []
-    for _, row in df.iterrows():
-        try:
-            author = CustomUser.objects.get(nickname=row["작성자"])
-        except CustomUser.DoesNotExist:
-            author = create_user_and_user_detail(row["작성자"], faker, PROFILE_PHOTOS_DIR_PATH)
-
-        posts.append(
-            Post(
-                author=author,
-                subject=POST_SUBJECT_CHOICES[row["주제"]],
-                title=row["제목"],
-                content=row["내용"],
-                tag=row["태그"],
-            )
+    def handle(self, *args, **kwargs):
+        rows = read_csv_rows(kwargs["file"])
+        importer = BulkImporter(
+            ImportProgress(kwargs["progress_file"], kwargs["file"]),
+            chunk_size=kwargs["chunk_size"],
+            workers=kwargs["workers"],
+            dry_run=kwargs["dry_run"],
+            log=self.stdout.write,
         )
-
-    Post.objects.bulk_create(posts)
-    return len(posts)
+        stats = importer.import_posts(rows, kwargs["profile_photos_dir"])
+        write_import_result(self, stats, kwargs["dry_run"], importer.progress)
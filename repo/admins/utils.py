@@ -1,51 +1,40 @@
 import mimetypes
 import os
+import re
+from collections import defaultdict
 from io import BytesIO
 
 import pandas as pd
 from django.core.files.uploadedfile import InMemoryUploadedFile
 from faker import Faker
 
-from repo.common.bucket import create_unique_filename
 from repo.profiles.models import CustomUser, UserDetail
-from repo.records.models import Photo, TastedRecord
 
+_re_review_photo = re.compile(r"^review_(\d+)_(\d+)\.\w+$")  # review_{행 번호}_{사진 순서}.jpg
 
-def pre_process_create_user(file_path: str, faker: Faker, profile_photos_dir_path: str) -> int:
-    # 엑셀 파일 읽기
-    df = pd.read_csv(file_path)
-
-    # 작성자 컬럼만 추출
-    nicknames = df["작성자"].tolist()
-
-    # 작성자 컬럼에서 중복 제거
-    nicknames = list(set(nicknames))
-
-    create_user_cnt = 0
-    for nickname in nicknames:
-        try:
-            CustomUser.objects.get(nickname=nickname)
-        except CustomUser.DoesNotExist:
-            create_user_and_user_detail(nickname, faker, profile_photos_dir_path)
-            create_user_cnt += 1
-
-    return create_user_cnt
 
+def read_csv_rows(file_path: str) -> list[dict]:
+    """CSV 파일을 행 목록으로 읽기 (빈 값은 NaN 대신 None)"""
+    df = pd.read_csv(file_path)
+    return df.astype(object).where(df.notna(), None).to_dict("records")
 
-def create_user_and_user_detail(nickname: str, faker: Faker, profile_photos_dir_path: str) -> None:
 
-    user = CustomUser.objects.create(
-        nickname=nickname,
-        gender=faker.random_element(elements=["남", "여"]),
-        birth=faker.random_int(min=1970, max=2010),
-        email=generate_unique_email(faker),
-        login_type=faker.random_element(elements=["naver", "kakao", "apple"]),
-    )
+def generate_unique_emails(faker: Faker, count: int) -> list[str]:
+    """
+    중복되지 않는 이메일 일괄 생성
+    - 후보를 한 번에 만든 뒤 이미 사용 중인 이메일만 한 번의 쿼리로 걸러내고 다시 생성
+    """
+    emails = set()
+    while len(emails) < count:
+        candidates = {faker.unique.email() for _ in range(count - len(emails))} - emails
+        used = set(CustomUser.objects.filter(email__in=candidates).values_list("email", flat=True))
+        emails |= candidates - used
+    return list(emails)
 
-    upload_profile_photo(profile_photos_dir_path, user)
 
-    UserDetail.objects.create(
-        user=user,
+def build_user_detail(user_id: int, faker: Faker) -> UserDetail:
+    return UserDetail(
+        user_id=user_id,
         introduction=faker.sentence(),
         profile_link=faker.url(),
         coffee_life=get_random_coffee_life(faker),
@@ -54,13 +43,6 @@ def create_user_and_user_detail(nickname: str, faker: Faker, profile_photos_dir_
     )
 
 
-def generate_unique_email(faker: Faker) -> str:
-    email = faker.email()
-    while CustomUser.objects.filter(email=email).exists():
-        email = faker.email()
-    return email
-
-
 def get_random_coffee_life(faker: Faker) -> dict:
     coffee_life_json = UserDetail.default_coffee_life()
 
@@ -79,46 +61,38 @@ def get_random_preferred_taste(faker: Faker) -> dict:
     return preferred_taste_json
 
 
-def upload_profile_photo(profile_photos_dir_path: str, user: CustomUser) -> None:
-    """프로필 사진 업로드"""
-    photo_files = get_photo_file_by_nickname(profile_photos_dir_path, user.nickname)
-    save_profile_photos(photo_files, user)
-
-
-def get_photo_file_by_nickname(photos_dir_path: str, nickname: str) -> list:
-    """해당 인덱스의 사진 파일들을 찾아서 반환"""
-
-    photo_files = []
-
-    for file in os.listdir(photos_dir_path):
-        # 해당 nickname이 포함된 파일명 찾기
-        if nickname not in file:
-            continue
+def index_profile_photos(photos_dir_path: str | None, nicknames: set[str]) -> dict[str, str]:
+    """닉네임이 포함된 프로필 사진 파일 경로 (디렉토리를 한 번만 조회)"""
+    if not photos_dir_path:
+        return {}
 
+    photos = {}
+    for file in sorted(os.listdir(photos_dir_path)):
         photo_path = os.path.join(photos_dir_path, file)
         if not os.path.isfile(photo_path):
             continue
-
-        try:
-            photo_file = create_memory_file(photo_path, file)
-            photo_files.append(photo_file)
-        except IOError as e:
-            print(f"파일 읽기 오류: {photo_path} - {str(e)}")
-            continue
-
-    return photo_files
-
-
-def save_profile_photos(photo_files: list, user: CustomUser) -> None:
-    """사진들을 DB에 저장"""
-    for i, photo_file in enumerate(photo_files):
-        try:
-            photo_file.name = create_unique_filename(photo_file.name, is_main=(i == 0))
-            user.profile_image = photo_file
-            user.save()
-        except Exception as e:
-            print(f"사진 업로드 오류: {photo_file.name} - {str(e)}")
-            continue
+        for nickname in nicknames:
+            if nickname in file:
+                photos.setdefault(nickname, photo_path)
+    return photos
+
+
+def index_review_photos(photos_dir_path: str) -> dict[int, list[str]]:
+    """
+    시음기록 행 번호별 사진 파일 경로 (디렉토리를 한 번만 조회)
+    Returns:
+        dict[int, list[str]]: {행 번호(1부터): 사진 순서대로 정렬된 파일 경로}
+    """
+    if not os.path.exists(photos_dir_path):
+        raise FileNotFoundError(f"사진 디렉토리를 찾을 수 없습니다: {photos_dir_path}")
+
+    photos = defaultdict(list)
+    for file in os.listdir(photos_dir_path):
+        match = _re_review_photo.match(file)
+        photo_path = os.path.join(photos_dir_path, file)
+        if match and os.path.isfile(photo_path):
+            photos[int(match.group(1))].append((int(match.group(2)), photo_path))
+    return {idx: [path for _, path in sorted(files)] for idx, files in photos.items()}
 
 
 def create_memory_file(photo_path: str, filename: str) -> InMemoryUploadedFile:
@@ -128,15 +102,3 @@ def create_memory_file(photo_path: str, filename: str) -> InMemoryUploadedFile:
         content_type = mimetypes.guess_type(filename)[0] or "image/jpeg"
 
         return InMemoryUploadedFile(file_content, "photo_url", filename, content_type, file_content.getbuffer().nbytes, None)
-
-
-def save_tasted_record_photos(photo_files: list, tasted_record: TastedRecord) -> None:
-    """사진들을 DB에 저장"""
-    for i, photo_file in enumerate(photo_files):
-        try:
-            photo_file.name = create_unique_filename(photo_file.name, is_main=(i == 0))
-            photo = Photo(tasted_record=tasted_record, photo_url=photo_file)
-            photo.save()
-        except Exception as e:
-            print(f"사진 업로드 오류: {photo_file.name} - {str(e)}")
-            continue
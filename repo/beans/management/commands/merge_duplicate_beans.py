@@ -0,0 +1,103 @@
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Min
+
+from repo.beans.models import Bean
+from repo.interactions.note.models import Note
+from repo.records.models import TastedRecord
+
+
+class Command(BaseCommand):
+    help = "원두 식별값을 채우고 중복 원두를 병합 (시음기록, 노트 FK 재연결)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            default=1000,
+            type=int,
+            help="한 번에 처리할 원두 개수",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="실제 병합 없이 병합 대상 개수만 출력",
+        )
+
+    def handle(self, *args, **kwargs):
+        batch_size = kwargs["batch_size"]
+        dry_run = kwargs["dry_run"]
+
+        last_id = 0
+        filled_cnt = 0
+        merged_cnt = 0
+
+        while True:
+            # 식별값이 없는 원두만 id 기준 keyset 배치 조회
+            beans = list(
+                Bean.objects.filter(fingerprint__isnull=True, id__gt=last_id)
+                .order_by("id")
+                .only("id", "fingerprint", "is_official", *Bean.FINGERPRINT_FIELDS)[:batch_size]
+            )
+            if not beans:
+                break
+            last_id = beans[-1].id
+
+            groups = defaultdict(list)
+            for bean in beans:
+                groups[Bean.make_fingerprint({field: getattr(bean, field) for field in Bean.FINGERPRINT_FIELDS})].append(bean)
+
+            # 이미 식별값이 채워진 원두도 같은 그룹에 포함
+            for bean in Bean.objects.filter(fingerprint__in=groups.keys()).only("id", "fingerprint", "is_official"):
+                groups[bean.fingerprint].append(bean)
+
+            filled, merged = self.merge_groups(groups, dry_run)
+            filled_cnt += filled
+            merged_cnt += merged
+
+            self.stdout.write(f"~{last_id}번 원두까지 처리 (병합 {merged}개)")
+
+        prefix = "[dry-run] " if dry_run else ""
+        self.stdout.write(self.style.SUCCESS(f"{prefix}{filled_cnt}개 원두 식별값 등록, {merged_cnt}개 중복 원두 병합 완료"))
+
+    @transaction.atomic
+    def merge_groups(self, groups: dict[str, list[Bean]], dry_run: bool) -> tuple[int, int]:
+        """식별값 그룹별로 대표 원두를 정하고 나머지 원두를 병합"""
+        filled_cnt = 0
+        merged_cnt = 0
+
+        for fingerprint, beans in groups.items():
+            # 공식 원두 우선, 그 다음 먼저 생성된 원두를 대표 원두로 사용
+            canonical, *duplicates = sorted(beans, key=lambda bean: (not bean.is_official, bean.id))
+            duplicate_ids = [bean.id for bean in duplicates]
+
+            if canonical.fingerprint != fingerprint:
+                filled_cnt += 1
+            merged_cnt += len(duplicate_ids)
+
+            if dry_run:
+                continue
+
+            if duplicate_ids:
+                TastedRecord.objects.filter(bean_id__in=duplicate_ids).update(bean_id=canonical.id)
+                Note.objects.filter(bean_id__in=duplicate_ids).update(bean_id=canonical.id)
+                self.delete_duplicate_notes(canonical.id)
+                Bean.objects.filter(id__in=duplicate_ids).delete()
+
+            if canonical.fingerprint != fingerprint:
+                Bean.objects.filter(id=canonical.id).update(fingerprint=fingerprint)
+
+        return filled_cnt, merged_cnt
+
+    @staticmethod
+    def delete_duplicate_notes(bean_id: int) -> None:
+        """병합으로 한 유저가 같은 원두에 여러 노트를 갖게 된 경우 가장 오래된 노트만 유지"""
+        duplicated = (
+            Note.objects.filter(bean_id=bean_id)
+            .values("author_id")
+            .annotate(first_id=Min("id"), note_cnt=Count("id"))
+            .filter(note_cnt__gt=1)
+        )
+        for row in duplicated:
+            Note.objects.filter(bean_id=bean_id, author_id=row["author_id"]).exclude(id=row["first_id"]).delete()
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-10-19 18:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("beans", "0010_alter_bean_bean_type"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="bean",
+            name="fingerprint",
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True, unique=True, verbose_name="원두 식별값"),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-10-19 21:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("beans", "0011_bean_fingerprint"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="beantastereview",
+            name="batch_key",
+            field=models.CharField(blank=True, editable=False, max_length=32, null=True, unique=True, verbose_name="일괄 생성 키"),
+        ),
+    ]
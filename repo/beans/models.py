@@ -1,3 +1,6 @@
+import hashlib
+import unicodedata
+
 from django.db import models
 
 
@@ -22,6 +25,21 @@ class Bean(models.Model):
     variety = models.CharField(max_length=100, null=True, blank=True, verbose_name="원두 품종")
     is_user_created = models.BooleanField(default=False, null=True, blank=True, verbose_name="사용자 추가 여부")
     is_official = models.BooleanField(default=False, null=True, blank=True, verbose_name="공식원두 여부")
+    fingerprint = models.CharField(max_length=64, unique=True, null=True, blank=True, editable=False, verbose_name="원두 식별값")
+
+    FINGERPRINT_FIELDS = ["name", "roastery", "origin_country", "bean_type"]
+
+    @classmethod
+    def make_fingerprint(cls, bean_data: dict) -> str:
+        """
+        원두 식별값 생성
+        - 원두명, 로스터리, 원산지, 원두 유형을 정규화(NFKC, 소문자, 공백 정리)한 뒤 sha256 해시
+        """
+        canonical = []
+        for field in cls.FINGERPRINT_FIELDS:
+            value = unicodedata.normalize("NFKC", str(bean_data.get(field) or ""))
+            canonical.append(" ".join(value.casefold().split()))
+        return hashlib.sha256("\x1f".join(canonical).encode("utf-8")).hexdigest()
 
     def __str__(self):
         return f"{self.id} - {self.name}"
@@ -65,6 +83,9 @@ class BeanTasteReview(BeanTasteBase):
     star = models.FloatField(choices=star_choices, verbose_name="별점")
     tasted_at = models.DateField(null=True, blank=True, verbose_name="시음일")
     place = models.CharField(null=True, blank=True, max_length=100, verbose_name="시음 장소")
+    batch_key = models.CharField(
+        max_length=32, null=True, blank=True, unique=True, editable=False, verbose_name="일괄 생성 키"
+    )  # MySQL bulk_create 후 생성된 id를 한 번에 다시 조회하기 위한 행별 고유 값
 
     def __str__(self):
         return f"bean :{self.flavor} - {self.tasted_at}"
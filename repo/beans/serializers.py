@@ -6,7 +6,7 @@ from .models import Bean, BeanTaste, BeanTasteReview
 class BeanSerializer(serializers.ModelSerializer):
     class Meta:
         model = Bean
-        fields = "__all__"
+        exclude = ["fingerprint"]
 
 
 class BeanTasteReviewSerializer(serializers.ModelSerializer):
@@ -41,7 +41,7 @@ class BeanDetailSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Bean
-        fields = "__all__"
+        exclude = ["fingerprint"]
 
 
 class BeanNameSearchInputSerializer(serializers.Serializer):
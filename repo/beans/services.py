@@ -3,7 +3,8 @@ from collections import Counter
 from typing import Dict
 
 from django.core.cache import cache
-from django.db.models import Avg, Count, FloatField, QuerySet
+from django.db import IntegrityError, transaction
+from django.db.models import Avg, Count, FloatField, Q, QuerySet
 from django.db.models.functions import Coalesce
 from django.utils import timezone
 from redis.exceptions import ConnectionError
@@ -60,12 +61,65 @@ class BeanService:
         return saved_beans
 
     def create(self, bean_data: Dict) -> Bean:
-        """원두 생성"""
+        """
+        원두 생성 (식별값 기준 upsert)
+        - 원두명, 로스터리, 원산지, 원두 유형이 같은 원두가 있으면 재사용
+        - 동시 생성으로 unique 제약 충돌 시 먼저 생성된 원두 반환
+        """
+
+        fingerprint = Bean.make_fingerprint(bean_data)
 
-        bean = Bean.objects.filter(**bean_data).first()
-        if not bean:
-            bean = Bean.objects.create(**bean_data)
-        return bean
+        bean = Bean.objects.filter(fingerprint=fingerprint).first()
+        if bean:
+            return bean
+
+        # 식별값이 없는 원두(관리자 등록, merge_duplicate_beans 실행 전 원두)는 기존 방식으로 조회
+        # fingerprint IS NULL 조건으로 unique 인덱스 범위만 탐색
+        bean = Bean.objects.filter(fingerprint__isnull=True, **bean_data).first()
+        if bean:
+            return bean
+
+        try:
+            with transaction.atomic():
+                return Bean.objects.create(fingerprint=fingerprint, **bean_data)
+        except IntegrityError:
+            # 잠금 읽기로 조회해야 REPEATABLE READ 스냅샷에 가려진 다른 트랜잭션의 원두도 보임
+            with transaction.atomic():
+                return Bean.objects.select_for_update().get(fingerprint=fingerprint)
+
+    def get_or_create_many(self, bean_data_list: list[Dict]) -> list[Bean]:
+        """
+        원두 일괄 조회 또는 생성 (식별값 기준 upsert, 요청 원두 수와 무관하게 고정 쿼리 수)
+        - create()와 같은 기준으로 재사용하고, 없는 원두만 bulk_create
+        - 동시 생성으로 unique 제약 충돌한 원두는 무시 후 잠금 읽기로 다시 조회
+        Returns:
+            list[Bean]: bean_data_list와 같은 순서의 원두
+        """
+        fingerprints = [Bean.make_fingerprint(bean_data) for bean_data in bean_data_list]
+        beans = {bean.fingerprint: bean for bean in Bean.objects.filter(fingerprint__in=set(fingerprints))}
+
+        missing = {fingerprint: bean_data for fingerprint, bean_data in zip(fingerprints, bean_data_list) if fingerprint not in beans}
+        if missing:
+            # 식별값이 없는 원두는 create()와 같이 요청 데이터 전체로 조회
+            legacy_filter = Q()
+            for bean_data in missing.values():
+                legacy_filter |= Q(**bean_data)
+            legacy_beans = list(Bean.objects.filter(legacy_filter, fingerprint__isnull=True))
+            for fingerprint, bean_data in list(missing.items()):
+                bean = next((bean for bean in legacy_beans if all(getattr(bean, k) == v for k, v in bean_data.items())), None)
+                if bean:
+                    beans[fingerprint] = bean
+                    del missing[fingerprint]
+
+        if missing:
+            with transaction.atomic():
+                Bean.objects.bulk_create(
+                    [Bean(fingerprint=fingerprint, **bean_data) for fingerprint, bean_data in missing.items()], ignore_conflicts=True
+                )
+                # ignore_conflicts는 PK를 반환하지 않으므로 다시 조회 (잠금 읽기로 다른 트랜잭션이 만든 원두도 조회)
+                beans.update({bean.fingerprint: bean for bean in Bean.objects.select_for_update().filter(fingerprint__in=missing)})
+
+        return [beans[fingerprint] for fingerprint in fingerprints]
 
     def update(self, bean_data: Dict, user: CustomUser) -> Bean:
         """원두 데이터 수정"""
@@ -80,10 +134,7 @@ class BeanService:
     def get_or_create(self, bean_data: Dict) -> Bean:
         """원두 조회 또는 생성"""
 
-        if self.exists_by_data(bean_data):
-            return Bean.objects.get(**bean_data)
-        else:
-            return self.create(bean_data)
+        return self.create(bean_data)
 
     @staticmethod
     def get_flavor_percentages(flavors: list[str], limit: int = None) -> list[dict[str, str | int]]:
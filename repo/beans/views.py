@@ -17,6 +17,7 @@ from repo.beans.serializers import (
     UserBeanSerializer,
 )
 from repo.beans.services import BeanRankingService, BeanService
+from repo.common.db_router import ReplicaReadMixin
 from repo.common.filters import BeanFilter
 from repo.interactions.note.models import Note
 from repo.records.models import TastedRecord
@@ -24,7 +25,7 @@ from repo.search.serializers import TastedRecordSearchSerializer
 
 
 @BeanSchema.bean_name_search_schema
-class BeanNameSearchView(APIView):
+class BeanNameSearchView(ReplicaReadMixin, APIView):
     """
     원두 데이터 이름 기반 검색 API
     """
@@ -113,7 +114,7 @@ class BeanTastedRecordView(APIView):
 
     def get(self, request, id):
         bean = get_object_or_404(Bean, id=id, is_official=True)
-        records = TastedRecord.objects.filter(bean=bean).select_related("author", "bean", "taste_review")
+        records = TastedRecord.objects.filter(bean=bean).select_related("author", "bean", "taste_review").order_by("-created_at")
 
         paginator = PageNumberPagination()
         paginator.page_size = 4
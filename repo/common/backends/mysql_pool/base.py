@@ -0,0 +1,42 @@
+"""
+커넥션 풀을 사용하는 MySQL 백엔드 (DATABASES ENGINE: "repo.common.backends.mysql_pool")
+- Django 기본 MySQL 백엔드와 같고, 연결을 닫는 대신 프로세스 공용 풀(repo.common.db_pool)에 반납
+- 요청마다 풀에서 꺼내고 반납하므로 CONN_MAX_AGE는 0으로 사용 (Django PostgreSQL 풀과 동일한 제약)
+"""
+
+from functools import partial
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.mysql.base import DatabaseWrapper as MySQLDatabaseWrapper
+
+from repo.common.db_pool import get_pool
+
+
+class DatabaseWrapper(MySQLDatabaseWrapper):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.settings_dict["CONN_MAX_AGE"] != 0:
+            raise ImproperlyConfigured("커넥션 풀을 사용하는 경우 CONN_MAX_AGE는 0이어야 합니다.")
+
+    @property
+    def pool(self):
+        return get_pool(self.alias)
+
+    def get_new_connection(self, conn_params):
+        return self.pool.acquire(partial(super().get_new_connection, conn_params))
+
+    def _close(self):
+        if self.connection is None:
+            return
+        # 트랜잭션 도중이거나 오류가 발생한 연결은 상태를 보장할 수 없으므로 닫음
+        if self.in_atomic_block or self.errors_occurred:
+            self.pool.discard(self.connection)
+            return
+        if not self.get_autocommit():
+            try:
+                with self.wrap_database_errors:
+                    self.connection.rollback()
+            except Exception:
+                self.pool.discard(self.connection)
+                raise
+        self.pool.release(self.connection)
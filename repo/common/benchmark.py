@@ -0,0 +1,125 @@
+"""
+벤치마크 시나리오, 결과 리포트
+- run_benchmark 커맨드(프로세스 내 측정)와 tests/locustfile.py(부하 테스트)가 같은 시나리오 사용
+- locust 실행 환경에서도 import 할 수 있도록 Django 의존성 없이 작성
+"""
+
+import json
+import math
+import random
+import statistics
+import subprocess
+from datetime import datetime
+from typing import NamedTuple
+
+
+class Scenario(NamedTuple):
+    name: str
+    method: str
+    path: str  # {user_id}, {post_id}, {tasted_record_id}, {bean_id} 치환
+    params: dict | None = None
+    weight: int = 1  # locust 태스크 가중치
+    auth: bool = True
+
+
+SCENARIOS = [
+    Scenario("feed_v2", "GET", "/records/feed/v2/", weight=10),
+    Scenario("feed_v2_refresh", "GET", "/records/feed/v2/", {"feed_type": "refresh"}, weight=3),
+    Scenario("feed_v2_anonymous", "GET", "/records/feed/v2/", weight=5, auth=False),
+    Scenario("search_post", "GET", "/search/post/", {"q": "커피"}, weight=2),
+    Scenario("search_bean", "GET", "/search/bean/", {"q": "에티오피아"}, weight=2),
+    Scenario("search_tasted_record", "GET", "/search/tasted_record/", {"q": "산미"}, weight=2),
+    Scenario("search_buddy", "GET", "/search/buddy/", {"q": "벤치"}),
+    Scenario("suggest_post", "GET", "/search/suggest/post/", {"q": "커피"}, weight=3),
+    Scenario("suggest_bean", "GET", "/search/suggest/bean/", {"q": "에티"}, weight=3),
+    Scenario("my_profile", "GET", "/profiles/", weight=2),
+    Scenario("other_profile", "GET", "/profiles/{user_id}/", weight=3),
+    Scenario("user_posts", "GET", "/records/post/user/{user_id}/", weight=2),
+    Scenario("post_detail", "GET", "/records/post/{post_id}/", weight=4),
+    Scenario("tasted_record_detail", "GET", "/records/tasted_record/{tasted_record_id}/", weight=4),
+    Scenario("post_comments", "GET", "/records/comment/post/{post_id}/", weight=4),
+    Scenario("like_post", "POST", "/interactions/like/post/{post_id}/", weight=2),
+    Scenario("unlike_post", "DELETE", "/interactions/like/post/{post_id}/", weight=2),
+    Scenario("bean_recommendation", "GET", "/recommendation/bean/{user_id}/"),
+    Scenario("buddy_recommendation", "GET", "/recommendation/budy/"),
+]
+
+
+def build_path(scenario: Scenario, fixture: dict, rng: random.Random) -> str:
+    """시나리오 경로의 id 자리를 벤치마크 fixture의 id로 채움"""
+    return scenario.path.format(
+        user_id=rng.choice(fixture["user_ids"]),
+        post_id=rng.choice(fixture["post_ids"]),
+        tasted_record_id=rng.choice(fixture["tasted_record_ids"]),
+        bean_id=rng.choice(fixture["bean_ids"]),
+    )
+
+
+def percentile(values: list[float], percent: float) -> float:
+    """최근접 순위(nearest-rank) 백분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(percent / 100 * len(ordered)) - 1)]
+
+
+def summarize(durations: list[float], query_counts: list[int], errors: int) -> dict:
+    """시나리오 측정 결과 요약 (시간 단위: ms)"""
+    return {
+        "requests": len(durations),
+        "errors": errors,
+        "mean_ms": round(statistics.fmean(durations), 2) if durations else 0.0,
+        "p50_ms": round(percentile(durations, 50), 2),
+        "p95_ms": round(percentile(durations, 95), 2),
+        "p99_ms": round(percentile(durations, 99), 2),
+        "queries_mean": round(statistics.fmean(query_counts), 1) if query_counts else 0.0,
+        "queries_max": max(query_counts, default=0),
+    }
+
+
+def get_git_commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def build_report(results: dict[str, dict], dataset: dict, options: dict) -> dict:
+    """커밋 간 비교용 JSON 리포트"""
+    return {
+        "commit": get_git_commit(),
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "options": options,
+        "dataset": dataset,
+        "scenarios": results,
+    }
+
+
+def load_report(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_report(report: dict, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+
+def compare_reports(base: dict, current: dict, metrics: tuple[str, ...] = ("p50_ms", "p95_ms", "queries_mean")) -> list[dict]:
+    """
+    두 리포트의 시나리오별 지표 비교
+    Returns:
+        list[dict]: 시나리오별 {name, metric: (기준값, 현재값, 변화율%)}
+    """
+    rows = []
+    for name, result in current["scenarios"].items():
+        base_result = base["scenarios"].get(name)
+        if base_result is None:
+            continue
+        row = {"name": name}
+        for metric in metrics:
+            before, after = base_result[metric], result[metric]
+            row[metric] = (before, after, round((after - before) / before * 100, 1) if before else None)
+        rows.append(row)
+    return rows
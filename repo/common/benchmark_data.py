@@ -0,0 +1,409 @@
+import random
+from contextlib import contextmanager
+from datetime import timedelta
+from itertools import accumulate, islice
+from typing import Iterable
+
+from django.db import models, transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from repo.beans.models import Bean, BeanTasteReview
+from repo.interactions.note.models import Note
+from repo.interactions.relationship.models import Relationship
+from repo.profiles.models import CustomUser, UserDetail
+from repo.records.models import Comment, Photo, Post, TastedRecord
+
+BENCHMARK_EMAIL_DOMAIN = "benchmark.brewbuds"
+BENCHMARK_ROASTERY = "브루버즈 벤치마크"
+
+# 규모별 사용자 수 (사용자당 약 45행 생성: 10k ≈ 1만, 100k ≈ 10만, 1m ≈ 100만 행)
+SCALES = {"10k": 250, "100k": 2500, "1m": 25000}
+
+# 사용자당 평균 생성 수
+RATES = {
+    "tasted_records": 3,
+    "posts": 1.5,
+    "comments": 6,
+    "replies": 2,
+    "post_likes": 8,
+    "tasted_record_likes": 6,
+    "comment_likes": 2,
+    "follows": 8,
+    "blocks": 0.05,
+    "notes": 2,
+}
+
+POPULARITY_ALPHA = 1.1  # 인기도(팔로워, 좋아요, 댓글을 받는 쪽) 멱법칙 지수
+ACTIVITY_ALPHA = 0.8  # 활동량(팔로우, 좋아요, 댓글을 하는 쪽) 멱법칙 지수
+DATE_RANGE_DAYS = 365
+
+ORIGINS = [
+    ("에티오피아", ["예가체프", "시다모", "구지", "하라"]),
+    ("콜롬비아", ["우일라", "나리뇨", "카우카"]),
+    ("케냐", ["니에리", "키리냐가", "엠부"]),
+    ("브라질", ["세하도", "술 데 미나스", "모지아나"]),
+    ("과테말라", ["안티구아", "우에우에테낭고"]),
+    ("코스타리카", ["타라주", "웨스트 밸리"]),
+]
+FLAVORS = ["산미", "초콜릿", "견과류", "베리", "꽃향", "캐러멜", "시트러스", "복숭아", "와인", "흑설탕"]
+SUBJECTS = [choice for choice, _ in Post.SUBJECT_TYPE_CHOICES]
+TITLE_WORDS = ["오늘의", "추천하는", "처음 마셔본", "집에서 내린", "카페에서 만난", "인생", "데일리"]
+TAG_WORDS = ["핸드드립", "에스프레소", "콜드브루", "라떼", "홈카페", "싱글오리진", "블렌드", "카페투어"]
+
+
+@contextmanager
+def keep_created_at(*model_classes: type[models.Model]):
+    """
+    bulk_create 시 auto_now_add로 created_at이 현재 시간으로 덮어써지지 않도록 임시 해제
+    - 생성 시간을 과거 1년에 분포시켜 최신순 정렬, 기간 조회 쿼리를 실제 데이터처럼 측정
+    """
+    fields = [model_class._meta.get_field("created_at") for model_class in model_classes]
+    for field in fields:
+        field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field in fields:
+            field.auto_now_add = True
+
+
+def chunked(iterable: Iterable, size: int):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class PowerLawSampler:
+    """순위 기반 멱법칙(Zipf) 분포로 id 추출 (소수의 인기 사용자, 게시글에 팔로우, 좋아요, 댓글 집중)"""
+
+    def __init__(self, ids: list[int], alpha: float, rng: random.Random):
+        self.ids = list(ids)
+        rng.shuffle(self.ids)  # 순위와 id 순서 무관하게 섞음
+        self.cum_weights = list(accumulate(1 / (rank + 1) ** alpha for rank in range(len(self.ids))))
+        self.rng = rng
+
+    def sample(self, k: int) -> list[int]:
+        return self.rng.choices(self.ids, cum_weights=self.cum_weights, k=k)
+
+
+class BenchmarkDataGenerator:
+    """
+    벤치마크용 대용량 합성 데이터 생성
+    - 모든 모델을 bulk_create로 배치 생성 (id를 미리 할당해 M2M, 댓글 경로를 생성 전에 계산)
+    - 팔로워, 좋아요, 댓글은 멱법칙 분포, 생성 시간은 최근일수록 많도록 분포
+    - 같은 seed는 같은 데이터 생성 (커밋 간 벤치마크 결과 비교용)
+    """
+
+    def __init__(self, users: int, seed: int = 42, batch_size: int = 1000, log=None):
+        self.user_count = users
+        self.rng = random.Random(seed)
+        self.batch_size = batch_size
+        self.log = log or (lambda message: None)
+        self.now = timezone.now()
+        self.counts = {}
+        self.user_ids = []
+        self.bean_ids = []
+        self.tasted_record_ids = []
+        self.post_ids = []
+
+    def generate(self) -> dict[str, int]:
+        """데이터 생성 후 모델별 생성 수 반환"""
+        with keep_created_at(CustomUser, TastedRecord, Post, Photo, Comment, Relationship, Note):
+            self.user_ids = self.create_users()
+            self.bean_ids = self.create_beans()
+            popularity = PowerLawSampler(self.user_ids, POPULARITY_ALPHA, self.rng)
+            activity = PowerLawSampler(self.user_ids, ACTIVITY_ALPHA, self.rng)
+
+            self.tasted_record_ids = self.create_tasted_records(activity, self.bean_ids)
+            self.post_ids = self.create_posts(activity, self.tasted_record_ids)
+            self.create_photos(self.post_ids, self.tasted_record_ids)
+            self.create_comments(activity, self.post_ids, self.tasted_record_ids)
+            self.create_relationships(activity, popularity)
+            self.create_notes(activity, self.post_ids, self.tasted_record_ids, self.bean_ids)
+        return self.counts
+
+    @staticmethod
+    def clear() -> None:
+        """이전에 생성한 벤치마크 데이터 삭제 (사용자 삭제 시 기록, 게시글, 댓글 등 CASCADE 삭제)"""
+        CustomUser.objects.filter(email__endswith=f"@{BENCHMARK_EMAIL_DOMAIN}").delete()
+        Bean.objects.filter(roastery=BENCHMARK_ROASTERY).delete()
+
+    # 공통
+
+    def allocate_ids(self, model_class: type[models.Model], count: int) -> range:
+        start = (model_class.objects.aggregate(max_id=Max("id"))["max_id"] or 0) + 1
+        return range(start, start + count)
+
+    def random_datetime(self):
+        """최근일수록 많이 생성되도록 분포 (지수 분포, 평균 60일 전)"""
+        days = min(self.rng.expovariate(1 / 60), DATE_RANGE_DAYS)
+        return self.now - timedelta(days=days)
+
+    def count(self, rate_name: str) -> int:
+        return int(self.user_count * RATES[rate_name])
+
+    def bulk_create(self, model_class: type[models.Model], objs: Iterable[models.Model], name: str = None) -> int:
+        created = 0
+        with transaction.atomic():
+            for chunk in chunked(objs, self.batch_size):
+                model_class.objects.bulk_create(chunk, batch_size=self.batch_size)
+                created += len(chunk)
+        name = name or model_class._meta.model_name
+        self.counts[name] = self.counts.get(name, 0) + created
+        self.log(f"{name}: {created:,}개 생성")
+        return created
+
+    def unique_pairs(self, sources: list[int], targets: list[int], exclude_self: bool = False) -> list[tuple[int, int]]:
+        """(행동 주체, 대상) 쌍 중복 제거"""
+        pairs = dict.fromkeys(zip(sources, targets))
+        return [(source, target) for source, target in pairs if not (exclude_self and source == target)]
+
+    # 모델별 생성
+
+    def create_users(self) -> list[int]:
+        ids = self.allocate_ids(CustomUser, self.user_count)
+        users = (
+            CustomUser(
+                id=user_id,
+                email=f"bench{user_id}@{BENCHMARK_EMAIL_DOMAIN}",
+                nickname=f"벤치{user_id}",
+                gender=self.rng.choice(["남", "여"]),
+                birth=self.rng.randint(1970, 2005),
+                login_type=self.rng.choice(["kakao", "naver", "apple"]),
+                profile_image=f"profiles/benchmark/{user_id}.jpg",
+                social_id=10**12 + user_id,
+                password="!",  # 사용 불가 비밀번호
+                created_at=self.now - timedelta(days=self.rng.uniform(0, DATE_RANGE_DAYS)),
+            )
+            for user_id in ids
+        )
+        self.bulk_create(CustomUser, users)
+        self.bulk_create(UserDetail, (UserDetail(user_id=user_id, introduction="벤치마크 사용자") for user_id in ids))
+        return list(ids)
+
+    def create_beans(self) -> list[int]:
+        ids = self.allocate_ids(Bean, max(50, self.user_count // 5))
+        beans = []
+        for bean_id in ids:
+            origin, regions = self.rng.choice(ORIGINS)
+            bean_data = {
+                "bean_type": self.rng.choice(["single", "blend"]),
+                "name": f"{origin} {self.rng.choice(regions)} {bean_id}",
+                "origin_country": origin,
+                "roastery": BENCHMARK_ROASTERY,
+            }
+            beans.append(
+                Bean(
+                    id=bean_id,
+                    **bean_data,
+                    fingerprint=Bean.make_fingerprint(bean_data),
+                    roast_point=self.rng.randint(1, 5),
+                    is_decaf=self.rng.random() < 0.05,
+                    is_official=self.rng.random() < 0.7,
+                )
+            )
+        self.bulk_create(Bean, beans)
+        return list(ids)
+
+    def create_tasted_records(self, activity: PowerLawSampler, bean_ids: list[int]) -> list[int]:
+        count = self.count("tasted_records")
+        review_ids = self.allocate_ids(BeanTasteReview, count)
+        ids = self.allocate_ids(TastedRecord, count)
+        authors = activity.sample(count)
+        bean_sampler = PowerLawSampler(bean_ids, POPULARITY_ALPHA, self.rng)
+        beans = bean_sampler.sample(count)
+
+        reviews = [
+            BeanTasteReview(
+                id=review_id,
+                flavor=",".join(self.rng.sample(FLAVORS, 2)),
+                body=self.rng.randint(1, 5),
+                acidity=self.rng.randint(1, 5),
+                bitterness=self.rng.randint(1, 5),
+                sweetness=self.rng.randint(1, 5),
+                star=self.rng.choice([2.5, 3.0, 3.5, 4.0, 4.5, 5.0]),
+            )
+            for review_id in review_ids
+        ]
+        self.bulk_create(BeanTasteReview, reviews)
+
+        likes = self.like_pairs(ids, "tasted_record_likes")
+        like_counts = self.count_targets(likes)
+        records = (
+            TastedRecord(
+                id=record_id,
+                author_id=author_id,
+                bean_id=bean_id,
+                taste_review_id=review.id,
+                star=review.star,  # bulk_create는 save()를 거치지 않으므로 별점 복사본 직접 설정
+                content=f"{', '.join(self.rng.sample(FLAVORS, 3))} 느낌이 나는 커피",
+                view_cnt=int(self.rng.paretovariate(1.5) * 10),
+                is_private=self.rng.random() < 0.1,
+                created_at=self.random_datetime(),
+                tag=",".join(self.rng.sample(TAG_WORDS, 2)),
+                likes=like_counts.get(record_id, 0),
+            )
+            for record_id, author_id, bean_id, review in zip(ids, authors, beans, reviews)
+        )
+        self.bulk_create(TastedRecord, records)
+        self.create_likes(TastedRecord.like_cnt.through, "tastedrecord_id", likes, "tasted_record_likes")
+        return list(ids)
+
+    def create_posts(self, activity: PowerLawSampler, tasted_record_ids: list[int]) -> list[int]:
+        count = self.count("posts")
+        ids = self.allocate_ids(Post, count)
+        authors = activity.sample(count)
+        likes = self.like_pairs(ids, "post_likes")
+        like_counts = self.count_targets(likes)
+
+        posts = (
+            Post(
+                id=post_id,
+                author_id=author_id,
+                title=f"{self.rng.choice(TITLE_WORDS)} 커피 이야기 {post_id}",
+                content=f"{self.rng.choice(FLAVORS)} 향이 좋은 커피를 마셨어요.",
+                subject=self.rng.choice(SUBJECTS),
+                view_cnt=int(self.rng.paretovariate(1.5) * 10),
+                created_at=self.random_datetime(),
+                tag=",".join(self.rng.sample(TAG_WORDS, 2)),
+                likes=like_counts.get(post_id, 0),
+            )
+            for post_id, author_id in zip(ids, authors)
+        )
+        self.bulk_create(Post, posts)
+        self.create_likes(Post.like_cnt.through, "post_id", likes, "post_likes")
+
+        # 게시글 절반에 시음기록 1~2개 연결
+        through = Post.tasted_records.through
+        links = dict.fromkeys(
+            (post_id, tasted_record_id)
+            for post_id in ids
+            if self.rng.random() < 0.5
+            for tasted_record_id in self.rng.sample(tasted_record_ids, self.rng.randint(1, 2))
+        )
+        self.bulk_create(through, (through(post_id=post_id, tastedrecord_id=tr_id) for post_id, tr_id in links), "post_tasted_records")
+        return list(ids)
+
+    def create_photos(self, post_ids: list[int], tasted_record_ids: list[int]) -> None:
+        targets = [("post_id", post_id, self.rng.randint(0, 3)) for post_id in post_ids]
+        targets += [("tasted_record_id", tr_id, self.rng.randint(0, 2)) for tr_id in tasted_record_ids]
+        ids = iter(self.allocate_ids(Photo, sum(count for _, _, count in targets)))
+
+        def photos():
+            for field, target_id, count in targets:
+                for _ in range(count):
+                    photo_id = next(ids)
+                    yield Photo(
+                        id=photo_id,
+                        **{field: target_id},
+                        photo_url=f"records/benchmark/{photo_id}.jpg",
+                        thumbnail_url=f"records/benchmark/{photo_id}_thumb.webp",
+                        medium_url=f"records/benchmark/{photo_id}_medium.jpg",
+                        created_at=self.random_datetime(),
+                    )
+
+        self.bulk_create(Photo, photos())
+
+    def create_comments(self, activity: PowerLawSampler, post_ids: list[int], tasted_record_ids: list[int]) -> None:
+        """댓글, 대댓글 생성 (스레드 경로를 id로 미리 계산)"""
+        top_count, reply_count = self.count("comments"), self.count("replies")
+        ids = iter(self.allocate_ids(Comment, top_count + reply_count))
+        authors = iter(activity.sample(top_count + reply_count))
+        post_sampler = PowerLawSampler(post_ids, POPULARITY_ALPHA, self.rng)
+        tasted_record_sampler = PowerLawSampler(tasted_record_ids, POPULARITY_ALPHA, self.rng)
+        segment = Comment.PATH_SEGMENT_LENGTH
+
+        comments = []
+        for target_post_id, target_tasted_record_id in zip(
+            post_sampler.sample(top_count // 2) + [None] * (top_count - top_count // 2),
+            [None] * (top_count // 2) + tasted_record_sampler.sample(top_count - top_count // 2),
+        ):
+            comment_id = next(ids)
+            comments.append(
+                Comment(
+                    id=comment_id,
+                    root_id=comment_id,
+                    path=f"{comment_id:0{segment}d}/",
+                    depth=0,
+                    author_id=next(authors),
+                    post_id=target_post_id,
+                    tasted_record_id=target_tasted_record_id,
+                    content=f"{self.rng.choice(FLAVORS)} 맛이 궁금하네요!",
+                    is_deleted=self.rng.random() < 0.02,
+                    created_at=self.random_datetime(),
+                )
+            )
+
+        # 대댓글은 상위 댓글(일부는 대댓글)과 같은 게시글, 시음기록에 생성
+        replies = []
+        for _ in range(reply_count):
+            parent = self.rng.choice(replies) if replies and self.rng.random() < 0.2 else self.rng.choice(comments)
+            comment_id = next(ids)
+            replies.append(
+                Comment(
+                    id=comment_id,
+                    parent_id=parent.id,
+                    root_id=parent.root_id,
+                    path=f"{parent.path}{comment_id:0{segment}d}/",
+                    depth=parent.depth + 1,
+                    author_id=next(authors),
+                    post_id=parent.post_id,
+                    tasted_record_id=parent.tasted_record_id,
+                    content="저도 마셔보고 싶어요.",
+                    created_at=parent.created_at + timedelta(minutes=self.rng.randint(1, 600)),
+                )
+            )
+
+        all_comments = comments + replies
+        likes = self.like_pairs([comment.id for comment in all_comments], "comment_likes")
+        like_counts = self.count_targets(likes)
+        for comment in all_comments:
+            comment.likes = like_counts.get(comment.id, 0)
+
+        self.bulk_create(Comment, comments)
+        self.bulk_create(Comment, replies, "comment_replies")
+        self.create_likes(Comment.like_cnt.through, "comment_id", likes, "comment_likes")
+
+    def create_relationships(self, activity: PowerLawSampler, popularity: PowerLawSampler) -> None:
+        """팔로우(인기 사용자에게 팔로워 집중), 차단 관계 생성"""
+        follows = self.unique_pairs(activity.sample(self.count("follows")), popularity.sample(self.count("follows")), exclude_self=True)
+        blocks = self.unique_pairs(activity.sample(self.count("blocks")), popularity.sample(self.count("blocks")), exclude_self=True)
+        follow_set = set(follows)
+        blocks = [pair for pair in blocks if pair not in follow_set]
+
+        relationships = [
+            Relationship(from_user_id=from_id, to_user_id=to_id, relationship_type=relationship_type, created_at=self.random_datetime())
+            for pairs, relationship_type in ((follows, "follow"), (blocks, "block"))
+            for from_id, to_id in pairs
+        ]
+        self.bulk_create(Relationship, relationships)
+
+    def create_notes(self, activity: PowerLawSampler, post_ids: list[int], tasted_record_ids: list[int], bean_ids: list[int]) -> None:
+        count = self.count("notes")
+        notes = []
+        for author_id, (field, target_ids) in zip(
+            activity.sample(count),
+            self.rng.choices([("post_id", post_ids), ("tasted_record_id", tasted_record_ids), ("bean_id", bean_ids)], k=count),
+        ):
+            notes.append(Note(author_id=author_id, **{field: self.rng.choice(target_ids)}, created_at=self.random_datetime()))
+        self.bulk_create(Note, notes)
+
+    # 좋아요
+
+    def like_pairs(self, target_ids: list[int], rate_name: str) -> list[tuple[int, int]]:
+        """(사용자, 대상) 좋아요 쌍 생성 (인기 대상에 좋아요 집중)"""
+        count = self.count(rate_name)
+        users = self.rng.choices(self.user_ids, k=count)
+        targets = PowerLawSampler(target_ids, POPULARITY_ALPHA, self.rng).sample(count)
+        return self.unique_pairs(users, targets)
+
+    @staticmethod
+    def count_targets(pairs: list[tuple[int, int]]) -> dict[int, int]:
+        counts = {}
+        for _, target_id in pairs:
+            counts[target_id] = counts.get(target_id, 0) + 1
+        return counts
+
+    def create_likes(self, through: type[models.Model], target_field: str, pairs: list[tuple[int, int]], name: str) -> None:
+        self.bulk_create(through, (through(customuser_id=user_id, **{target_field: target_id}) for user_id, target_id in pairs), name)
@@ -1,16 +1,22 @@
+import mimetypes
 import uuid
 
-import boto3
-from boto3.exceptions import Boto3Error
 from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import transaction
 from storages.backends.s3boto3 import S3Boto3Storage, S3StaticStorage
 
+from repo.common.storage import (
+    delete_objects,
+    delete_objects_on_commit,
+    get_s3_client,
+    run_after_commit,
+)
 from repo.profiles.models import CustomUser
+from repo.records.models import Photo, PhotoFile
 
 DEBUG = settings.DEBUG
 
-AWS_S3_ACCESS_KEY_ID = getattr(settings, "AWS_S3_ACCESS_KEY_ID", None)
-AWS_S3_SECRET_ACCESS_KEY = getattr(settings, "AWS_S3_SECRET_ACCESS_KEY", None)
 AWS_STORAGE_BUCKET_NAME = getattr(settings, "AWS_STORAGE_BUCKET_NAME", None)
 
 
@@ -39,22 +45,19 @@ class AwsMediaStorage(S3Boto3Storage):
             str: 업로드된 파일 이름
         """
 
-        s3 = boto3.client(
-            "s3",
-            aws_access_key_id=AWS_S3_ACCESS_KEY_ID,
-            aws_secret_access_key=AWS_S3_SECRET_ACCESS_KEY,
-        )
+        s3 = get_s3_client()
 
         content.seek(0)
 
         file_name = name.split("/")[-1]  # 파일명
+        content_type = getattr(content, "content_type", None) or mimetypes.guess_type(file_name)[0] or "application/octet-stream"
 
         try:
             s3.put_object(
                 Bucket=AWS_STORAGE_BUCKET_NAME,
                 Key=f"{self.location}/{name}",
                 Body=content,
-                ContentType=content.content_type,
+                ContentType=content_type,
                 Metadata={"is-representative": str(file_name.startswith("main_")).lower()},  # 'true' or 'false'
                 ACL="public-read",
             )
@@ -79,66 +82,97 @@ def create_unique_filename(filename, is_main=False):
     return f"{unique_id}.{ext}"
 
 
-def delete_photo(photo_url: str) -> None:
+def delete_media_files(names: list[str]) -> None:
     """
-    S3에서 이미지 삭제 함수
+    트랜잭션 커밋 이후 백그라운드에서 미디어 파일 삭제 함수
     Args:
-        photo_url: 삭제할 이미지 URL
+        names: 삭제할 파일 이름 목록 (개발 환경은 로컬 파일, 운영 환경은 S3 객체 일괄 삭제)
     """
-    try:
-        s3 = boto3.client("s3", aws_access_key_id=AWS_S3_ACCESS_KEY_ID, aws_secret_access_key=AWS_S3_SECRET_ACCESS_KEY)
-        s3_key = f"{AwsMediaStorage.location}/{photo_url.name}"
+    names = [name for name in names if name]
+    if not names:
+        return None
+
+    if DEBUG:
+        run_after_commit(_delete_local_files, names)
+    else:
+        delete_objects_on_commit([f"{AwsMediaStorage.location}/{name}" for name in names], AWS_STORAGE_BUCKET_NAME)
 
-        s3.delete_object(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=s3_key)
-    except (Boto3Error, OSError, Exception) as e:
-        error_msg = {
-            Boto3Error: "S3 삭제 중 오류가 발생했습니다",
-            OSError: "파일 시스템 작업 중 오류가 발생했습니다",
-            Exception: "이미지 삭제 중 예기치 않은 오류가 발생했습니다",
-        }.get(type(e), "알 수 없는 오류가 발생했습니다")
 
-        raise type(e)(f"{error_msg}: {str(e)}") from e
+def _delete_local_files(names: list[str]) -> None:
+    """개발 환경 로컬 파일 삭제"""
+    for name in names:
+        default_storage.delete(name)
 
 
-def delete_photos(object) -> None:
+def remove_media_files(names: list[str]) -> list[str]:
     """
-    S3에서 여러 이미지를 한 번에 삭제하는 함수
+    미디어 파일 즉시 삭제 함수 (Celery 작업 등 트랜잭션, 응답 시간과 무관한 곳에서 사용)
     Args:
-        object: 삭제할 이미지를 포함하는 객체
+        names: 삭제할 파일 이름 목록 (개발 환경은 로컬 파일, 운영 환경은 S3 객체 1000개 단위 일괄 삭제)
+    Returns:
+        list[str]: 삭제에 실패한 파일 이름 목록
     """
-    if not object.photo_set.exists():
-        return None
+    names = [name for name in names if name]
+    if not DEBUG:
+        prefix = f"{AwsMediaStorage.location}/"
+        return [key.removeprefix(prefix) for key in delete_objects([prefix + name for name in names], AWS_STORAGE_BUCKET_NAME)]
 
-    photos = object.photo_set.all()
-    try:
-        if DEBUG:
-            for photo in photos:
-                photo.photo_url.delete()
-            photos.delete()
-        else:
-            s3 = boto3.client("s3", aws_access_key_id=AWS_S3_ACCESS_KEY_ID, aws_secret_access_key=AWS_S3_SECRET_ACCESS_KEY)
+    failed = []
+    for name in names:
+        try:
+            default_storage.delete(name)
+        except Exception:
+            failed.append(name)
+    return failed
 
-            # S3에서 삭제할 객체 목록 생성
-            objects = [{"Key": f"{AwsMediaStorage.location}/{photo.photo_url.name}"} for photo in photos]
 
-            objects_to_delete = {
-                "Objects": objects,
-                "Quiet": True,  # 삭제 결과 메시지를 간소화
-            }
+def delete_photo(photo_url) -> None:
+    """
+    S3에서 이미지 삭제 함수 (커밋 이후 삭제)
+    Args:
+        photo_url: 삭제할 이미지 파일 필드
+    """
+    delete_media_files([photo_url.name])
 
-            s3.delete_objects(Bucket=AWS_STORAGE_BUCKET_NAME, Delete=objects_to_delete)  # 일괄 삭제 요청
-            photos.delete()
 
-    except (Boto3Error, OSError, Exception) as e:
-        error_msg = {
-            Boto3Error: "S3 삭제 중 오류가 발생했습니다",
-            OSError: "파일 시스템 작업 중 오류가 발생했습니다",
-            Exception: "이미지 삭제 중 예기치 않은 오류가 발생했습니다",
-        }.get(type(e), "알 수 없는 오류가 발생했습니다")
+def delete_photos(object, exclude_ids=()) -> None:
+    """
+    객체의 사진을 삭제하는 함수
+    - 사진 레코드는 현재 트랜잭션에서 삭제하고, 원본, 변형 이미지 파일은 커밋 이후 일괄 삭제
+    - 공유 파일(PhotoFile)은 다른 사진이 참조하지 않게 된 경우에만 삭제
+    Args:
+        object: 삭제할 이미지를 포함하는 객체
+        exclude_ids: 삭제하지 않고 유지할 사진 id (사진 수정 시 변경되지 않은 사진)
+    """
+    photos = list(object.photo_set.exclude(id__in=exclude_ids).only("id", "stored_file_id", "photo_url", "thumbnail_url", "medium_url"))
+    if not photos:
+        return None
+
+    object.photo_set.filter(id__in=[photo.id for photo in photos]).delete()
+    names = [name for photo in photos if photo.stored_file_id is None for name in photo.get_file_names()]
+    released = release_photo_files({photo.stored_file_id for photo in photos if photo.stored_file_id})
+    delete_media_files(names + [name for file in released for name in file.get_file_names()])
+
+
+def release_photo_files(file_ids) -> list[PhotoFile]:
+    """
+    참조하는 사진이 없어진 공유 파일 레코드 삭제
+    - 파일 행을 잠근 뒤 참조 사진을 잠금 읽기로 확인 (동시에 같은 파일을 재사용하는 업로드와 직렬화)
+    Args:
+        file_ids: 참조가 줄어든 PhotoFile id
+    Returns:
+        list[PhotoFile]: 삭제한 공유 파일 (원본, 변형 이미지 파일 삭제는 호출하는 쪽에서 처리)
+    """
+    if not file_ids:
+        return []
 
-        for photo in photos:  # 에러 발생시 롤백 처리
-            photo.save()
-        raise type(e)(f"{error_msg}: {str(e)}") from e
+    with transaction.atomic():
+        files = list(PhotoFile.objects.select_for_update().filter(id__in=file_ids).order_by("id"))
+        referenced = set(Photo.objects.select_for_update().filter(stored_file_id__in=file_ids).values_list("stored_file_id", flat=True))
+        released = [file for file in files if file.id not in referenced]
+        if released:
+            PhotoFile.objects.filter(id__in=[file.id for file in released]).delete()
+    return released
 
 
 def delete_profile_photo(user: CustomUser) -> None:
@@ -150,12 +184,7 @@ def delete_profile_photo(user: CustomUser) -> None:
     if not user.profile_image:
         return None
 
-    try:
-        if DEBUG:
-            user.profile_image.delete()
-        else:
-            delete_photo(user.profile_image)
-            user.profile_image = None
-            user.save(update_fields=["profile_image"])
-    except Exception as e:
-        raise e
+    name = user.profile_image.name
+    user.profile_image = None
+    user.save(update_fields=["profile_image"])
+    delete_media_files([name])
@@ -0,0 +1,30 @@
+from typing import Any
+
+from django_redis.serializers.json import JSONSerializer
+
+from repo.common.renderers import orjson
+
+CACHE_ORJSON_OPTIONS = (orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+
+class FastJSONSerializer(JSONSerializer):
+    """
+    orjson 기반 django_redis 캐시 직렬화 클래스
+    - 피드, 게시글 목록 등 큰 캐시 값의 인코딩, 디코딩 시간 단축
+    - datetime 등은 DjangoJSONEncoder로 변환해 JSONSerializer로 저장된 값과 같은 형식 유지 (기존 캐시 값 그대로 조회 가능)
+    - orjson 미설치 시 JSONSerializer로 동작
+    """
+
+    def __init__(self, options):
+        super().__init__(options)
+        self._default = self.encoder_class().default
+
+    def dumps(self, value: Any) -> bytes:
+        if orjson is None:
+            return super().dumps(value)
+        return orjson.dumps(value, default=self._default, option=CACHE_ORJSON_OPTIONS)
+
+    def loads(self, value: bytes) -> Any:
+        if orjson is None:
+            return super().loads(value)
+        return orjson.loads(value)
@@ -0,0 +1,199 @@
+"""
+DB 연결 관리 (프로세스 단위 커넥션 풀, 연결 지표)
+- DB_POOL_ENABLED 설정 시 MySQL 엔진을 repo.common.backends.mysql_pool로 교체해 사용
+- 요청이 끝나면 연결을 닫는 대신 풀에 반납하고, 다음 요청(같은 프로세스의 다른 스레드 포함)에서 재사용
+- 풀은 프로세스마다 따로 만들며, fork된 자식 프로세스는 부모의 연결을 물려받지 않음
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import Counter, deque
+
+from django.conf import settings
+from django.db import OperationalError
+from django.db.backends.signals import connection_created
+
+logger = logging.getLogger("performance")
+
+DB_POOL_MAX_SIZE = getattr(settings, "DB_POOL_MAX_SIZE", 10)  # 프로세스당 alias별 최대 연결 수 (gthread 스레드 수 이상)
+DB_POOL_TIMEOUT = getattr(settings, "DB_POOL_TIMEOUT", 5)  # 풀이 가득 찼을 때 반납을 기다리는 최대 시간(초)
+DB_POOL_RECYCLE = getattr(settings, "DB_POOL_RECYCLE", 1800)  # 연결 최대 사용 시간(초), MySQL wait_timeout보다 짧게
+
+
+class ConnectionPool:
+    """
+    DB 연결 풀 (스레드 안전)
+    - 유휴 연결은 최근 반납한 것부터 재사용(LIFO)해 오래 쉰 연결은 자연스럽게 만료
+    - 꺼낼 때 ping으로 끊긴 연결을 걸러내고, RECYCLE 시간이 지난 연결은 닫고 새로 연결
+    - 사용 중 + 유휴 연결 수가 max_size를 넘지 않도록 제한 (MySQL max_connections 보호)
+    """
+
+    def __init__(self, alias: str, max_size: int = DB_POOL_MAX_SIZE, timeout: float = DB_POOL_TIMEOUT, recycle: float = DB_POOL_RECYCLE):
+        self.alias = alias
+        self.max_size = max_size
+        self.timeout = timeout
+        self.recycle = recycle
+        self._idle = deque()  # (연결, 생성 시각)
+        self._created_at = {}  # 사용 중인 연결 id -> 생성 시각
+        self._connecting = 0  # 연결 중인 수 (연결하는 동안 자리 예약)
+        self._condition = threading.Condition()
+        self.stats = Counter()  # created, reused, recycled, broken, discarded, waited, timeouts
+
+    @property
+    def size(self) -> int:
+        return len(self._idle) + len(self._created_at) + self._connecting
+
+    def acquire(self, connect):
+        """
+        유휴 연결 반환, 없으면 connect()로 새로 연결
+        Raises:
+            OperationalError: timeout 동안 반납된 연결이 없는 경우
+        """
+        deadline = time.monotonic() + self.timeout
+        with self._condition:
+            while not self._idle and self.size >= self.max_size:
+                self.stats["waited"] += 1
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._condition.wait(remaining):
+                    self.stats["timeouts"] += 1
+                    raise OperationalError(f"DB 커넥션 풀 대기 시간 초과 ({self.alias}, max_size={self.max_size})")
+            item = self._idle.pop() if self._idle else None
+            if item is None:
+                self._connecting += 1
+
+        if item is None:
+            return self._connect(connect)
+
+        connection, created_at = item
+        if time.monotonic() - created_at > self.recycle:
+            self.stats["recycled"] += 1
+        elif self.is_usable(connection):
+            with self._condition:
+                self._created_at[id(connection)] = created_at
+            self.stats["reused"] += 1
+            return connection
+        else:
+            self.stats["broken"] += 1
+
+        with self._condition:
+            self._connecting += 1
+        self._close_connection(connection)
+        return self._connect(connect)
+
+    def _connect(self, connect):
+        try:
+            connection = connect()
+        except BaseException:
+            with self._condition:
+                self._connecting -= 1
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            self._connecting -= 1
+            self._created_at[id(connection)] = time.monotonic()
+        self.stats["created"] += 1
+        return connection
+
+    def release(self, connection) -> None:
+        """사용이 끝난 연결을 풀에 반납"""
+        with self._condition:
+            created_at = self._created_at.pop(id(connection), None)
+            if created_at is not None:
+                self._idle.append((connection, created_at))
+                self._condition.notify()
+                return
+        self._close_connection(connection)  # 다른 풀(fork 이전 프로세스)에서 꺼낸 연결
+
+    def discard(self, connection) -> None:
+        """오류가 발생했거나 트랜잭션 도중인 연결은 반납하지 않고 닫음"""
+        with self._condition:
+            self._created_at.pop(id(connection), None)
+            self._condition.notify()
+        self.stats["discarded"] += 1
+        self._close_connection(connection)
+
+    def close_idle(self) -> None:
+        """유휴 연결을 모두 닫음 (사용 중인 연결은 반납될 때 다시 풀에 들어감)"""
+        with self._condition:
+            idle, self._idle = list(self._idle), deque()
+        for connection, _ in idle:
+            self._close_connection(connection)
+
+    def get_stats(self) -> dict:
+        with self._condition:
+            return {
+                "size": self.size,
+                "idle": len(self._idle),
+                "in_use": len(self._created_at) + self._connecting,
+                "max_size": self.max_size,
+                **self.stats,
+            }
+
+    @staticmethod
+    def is_usable(connection) -> bool:
+        try:
+            connection.ping()
+        except Exception:
+            return False
+        return True
+
+    def _close_connection(self, connection) -> None:
+        try:
+            connection.close()
+        except Exception as e:
+            logger.debug(f"DB 연결 종료 실패 ({self.alias}): {str(e)}")
+
+
+_pools: dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+_connects = Counter()  # alias별 Django 연결 수립 횟수 (풀 사용 시 풀에서 꺼낸 횟수 포함)
+
+
+def get_pool(alias: str) -> ConnectionPool:
+    """프로세스 공용 커넥션 풀 반환 (alias별로 생성)"""
+    pool = _pools.get(alias)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.setdefault(alias, ConnectionPool(alias))
+    return pool
+
+
+def reset_pools() -> None:
+    """
+    풀, 연결 지표 초기화 (fork 이후 자식 프로세스에서 호출)
+    - 부모 프로세스와 소켓을 공유하므로 연결을 닫지 않고 버림 (닫으면 부모의 세션도 종료됨)
+    """
+    _pools.clear()
+    _connects.clear()
+
+
+def close_pools() -> None:
+    """모든 풀의 유휴 연결 종료 (프로세스 종료 시 사용)"""
+    for pool in list(_pools.values()):
+        pool.close_idle()
+
+
+def get_connection_stats() -> dict:
+    """
+    현재 프로세스의 DB 연결 지표
+    Returns:
+        dict: {"pid": 프로세스 id, "databases": {alias: {"connects": 연결 수립 횟수, "pool": 풀 지표(풀 미사용 시 None)}}}
+    """
+    aliases = sorted(set(_connects) | set(_pools))
+    return {
+        "pid": os.getpid(),
+        "databases": {
+            alias: {"connects": _connects[alias], "pool": _pools[alias].get_stats() if alias in _pools else None} for alias in aliases
+        },
+    }
+
+
+def count_connection_created(sender, connection, **kwargs) -> None:
+    _connects[connection.alias] += 1
+
+
+connection_created.connect(count_connection_created, dispatch_uid="db_pool_count_connection_created")
+os.register_at_fork(after_in_child=reset_pools)
@@ -0,0 +1,99 @@
+"""
+읽기 전용 복제본(replica) DB 라우팅
+- 기본은 모든 쿼리를 primary(default)로 보내고, use_replica() 범위 안의 읽기 쿼리만 복제본으로 보냄
+- 피드, 검색, 취향 분석, 추천, 관리자 보고서처럼 조금 늦은 데이터를 읽어도 되는 조회에서만 사용
+- 사용자가 쓰기 요청을 하면 REPLICA_STICKY_SECONDS 동안 그 사용자의 읽기는 primary로 고정
+  (복제 지연으로 방금 작성한 게시글이 보이지 않는 문제 방지)
+"""
+
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+from rest_framework.permissions import SAFE_METHODS
+
+REPLICA_DATABASES = getattr(settings, "REPLICA_DATABASES", [])  # 복제본 DB alias 목록 (비어 있으면 항상 primary)
+REPLICA_STICKY_SECONDS = getattr(settings, "REPLICA_STICKY_SECONDS", 10)  # 쓰기 이후 primary 고정 시간 (최대 복제 지연보다 길게)
+
+
+class ReplicaScope:
+    __slots__ = ("alias", "wrote")
+
+    def __init__(self, alias: str):
+        self.alias = alias  # 범위 안에서는 같은 복제본 사용
+        self.wrote = False
+
+
+_replica_scope: ContextVar[ReplicaScope | None] = ContextVar("replica_scope", default=None)
+
+
+@contextmanager
+def use_replica():
+    """블록 안의 읽기 쿼리를 복제본으로 보냄 (복제본이 없으면 아무 동작 안 함)"""
+    token = _replica_scope.set(ReplicaScope(random.choice(REPLICA_DATABASES)) if REPLICA_DATABASES else None)
+    try:
+        yield
+    finally:
+        _replica_scope.reset(token)
+
+
+def get_primary_pin_key(user_id: int) -> str:
+    return f"db:primary_pin:{user_id}"
+
+
+def pin_primary(user_id: int) -> None:
+    """사용자의 읽기를 일정 시간 primary로 고정"""
+    cache.set(get_primary_pin_key(user_id), 1, timeout=REPLICA_STICKY_SECONDS)
+
+
+def is_primary_pinned(user) -> bool:
+    return user.is_authenticated and cache.get(get_primary_pin_key(user.id)) is not None
+
+
+class PrimaryReplicaRouter:
+    """
+    primary/replica 라우터 (DATABASE_ROUTERS)
+    - 쓰기, 마이그레이션은 항상 primary
+    - use_replica() 범위 안이라도 트랜잭션 중이거나 같은 범위에서 쓰기가 있었으면 primary에서 읽음
+    """
+
+    def db_for_read(self, model, **hints):
+        scope = _replica_scope.get()
+        if scope is None or scope.wrote or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return scope.alias
+
+    def db_for_write(self, model, **hints):
+        scope = _replica_scope.get()
+        if scope is not None:
+            scope.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True  # 복제본은 primary와 같은 데이터
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db not in REPLICA_DATABASES
+
+
+class ReplicaReadMixin:
+    """
+    조회(GET) 요청의 읽기 쿼리를 복제본으로 보내는 APIView 믹스인
+    - 인증 이후에 판단하므로 최근 쓰기 요청을 한 사용자는 primary에서 읽음
+    """
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if request.method in SAFE_METHODS and not is_primary_pinned(request.user):
+            self._replica_context = use_replica()
+            self._replica_context.__enter__()
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        replica_context = getattr(self, "_replica_context", None)
+        if replica_context is not None:
+            self._replica_context = None
+            replica_context.__exit__(None, None, None)
+        return super().finalize_response(request, response, *args, **kwargs)
@@ -0,0 +1,303 @@
+import hashlib
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor, wait
+from io import BytesIO
+from typing import NamedTuple
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import Storage, default_storage
+from django.core.files.uploadedfile import UploadedFile
+from django.db import transaction
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from repo.common.bucket import (
+    create_unique_filename,
+    delete_media_files,
+    release_photo_files,
+)
+from repo.common.exception.exceptions import ImageProcessingException, S3Exception
+from repo.common.querysets import bulk_create_with_pk
+from repo.common.storage import AWS_S3_MAX_POOL_CONNECTIONS
+from repo.records.models import Photo, PhotoFile
+
+logger = logging.getLogger(__name__)
+
+IMAGE_PROCESS_WORKERS = getattr(settings, "IMAGE_PROCESS_WORKERS", min(4, os.cpu_count() or 1))
+ALLOWED_IMAGE_FORMATS = {"JPEG", "MPO", "PNG", "WEBP", "GIF"}
+MAX_IMAGE_PIXELS = 40_000_000  # 약 40MP 초과 이미지는 디코딩하지 않음
+
+
+class ImageVariant(NamedTuple):
+    field: str  # 변형 이미지 이름을 저장할 Photo 필드
+    suffix: str
+    max_size: int  # 긴 변 기준 최대 픽셀
+    format: str
+    extension: str
+    quality: int
+
+
+# 긴 변이 큰 순서로 정렬 (큰 변형부터 줄여가며 생성)
+IMAGE_VARIANTS = [
+    ImageVariant("medium_url", "medium", 1280, "JPEG", "jpg", 85),
+    ImageVariant("thumbnail_url", "thumb", 400, "WEBP", "webp", 80),
+]
+
+# 이미지 리사이즈(CPU)와 S3 업로드(I/O)는 프로세스 공용 워커 풀에서 처리
+_process_executor = ThreadPoolExecutor(max_workers=IMAGE_PROCESS_WORKERS, thread_name_prefix="image-process")
+_upload_executor = ThreadPoolExecutor(max_workers=AWS_S3_MAX_POOL_CONNECTIONS, thread_name_prefix="image-upload")
+
+
+class PhotoUploadPipeline:
+    """
+    사진 업로드 파이프라인
+    - 이미지 검증 후 원본과 리사이즈 변형(썸네일 WebP, 중간 크기 JPEG) 생성
+    - 모든 파일을 공용 S3 클라이언트로 동시 업로드한 뒤 Photo 생성
+    - 원본 내용(SHA-256)이 같은 저장 파일(PhotoFile)이 있으면 업로드 없이 재사용
+    - 업로드 실패 시 이미 업로드된 파일 삭제
+    """
+
+    def __init__(self, storage: Storage = None):
+        self.storage = storage or default_storage
+        self.hashes: dict[UploadedFile, str] = {}  # 파일별 해시 (사진 수정 시 비교한 해시를 업로드에서 다시 계산하지 않도록 보관)
+
+    def upload(self, files: list[UploadedFile], first_is_main: bool = True, **photo_data) -> list[Photo]:
+        """
+        사진 업로드 및 Photo 생성
+        Args:
+            files: 업로드할 이미지 파일 목록 (첫번째 파일이 대표 사진)
+            first_is_main: 첫번째 파일을 대표 사진으로 저장할지 여부 (기존 대표 사진을 유지하고 뒤에 추가하는 경우 False)
+            photo_data: Photo 생성 시 추가할 필드 (post, tasted_record)
+        Returns:
+            list[Photo]: 생성된 사진 목록
+        """
+        for _ in range(2):
+            stored_files = self.store_files(files, first_is_main)
+            file_ids = {stored_file.id for stored_file in stored_files}
+            try:
+                with transaction.atomic():
+                    # 재사용할 파일이 다른 요청의 사진 삭제로 함께 삭제되지 않았는지 잠금 후 확인 (삭제됐으면 다시 업로드)
+                    if len(PhotoFile.objects.select_for_update().filter(id__in=file_ids).values_list("id", flat=True)) < len(file_ids):
+                        continue
+                    photos = [
+                        Photo(
+                            stored_file=stored_file,
+                            **{field: getattr(stored_file, field).name for field in PhotoFile.FILE_FIELDS},
+                            **photo_data,
+                        )
+                        for stored_file in stored_files
+                    ]
+                    return bulk_create_with_pk(Photo, photos)
+            except Exception:
+                released = release_photo_files(file_ids)  # 이번 업로드에서만 사용하던 파일 정리
+                delete_media_files([name for stored_file in released for name in stored_file.get_file_names()])
+                raise
+
+        raise S3Exception(detail="사진 업로드 중 오류가 발생했습니다: 저장 파일이 삭제되었습니다.")
+
+    def store_files(self, files: list[UploadedFile], first_is_main: bool = True) -> list[PhotoFile]:
+        """
+        원본 내용 기준 저장 파일 조회, 없는 파일만 업로드
+        - 같은 요청 안의 같은 사진도 한 번만 업로드
+        Returns:
+            list[PhotoFile]: files와 같은 순서의 저장 파일
+        """
+        hashes = list(_process_executor.map(self.get_hash, files))
+        keys = [(content_hash, first_is_main and i == 0) for i, content_hash in enumerate(hashes)]
+
+        stored_files = {
+            (stored_file.content_hash, stored_file.is_main): stored_file
+            for stored_file in PhotoFile.objects.filter(content_hash__in=set(hashes))
+        }
+        missing = {}
+        for key, file in zip(keys, files):
+            if key not in stored_files:
+                missing.setdefault(key, file)
+        if missing:
+            stored_files.update(self.create_files(missing))
+
+        return [stored_files[key] for key in keys]
+
+    def create_files(self, missing: dict[tuple[str, bool], UploadedFile]) -> dict[tuple[str, bool], PhotoFile]:
+        """
+        저장 파일 업로드 및 PhotoFile 생성
+        - 동시에 같은 내용을 먼저 저장한 요청이 있으면 먼저 저장된 파일을 사용하고 이번에 올린 파일은 삭제
+        """
+        keys = list(missing)
+        upload_files = self.prepare_files(list(missing.values()), is_main=[is_main for _, is_main in keys])
+        uploaded_names = self.upload_files(upload_files)
+        new_files = [
+            PhotoFile(
+                content_hash=content_hash,
+                is_main=is_main,
+                size=sum(content.size for _, content in photo_files.values()),
+                **names,
+            )
+            for (content_hash, is_main), photo_files, names in zip(keys, upload_files, uploaded_names)
+        ]
+
+        try:
+            with transaction.atomic():
+                PhotoFile.objects.bulk_create(new_files, ignore_conflicts=True)
+                # ignore_conflicts는 PK를 반환하지 않으므로 다시 조회 (잠금 읽기로 다른 트랜잭션이 만든 파일도 조회)
+                stored_files = {
+                    (stored_file.content_hash, stored_file.is_main): stored_file
+                    for stored_file in PhotoFile.objects.select_for_update().filter(content_hash__in={key[0] for key in keys})
+                }
+        except Exception:
+            self.delete_files([name for names in uploaded_names for name in names.values()])
+            raise
+
+        self.delete_files(
+            [
+                name
+                for key, new_file in zip(keys, new_files)
+                if stored_files[key].photo_url.name != new_file.photo_url.name
+                for name in new_file.get_file_names()
+            ]
+        )
+        return {key: stored_files[key] for key in keys}
+
+    def match_photos(self, photos: list[Photo], files: list[UploadedFile]) -> tuple[list[Photo], list[UploadedFile]]:
+        """
+        사진 수정 시 기존 사진과 새 파일 비교
+        - 사진 순서는 id 순서이므로 새 파일 목록의 앞부분과 같은 내용, 같은 순서인 기존 사진만 유지
+        Args:
+            photos: 기존 사진 (id 순서, stored_file 포함)
+            files: 수정할 사진 파일 목록 (첫번째 파일이 대표 사진)
+        Returns:
+            tuple[list[Photo], list[UploadedFile]]: 유지할 기존 사진, 새로 업로드할 파일
+        """
+        hashes = list(_process_executor.map(self.get_hash, files))
+
+        kept = []
+        remaining = iter(photos)
+        for i, content_hash in enumerate(hashes):
+            photo = next(
+                (photo for photo in remaining if photo.stored_file and photo.stored_file.content_hash == content_hash),
+                None,
+            )
+            if photo is None or photo.stored_file.is_main != (i == 0):
+                break
+            kept.append(photo)
+
+        return kept, files[len(kept) :]
+
+    def get_hash(self, file: UploadedFile) -> str:
+        """원본 파일 SHA-256 해시 (청크 단위로 읽어 큰 파일도 한 번에 메모리에 올리지 않음)"""
+        if file not in self.hashes:
+            digest = hashlib.sha256()
+            for chunk in file.chunks():
+                digest.update(chunk)
+            file.seek(0)
+            self.hashes[file] = digest.hexdigest()
+        return self.hashes[file]
+
+    def store(self, files: list[UploadedFile], is_main: list[bool] = None) -> list[dict[str, str]]:
+        """
+        원본, 변형 이미지 생성 후 업로드 (Photo는 생성하지 않음)
+        - 여러 Photo를 bulk_create 하는 일괄 등록에서 사용 (파일을 공유하지 않는 사진으로 등록)
+        Returns:
+            list[dict[str, str]]: 사진별 {Photo 필드: 저장된 파일 이름}
+        """
+        return self.upload_files(self.prepare_files(files, is_main))
+
+    def prepare_files(self, files: list[UploadedFile], is_main: list[bool] = None) -> list[dict[str, tuple]]:
+        """
+        원본, 변형 이미지 생성 후 업로드할 파일 목록 구성
+        Args:
+            is_main: 파일별 대표 사진 여부 (없으면 첫번째 파일이 대표 사진)
+        Returns:
+            list[dict[str, tuple]]: 사진별 {Photo 필드: (파일 이름, 파일 내용)}
+        """
+        variants_list = list(_process_executor.map(self.create_variants, files))
+        is_main = is_main or [i == 0 for i in range(len(files))]
+
+        upload_files = []
+        for file, variants, main in zip(files, variants_list, is_main):
+            name = Photo._meta.get_field("photo_url").generate_filename(None, create_unique_filename(file.name, is_main=main))
+            stem = name.rsplit(".", 1)[0]
+
+            photo_files = {"photo_url": (name, file)}
+            for variant in IMAGE_VARIANTS:
+                photo_files[variant.field] = (f"{stem}_{variant.suffix}.{variant.extension}", variants[variant.field])
+            upload_files.append(photo_files)
+
+        return upload_files
+
+    def create_variants(self, file: UploadedFile) -> dict[str, ContentFile]:
+        """이미지 검증 후 리사이즈 변형 생성"""
+        image = self.open_image(file)
+
+        # JPEG는 디코딩 단계에서 축소해 메모리, CPU 사용량 감소
+        image.draft("RGB", (IMAGE_VARIANTS[0].max_size, IMAGE_VARIANTS[0].max_size))
+        image = ImageOps.exif_transpose(image)
+        if image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+
+        variants = {}
+        for variant in IMAGE_VARIANTS:
+            image.thumbnail((variant.max_size, variant.max_size), Image.Resampling.LANCZOS)
+
+            buffer = BytesIO()
+            image.save(buffer, format=variant.format, quality=variant.quality, optimize=True)
+            variants[variant.field] = ContentFile(buffer.getvalue())
+
+        file.seek(0)
+        return variants
+
+    @staticmethod
+    def open_image(file: UploadedFile) -> Image.Image:
+        """이미지 형식, 크기 검증"""
+        try:
+            file.seek(0)
+            image = Image.open(file)
+        except (UnidentifiedImageError, Image.DecompressionBombError, OSError) as e:
+            raise ImageProcessingException(detail="업로드한 파일이 이미지가 아니거나 손상된 이미지입니다.") from e
+
+        if image.format not in ALLOWED_IMAGE_FORMATS:
+            raise ImageProcessingException(detail=f"지원하지 않는 이미지 형식입니다: {image.format}")
+
+        if image.width * image.height > MAX_IMAGE_PIXELS:
+            raise ImageProcessingException(detail="이미지 해상도가 너무 큽니다.")
+
+        return image
+
+    def upload_files(self, upload_files: list[dict[str, tuple]]) -> list[dict[str, str]]:
+        """
+        모든 원본, 변형 파일 동시 업로드
+        Returns:
+            list[dict[str, str]]: 사진별 {Photo 필드: 저장된 파일 이름}
+        """
+        futures = [
+            {field: _upload_executor.submit(self.storage.save, name, content) for field, (name, content) in photo_files.items()}
+            for photo_files in upload_files
+        ]
+        wait([future for photo_futures in futures for future in photo_futures.values()])
+
+        uploaded_names = []
+        failed = None
+        for photo_futures in futures:
+            names = {}
+            for field, future in photo_futures.items():
+                if future.exception():
+                    failed = future.exception()
+                else:
+                    names[field] = future.result()
+            uploaded_names.append(names)
+
+        if failed:
+            logger.error(f"사진 업로드 실패: {str(failed)}")
+            self.delete_files([name for names in uploaded_names for name in names.values()])
+            raise S3Exception(detail=f"사진 업로드 중 오류가 발생했습니다: {str(failed)}") from failed
+
+        return uploaded_names
+
+    def delete_files(self, names: list[str]) -> None:
+        """업로드된 파일 삭제 (업로드 실패 시 정리용)"""
+        for name in names:
+            try:
+                self.storage.delete(name)
+            except Exception as e:
+                logger.warning(f"업로드 파일 정리 실패: {name} - {str(e)}")
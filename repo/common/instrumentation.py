@@ -0,0 +1,214 @@
+import logging
+import random
+import re
+import socket
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from django.conf import settings
+from django.db import connections
+from django_redis.client import DefaultClient
+
+logger = logging.getLogger("performance")
+
+METRICS_SAMPLE_RATE = getattr(settings, "METRICS_SAMPLE_RATE", 0.1)  # N+1 분석, 지표 전송 대상 요청 비율
+METRICS_STATSD_HOST = getattr(settings, "METRICS_STATSD_HOST", None)  # 미설정 시 지표 전송 안 함
+METRICS_STATSD_PORT = getattr(settings, "METRICS_STATSD_PORT", 8125)
+METRICS_STATSD_PREFIX = getattr(settings, "METRICS_STATSD_PREFIX", "brewbuds")
+SERVER_TIMING_ENABLED = getattr(settings, "SERVER_TIMING_ENABLED", settings.DEBUG)
+N_PLUS_ONE_THRESHOLD = 5  # 같은 형태의 쿼리가 이 횟수 이상 실행되면 N+1 의심
+
+# 쿼리 형태(fingerprint) 정규화: 리터럴, IN 절 파라미터 개수 차이 무시
+_re_string_literal = re.compile(r"'(?:[^']|'')*'")
+_re_number_literal = re.compile(r"\b\d+\b")
+_re_in_clause = re.compile(r"\bIN\s*\((?:\s*(?:%s|\?)\s*,?)+\)", re.IGNORECASE)
+_re_whitespace = re.compile(r"\s+")
+_re_metric_name = re.compile(r"[^a-zA-Z0-9_]+")
+
+
+def fingerprint_sql(sql: str) -> str:
+    """쿼리 형태 추출 (파라미터 값만 다른 쿼리는 같은 fingerprint)"""
+    sql = _re_string_literal.sub("?", sql)
+    sql = _re_number_literal.sub("?", sql)
+    sql = _re_in_clause.sub("IN (...)", sql)
+    return _re_whitespace.sub(" ", sql).strip()
+
+
+class RequestMetrics:
+    """
+    요청 단위 DB, 캐시 사용 지표
+    - 쿼리 수, DB 시간, 캐시 hit/miss, 캐시 시간은 모든 요청에서 수집 (카운터 증가 수준의 비용)
+    - 쿼리 fingerprint(N+1 탐지)는 샘플링된 요청에서만 수집
+    """
+
+    __slots__ = ("sampled", "query_count", "db_time", "fingerprints", "cache_hits", "cache_misses", "cache_time")
+
+    def __init__(self, sampled: bool = False):
+        self.sampled = sampled
+        self.query_count = 0
+        self.db_time = 0.0
+        self.fingerprints = Counter() if sampled else None
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_time = 0.0
+
+    def duplicate_queries(self, threshold: int = N_PLUS_ONE_THRESHOLD) -> list[tuple[str, int]]:
+        """N+1 의심 쿼리 목록 (fingerprint, 실행 횟수)"""
+        if not self.fingerprints:
+            return []
+        return [(fingerprint, count) for fingerprint, count in self.fingerprints.most_common() if count >= threshold]
+
+    def query_wrapper(self, execute, sql, params, many, context):
+        """connection.execute_wrapper: 쿼리 수, DB 시간, fingerprint 기록"""
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - start
+            self.query_count += 1
+            if self.fingerprints is not None:
+                self.fingerprints[fingerprint_sql(sql)] += 1
+
+    def record_cache(self, duration: float, hits: int = 0, misses: int = 0) -> None:
+        self.cache_time += duration
+        self.cache_hits += hits
+        self.cache_misses += misses
+
+
+# 수집 중인 지표 목록 (테스트의 쿼리 측정처럼 수집 범위가 중첩되면 모든 범위에 기록)
+_active_metrics: ContextVar[tuple[RequestMetrics, ...]] = ContextVar("request_metrics", default=())
+
+
+def get_request_metrics() -> RequestMetrics | None:
+    """현재 요청의 지표 반환 (요청 밖에서는 None)"""
+    active_metrics = _active_metrics.get()
+    return active_metrics[-1] if active_metrics else None
+
+
+def record_cache(duration: float, hits: int = 0, misses: int = 0) -> None:
+    """캐시 조회 지표 기록"""
+    for metrics in _active_metrics.get():
+        metrics.record_cache(duration, hits, misses)
+
+
+@contextmanager
+def collect_request_metrics(sampled: bool = False) -> Iterator[RequestMetrics]:
+    """
+    블록 안에서 실행되는 쿼리, 캐시 지표 수집
+    - DEBUG=False에서도 동작하도록 connection.queries 대신 execute_wrapper 사용
+    """
+    metrics = RequestMetrics(sampled=sampled)
+    token = _active_metrics.set(_active_metrics.get() + (metrics,))
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(metrics.query_wrapper))
+            yield metrics
+    finally:
+        _active_metrics.reset(token)
+
+
+def should_sample() -> bool:
+    return METRICS_SAMPLE_RATE >= 1 or random.random() < METRICS_SAMPLE_RATE
+
+
+def metric_name(value: str) -> str:
+    """StatsD 지표 이름에 사용할 수 없는 문자 치환 (records:feed-list -> records_feed_list)"""
+    return _re_metric_name.sub("_", value).strip("_") or "unknown"
+
+
+class StatsDClient:
+    """
+    StatsD UDP 클라이언트
+    - 전송 실패가 요청 처리에 영향을 주지 않도록 fire-and-forget으로 전송
+    - gunicorn 워커가 여러 개여도 StatsD 에이전트에서 집계되므로 엔드포인트별 히스토그램 유지
+    """
+
+    def __init__(self, host: str, port: int, prefix: str):
+        self.address = (host, port)
+        self.prefix = prefix
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.setblocking(False)
+
+    def send(self, metrics: list[tuple[str, float, str]], sample_rate: float = 1.0) -> None:
+        """
+        지표 일괄 전송
+        Args:
+            metrics: (지표 이름, 값, 유형) 목록. 유형은 ms(timer), c(counter), h(histogram)
+            sample_rate: 샘플링 비율 (StatsD 에이전트에서 카운터 보정)
+        """
+        rate = f"|@{sample_rate}" if sample_rate < 1 else ""
+        payload = "\n".join(f"{self.prefix}.{name}:{value:g}|{metric_type}{rate}" for name, value, metric_type in metrics)
+        try:
+            self.socket.sendto(payload.encode(), self.address)
+        except OSError as e:
+            logger.debug(f"StatsD 전송 실패: {str(e)}")
+
+
+_statsd_client = None
+
+
+def get_statsd_client() -> StatsDClient | None:
+    """프로세스 공용 StatsD 클라이언트 반환 (METRICS_STATSD_HOST 미설정 시 None)"""
+    global _statsd_client
+
+    if _statsd_client is None and METRICS_STATSD_HOST:
+        _statsd_client = StatsDClient(METRICS_STATSD_HOST, METRICS_STATSD_PORT, METRICS_STATSD_PREFIX)
+    return _statsd_client
+
+
+def reset_statsd_client() -> None:
+    """공용 StatsD 클라이언트 초기화 (fork 이후 자식 프로세스에서 소켓 재생성용)"""
+    global _statsd_client
+
+    _statsd_client = None
+
+
+class InstrumentedRedisClient(DefaultClient):
+    """
+    캐시 hit/miss, Redis 시간을 요청 지표에 기록하는 django_redis 클라이언트
+    - CACHES OPTIONS CLIENT_CLASS로 사용
+    """
+
+    def get(self, key, default=None, version=None, client=None):
+        if not _active_metrics.get():
+            return super().get(key, default=default, version=version, client=client)
+
+        start = time.perf_counter()
+        value = super().get(key, default=default, version=version, client=client)
+        hit = value is not default
+        record_cache(time.perf_counter() - start, hits=int(hit), misses=int(not hit))
+        return value
+
+    def get_many(self, keys, version=None, client=None):
+        if not _active_metrics.get():
+            return super().get_many(keys, version=version, client=client)
+
+        keys = list(keys)
+        start = time.perf_counter()
+        values = super().get_many(keys, version=version, client=client)
+        record_cache(time.perf_counter() - start, hits=len(values), misses=len(keys) - len(values))
+        return values
+
+    def set(self, *args, **kwargs):
+        if not _active_metrics.get():
+            return super().set(*args, **kwargs)
+
+        start = time.perf_counter()
+        try:
+            return super().set(*args, **kwargs)
+        finally:
+            record_cache(time.perf_counter() - start)
+
+    def delete(self, *args, **kwargs):
+        if not _active_metrics.get():
+            return super().delete(*args, **kwargs)
+
+        start = time.perf_counter()
+        try:
+            return super().delete(*args, **kwargs)
+        finally:
+            record_cache(time.perf_counter() - start)
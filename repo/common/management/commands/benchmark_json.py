@@ -0,0 +1,83 @@
+import gzip
+import timeit
+from itertools import chain
+
+from django.core.management.base import BaseCommand
+from django_redis.compressors.zlib import ZlibCompressor
+from django_redis.serializers.json import JSONSerializer
+from rest_framework.renderers import JSONRenderer
+
+from repo.common.cache_serializers import FastJSONSerializer
+from repo.common.middleware.compression import BROTLI_QUALITY, brotli
+from repo.common.renderers import FastJSONRenderer, orjson
+from repo.records.serializers import FeedSerializer
+from repo.records.services import get_feed_service
+
+
+class Command(BaseCommand):
+    help = "JSON 렌더링, 캐시 직렬화 성능 비교 (인코딩 시간, Redis 저장 크기, 응답 압축 크기)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--items",
+            default=200,
+            type=int,
+            help="직렬화할 피드 아이템 수 (게시글, 시음기록 각각)",
+        )
+        parser.add_argument(
+            "--repeat",
+            default=5,
+            type=int,
+            help="측정 반복 횟수 (가장 빠른 결과 사용)",
+        )
+
+    def handle(self, *args, **kwargs):
+        items = kwargs["items"]
+        repeat = kwargs["repeat"]
+
+        feed_service = get_feed_service()
+        posts = feed_service.post_service.get_base_record_list_queryset()[:items]
+        tasted_records = feed_service.tasted_record_service.get_base_record_list_queryset()[:items]
+        data = FeedSerializer(list(chain(posts, tasted_records)), many=True).data  # 캐시에 저장되는 피드 데이터와 같은 형태
+        if not data:
+            self.stdout.write(self.style.WARNING("피드 데이터가 없습니다. seed_posts, seed_tasted_records 실행 후 다시 시도해주세요."))
+            return
+
+        if orjson is None:
+            self.stdout.write(self.style.WARNING("orjson이 설치되지 않아 기본 json 모듈로 측정합니다."))
+
+        def measure(func):
+            return min(timeit.repeat(func, number=1, repeat=repeat)) * 1000
+
+        self.stdout.write(f"피드 아이템 {len(data)}개")
+
+        # 응답 렌더링
+        drf_renderer, fast_renderer = JSONRenderer(), FastJSONRenderer()
+        content = fast_renderer.render(data)
+        self.stdout.write("[응답 렌더링]")
+        self.stdout.write(f"  JSONRenderer: {measure(lambda: drf_renderer.render(data)):.2f}ms")
+        self.stdout.write(f"  FastJSONRenderer: {measure(lambda: fast_renderer.render(data)):.2f}ms")
+
+        # 응답 압축
+        self.stdout.write("[응답 압축]")
+        self.stdout.write(f"  원본: {len(content):,} bytes")
+        self.stdout.write(f"  gzip: {len(gzip.compress(content)):,} bytes ({measure(lambda: gzip.compress(content)):.2f}ms)")
+        if brotli:
+            br_time = measure(lambda: brotli.compress(content, quality=BROTLI_QUALITY))
+            self.stdout.write(f"  brotli: {len(brotli.compress(content, quality=BROTLI_QUALITY)):,} bytes ({br_time:.2f}ms)")
+
+        # 캐시 직렬화 (Redis 저장 값)
+        self.stdout.write("[캐시 직렬화]")
+        for name, serializer in (("JSONSerializer", JSONSerializer({})), ("FastJSONSerializer", FastJSONSerializer({}))):
+            self.write_cache_result(name, serializer, data, measure)
+
+    def write_cache_result(self, name, serializer, data, measure):
+        compressor = ZlibCompressor({})
+        value = serializer.dumps(data)
+        compressed = compressor.compress(value)
+
+        dumps_time = measure(lambda: serializer.dumps(data))
+        loads_time = measure(lambda: serializer.loads(value))
+        zlib_time = measure(lambda: compressor.compress(serializer.dumps(data)))
+        self.stdout.write(f"  {name}: dumps {dumps_time:.2f}ms, loads {loads_time:.2f}ms, {len(value):,} bytes")
+        self.stdout.write(f"  {name} + zlib: dumps {zlib_time:.2f}ms, {len(compressed):,} bytes")
@@ -0,0 +1,94 @@
+import json
+import random
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from repo.common.benchmark_data import (
+    BENCHMARK_EMAIL_DOMAIN,
+    SCALES,
+    BenchmarkDataGenerator,
+)
+from repo.profiles.models import CustomUser
+
+
+class Command(BaseCommand):
+    help = "벤치마크용 대용량 합성 데이터 생성 (멱법칙 팔로워, 좋아요, 댓글 분포)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scale",
+            default="10k",
+            choices=SCALES.keys(),
+            help="생성 규모 (생성 행 수 기준)",
+        )
+        parser.add_argument(
+            "--users",
+            type=int,
+            help="생성할 사용자 수 (지정 시 --scale 무시)",
+        )
+        parser.add_argument(
+            "--seed",
+            default=42,
+            type=int,
+            help="난수 시드 (같은 시드는 같은 데이터 생성)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            default=1000,
+            type=int,
+            help="bulk_create 배치 크기",
+        )
+        parser.add_argument(
+            "--clear",
+            action="store_true",
+            help="이전에 생성한 벤치마크 데이터 삭제 후 생성",
+        )
+        parser.add_argument(
+            "--fixture-file",
+            default="benchmark_fixture.json",
+            help="벤치마크 대상 id, 토큰을 저장할 파일 (run_benchmark, locust에서 사용)",
+        )
+        parser.add_argument(
+            "--token-users",
+            default=20,
+            type=int,
+            help="fixture 파일에 액세스 토큰을 저장할 사용자 수",
+        )
+
+    def handle(self, *args, **kwargs):
+        users = kwargs["users"] or SCALES[kwargs["scale"]]
+        if users < 2:
+            raise CommandError("사용자는 2명 이상이어야 합니다.")
+
+        if kwargs["clear"]:
+            self.stdout.write("기존 벤치마크 데이터 삭제 중...")
+            BenchmarkDataGenerator.clear()
+        elif CustomUser.objects.filter(email__endswith=f"@{BENCHMARK_EMAIL_DOMAIN}").exists():
+            raise CommandError("이미 벤치마크 데이터가 있습니다. --clear 옵션으로 삭제 후 다시 생성해주세요.")
+
+        start = time.perf_counter()
+        generator = BenchmarkDataGenerator(users, seed=kwargs["seed"], batch_size=kwargs["batch_size"], log=self.stdout.write)
+        counts = generator.generate()
+        elapsed = time.perf_counter() - start
+        self.stdout.write(self.style.SUCCESS(f"총 {sum(counts.values()):,}행 생성 완료 ({elapsed:.1f}초)"))
+
+        fixture = self.build_fixture(generator, counts, kwargs["seed"], kwargs["token_users"])
+        with open(kwargs["fixture_file"], "w", encoding="utf-8") as f:
+            json.dump(fixture, f, ensure_ascii=False)
+        self.stdout.write(f"fixture 저장: {kwargs['fixture_file']}")
+
+    def build_fixture(self, generator: BenchmarkDataGenerator, counts: dict, seed: int, token_users: int) -> dict:
+        """벤치마크 요청에 사용할 id 목록, 요청 사용자 액세스 토큰"""
+        rng = random.Random(seed)
+        users = CustomUser.objects.filter(id__in=rng.sample(generator.user_ids, min(token_users, len(generator.user_ids))))
+        return {
+            "seed": seed,
+            "dataset": {"users": len(generator.user_ids), "rows": sum(counts.values()), "counts": counts},
+            "tokens": [str(RefreshToken.for_user(user).access_token) for user in users],
+            "user_ids": generator.user_ids,
+            "post_ids": generator.post_ids,
+            "tasted_record_ids": generator.tasted_record_ids,
+            "bean_ids": generator.bean_ids,
+        }
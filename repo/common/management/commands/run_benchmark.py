@@ -0,0 +1,155 @@
+import json
+import random
+import time
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections, connection
+from django.test import Client
+
+from repo.common.benchmark import (
+    SCENARIOS,
+    build_path,
+    build_report,
+    compare_reports,
+    load_report,
+    save_report,
+    summarize,
+)
+from repo.common.db_pool import get_connection_stats
+from repo.common.instrumentation import collect_request_metrics
+
+COMPARE_METRICS = ("p50_ms", "p95_ms", "p99_ms", "queries_mean")
+
+
+class Command(BaseCommand):
+    help = "벤치마크 시나리오(피드, 검색, 프로필, 댓글, 좋아요, 추천) 응답 시간, 쿼리 수 측정 후 JSON 리포트 저장"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--fixture-file",
+            default="benchmark_fixture.json",
+            help="generate_benchmark_data로 생성한 fixture 파일",
+        )
+        parser.add_argument(
+            "--requests",
+            default=50,
+            type=int,
+            help="시나리오별 측정 요청 수",
+        )
+        parser.add_argument(
+            "--warmup",
+            default=3,
+            type=int,
+            help="시나리오별 측정 전 워밍업 요청 수",
+        )
+        parser.add_argument(
+            "--seed",
+            default=42,
+            type=int,
+            help="요청 대상 선택 난수 시드",
+        )
+        parser.add_argument(
+            "--scenario",
+            action="append",
+            help="측정할 시나리오 이름 (여러 번 지정 가능, 미지정 시 전체)",
+        )
+        parser.add_argument(
+            "--cold-cache",
+            action="store_true",
+            help="요청마다 캐시 초기화 (캐시 미스 기준 측정)",
+        )
+        parser.add_argument(
+            "--close-connections",
+            action="store_true",
+            help="요청이 끝날 때마다 실제 서버처럼 DB 연결 정리 (CONN_MAX_AGE, 커넥션 풀 설정 비교용)",
+        )
+        parser.add_argument(
+            "--output",
+            default="benchmark_report.json",
+            help="리포트 저장 경로",
+        )
+        parser.add_argument(
+            "--compare",
+            help="비교할 기준 리포트 경로 (이전 커밋 리포트)",
+        )
+
+    def handle(self, *args, **kwargs):
+        try:
+            with open(kwargs["fixture_file"], encoding="utf-8") as f:
+                fixture = json.load(f)
+        except FileNotFoundError as exc:
+            raise CommandError(
+                f"fixture 파일이 없습니다. generate_benchmark_data 실행 후 다시 시도해주세요: {kwargs['fixture_file']}"
+            ) from exc
+
+        scenarios = [scenario for scenario in SCENARIOS if not kwargs["scenario"] or scenario.name in kwargs["scenario"]]
+        if not scenarios:
+            raise CommandError(f"시나리오가 없습니다. 사용 가능한 시나리오: {', '.join(scenario.name for scenario in SCENARIOS)}")
+
+        rng = random.Random(kwargs["seed"])
+        host = next((host for host in settings.ALLOWED_HOSTS if host != "*" and not host.startswith(".")), "localhost")
+        client = Client(HTTP_HOST=host)
+
+        results = {}
+        for scenario in scenarios:
+            results[scenario.name] = self.run_scenario(client, scenario, fixture, rng, kwargs)
+            result = results[scenario.name]
+            self.stdout.write(
+                f"{scenario.name:<24} p50 {result['p50_ms']:>8.2f}ms  p95 {result['p95_ms']:>8.2f}ms  p99 {result['p99_ms']:>8.2f}ms  "
+                f"queries {result['queries_mean']:>5.1f}  errors {result['errors']}"
+            )
+
+        options = {key: kwargs[key] for key in ("requests", "warmup", "seed", "cold_cache", "close_connections")}
+        options.update(db_pool_enabled=settings.DB_POOL_ENABLED, conn_max_age=settings.DATABASES["default"].get("CONN_MAX_AGE", 0))
+        report = build_report(results, fixture.get("dataset", {}), options)
+        report["connections"] = get_connection_stats()["databases"]
+        save_report(report, kwargs["output"])
+        self.stdout.write(self.style.SUCCESS(f"리포트 저장: {kwargs['output']}"))
+
+        if kwargs["compare"]:
+            self.write_comparison(load_report(kwargs["compare"]), report)
+
+    def run_scenario(self, client: Client, scenario, fixture: dict, rng: random.Random, kwargs: dict) -> dict:
+        durations, query_counts, errors = [], [], 0
+        for i in range(kwargs["warmup"] + kwargs["requests"]):
+            headers = {}
+            if scenario.auth and fixture["tokens"]:
+                headers["HTTP_AUTHORIZATION"] = f"Bearer {rng.choice(fixture['tokens'])}"
+            path = build_path(scenario, fixture, rng)
+            if kwargs["cold_cache"]:
+                cache.clear()
+
+            with collect_request_metrics() as metrics:
+                start = time.perf_counter()
+                response = client.generic(scenario.method, path, **self.build_request_data(scenario), **headers)
+                duration = (time.perf_counter() - start) * 1000
+            if kwargs["close_connections"] and not connection.in_atomic_block:
+                # 테스트 클라이언트는 요청 종료 시 연결을 정리하지 않으므로 request_finished 동작을 직접 수행
+                # (트랜잭션 안에서 연결을 닫으면 이후 쿼리가 실패하므로 건너뜀)
+                close_old_connections()
+
+            if i < kwargs["warmup"]:
+                continue
+            durations.append(duration)
+            query_counts.append(metrics.query_count)
+            errors += response.status_code >= 500
+        return summarize(durations, query_counts, errors)
+
+    @staticmethod
+    def build_request_data(scenario) -> dict:
+        if not scenario.params:
+            return {}
+        if scenario.method == "GET":
+            return {"QUERY_STRING": urlencode(scenario.params)}
+        return {"data": json.dumps(scenario.params), "content_type": "application/json"}
+
+    def write_comparison(self, base: dict, current: dict) -> None:
+        self.stdout.write(f"[비교] {base.get('commit')} -> {current.get('commit')}")
+        for row in compare_reports(base, current, COMPARE_METRICS):
+            changes = []
+            for metric, (before, after, change) in ((key, value) for key, value in row.items() if key != "name"):
+                changes.append(f"{metric} {before} -> {after}" + (f" ({change:+.1f}%)" if change is not None else ""))
+            self.stdout.write(f"  {row['name']:<24} " + ", ".join(changes))
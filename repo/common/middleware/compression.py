@@ -0,0 +1,51 @@
+from django.conf import settings
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+from django.utils.regex_helper import _lazy_re_compile
+
+try:
+    import brotli
+except ImportError:  # brotli 미설치 환경은 gzip만 사용
+    brotli = None
+
+re_accepts_brotli = _lazy_re_compile(r"\bbr\b")
+
+COMPRESSION_MIN_LENGTH = getattr(settings, "COMPRESSION_MIN_LENGTH", 1024)  # 작은 응답은 압축 이득보다 CPU 비용이 큼
+BROTLI_QUALITY = getattr(settings, "BROTLI_QUALITY", 5)  # 동적 응답 기준 압축률, 속도 균형 (최대 11)
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """
+    응답 압축 미들웨어
+    - Accept-Encoding 협상: brotli 지원 클라이언트는 br, 그 외는 gzip
+    - 피드, 목록 등 COMPRESSION_MIN_LENGTH 이상 응답만 압축
+    - 스트리밍 응답은 GZipMiddleware와 같이 gzip으로 압축
+    """
+
+    def process_response(self, request, response):
+        if not response.streaming and len(response.content) < COMPRESSION_MIN_LENGTH:
+            return response
+
+        if response.has_header("Content-Encoding"):
+            return response
+
+        ae = request.META.get("HTTP_ACCEPT_ENCODING", "")
+        if brotli is None or response.streaming or not re_accepts_brotli.search(ae):
+            return super().process_response(request, response)
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+
+        # 압축 결과가 더 짧을 때만 적용
+        compressed_content = brotli.compress(response.content, quality=BROTLI_QUALITY)
+        if len(compressed_content) >= len(response.content):
+            return response
+        response.content = compressed_content
+        response.headers["Content-Length"] = str(len(response.content))
+
+        # 강한 ETag는 인코딩이 달라지면 유지할 수 없으므로 약한 ETag로 변경 (RFC 9110 8.8.1)
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = "br"
+
+        return response
@@ -1,7 +1,16 @@
 import logging
+import re
 import time
 
-from django.db import connection
+from repo.common.db_pool import get_connection_stats
+from repo.common.instrumentation import (
+    METRICS_SAMPLE_RATE,
+    SERVER_TIMING_ENABLED,
+    collect_request_metrics,
+    get_statsd_client,
+    metric_name,
+    should_sample,
+)
 
 logger = logging.getLogger("performance")
 
@@ -33,38 +42,114 @@ LEGITIMATE_BOT_PATHS = [
 SUSPICIOUS_PATHS = ATTACK_PATHS + LEGITIMATE_BOT_PATHS
 
 # PHP 파일 확장자
-SUSPICIOUS_EXTENSIONS = [".php", ".asp", ".aspx", ".jsp"]
+SUSPICIOUS_EXTENSIONS = (".php", ".asp", ".aspx", ".jsp")
+
+# 모든 경로를 한 번에 검사하도록 정규식 하나로 컴파일 (요청마다 목록 순회 방지)
+SUSPICIOUS_PATH_PATTERN = re.compile("|".join(re.escape(path) for path in SUSPICIOUS_PATHS))
+
+
+def is_suspicious_request(path: str) -> bool:
+    """공격 시도, 봇 요청 경로 여부"""
+    return path.endswith(SUSPICIOUS_EXTENSIONS) or SUSPICIOUS_PATH_PATTERN.search(path) is not None
 
 
 class PerformanceMiddleware:
+    """
+    요청 성능 로깅 및 지표 수집
+    - 모든 요청의 처리 시간, 쿼리 수, DB 시간, 캐시 hit/miss 로깅
+    - 샘플링된 요청은 N+1 의심 쿼리 탐지 및 엔드포인트별 지표를 StatsD로 전송
+    - SERVER_TIMING_ENABLED 설정 시 Server-Timing 헤더 추가
+    """
+
     def __init__(self, get_response):
         self.get_response = get_response
 
     def __call__(self, request):
-        start_time = time.time()
+        start_time = time.perf_counter()
 
-        response = self.get_response(request)
+        with collect_request_metrics(sampled=should_sample()) as metrics:
+            response = self.get_response(request)
 
-        duration = time.time() - start_time
-
-        # 의심스러운 경로 체크
-        is_suspicious = any(request.path.startswith(path) or path in request.path for path in SUSPICIOUS_PATHS)
-
-        # 의심스러운 확장자 체크
-        has_suspicious_ext = any(request.path.endswith(ext) for ext in SUSPICIOUS_EXTENSIONS)
+        duration = time.perf_counter() - start_time
 
         # 404 응답이면서 의심스러운 경로/확장자는 로깅 제외
-        should_skip_log = response.status_code == 404 and (is_suspicious or has_suspicious_ext)
-
-        if not should_skip_log:
-            log_message = (
-                f"[Performance] "
-                f"Method: {request.method} | "
-                f"Path: {request.path} | "
-                f"Duration: {duration:.4f}s | "
-                f"DB Queries: {len(connection.queries)} | "
-                f"Status: {response.status_code}"
+        if response.status_code == 404 and is_suspicious_request(request.path):
+            return response
+
+        endpoint = self.get_endpoint(request)
+        logger.info(
+            f"[Performance] "
+            f"Method: {request.method} | "
+            f"Path: {request.path} | "
+            f"Duration: {duration:.4f}s | "
+            f"DB Queries: {metrics.query_count} | "
+            f"DB Time: {metrics.db_time:.4f}s | "
+            f"Cache: {metrics.cache_hits} hit, {metrics.cache_misses} miss | "
+            f"Status: {response.status_code}"
+        )
+
+        if metrics.sampled:
+            duplicate_queries = metrics.duplicate_queries()
+            for fingerprint, count in duplicate_queries:
+                logger.warning(f"[N+1] {request.method} {endpoint} | {count}회 실행 | {fingerprint}")
+            self.send_metrics(request, response, endpoint, duration, metrics, len(duplicate_queries))
+            self.send_connection_metrics()
+
+        if SERVER_TIMING_ENABLED:
+            response["Server-Timing"] = (
+                f'db;dur={metrics.db_time * 1000:.1f};desc="{metrics.query_count} queries", '
+                f'cache;dur={metrics.cache_time * 1000:.1f};desc="{metrics.cache_hits} hit {metrics.cache_misses} miss", '
+                f"total;dur={duration * 1000:.1f}"
             )
-            logger.info(log_message)
 
         return response
+
+    @staticmethod
+    def get_endpoint(request) -> str:
+        """URL 패턴 기준 엔드포인트 이름 (경로 파라미터 값과 무관하게 집계)"""
+        resolver_match = getattr(request, "resolver_match", None)
+        if resolver_match is None:
+            return "unmatched"
+        return resolver_match.view_name or resolver_match.route
+
+    @staticmethod
+    def send_metrics(request, response, endpoint, duration, metrics, duplicate_query_count) -> None:
+        """엔드포인트별 응답 시간, 쿼리 수, DB 시간, 캐시 지표 전송"""
+        statsd = get_statsd_client()
+        if statsd is None:
+            return
+
+        name = f"request.{metric_name(endpoint)}.{request.method.lower()}"
+        statsd.send(
+            [
+                (f"{name}.duration", duration * 1000, "ms"),
+                (f"{name}.db_time", metrics.db_time * 1000, "ms"),
+                (f"{name}.db_queries", metrics.query_count, "h"),
+                (f"{name}.cache_time", metrics.cache_time * 1000, "ms"),
+                (f"{name}.cache_hit", metrics.cache_hits, "c"),
+                (f"{name}.cache_miss", metrics.cache_misses, "c"),
+                (f"{name}.n_plus_one", duplicate_query_count, "c"),
+                (f"{name}.status_{response.status_code // 100}xx", 1, "c"),
+            ],
+            sample_rate=METRICS_SAMPLE_RATE,
+        )
+
+    @staticmethod
+    def send_connection_metrics() -> None:
+        """
+        프로세스별 커넥션 풀 사용량 전송 (샘플링된 요청 시점 기준)
+        - 여러 워커 프로세스 값이 섞이므로 gauge 대신 histogram으로 전송
+        """
+        statsd = get_statsd_client()
+        if statsd is None:
+            return
+
+        metrics = []
+        for alias, stats in get_connection_stats()["databases"].items():
+            pool = stats["pool"]
+            if pool is None:
+                continue
+            name = f"db.{metric_name(alias)}.pool"
+            metrics += [(f"{name}.in_use", pool["in_use"], "h"), (f"{name}.idle", pool["idle"], "h"), (f"{name}.size", pool["size"], "h")]
+        if metrics:
+            statsd.send(metrics)
@@ -0,0 +1,22 @@
+from rest_framework.permissions import SAFE_METHODS
+
+from repo.common.db_router import pin_primary
+
+
+class PrimaryStickyMiddleware:
+    """
+    쓰기 요청에 성공한 사용자의 이후 읽기를 일정 시간 primary DB로 고정 (repo.common.db_router)
+    - JWT 인증은 DRF 뷰에서 처리되므로 응답 이후 request.user로 판단
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            user = getattr(request, "user", None)
+            if user is not None and user.is_authenticated:
+                pin_primary(user.id)
+        return response
@@ -0,0 +1,18 @@
+from repo.common.utils import reset_request_now, set_request_now
+
+
+class RequestTimeMiddleware:
+    """
+    요청 단위 현재 시간 고정
+    - 응답 직렬화 시 상대 시간(n분 전) 계산에 같은 기준 시간을 사용하도록 요청 시작 시간을 한 번만 계산
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = set_request_now()
+        try:
+            return self.get_response(request)
+        finally:
+            reset_request_now(token)
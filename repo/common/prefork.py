@@ -0,0 +1,39 @@
+"""
+prefork 서버(gunicorn preload_app, celery prefork 워커) 프로세스 관리
+- 부모 프로세스에서 앱을 미리 로드하면 모듈 전역 클라이언트와 소켓이 자식 프로세스에 그대로 복사됨
+- fork 직전 부모는 연결을 닫고(close_connections), fork 이후 자식은 복사된 클라이언트를 버림(reset_clients)
+  (자식에서 복사된 연결을 닫으면 같은 소켓을 쓰는 부모의 세션도 끊기므로 닫지 않고 버림)
+"""
+
+from django.core.cache import caches
+from django.db import connections
+
+from repo.common.db_pool import close_pools, reset_pools
+from repo.common.instrumentation import reset_statsd_client
+from repo.common.storage import reset_s3_client
+
+
+def close_connections() -> None:
+    """부모 프로세스의 DB 연결, 커넥션 풀 유휴 연결 종료"""
+    connections.close_all()
+    close_pools()
+
+
+def reset_redis_pools() -> None:
+    """생성된 django_redis 클라이언트의 커넥션 풀 초기화"""
+    for cache in caches.all(initialized_only=True):
+        client = getattr(cache, "_client", None)  # django_redis 캐시만 해당
+        for redis_client in getattr(client, "_clients", None) or []:
+            if redis_client is not None:
+                redis_client.connection_pool.reset()
+
+
+def reset_clients() -> None:
+    """자식 프로세스에서 DB 풀, Redis, FCM, S3, StatsD 클라이언트 초기화 (다음 사용 시 새로 생성)"""
+    from repo.notifications.services import FCMService
+
+    reset_pools()
+    reset_redis_pools()
+    FCMService.reset()
+    reset_s3_client()
+    reset_statsd_client()
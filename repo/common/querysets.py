@@ -0,0 +1,224 @@
+import binascii
+import json
+import random
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from typing import NamedTuple
+
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import connections, router
+from django.db.models import Q, QuerySet
+
+
+class MergedQuerySet:
+    """
+    여러 모델의 쿼리셋을 하나의 정렬 기준으로 합친 지연 평가 목록 (피드의 게시글 + 시음기록)
+    - 페이지네이터가 요구하는 count(), 슬라이싱만 지원
+    - 슬라이싱 시 각 쿼리셋에서 정렬 키(order_field, id)만 필요한 만큼 조회해 병합한 뒤,
+      현재 페이지에 해당하는 객체만 id로 다시 조회 (select_related, prefetch_related는 페이지 항목에만 적용)
+    - 정렬 값이 같으면 querysets 순서, id 역순 (최신순 기준)
+    """
+
+    ordered = True  # Paginator 정렬 경고 방지
+
+    def __init__(self, querysets: list[QuerySet], order_field: str = "created_at"):
+        self.querysets = querysets
+        self.order_field = order_field
+        self._count = None
+
+    def count(self) -> int:
+        if self._count is None:
+            self._count = sum(queryset.count() for queryset in self.querysets)
+        return self._count
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def __getitem__(self, index):
+        if isinstance(index, int):
+            return self[index : index + 1][0]
+
+        start, stop, step = index.indices(self.count())
+        if step != 1:
+            raise ValueError("step은 지원하지 않습니다.")
+        if start >= stop:
+            return []
+
+        # 1. 각 쿼리셋의 상위 stop개 정렬 키만 조회해 병합
+        keys = []
+        for position, queryset in enumerate(self.querysets):
+            rows = queryset.order_by(f"-{self.order_field}", "-id").values_list(self.order_field, "id")[:stop]
+            keys += [(value, -position, pk, position) for value, pk in rows]
+        keys.sort(reverse=True)
+        page_keys = keys[start:stop]
+
+        # 2. 현재 페이지 항목만 쿼리셋별로 조회
+        objects = {}
+        for position, queryset in enumerate(self.querysets):
+            ids = [pk for _, _, pk, key_position in page_keys if key_position == position]
+            if ids:
+                objects.update({(position, obj.id): obj for obj in queryset.filter(id__in=ids)})
+        return [objects[(position, pk)] for _, _, pk, position in page_keys if (position, pk) in objects]
+
+    def __iter__(self):
+        return iter(self[:])
+
+
+class SampledQuerySet:
+    """
+    여러 모델의 쿼리셋을 시드 기준 랜덤 순서로 섞은 지연 평가 목록 (새로고침 피드)
+    - 처음 조회 시 각 쿼리셋의 id만 조회해 (쿼리셋 위치, id) 목록을 시드로 섞은 뒤 캐시 (세션별 id 풀)
+    - 슬라이싱 시 풀에서 현재 페이지의 k개 id만 꺼내 해당 객체만 조회
+    - 같은 시드의 페이지는 항상 같은 순서이므로 페이지를 넘겨도 항목이 겹치거나 빠지지 않음
+    """
+
+    ordered = True  # Paginator 정렬 경고 방지
+
+    def __init__(self, querysets: list[QuerySet], seed: int, cache_key: str, timeout: int):
+        self.querysets = querysets
+        self.seed = seed
+        self.cache_key = cache_key
+        self.timeout = timeout
+        self._pool = None
+
+    def get_pool(self) -> list[list[int]]:
+        """시드로 섞은 [쿼리셋 위치, id] 목록 (캐시가 만료되면 같은 시드로 다시 생성)"""
+        if self._pool is None:
+            pool = cache.get(self.cache_key)
+            if pool is None:
+                pool = [
+                    [position, pk]
+                    for position, queryset in enumerate(self.querysets)
+                    for pk in queryset.order_by("id").values_list("id", flat=True)
+                ]
+                random.Random(self.seed).shuffle(pool)
+                cache.set(self.cache_key, pool, timeout=self.timeout)
+            self._pool = pool
+        return self._pool
+
+    def count(self) -> int:
+        return len(self.get_pool())
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def __getitem__(self, index):
+        if isinstance(index, int):
+            return self[index : index + 1][0]
+
+        page_keys = self.get_pool()[index]
+        objects = {}
+        for position, queryset in enumerate(self.querysets):
+            ids = [pk for key_position, pk in page_keys if key_position == position]
+            if ids:
+                objects.update({(position, obj.id): obj for obj in queryset.filter(id__in=ids)})
+        return [objects[(position, pk)] for position, pk in page_keys if (position, pk) in objects]  # 풀 생성 이후 삭제된 항목 제외
+
+    def __iter__(self):
+        return iter(self[:])
+
+
+class KeysetPage(NamedTuple):
+    items: list
+    next_cursor: str | None  # 다음 페이지 조회 시 사용할 마지막 항목의 (정렬 값, id), 마지막 페이지면 None
+
+
+def encode_cursor(value, pk: int) -> str:
+    """정렬 값과 id를 URL에 사용할 수 있는 커서 문자열로 변환"""
+    return urlsafe_b64encode(json.dumps([value, pk], default=str).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple:
+    """
+    커서 문자열을 (정렬 값, id)로 변환
+    Raises:
+        ValueError: 형식이 잘못된 커서
+    """
+    try:
+        value, pk = json.loads(urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (TypeError, ValueError, binascii.Error) as e:
+        raise ValueError("invalid cursor") from e
+    if not isinstance(pk, int):
+        raise ValueError("invalid cursor")
+    return value, pk
+
+
+def get_keyset_queryset(queryset: QuerySet, field: str, cursor: str | None) -> QuerySet:
+    """
+    field 내림차순, 같은 값은 id 내림차순으로 cursor 다음 항목부터 조회하는 쿼리셋
+    - (조건 컬럼, field, id) 인덱스가 있으면 offset 없이 인덱스 범위 조회
+    Raises:
+        ValueError: 형식이 잘못된 커서
+    """
+    if cursor:
+        value, pk = decode_cursor(cursor)
+        if field == "id":
+            queryset = queryset.filter(id__lt=pk)
+        else:
+            try:
+                value = queryset.model._meta.get_field(field).to_python(value)
+            except ValidationError as e:
+                raise ValueError("invalid cursor") from e
+            queryset = queryset.filter(Q(**{f"{field}__lt": value}) | Q(**{field: value, "id__lt": pk}))
+
+    ordering = ["-id"] if field == "id" else [f"-{field}", "-id"]
+    return queryset.order_by(*ordering)
+
+
+def paginate_keyset(queryset: QuerySet, field: str, cursor: str | None, size: int) -> KeysetPage:
+    """
+    keyset 페이지네이션 (다음 페이지 존재 여부 확인을 위해 size + 1개 조회)
+    Raises:
+        ValueError: 형식이 잘못된 커서
+    """
+    items = list(get_keyset_queryset(queryset, field, cursor)[: size + 1])
+
+    next_cursor = None
+    if len(items) > size:
+        items = items[:size]
+        next_cursor = encode_cursor(getattr(items[-1], field), items[-1].id)
+    return KeysetPage(items=items, next_cursor=next_cursor)
+
+
+def encode_watermark(positions: dict[str, list], issued_at: datetime) -> str:
+    """종류별 마지막 위치 {종류: [시각, id]}와 발급 시각을 URL에 사용할 수 있는 워터마크 문자열로 변환"""
+    data = {"issued_at": issued_at, "positions": positions}
+    return urlsafe_b64encode(json.dumps(data, default=str).encode()).decode().rstrip("=")
+
+
+def decode_watermark(watermark: str) -> tuple[dict[str, list], datetime]:
+    """
+    워터마크 문자열을 (종류별 마지막 위치 {종류: [시각, id]}, 발급 시각)으로 변환
+    Raises:
+        ValueError: 형식이 잘못된 워터마크
+    """
+    try:
+        data = json.loads(urlsafe_b64decode(watermark + "=" * (-len(watermark) % 4)))
+        positions = {source: [datetime.fromisoformat(value), int(pk)] for source, (value, pk) in data["positions"].items()}
+        return positions, datetime.fromisoformat(data["issued_at"])
+    except (TypeError, ValueError, KeyError, AttributeError, binascii.Error) as e:
+        raise ValueError("invalid watermark") from e
+
+
+def bulk_create_with_pk(model, objs: list, key_field: str | None = None, batch_size: int | None = None) -> list:
+    """
+    PK가 채워진 객체 일괄 생성
+    - INSERT ... RETURNING을 지원하는 DB(SQLite, PostgreSQL, MariaDB 10.5+)는 batch_size 단위 INSERT로 생성
+    - 지원하지 않는 DB(MySQL)는 bulk_create가 PK를 채우지 않으므로
+      key_field(행별 고유 값 필드)가 있으면 일괄 생성 후 한 번에 다시 조회해 PK 설정, 없으면 한 건씩 생성 (소량만 사용)
+    """
+    if connections[router.db_for_write(model)].features.can_return_rows_from_bulk_insert:
+        return model.objects.bulk_create(objs, batch_size=batch_size)
+
+    if key_field is None:
+        for obj in objs:
+            obj.save(force_insert=True)
+        return objs
+
+    model.objects.bulk_create(objs, batch_size=batch_size)
+    keys = [getattr(obj, key_field) for obj in objs]
+    created = dict(model.objects.filter(**{f"{key_field}__in": keys}).values_list(key_field, "pk"))
+    for obj, key in zip(objs, keys):
+        obj.pk = created[key]
+    return objs
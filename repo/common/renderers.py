@@ -0,0 +1,31 @@
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 환경은 DRF 기본 JSONRenderer로 동작
+    orjson = None
+
+# DRF 직렬화 결과(OrderedDict, ReturnList 등)는 orjson이 직접 처리하고
+# datetime, Decimal, 지연 번역 문자열 등은 DRF 인코더로 변환해 기존 응답과 같은 형식 유지
+ORJSON_OPTIONS = (orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    orjson 기반 JSON 렌더러
+    - 응답 형식은 DRF JSONRenderer(compact, UTF-8)와 동일
+    - 들여쓰기 요청(Browsable API 등) 또는 orjson 미설치 시 DRF JSONRenderer 사용
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(data, default=self.encoder_class().default, option=ORJSON_OPTIONS)
+
+        # DRF와 동일하게 U+2028, U+2029를 이스케이프 (JSONP, <script> 내 삽입 시 안전)
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
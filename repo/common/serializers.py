@@ -31,9 +31,14 @@ class PhotoField(serializers.ImageField):
 
 
 class PhotoSerializer(serializers.ModelSerializer):
+    thumbnail_url = serializers.SerializerMethodField()
+
+    def get_thumbnail_url(self, obj):
+        return obj.get_thumbnail_url()
+
     class Meta:
         model = Photo
-        fields = ["photo_url"]
+        fields = ["photo_url", "thumbnail_url"]
 
 
 class PhotoDetailSerializer(PhotoSerializer):
@@ -44,7 +49,7 @@ class PhotoDetailSerializer(PhotoSerializer):
 
     class Meta:
         model = Photo
-        fields = ["id", "photo_url", "is_representative"]
+        fields = ["id", "photo_url", "thumbnail_url", "is_representative"]
 
 
 class PhotoUploadSerializer(serializers.Serializer):
@@ -0,0 +1,117 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+import boto3
+from botocore.config import Config
+from django.conf import settings
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+AWS_S3_ACCESS_KEY_ID = getattr(settings, "AWS_S3_ACCESS_KEY_ID", None)
+AWS_S3_SECRET_ACCESS_KEY = getattr(settings, "AWS_S3_SECRET_ACCESS_KEY", None)
+AWS_S3_REGION_NAME = getattr(settings, "AWS_S3_REGION_NAME", None)
+AWS_S3_ENDPOINT_URL = getattr(settings, "AWS_S3_ENDPOINT_URL", None)  # minio 등 로컬 S3 사용 시 설정
+AWS_S3_MAX_POOL_CONNECTIONS = getattr(settings, "AWS_S3_MAX_POOL_CONNECTIONS", 32)
+AWS_STORAGE_BUCKET_NAME = getattr(settings, "AWS_STORAGE_BUCKET_NAME", None)
+
+S3_DELETE_BATCH_SIZE = 1000  # delete_objects 한 번에 요청 가능한 최대 키 개수
+S3_DELETE_WORKERS = getattr(settings, "S3_DELETE_WORKERS", 2)
+
+_s3_client = None
+_s3_client_lock = threading.Lock()
+
+
+def get_s3_client():
+    """
+    프로세스 공용 S3 클라이언트 반환
+    - boto3 클라이언트는 thread-safe 하므로 프로세스 당 하나만 생성해 자격 증명 조회, TLS 연결 비용을 재사용
+    - 동시 업로드 수에 맞춰 커넥션 풀 크기 설정
+    """
+    global _s3_client
+
+    if _s3_client is None:
+        with _s3_client_lock:
+            if _s3_client is None:
+                config = Config(
+                    max_pool_connections=AWS_S3_MAX_POOL_CONNECTIONS,
+                    retries={"max_attempts": 3, "mode": "standard"},
+                    tcp_keepalive=True,
+                )
+                _s3_client = boto3.session.Session().client(
+                    "s3",
+                    aws_access_key_id=AWS_S3_ACCESS_KEY_ID,
+                    aws_secret_access_key=AWS_S3_SECRET_ACCESS_KEY,
+                    region_name=AWS_S3_REGION_NAME,
+                    endpoint_url=AWS_S3_ENDPOINT_URL,
+                    config=config,
+                )
+    return _s3_client
+
+
+def reset_s3_client() -> None:
+    """공용 S3 클라이언트 초기화 (fork 이후 자식 프로세스에서 커넥션 재생성용)"""
+    global _s3_client
+
+    with _s3_client_lock:
+        _s3_client = None
+
+
+def delete_objects(keys: list[str], bucket: str = None) -> list[str]:
+    """
+    S3 객체 일괄 삭제 (1000개 단위 배치)
+    Args:
+        keys: 삭제할 S3 객체 키 목록
+        bucket: 버킷 이름 (기본값: AWS_STORAGE_BUCKET_NAME)
+    Returns:
+        list[str]: 삭제에 실패한 객체 키 목록
+    """
+    s3 = get_s3_client()
+    bucket = bucket or AWS_STORAGE_BUCKET_NAME
+    keys = list(dict.fromkeys(keys))  # 중복 키 제거 (순서 유지)
+
+    failed_keys = []
+    for i in range(0, len(keys), S3_DELETE_BATCH_SIZE):
+        batch = keys[i : i + S3_DELETE_BATCH_SIZE]
+        try:
+            response = s3.delete_objects(
+                Bucket=bucket,
+                Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},  # Quiet 모드는 실패한 객체만 응답
+            )
+            failed_keys.extend(error["Key"] for error in response.get("Errors", []))
+        except Exception as e:
+            logger.error(f"S3 일괄 삭제 실패: {len(batch)}개 - {str(e)}", exc_info=True)
+            failed_keys.extend(batch)
+
+    if failed_keys:
+        logger.error(f"S3 객체 삭제 실패: {failed_keys}")
+    return failed_keys
+
+
+# 커밋 이후 파일 삭제를 처리하는 백그라운드 큐 (요청 응답 시간에서 S3 왕복 제외)
+_delete_executor = ThreadPoolExecutor(max_workers=S3_DELETE_WORKERS, thread_name_prefix="s3-delete")
+
+
+def _run_in_background(func: Callable, *args) -> None:
+    """백그라운드 큐 작업 실행 및 예외 로깅"""
+    try:
+        func(*args)
+    except Exception as e:
+        logger.error(f"백그라운드 파일 삭제 실패: {str(e)}", exc_info=True)
+
+
+def run_after_commit(func: Callable, *args) -> None:
+    """
+    현재 트랜잭션 커밋 이후 백그라운드 큐에서 func 실행
+    - 트랜잭션이 롤백되면 실행하지 않으므로 DB에 남은 사진의 파일이 먼저 지워지지 않음
+    - 트랜잭션 밖에서 호출하면 즉시 큐에 등록
+    """
+    transaction.on_commit(lambda: _delete_executor.submit(_run_in_background, func, *args))
+
+
+def delete_objects_on_commit(keys: list[str], bucket: str = None) -> None:
+    """트랜잭션 커밋 이후 S3 객체 일괄 삭제"""
+    if keys:
+        run_after_commit(delete_objects, keys, bucket)
@@ -1,3 +1,4 @@
+from contextvars import ContextVar, Token
 from datetime import datetime, timedelta
 from typing import Optional, Tuple, Type
 
@@ -9,6 +10,7 @@ from rest_framework.pagination import PageNumberPagination
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.serializers import Serializer
+from rest_framework.utils.urls import replace_query_param
 
 from repo.records.models import Comment, Post, TastedRecord
 
@@ -97,32 +99,112 @@ def get_paginated_response_with_class(request: Request, queryset: QuerySet, seri
     return paginator.get_paginated_response(serialized_data)
 
 
-def get_time_difference(object_created_at: timezone) -> str:
+def get_cursor_paginated_response(request: Request, data: dict) -> Response:
+    """
+    커서 페이지네이션 응답을 생성하는 매서드 (PageNumberPagination 응답 형식에 next_cursor 추가)
+
+    Args:
+        request (Request): 클라이언트로부터의 요청 객체
+        data (dict): {"count": 전체 수, "next_cursor": 다음 페이지 커서, "results": 직렬화 결과}
+
+    Returns:
+        Response: 커서 페이지네이션 응답
+    """
+    next_url = None
+    if data["next_cursor"]:
+        next_url = replace_query_param(request.build_absolute_uri(), "cursor", data["next_cursor"])
+
+    return Response(
+        {"count": data["count"], "next": next_url, "previous": None, "next_cursor": data["next_cursor"], "results": data["results"]},
+        status=status.HTTP_200_OK,
+    )
+
+
+_request_now: ContextVar[datetime | None] = ContextVar("request_now", default=None)
+
+# 상대 시간 구간 (초 단위, 큰 단위부터 확인)
+TIME_DIFFERENCE_UNITS = [
+    (60 * 60 * 24 * 365, "년 전"),
+    (60 * 60 * 24 * 30, "개월 전"),
+    (60 * 60 * 24, "일 전"),
+    (60 * 60, "시간 전"),
+    (60, "분 전"),
+]
+
+
+def get_request_now() -> datetime:
+    """요청 단위 현재 시간 반환 (RequestTimeMiddleware 밖에서는 호출 시점의 현재 시간)"""
+    return _request_now.get() or timezone.now()
+
+
+def set_request_now(now: datetime | None = None) -> Token:
+    """요청 단위 현재 시간 설정 (요청 종료 시 반환된 토큰으로 초기화)"""
+    return _request_now.set(now or timezone.now())
+
+
+def reset_request_now(token: Token) -> None:
+    _request_now.reset(token)
+
+
+def get_time_difference(object_created_at: timezone, now: datetime = None) -> str:
     """
     주어진 객체의 생성 시간과 현재 시간의 차이를 반환
     Args:
         object_created_at (datetime): 객체의 생성 시간
+        now (datetime): 기준 시간 (기본값: 요청 단위 현재 시간)
     Returns:
         timedelta: 현재 시간과 객체의 생성 시간의 차이
     작성자 : hwstar1204
     """
 
-    now = timezone.now()
-    time_difference = now - object_created_at
+    seconds = ((now or get_request_now()) - object_created_at) // timedelta(seconds=1)
 
-    if (years_ago := time_difference // timedelta(days=365)) > 0:
-        return f"{years_ago}년 전"
-    if (months_ago := (time_difference % timedelta(days=365)) // timedelta(days=30)) > 0:
-        return f"{months_ago}개월 전"
-    if (days_ago := (time_difference % timedelta(days=365)) // timedelta(days=1)) > 0:
-        return f"{days_ago}일 전"
-    if (hours_ago := time_difference // timedelta(hours=1)) > 0:
-        return f"{hours_ago}시간 전"
-    if (minutes_ago := (time_difference % timedelta(hours=1)) // timedelta(minutes=1)) > 0:
-        return f"{minutes_ago}분 전"
+    for unit_seconds, suffix in TIME_DIFFERENCE_UNITS:
+        if (value := seconds // unit_seconds) > 0:
+            return f"{value}{suffix}"
     return "방금 전"
 
 
+def render_relative_times(data: list[dict], now: datetime = None) -> list[dict]:
+    """
+    캐시된 직렬화 데이터의 상대 시간(created_at)을 응답 시점 기준으로 다시 계산
+    - 캐시에는 created_at_iso(원본 시간)를 함께 저장하고, 응답 직전에 현재 페이지 항목만 변환
+    - 대댓글 등 중첩된 목록도 함께 변환
+    Args:
+        data: created_at_iso 필드를 포함한 직렬화 데이터 목록
+        now: 기준 시간 (기본값: 요청 단위 현재 시간)
+    Returns:
+        list[dict]: created_at이 갱신된 데이터 목록
+    """
+    now = now or get_request_now()
+
+    for item in data:
+        if created_at_iso := item.get("created_at_iso"):
+            item["created_at"] = get_time_difference(datetime.fromisoformat(created_at_iso), now)
+
+        for value in item.values():
+            if isinstance(value, list) and value and isinstance(value[0], dict):
+                render_relative_times(value, now)
+
+    return data
+
+
+def get_paginated_cached_response(request: Request, data: list[dict]) -> Response:
+    """
+    캐시된 직렬화 데이터 페이지네이션 응답 (현재 페이지 항목만 상대 시간 갱신)
+
+    Args:
+        request (Request): 클라이언트로부터의 요청 객체
+        data (list[dict]): 캐시된 직렬화 데이터
+
+    Returns:
+        Response: 페이지네이션된 응답
+    """
+    paginator = PageNumberPagination()
+    page = paginator.paginate_queryset(data, request)
+    return paginator.get_paginated_response(render_relative_times(page))
+
+
 def get_last_monday(date: timezone) -> timezone:
     """
     주어진 날짜의 지난주 월요일을 반환
@@ -1,6 +1,7 @@
 import logging
 
 from django.core.cache import cache
+from django.db.models import QuerySet
 
 from repo.common.exception.exceptions import UnauthorizedException
 
@@ -64,9 +65,15 @@ class RedisViewTracker:
             logger.warning(f"조회 이력 가져오기 실패: {str(e)}")
             return set()
 
-    def filter_not_viewed_contents(self, request, content_type, queryset) -> list:
-        """사용자가 아직 조회하지 않은 데이터만 필터링하여 반환합니다."""
+    def filter_not_viewed_contents(self, request, content_type, queryset: QuerySet | list) -> QuerySet | list:
+        """
+        사용자가 아직 조회하지 않은 데이터만 필터링하여 반환합니다.
+        - 쿼리셋은 평가하지 않고 exclude(id__in=조회 이력)를 추가해 반환 (DB에서 페이지 단위로 조회 가능)
+        - 조회 이력은 최대 MAX_VIEWED_ITEMS개이므로 IN 절로 처리
+        """
         viewed_contents = self.get_user_viewed_contents(request, content_type)
+        if isinstance(queryset, QuerySet):
+            return queryset.exclude(id__in=viewed_contents) if viewed_contents else queryset
         return [content for content in queryset if content.id not in viewed_contents]
 
     def update_view_count(self, instance) -> bool:
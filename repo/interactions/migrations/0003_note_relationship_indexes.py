@@ -0,0 +1,43 @@
+# Generated by Django 5.1.4 on 2026-10-19 20:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("beans", "0011_bean_fingerprint"),
+        ("interactions", "0002_rename_report_contentreport_and_more"),
+        ("records", "0019_comment_thread"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="note",
+            index=models.Index(fields=["author", "post"], name="note_author__13b50b_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="note",
+            index=models.Index(fields=["author", "tasted_record"], name="note_author__a38256_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="note",
+            index=models.Index(fields=["author", "bean"], name="note_author__9a135c_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="relationship",
+            index=models.Index(
+                fields=["from_user", "relationship_type", "to_user"],
+                name="relationshi_from_us_9fb49a_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="relationship",
+            index=models.Index(
+                fields=["to_user", "relationship_type", "from_user"],
+                name="relationshi_to_user_83d322_idx",
+            ),
+        ),
+    ]
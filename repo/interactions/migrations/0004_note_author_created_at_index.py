@@ -0,0 +1,21 @@
+# Generated by Django 5.1.4 on 2026-10-19 20:38
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("beans", "0011_bean_fingerprint"),
+        ("interactions", "0003_note_relationship_indexes"),
+        ("records", "0022_post_tastedrecord_client_key"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="note",
+            index=models.Index(fields=["author", "created_at"], name="note_author__bde742_idx"),
+        ),
+    ]
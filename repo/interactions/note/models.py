@@ -19,3 +19,10 @@ class Note(models.Model):
         db_table = "note"
         verbose_name = "노트"
         verbose_name_plural = "노트"
+        indexes = [
+            # 피드의 저장 여부(Exists) 확인, 프로필 저장 목록
+            models.Index(fields=["author", "post"]),
+            models.Index(fields=["author", "tasted_record"]),
+            models.Index(fields=["author", "bean"]),
+            models.Index(fields=["author", "created_at"]),  # 저장 목록 변경 피드 (노트는 수정 없이 생성, 삭제만 있음)
+        ]
@@ -22,3 +22,8 @@ class Relationship(models.Model):
         db_table = "relationship"
         verbose_name = "관계"
         verbose_name_plural = "관계"
+        indexes = [
+            # 팔로잉/차단 목록, 피드의 팔로우 여부(Exists) 확인
+            models.Index(fields=["from_user", "relationship_type", "to_user"]),
+            models.Index(fields=["to_user", "relationship_type", "from_user"]),
+        ]
@@ -1,108 +1,155 @@
-from django.db.models import Count, F, IntegerField, Min, OuterRef, Q, Subquery
+from collections import defaultdict
+from typing import Iterator
 
+from django.db.models import Count, F, Min, Q, QuerySet, Window
+from django.db.models.functions import RowNumber
+
+from repo.common.db_router import use_replica
 from repo.common.utils import make_date_format
 from repo.interactions.note.models import Note
 from repo.profiles.models import CustomUser
 from repo.records.models import Post, TastedRecord
 
+REPORT_BATCH_SIZE = 2000  # 한 번에 지표를 계산할 사용자 수
+
+REPORT_HEADERS = [
+    "ID",
+    "닉네임",
+    "가입일",
+    "성별",
+    "출생 연도",
+    "카페 알바",
+    "카페 근무",
+    "카페 운영",
+    "커피 추출",
+    "커피 공부",
+    "카페 투어",
+    "자격증 여부",
+    "시음기록 작성 개수",
+    "게시물 작성 개수",
+    "원두정보 저장 개수",
+    "시음기록 저장 개수",
+    "게시물 저장 개수",
+    "첫 시음기록 작성일",
+    "두번째 시음기록 작성일",
+    "첫 게시물 작성일",
+    "두번째 게시물 작성일",
+    "첫 시음기록 저장일",
+    "첫 게시물 저장일",
+    "첫 원두 정보 저장일",
+]
+
+
+def iter_users_activity_report(batch_size: int = REPORT_BATCH_SIZE) -> Iterator[dict]:
+    """
+    사용자 활동 보고서 행을 사용자 id 순으로 생성
+    - 사용자를 id 기준 배치로 나눠 조회하고, 지표는 배치별로 모델마다 따로 집계한 뒤 user_id로 병합
+      (여러 테이블을 한 쿼리에서 JOIN 후 COUNT DISTINCT 하면 행이 곱으로 늘어남)
+    - 전체 결과를 메모리에 올리지 않으므로 CSV/XLSX 스트리밍에 사용
+    - 스트리밍 응답은 뷰가 끝난 뒤 생성되므로 생성기 안에서 복제본 사용
+    """
+    with use_replica():
+        last_id = 0
+        while True:
+            users = list(
+                CustomUser.objects.filter(id__gt=last_id)
+                .order_by("id")
+                .values(
+                    "id",
+                    "nickname",
+                    "created_at",
+                    "gender",
+                    "birth",
+                    coffee_life=F("user_detail__coffee_life"),
+                    is_certificated=F("user_detail__is_certificated"),
+                )[:batch_size]
+            )
+            if not users:
+                return
+
+            user_ids = [user["id"] for user in users]
+            metrics = get_activity_metrics(user_ids)
+            for user in users:
+                yield build_report_row(user, metrics.get(user["id"], {}))
+            last_id = user_ids[-1]
+
 
 def get_users_activity_report() -> list[dict]:
     """
     사용자 활동 보고서를 생성하는 함수
     """
-    user_activities = (
-        CustomUser.objects.select_related("user_detail")
-        .annotate(
-            coffee_life=F("user_detail__coffee_life"),
-            is_certificated=F("user_detail__is_certificated"),
-            tr_count=Count("tastedrecord", distinct=True),
-            post_count=Count("post", distinct=True),
-            noted_bean_count=Count("note__bean", distinct=True, filter=Q(note__bean__isnull=False)),
-            noted_tr_count=Count("note__tasted_record", distinct=True, filter=Q(note__tasted_record__isnull=False)),
-            noted_post_count=Count("note__post", distinct=True, filter=Q(note__post__isnull=False)),
-            first_tr_at=Min("tastedrecord__created_at"),
-            first_post_at=Min("post__created_at"),
-            second_tr_at=get_created_at_record_by_seq_subquery(TastedRecord, 2),
-            second_post_at=get_created_at_record_by_seq_subquery(Post, 2),
-            first_noted_tr_at=get_created_at_record_by_seq_subquery(Note, 1, "tasted_record"),
-            first_noted_post_at=get_created_at_record_by_seq_subquery(Note, 1, "post"),
-            first_noted_bean_at=get_created_at_record_by_seq_subquery(Note, 1, "bean"),
-        )
-        .values(
-            "id",
-            "nickname",
-            "created_at",
-            "gender",
-            "birth",
-            "coffee_life",
-            "is_certificated",
-            "tr_count",
-            "post_count",
-            "noted_bean_count",
-            "noted_tr_count",
-            "noted_post_count",
-            "first_tr_at",
-            "first_post_at",
-            "second_tr_at",
-            "second_post_at",
-            "first_noted_tr_at",
-            "first_noted_post_at",
-            "first_noted_bean_at",
-        )
-    )
+    return list(iter_users_activity_report())
 
-    reports = []
-    for user_activity in user_activities:
-        coffee_life = dict(user_activity["coffee_life"] or {})
-
-        report = {
-            "ID": user_activity["id"],
-            "닉네임": user_activity["nickname"],
-            "가입일": make_date_format(user_activity["created_at"]),
-            "성별": user_activity["gender"],
-            "출생 연도": user_activity["birth"],
-            "카페 알바": coffee_life.get("cafe_alba", False),
-            "카페 근무": coffee_life.get("cafe_work", False),
-            "카페 운영": coffee_life.get("cafe_operation", False),
-            "커피 추출": coffee_life.get("coffee_extraction", False),
-            "커피 공부": coffee_life.get("coffee_study", False),
-            "카페 투어": coffee_life.get("cafe_tour", False),
-            "자격증 여부": user_activity["is_certificated"],
-            "시음기록 작성 개수": user_activity["tr_count"] or 0,
-            "게시물 작성 개수": user_activity["post_count"] or 0,
-            "원두정보 저장 개수": user_activity["noted_bean_count"] or 0,
-            "시음기록 저장 개수": user_activity["noted_tr_count"] or 0,
-            "게시물 저장 개수": user_activity["noted_post_count"] or 0,
-            "첫 시음기록 작성일": make_date_format(user_activity["first_tr_at"]),
-            "두번째 시음기록 작성일": make_date_format(user_activity["second_tr_at"]),
-            "첫 게시물 작성일": make_date_format(user_activity["first_post_at"]),
-            "두번째 게시물 작성일": make_date_format(user_activity["second_post_at"]),
-            "첫 시음기록 저장일": make_date_format(user_activity["first_noted_tr_at"]),
-            "첫 게시물 저장일": make_date_format(user_activity["first_noted_post_at"]),
-            "첫 원두 정보 저장일": make_date_format(user_activity["first_noted_bean_at"]),
-        }
-        reports.append(report)
-
-    return reports
-
-
-def get_record_cnt_subquery(model: Post | TastedRecord | Note, noted_model: str | None = None) -> Subquery:
+
+def get_activity_metrics(user_ids: list[int]) -> dict[int, dict]:
     """
-    사용자의 시음기록 or 게시물 or 노트 작성 개수를 조회하는 서브쿼리
+    사용자별 활동 지표 (모델별 GROUP BY 쿼리 결과를 user_id로 병합)
+    Returns:
+        dict[int, dict]: {사용자 id: {지표 이름: 값}} (활동이 없는 지표는 없음)
     """
-
-    filters = Q(author=OuterRef("id"))
-    if noted_model:
-        filters &= Q(**{f"{noted_model}__isnull": False})
-    return Subquery(model.objects.filter(filters).values("author").annotate(count=Count("id")).values("count"), output_field=IntegerField())
+    metrics = defaultdict(dict)
+    querysets = [
+        TastedRecord.objects.filter(author_id__in=user_ids)
+        .values("author_id")
+        .annotate(tr_count=Count("id"), first_tr_at=Min("created_at")),
+        Post.objects.filter(author_id__in=user_ids).values("author_id").annotate(post_count=Count("id"), first_post_at=Min("created_at")),
+        Note.objects.filter(author_id__in=user_ids)
+        .values("author_id")
+        .annotate(
+            noted_bean_count=Count("bean", distinct=True),
+            noted_tr_count=Count("tasted_record", distinct=True),
+            noted_post_count=Count("post", distinct=True),
+            first_noted_bean_at=Min("created_at", filter=Q(bean__isnull=False)),
+            first_noted_tr_at=Min("created_at", filter=Q(tasted_record__isnull=False)),
+            first_noted_post_at=Min("created_at", filter=Q(post__isnull=False)),
+        ),
+        get_created_at_by_seq_queryset(TastedRecord, user_ids, 2, "second_tr_at"),
+        get_created_at_by_seq_queryset(Post, user_ids, 2, "second_post_at"),
+    ]
+    for queryset in querysets:
+        for row in queryset.order_by():
+            metrics[row.pop("author_id")].update(row)
+    return metrics
 
 
-def get_created_at_record_by_seq_subquery(model: Post | TastedRecord | Note, seq: int = 1, noted_model: str | None = None) -> Subquery:
+def get_created_at_by_seq_queryset(model: type[Post | TastedRecord], user_ids: list[int], seq: int, name: str) -> QuerySet:
     """
-    사용자의 시음기록 or 게시물 or 노트 작성 순서에 따른 작성일을 조회하는 서브쿼리
+    사용자별 seq번째 시음기록 or 게시물 작성일 (작성 순서 윈도우 함수로 한 번에 조회)
     """
+    return (
+        model.objects.filter(author_id__in=user_ids)
+        .annotate(seq=Window(RowNumber(), partition_by=F("author_id"), order_by=[F("created_at").asc(), F("id").asc()]))
+        .filter(seq=seq)
+        .values("author_id", **{name: F("created_at")})
+    )
+
+
+def build_report_row(user: dict, metrics: dict) -> dict:
+    coffee_life = dict(user["coffee_life"] or {})
 
-    filters = Q(author=OuterRef("id"))
-    if noted_model:
-        filters &= Q(**{f"{noted_model}__isnull": False})
-    return Subquery(model.objects.filter(filters).order_by("created_at").values("created_at")[seq - 1 : seq])
+    return {
+        "ID": user["id"],
+        "닉네임": user["nickname"],
+        "가입일": make_date_format(user["created_at"]),
+        "성별": user["gender"],
+        "출생 연도": user["birth"],
+        "카페 알바": coffee_life.get("cafe_alba", False),
+        "카페 근무": coffee_life.get("cafe_work", False),
+        "카페 운영": coffee_life.get("cafe_operation", False),
+        "커피 추출": coffee_life.get("coffee_extraction", False),
+        "커피 공부": coffee_life.get("coffee_study", False),
+        "카페 투어": coffee_life.get("cafe_tour", False),
+        "자격증 여부": user["is_certificated"],
+        "시음기록 작성 개수": metrics.get("tr_count", 0),
+        "게시물 작성 개수": metrics.get("post_count", 0),
+        "원두정보 저장 개수": metrics.get("noted_bean_count", 0),
+        "시음기록 저장 개수": metrics.get("noted_tr_count", 0),
+        "게시물 저장 개수": metrics.get("noted_post_count", 0),
+        "첫 시음기록 작성일": make_date_format(metrics.get("first_tr_at")),
+        "두번째 시음기록 작성일": make_date_format(metrics.get("second_tr_at")),
+        "첫 게시물 작성일": make_date_format(metrics.get("first_post_at")),
+        "두번째 게시물 작성일": make_date_format(metrics.get("second_post_at")),
+        "첫 시음기록 저장일": make_date_format(metrics.get("first_noted_tr_at")),
+        "첫 게시물 저장일": make_date_format(metrics.get("first_noted_post_at")),
+        "첫 원두 정보 저장일": make_date_format(metrics.get("first_noted_bean_at")),
+    }
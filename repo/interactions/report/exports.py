@@ -0,0 +1,53 @@
+import csv
+from datetime import datetime
+from typing import IO, Iterable, Iterator
+
+from openpyxl import Workbook
+
+from repo.common.utils import make_date_format
+
+REPORT_CONTENT_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+CSV_BOM = "\ufeff"  # 엑셀에서 UTF-8 CSV의 한글이 깨지지 않도록 추가
+
+
+class _Echo:
+    """csv.writer가 쓴 값을 그대로 반환 (행 단위 스트리밍용)"""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def iter_csv(rows: Iterable[dict], headers: list[str]) -> Iterator[str]:
+    """CSV 행 단위 생성 (StreamingHttpResponse 본문)"""
+    writer = csv.writer(_Echo())
+    yield CSV_BOM + writer.writerow(headers)
+    for row in rows:
+        yield writer.writerow([row[header] for header in headers])
+
+
+def write_csv(rows: Iterable[dict], headers: list[str], file: IO[bytes]) -> None:
+    for line in iter_csv(rows, headers):
+        file.write(line.encode("utf-8"))
+
+
+def write_xlsx(rows: Iterable[dict], headers: list[str], file: IO[bytes]) -> None:
+    """
+    XLSX 파일 작성
+    - write_only 모드는 행을 임시 파일에 바로 기록하므로 행 수와 관계없이 메모리 사용량 일정
+    """
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(headers)
+    for row in rows:
+        sheet.append([row[header] for header in headers])
+    workbook.save(file)
+
+
+REPORT_WRITERS = {"csv": write_csv, "xlsx": write_xlsx}
+
+
+def make_report_filename(file_type: str) -> str:
+    return f"Admin_Report_{make_date_format(datetime.now())}.{file_type}"
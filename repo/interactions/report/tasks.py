@@ -0,0 +1,56 @@
+import tempfile
+
+from celery import shared_task
+from celery.utils.log import get_task_logger
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.core.mail import send_mail
+
+from repo.interactions.report.admin_services import (
+    REPORT_HEADERS,
+    iter_users_activity_report,
+)
+from repo.interactions.report.exports import REPORT_WRITERS, make_report_filename
+from repo.profiles.models import CustomUser
+
+logger = get_task_logger(__name__)
+
+REPORT_STORAGE_DIR = "reports/"
+
+
+@shared_task(name="repo.interactions.report.tasks.export_users_activity_report", bind=True, default_retry_delay=10, max_retries=3)
+def export_users_activity_report(self, admin_id: int, file_type: str = "xlsx") -> str:
+    """
+    사용자 활동 보고서 파일을 생성해 스토리지에 저장한 뒤 요청한 관리자에게 알림
+    - 보고서는 임시 파일에 행 단위로 기록 (워커 메모리에 전체 결과를 올리지 않음)
+    Returns:
+        str: 저장된 파일 URL
+    """
+    try:
+        with tempfile.TemporaryFile() as file:
+            REPORT_WRITERS[file_type](iter_users_activity_report(), REPORT_HEADERS, file)
+            file.seek(0)
+            name = default_storage.save(f"{REPORT_STORAGE_DIR}{make_report_filename(file_type)}", File(file))
+    except Exception as e:
+        logger.error(f"사용자 활동 보고서 생성 실패: {str(e)}", exc_info=True)
+        raise self.retry(exc=e) from e
+
+    url = default_storage.url(name)
+    notify_report_ready(admin_id, url)
+    return url
+
+
+def notify_report_ready(admin_id: int, url: str) -> None:
+    """보고서 생성 완료 메일 전송 (이메일이 없는 관리자는 로그만 남김)"""
+    logger.info(f"사용자 활동 보고서 생성 완료: {url}")
+
+    admin = CustomUser.objects.filter(id=admin_id).only("email").first()
+    if not admin or not admin.email:
+        return
+    send_mail(
+        subject="[BrewBuds] 사용자 활동 보고서 생성 완료",
+        message=f"요청하신 사용자 활동 보고서가 생성되었습니다.\n{url}",
+        from_email=None,
+        recipient_list=[admin.email],
+        fail_silently=True,
+    )
@@ -1,15 +1,24 @@
-from datetime import datetime
-from io import BytesIO
+import tempfile
 
-import pandas as pd
-from django.http import HttpResponse
+from django.http import FileResponse, StreamingHttpResponse
 from rest_framework import status
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from repo.common.utils import make_date_format
-from repo.interactions.report.admin_services import get_users_activity_report
+from repo.common.db_router import ReplicaReadMixin
+from repo.common.exception.exceptions import ValidationException
+from repo.interactions.report.admin_services import (
+    REPORT_HEADERS,
+    iter_users_activity_report,
+)
+from repo.interactions.report.exports import (
+    REPORT_CONTENT_TYPES,
+    iter_csv,
+    make_report_filename,
+    write_xlsx,
+)
+from repo.interactions.report.tasks import export_users_activity_report
 
 from .schemas import ReportSchema
 from .serializers import ContentReportSerializer, UserReportSerializer
@@ -50,20 +59,35 @@ class UserReportAPIView(APIView):
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
 
 
-class AdminReportListAPIView(APIView):
+class AdminReportListAPIView(ReplicaReadMixin, APIView):
+    """
+    사용자 활동 보고서 다운로드 (관리자 전용)
+    - file_type: xlsx(기본) 또는 csv
+    - background=true: Celery 작업으로 생성 후 스토리지 URL을 관리자 메일로 전송 (대용량 보고서)
+    """
 
-    def get(self, request):
-        reports = get_users_activity_report()
-        df = pd.DataFrame(reports)
-
-        now = make_date_format(datetime.now())
-        filename = f"Admin_Report_{now}.xlsx"
-
-        excel_file = BytesIO()
-        df.to_excel(excel_file, index=False)
-        excel_file.seek(0)
-
-        response = HttpResponse(excel_file.getvalue(), content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
-        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    permission_classes = [IsAdminUser]
 
+    def get(self, request):
+        file_type = request.query_params.get("file_type", "xlsx")
+        if file_type not in REPORT_CONTENT_TYPES:
+            raise ValidationException(detail=f"지원하지 않는 파일 형식입니다: {file_type}")
+
+        if request.query_params.get("background") == "true":
+            export_users_activity_report.delay(request.user.id, file_type)
+            return Response({"detail": "보고서 생성을 시작했습니다. 완료되면 메일로 알려드립니다."}, status=status.HTTP_202_ACCEPTED)
+
+        if file_type == "csv":
+            # 행 단위로 생성하면서 바로 전송
+            response = StreamingHttpResponse(
+                iter_csv(iter_users_activity_report(), REPORT_HEADERS), content_type=REPORT_CONTENT_TYPES["csv"]
+            )
+        else:
+            # XLSX(zip)는 파일이 완성되어야 전송 가능하므로 임시 파일에 기록 후 청크 단위로 전송
+            file = tempfile.TemporaryFile()
+            write_xlsx(iter_users_activity_report(), REPORT_HEADERS, file)
+            file.seek(0)
+            response = FileResponse(file, content_type=REPORT_CONTENT_TYPES["xlsx"])
+
+        response["Content-Disposition"] = f'attachment; filename="{make_report_filename(file_type)}"'
         return response
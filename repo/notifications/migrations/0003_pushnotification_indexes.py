@@ -0,0 +1,26 @@
+# Generated by Django 5.1.4 on 2026-10-19 20:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0002_alter_notificationsetting_comment_notify_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="pushnotification",
+            index=models.Index(fields=["user", "id"], name="notificatio_user_id_8cb118_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="pushnotification",
+            index=models.Index(
+                fields=["user", "notification_type", "created_at"],
+                name="notificatio_user_id_ac27d7_idx",
+            ),
+        ),
+    ]
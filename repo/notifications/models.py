@@ -47,6 +47,12 @@ class PushNotification(models.Model):
     is_read = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "id"]),  # 알림 최신순 목록
+            models.Index(fields=["user", "notification_type", "created_at"]),  # 중복 알림 확인
+        ]
+
 
 class NotificationSetting(models.Model):
     """
@@ -37,6 +37,15 @@ class FCMService:
             cls._instance._initialize_firebase()
         return cls._instance
 
+    @classmethod
+    def reset(cls) -> None:
+        """싱글톤, Firebase 앱 초기화 (fork 이후 자식 프로세스에서 HTTP 세션 재생성용)"""
+        cls._instance = None
+        try:
+            firebase_admin.delete_app(firebase_admin.get_app())
+        except ValueError:
+            pass  # 초기화된 앱이 없는 경우
+
     def _initialize_firebase(self):
         """Firebase Admin SDK를 초기화합니다."""
         try:
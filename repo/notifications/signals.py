@@ -4,9 +4,11 @@ from django.db.models.signals import post_save
 from django.dispatch import receiver
 
 from repo.interactions.relationship.models import Relationship
-from repo.notifications.enums import Topic
-from repo.notifications.services import NotificationService
-from repo.profiles.models import CustomUser
+from repo.notifications.tasks import (
+    enqueue_on_commit,
+    send_notification_comment,
+    send_notification_follow,
+)
 from repo.records.models import Comment
 
 logger = logging.getLogger(__name__)
@@ -95,61 +97,20 @@ logger = logging.getLogger(__name__)
 @receiver(post_save, sender=Comment)
 def send_comment_notification(sender, instance: Comment, created: bool, **kwargs):
     """
-    댓글 생성 시 Celery task를 통해 알림 전송
+    댓글 생성 시 커밋 이후 Celery task를 통해 알림 전송 (요청 처리 중에는 FCM을 호출하지 않음)
     """
     if not created:
         return
 
-    try:
-        comment = Comment.objects.get(id=instance.id)
-
-        notification_service = NotificationService()
-        if comment.post:
-            is_sent = notification_service.send_notification_comment(Topic.POST, comment.post, comment)
-        elif comment.tasted_record:
-            is_sent = notification_service.send_notification_comment(Topic.TASTED_RECORD, comment.tasted_record, comment)
-
-        if not is_sent:
-            return
-
-        logger.info(f"댓글({comment.id}) 알림 전송 완료")
-        return {"status": "success", "comment_id": comment.id}
-
-    except Comment.DoesNotExist:
-        logger.error(f"댓글({comment.id})을 찾을 수 없습니다")
-        return {"status": "error", "message": "댓글을 찾을 수 없습니다"}
-
-    except Exception as e:
-        logger.error(f"댓글({comment.id}) 알림 전송 실패: {str(e)}")
-        return {"status": "retrying", "message": str(e)}
+    enqueue_on_commit(send_notification_comment, instance.id)
 
 
 @receiver(post_save, sender=Relationship)
 def send_follow_notification(sender, instance: Relationship, created: bool, **kwargs):
     """
-    팔로우 생성 시 알림 전송 및 저장
+    팔로우 생성 시 커밋 이후 Celery task를 통해 알림 전송 및 저장
     """
-
     if not created or instance.relationship_type != "follow":
         return
 
-    try:
-        follower = CustomUser.objects.get(id=instance.from_user.id)
-        followee = CustomUser.objects.get(id=instance.to_user.id)
-
-        notification_service = NotificationService()
-        is_sent = notification_service.send_notification_follow(follower, followee)
-
-        if not is_sent:
-            return
-
-        logger.info(f"팔로우({instance.id}) 알림 전송 완료")
-        return {"status": "success", "follower_id": follower.id, "followee_id": followee.id}
-
-    except CustomUser.DoesNotExist:
-        logger.error(f"팔로우({instance.id}) 알림 전송 실패: 사용자를 찾을 수 없습니다")
-        return {"status": "error", "message": "사용자를 찾을 수 없습니다"}
-
-    except Exception as e:
-        logger.error(f"팔로우({instance.id}) 알림 전송 실패: {str(e)}")
-        return {"status": "retrying", "message": str(e)}
+    enqueue_on_commit(send_notification_follow, instance.from_user_id, instance.to_user_id)
@@ -1,5 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from celery import shared_task
 from celery.utils.log import get_task_logger
+from django.conf import settings
+from django.db import close_old_connections, transaction
 
 from repo.common.utils import get_object_by_type
 from repo.profiles.models import CustomUser
@@ -10,8 +14,51 @@ from .services import NotificationService
 
 logger = get_task_logger(__name__)
 
+NOTIFICATION_LOCAL_WORKERS = getattr(settings, "NOTIFICATION_LOCAL_WORKERS", 2)
+
+# 브로커 연결 실패 시 알림 작업을 실행하는 프로세스 내 백그라운드 큐 (요청 응답 시간에서 FCM 호출 제외)
+_local_executor = ThreadPoolExecutor(max_workers=NOTIFICATION_LOCAL_WORKERS, thread_name_prefix="notification-local")
+
+
+def enqueue_on_commit(task, *args) -> None:
+    """
+    현재 트랜잭션 커밋 이후 알림 작업 등록
+    - 롤백된 댓글, 팔로우는 알림을 보내지 않고, 작업은 커밋된 행을 ID로 다시 조회
+    - 트랜잭션 밖에서 호출하면 즉시 등록
+    Args:
+        task: 등록할 Celery 작업
+        args: 작업 인자 (JSON 직렬화 가능한 ID)
+    """
+    transaction.on_commit(lambda: _enqueue(task, *args))
+
+
+def _enqueue(task, *args) -> None:
+    """
+    Celery 작업 등록 (브로커 연결 실패 시 재시도로 응답을 지연시키지 않고 로컬 큐에서 실행)
+    - 커밋 이후 콜백이므로 예외가 댓글, 팔로우 요청으로 전파되지 않도록 등록 실패는 모두 로컬 큐로 전환
+    - kombu OperationalError(브로커), redis ConnectionError, 결과 저장소 재연결 한도 초과 RuntimeError 등
+    """
+    try:
+        task.apply_async(args=args, retry=False)
+    except Exception as e:
+        logger.warning(f"작업 등록 실패, 로컬 큐에서 실행: {task.name}{args} - {str(e)}", exc_info=True)
+        _local_executor.submit(_run_locally, task, *args)
+
+
+def _run_locally(task, *args) -> None:
+    """로컬 큐 작업 실행 및 예외 로깅 (요청 사이클 밖 스레드이므로 DB 연결 직접 정리)"""
+    close_old_connections()
+    try:
+        task.apply(args=args)
+    except Exception as e:
+        logger.error(f"로컬 큐 작업 실패: {task.name}{args} - {str(e)}", exc_info=True)
+    finally:
+        close_old_connections()
+
 
-@shared_task(name="repo.notifications.tasks.send_notification_comment", bind=True, default_retry_delay=10, max_retries=3)
+@shared_task(
+    name="repo.notifications.tasks.send_notification_comment", bind=True, default_retry_delay=10, max_retries=3, ignore_result=True
+)
 def send_notification_comment(self, comment_id):
     """
     댓글 알림을 비동기적으로 전송하는 Celery task
@@ -44,7 +91,7 @@ def send_notification_comment(self, comment_id):
         return {"status": "retrying", "message": str(e), "task_id": task_id}
 
 
-@shared_task(name="repo.notifications.tasks.send_notification_follow", bind=True, default_retry_delay=10, max_retries=3)
+@shared_task(name="repo.notifications.tasks.send_notification_follow", bind=True, default_retry_delay=10, max_retries=3, ignore_result=True)
 def send_notification_follow(self, follower_id, followee_id):
     """
     팔로우 알림을 비동기적으로 전송하는 Celery task
@@ -75,7 +122,7 @@ def send_notification_follow(self, follower_id, followee_id):
         return {"status": "retrying", "message": str(e), "task_id": task_id}
 
 
-@shared_task(name="repo.notifications.tasks.send_notification_like", bind=True, default_retry_delay=10, max_retries=3)
+@shared_task(name="repo.notifications.tasks.send_notification_like", bind=True, default_retry_delay=10, max_retries=3, ignore_result=True)
 def send_notification_like(self, liked_obj_type, liked_obj_id, liked_user_id):
     """
     좋아요 알림을 비동기적으로 전송하는 Celery task
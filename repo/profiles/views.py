@@ -22,6 +22,7 @@ from rest_framework_simplejwt.tokens import RefreshToken
 
 from repo.beans.models import Bean
 from repo.beans.services import BeanService
+from repo.common.db_router import ReplicaReadMixin
 from repo.common.utils import get_paginated_response_with_class
 from repo.interactions.note.models import Note
 from repo.notifications.models import NotificationSetting
@@ -442,7 +443,7 @@ class UserNoteAPIView(APIView):
         return get_paginated_response_with_class(request, notes, UserNoteSerializer)
 
 
-class PrefSummaryView(APIView):
+class PrefSummaryView(ReplicaReadMixin, APIView):
     """
     전체 기간 유저 활동 요약 API
     """
@@ -476,7 +477,7 @@ class PrefSummaryView(APIView):
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
-class PrefCalendarAPIView(APIView):
+class PrefCalendarAPIView(ReplicaReadMixin, APIView):
     """
     활동 캘린더 API
     - 특정 유저의 특정 월 시음 기록을 날짜별로 그룹화하여 반환
@@ -591,7 +592,7 @@ class PrefCalendarAPIView(APIView):
         return Response(response_data, status=status.HTTP_200_OK)
 
 
-class PrefStarAPIView(APIView):
+class PrefStarAPIView(ReplicaReadMixin, APIView):
     """
     유저의 별점 분포 API
     """
@@ -602,10 +603,10 @@ class PrefStarAPIView(APIView):
         user = get_object_or_404(CustomUser, id=user_id)
 
         star_distribution_query = (
-            TastedRecord.objects.filter(author=user).values(star=F("taste_review__star")).annotate(count=Count("id")).order_by("star")
-        )
+            TastedRecord.objects.filter(author=user).values("star").annotate(count=Count("id")).order_by("star")
+        )  # star: 맛&평가 별점 복사본 (taste_review 조인 없이 집계)
 
-        avg_star = TastedRecord.objects.filter(author=user).aggregate(avg_star=Avg("taste_review__star"))["avg_star"]
+        avg_star = TastedRecord.objects.filter(author=user).aggregate(avg_star=Avg("star"))["avg_star"]
         avg_star = round(avg_star, 1) if avg_star is not None else 0
 
         total_ratings = TastedRecord.objects.filter(author=user).count()
@@ -627,7 +628,7 @@ class PrefStarAPIView(APIView):
         return Response(serializer.data)
 
 
-class PrefFlavorAPIView(APIView):
+class PrefFlavorAPIView(ReplicaReadMixin, APIView):
     """
     유저의 선호하는 맛 API
     """
@@ -654,7 +655,7 @@ class PrefFlavorAPIView(APIView):
         return Response(serializer.data)
 
 
-class PrefCountryAPIView(APIView):
+class PrefCountryAPIView(ReplicaReadMixin, APIView):
     """
     유저의 선호하는 원산지 API
     """
@@ -3,6 +3,7 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from repo.common.db_router import ReplicaReadMixin
 from repo.profiles.models import CustomUser
 from repo.profiles.services import CoffeeLifeCategoryService
 from repo.recommendation.schemas import BudyRecommendSchema
@@ -14,7 +15,7 @@ from repo.recommendation.services import *
 
 
 @BudyRecommendSchema.budy_recommend_schema_view
-class BudyRecommendAPIView(APIView):
+class BudyRecommendAPIView(ReplicaReadMixin, APIView):
     """
     유저의 커피 즐기는 방식 6개 중 한가지 방식에 해당 하는 유저 리스트 반환
     Args:
@@ -47,7 +48,7 @@ class BudyRecommendAPIView(APIView):
         return Response(response_data, status=status.HTTP_200_OK)
 
 
-class BeanRecommendAPIView(APIView):
+class BeanRecommendAPIView(ReplicaReadMixin, APIView):
     """
     유저를 위한 원두 추천 API (모델 기반 추천)
     """
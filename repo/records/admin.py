@@ -71,6 +71,7 @@ class CommentAdmin(RecordsInfoMixin, admin.ModelAdmin):
 class PhotoAdmin(RelatedRecordsMixin, admin.ModelAdmin):
     list_display = ["id", "author"]
     list_filter = [("post", admin.EmptyFieldListFilter), ("tasted_record", admin.EmptyFieldListFilter)]
+    raw_id_fields = ["stored_file"]  # 공유 파일 목록 전체를 선택 상자로 불러오지 않음
 
     @admin.display(description="작성자")
     def author(self, obj):
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class RecordsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "repo.records"
+
+    def ready(self):
+        import repo.records.signals  # noqa
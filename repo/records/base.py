@@ -1,18 +1,52 @@
+import logging
+import time
 from abc import ABC, abstractmethod
 from typing import Dict, Optional
 
+from django.core.cache import cache
+from django.db import transaction
 from django.db.models import Exists, QuerySet
+from django.http import Http404
+from redis.exceptions import ConnectionError
+from rest_framework.serializers import Serializer
 
+from repo.common.querysets import paginate_keyset
+from repo.common.utils import render_relative_times
 from repo.interactions.like.services import LikeService
 from repo.interactions.note.services import NoteService
 from repo.interactions.relationship.services import RelationshipService
 from repo.profiles.models import CustomUser
 from repo.records.models import Post, TastedRecord
 
+logger = logging.getLogger(__name__)
+
+USER_RECORDS_PAGE_SIZE = 12
+USER_RECORDS_CACHE_TTL = 60 * 5  # 좋아요 수 변경은 무효화하지 않으므로 좋아요순 첫 페이지는 최대 이 시간만큼 지연 반영
+USER_RECORDS_VERSION_TTL = 60 * 60 * 24  # 페이지 캐시 TTL 보다 길게 유지
+
+
+def get_user_records_version_key(content_type: str, author_id: int) -> str:
+    return f"user_records:{content_type}:{author_id}:version"
+
+
+def invalidate_user_records_cache(content_type: str, author_id: int) -> None:
+    """작성자별 게시물 목록 첫 페이지 캐시 무효화 (커밋 이후 캐시 버전 변경)"""
+
+    def bump_version():
+        try:
+            cache.set(get_user_records_version_key(content_type, author_id), time.time_ns(), timeout=USER_RECORDS_VERSION_TTL)
+        except ConnectionError as e:
+            logger.error(f"Redis 연결 실패 user_records: {str(e)}", exc_info=True)
+
+    transaction.on_commit(bump_version)
+
 
 class BaseRecordService(ABC):
     """레코드(Post/TastedRecord) 서비스의 추상 기본 클래스"""
 
+    content_type: str = ""  # 캐시 키 구분값 (post, tasted_record)
+    user_record_orderings: Dict[str, str] = {}  # 작성자별 목록 정렬 이름: 정렬 필드 (필드마다 (author, 필드, id) 인덱스 필요)
+
     def __init__(
         self,
         relationship_service: RelationshipService,
@@ -43,6 +77,63 @@ class BaseRecordService(ABC):
 
         return queryset
 
+    def get_detail_state(self, model: type[Post | TastedRecord], pk: int, user: CustomUser) -> Optional[dict]:
+        """
+        상세 조회 시점 정보 (조회수, 작성일, 로그인 사용자의 상호작용 여부)를 한 번의 쿼리로 조회
+        Returns:
+            Optional[dict]: 게시물이 없으면 None
+        """
+        queryset = model.objects.filter(pk=pk)
+        fields = ["view_cnt", "created_at"]
+        if user.is_authenticated:
+            queryset = self.annotate_user_interactions(queryset, user)
+            fields += ["is_user_liked", "is_user_noted", "is_user_following"]
+        return queryset.values(*fields).first()
+
+    def get_user_records_page(
+        self,
+        user_id: int,
+        queryset: QuerySet[Post | TastedRecord],
+        serializer_class: type[Serializer],
+        ordering: str = "latest",
+        cursor: Optional[str] = None,
+        size: int = USER_RECORDS_PAGE_SIZE,
+        cache_variant: Optional[str] = "",
+    ) -> dict:
+        """
+        작성자별 게시물 목록 페이지 (정렬별 keyset 페이지네이션)
+        - 첫 페이지는 작성자, 정렬별로 직렬화 결과를 캐시하고 작성자가 게시물을 작성, 수정, 삭제하면 무효화
+        Args:
+            queryset: get_user_records 쿼리셋 (필터 적용 가능)
+            cache_variant: 첫 페이지 캐시 구분값 (주제 등), None이면 캐시하지 않음 (필터 조합이 많은 조회)
+        Returns:
+            dict: {"count": 전체 수, "next_cursor": 다음 페이지 커서, "results": 직렬화 결과}
+        Raises:
+            ValueError: 형식이 잘못된 커서
+            Http404: 사용자가 없는 경우
+        """
+        cache_key = None
+        if cursor is None and cache_variant is not None:
+            try:
+                version = cache.get(get_user_records_version_key(self.content_type, user_id), 0)
+                cache_key = f"user_records:{self.content_type}:{user_id}:{version}:{ordering}:{cache_variant}:{size}"
+                if (data := cache.get(cache_key)) is not None:
+                    render_relative_times(data["results"])  # 캐시된 페이지의 상대 시간을 응답 시점 기준으로 갱신
+                    return data
+            except ConnectionError as e:
+                logger.error(f"Redis 연결 실패 user_records: {str(e)}", exc_info=True)
+                cache_key = None
+
+        page = paginate_keyset(queryset, self.user_record_orderings[ordering], cursor, size)
+        count = queryset.count() if page.next_cursor or cursor else len(page.items)
+        if count == 0 and not CustomUser.objects.filter(id=user_id).exists():
+            raise Http404("No CustomUser matches the given query.")
+
+        data = {"count": count, "next_cursor": page.next_cursor, "results": serializer_class(page.items, many=True).data}
+        if cache_key:
+            cache.set(cache_key, data, timeout=USER_RECORDS_CACHE_TTL)
+        return data
+
     @abstractmethod
     def get_record_detail(self, pk: int) -> Post | TastedRecord:
         """게시물 상세 조회"""
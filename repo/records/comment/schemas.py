@@ -6,9 +6,11 @@ from drf_spectacular.utils import (
     extend_schema_view,
 )
 
-from repo.common.serializers import PageNumberSerializer
-
-from .serializers import CommentInputSerializer, CommentOutputSerializer
+from .serializers import (
+    CommentCursorSerializer,
+    CommentInputSerializer,
+    CommentOutputSerializer,
+)
 
 Comment_TAG = "Comment"
 
@@ -16,7 +18,7 @@ Comment_TAG = "Comment"
 class CommentSchema:
     comment_get_schema = extend_schema(
         parameters=[
-            PageNumberSerializer,
+            CommentCursorSerializer,
             OpenApiParameter(
                 name="object_type",
                 type=OpenApiTypes.STR,
@@ -38,8 +40,14 @@ class CommentSchema:
             - object_id : 댓글을 처리할 객체의 ID
             - content : 댓글 내용
 
+            - cursor : 다음 페이지 조회 시 이전 응답의 next_cursor (없으면 첫 페이지)
+            - size : 한 페이지에 조회할 최상위 댓글 수 (기본 12, 최대 50)
+
             notice:
             - 차단한 사용자의 댓글은 제외됩니다. (대댓글 포함)
+            - 최상위 댓글마다 대댓글은 최대 3개까지만 replies로 반환되며, 전체 대댓글 수는 reply_count 입니다.
+              (전체 대댓글은 댓글 상세 조회 API 사용)
+            - page 파라미터 대신 cursor 기반으로 변경되었습니다. 응답의 next 주소로 다음 페이지를 조회해주세요.
             - url 주소 끝에 '/'가 빠져있었어서 추가하였습니다.
             (해당 api를 사용하고있었다면 수정해주세요!!)
             담당자: hwstar1204
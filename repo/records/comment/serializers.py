@@ -10,6 +10,11 @@ class CommentInputSerializer(serializers.Serializer):
     parent = serializers.IntegerField(required=False)
 
 
+class CommentCursorSerializer(serializers.Serializer):
+    cursor = serializers.IntegerField(required=False, min_value=1, help_text="이전 페이지 응답의 next_cursor")
+    size = serializers.IntegerField(required=False, min_value=1, max_value=50, default=12, help_text="최상위 댓글 수")
+
+
 class CommentOutputSerializer(serializers.ModelSerializer):
     content = serializers.CharField(max_length=200)
     parent = serializers.PrimaryKeyRelatedField(
@@ -18,7 +23,9 @@ class CommentOutputSerializer(serializers.ModelSerializer):
     author = UserSimpleSerializer(read_only=True)
     likes = serializers.IntegerField(read_only=True)
     created_at = serializers.SerializerMethodField(read_only=True)
+    created_at_iso = serializers.DateTimeField(source="created_at", read_only=True)
     replies = serializers.SerializerMethodField()
+    reply_count = serializers.SerializerMethodField()
     is_user_liked = serializers.BooleanField(read_only=True)
 
     def get_created_at(self, obj):
@@ -30,6 +37,9 @@ class CommentOutputSerializer(serializers.ModelSerializer):
 
         return []
 
+    def get_reply_count(self, obj):
+        return getattr(obj, "reply_count", 0)
+
     class Meta:
         model = Comment
-        fields = ["id", "content", "parent", "author", "likes", "created_at", "replies", "is_user_liked"]
+        fields = ["id", "content", "parent", "author", "likes", "created_at", "created_at_iso", "replies", "reply_count", "is_user_liked"]
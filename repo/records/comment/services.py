@@ -1,10 +1,43 @@
-from collections import defaultdict
+import logging
+import time
+from functools import reduce
+from operator import or_
+from typing import NamedTuple
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import (
+    BooleanField,
+    Count,
+    Exists,
+    F,
+    OuterRef,
+    Q,
+    QuerySet,
+    Value,
+    Window,
+)
+from django.db.models.functions import RowNumber
+from redis.exceptions import ConnectionError
 
 from repo.common.exception.exceptions import NotFoundException, ValidationException
 from repo.interactions.relationship.services import RelationshipService
 from repo.profiles.models import CustomUser
 from repo.records.models import Comment, Post, TastedRecord
 
+logger = logging.getLogger(__name__)
+
+COMMENT_PAGE_SIZE = 12  # 한 페이지에 조회할 최상위 댓글 수
+REPLY_PREVIEW_SIZE = 3  # 댓글 목록에서 최상위 댓글마다 미리 보여줄 대댓글 수
+THREAD_CACHE_TTL = 60 * 5
+THREAD_CACHE_VERSION_TTL = 60 * 60 * 24  # 페이지 캐시 TTL 보다 길게 유지
+
+
+class CommentThreadPage(NamedTuple):
+    comments: list[Comment]  # 최상위 댓글 (replies_list에 대댓글 미리보기 포함)
+    count: int  # 전체 최상위 댓글 수
+    next_cursor: int | None  # 다음 페이지 조회 시 사용할 마지막 최상위 댓글 ID
+
 
 class CommentService:
     """
@@ -16,6 +49,10 @@ class CommentService:
         target_model: 댓글 대상 모델 클래스
         target_object: 댓글 대상 객체 (Post, TastedRecord)
         relationship_service: 관계 서비스 인스턴스
+
+    댓글은 최상위 댓글(root), 경로(path), 깊이(depth)로 스레드를 구성
+    - 최상위 댓글은 id 기준 keyset 페이지네이션
+    - 대댓글은 path 순 정렬(DFS 순서)로 최상위 댓글마다 REPLY_PREVIEW_SIZE개만 미리보기
     """
 
     model_map = {"post": Post, "tasted_record": TastedRecord}
@@ -43,52 +80,73 @@ class CommentService:
     @classmethod
     def get_comment_by_id(cls, comment_id: int) -> Comment:
         """댓글 ID로 단일 댓글 조회"""
-        try:
-            return Comment.objects.filter(id=comment_id).select_related("author").first()
-        except Comment.DoesNotExist as e:
-            raise NotFoundException(detail="Comment not found", code="not_found") from e
-
-    def get_comment_detail(self, comment: Comment, user: CustomUser = None) -> Comment:
-        """댓글 상세 조회 - 해당 댓글의 모든 대댓글들을 계층 구조로 조회"""
-        if comment.post:
-            target_object = comment.post
-        elif comment.tasted_record:
-            target_object = comment.tasted_record
-        else:
-            comment.replies_list = []
-            comment.is_user_liked = comment.like_cnt.filter(id=user.id).exists() if user else False
-            return comment
-
-        if user:
-            blocked_users = set(self.relationship_service.get_unique_blocked_user_list(user.id))
-            base_queryset = target_object.comment_set.select_related("author", "parent").exclude(author__in=blocked_users)
-            user_liked_comments_ids = set(base_queryset.filter(like_cnt=user.id).values_list("id", flat=True))
-        else:
-            base_queryset = target_object.comment_set.select_related("author", "parent")
-            user_liked_comments_ids = set()
-
-        # 모든 댓글들을 가져와서 해당 댓글과 관련된 대댓글들만 필터링
-        child_comments_dict: dict[int, list[Comment]] = defaultdict(list)
-        all_comments = list(base_queryset.order_by("id").all())
+        comment = Comment.objects.filter(id=comment_id).select_related("author").first()
+        if not comment:
+            raise NotFoundException(detail="Comment not found", code="not_found")
+        return comment
 
-        # 좋아요 상태 설정 및 댓글 분류
-        for reply in all_comments:
-            reply.is_user_liked = reply.id in user_liked_comments_ids if user else False
-            if reply.parent_id:
-                child_comments_dict[reply.parent_id].append(reply)
+    @staticmethod
+    def annotate_user_liked(queryset: QuerySet[Comment], user: CustomUser = None) -> QuerySet[Comment]:
+        """유저의 댓글 좋아요 여부 annotate (비회원은 False)"""
+        if not user or not user.is_authenticated:
+            return queryset.annotate(is_user_liked=Value(False, output_field=BooleanField()))
+
+        liked = Comment.like_cnt.through.objects.filter(comment_id=OuterRef("pk"), customuser_id=user.id)
+        return queryset.annotate(is_user_liked=Exists(liked))
+
+    def get_blocked_users(self, user: CustomUser = None) -> list[int]:
+        if not user or not user.is_authenticated:
+            return []
+        return list(self.relationship_service.get_unique_blocked_user_list(user.id))
+
+    @staticmethod
+    def get_blocked_thread_filter(root_ids: list[int], blocked_users: list[int]) -> Q:
+        """차단한 유저의 댓글과 그 하위 대댓글 전체를 제외하는 path 조건"""
+        if not blocked_users:
+            return Q()
+
+        blocked_paths = Comment.objects.filter(root_id__in=root_ids, author__in=blocked_users).values_list("path", flat=True)
+        return reduce(or_, [Q(path__startswith=path) for path in blocked_paths], Q(pk__in=[]))
+
+    def get_replies_in_dfs_order(self, comment: Comment, user: CustomUser = None) -> QuerySet[Comment]:
+        """댓글의 모든 하위 대댓글을 DFS 순서로 조회 (path 접두어 인덱스 범위 조회, 댓글 자신 제외)"""
+        blocked_filter = self.get_blocked_thread_filter([comment.root_id], self.get_blocked_users(user))
+
+        replies = (
+            Comment.objects.filter(root_id=comment.root_id, path__startswith=comment.path)
+            .exclude(pk=comment.pk)
+            .exclude(blocked_filter)
+            .select_related("author")
+            .order_by("path")
+        )
+        return self.annotate_user_liked(replies, user)
 
-        comment.replies_list = self.get_replies_to_one_depths_by_dfs(comment, child_comments_dict)
-        comment.is_user_liked = comment.like_cnt.filter(id=user.id).exists() if user else False
+    def get_comment_detail(self, comment: Comment, user: CustomUser = None) -> Comment:
+        """댓글 상세 조회 - 해당 댓글의 모든 대댓글들을 DFS 순서로 조회"""
+        comment.replies_list = list(self.get_replies_in_dfs_order(comment, user))
+        comment.reply_count = len(comment.replies_list)
+        comment.is_user_liked = comment.like_cnt.filter(id=user.id).exists() if user and user.is_authenticated else False
         return comment
 
     def update_comment(self, comment: Comment, validated_data: dict) -> Comment:
         """댓글 수정"""
         comment.content = validated_data.get("content", comment.content)
         comment.save()
+        self.invalidate_thread_cache(comment)
         return comment
 
     def delete_comment(self, comment: Comment) -> None:
-        """댓글 삭제 (Soft Delete)"""
+        """
+        댓글 삭제
+        - 하위 대댓글이 없는 대댓글은 Hard Delete
+        - 최상위 댓글, 하위 대댓글이 있는 댓글은 스레드 유지를 위해 Soft Delete
+        """
+        self.invalidate_thread_cache(comment)
+
+        if comment.depth > 0 and not comment.replies.exists():
+            comment.delete()
+            return
+
         comment.content = "삭제된 댓글입니다."
         comment.is_deleted = True
         comment.save(update_fields=["content", "is_deleted"])
@@ -105,9 +163,11 @@ class CommentService:
         }
 
         if comment_data["parent"]:
-            parent_comment = Comment.objects.get(id=comment_data["parent"])
+            parent_comment = Comment.objects.filter(id=comment_data["parent"]).first()
             if not parent_comment:
                 raise NotFoundException(detail="Parent comment does not exist", code="not_found")
+            if parent_comment.depth >= Comment.MAX_DEPTH:
+                raise ValidationException(detail=f"대댓글은 {Comment.MAX_DEPTH}단계까지 작성할 수 있습니다.", code="validation_error")
             comment_data["parent"] = parent_comment
 
         if isinstance(self.target_object, Post):
@@ -115,75 +175,109 @@ class CommentService:
         elif isinstance(self.target_object, TastedRecord):
             comment_data["tasted_record"] = self.target_object
 
-        return Comment.objects.create(**comment_data)
-
-    def get_comment_list(self, user: CustomUser) -> list[Comment]:
-        """댓글 목록 조회 (유저 최신 댓글 우선 정렬)"""
-
-        # 차단한 유저들 필터링
-        blocked_users = set(self.relationship_service.get_unique_blocked_user_list(user.id))
-
-        base_queryset = self.target_object.comment_set.select_related("author", "parent").exclude(author__in=blocked_users)
-
-        # 유저가 좋아요한 댓글들 ID
-        user_liked_comments_ids = set(base_queryset.filter(like_cnt=user.id).values_list("id", flat=True))
-
-        # 유저가 작성한 최신 부모 댓글
-        user_recent_comment: Comment | None = base_queryset.filter(author=user, parent=None).order_by("-id").first()
-
-        root_comments: list[Comment] = []
-        child_comments_dict: dict[int, list[Comment]] = defaultdict(list)
-        comments = list(base_queryset.order_by("id").all())
-
-        # 댓글 분류 및 좋아요 상태 설정
-        for comment in comments:
-            comment.is_user_liked = comment.id in user_liked_comments_ids
-
-            if comment.parent_id:  # 대댓글
-                child_comments_dict[comment.parent_id].append(comment)
-            else:  # 부모 댓글
-                root_comments.append(comment)
-
-        # 최상위 댓글의 대댓글의 깊이를 제거하고 DFS 순서대로 정렬하여 최상위 댓글의 replies_list로 저장
-        for parent in root_comments:
-            parent.replies_list = self.get_replies_to_one_depths_by_dfs(parent, child_comments_dict)
-
-        # 유저의 최신 부모 댓글 우선순위 적용
-        if user_recent_comment:
-            user_recent_comment = root_comments.pop(root_comments.index(user_recent_comment))
-            root_comments.insert(0, user_recent_comment)
-
-        return root_comments
-
-    def get_comment_list_for_annonymouse(self) -> list[Comment]:
-        """익명 유저 댓글 목록 조회"""
-        comments = self.target_object.comment_set.select_related("author", "parent").order_by("id").all()
+        comment = Comment.objects.create(**comment_data)
+        self.invalidate_thread_cache(comment)
+        return comment
 
-        root_comments: list[Comment] = []
-        child_comments_dict: dict[int, list[Comment]] = defaultdict(list)
+    def get_thread_page(self, user: CustomUser = None, cursor: int = None, size: int = COMMENT_PAGE_SIZE) -> CommentThreadPage:
+        """
+        댓글 스레드 페이지 조회
+        - 최상위 댓글을 id 기준 keyset 페이지네이션 (cursor 보다 큰 id부터 size개)
+        - 첫 페이지는 유저가 작성한 최신 최상위 댓글을 맨 앞에 고정
+        - 최상위 댓글마다 대댓글 미리보기 REPLY_PREVIEW_SIZE개와 전체 대댓글 수 포함
+        """
+        blocked_users = self.get_blocked_users(user)
+        roots = self.target_object.comment_set.filter(depth=0).exclude(author__in=blocked_users)
+
+        # 유저가 작성한 최신 최상위 댓글 우선순위 적용
+        pinned_id = None
+        if user and user.is_authenticated:
+            pinned_id = roots.filter(author=user).order_by("-id").values_list("id", flat=True).first()
+            if pinned_id:
+                roots = roots.exclude(id=pinned_id)
+
+        count = roots.count() + (1 if pinned_id else 0)
+
+        page_roots = roots.filter(id__gt=cursor) if cursor else roots
+        page_roots = list(self.annotate_user_liked(page_roots.select_related("author"), user).order_by("id")[: size + 1])
+
+        next_cursor = None
+        if len(page_roots) > size:
+            page_roots = page_roots[:size]
+            next_cursor = page_roots[-1].id
+
+        if pinned_id and not cursor:
+            page_roots.insert(0, self.annotate_user_liked(Comment.objects.select_related("author"), user).get(id=pinned_id))
+
+        self.attach_reply_previews(page_roots, user, blocked_users)
+        return CommentThreadPage(comments=page_roots, count=count, next_cursor=next_cursor)
+
+    def attach_reply_previews(self, roots: list[Comment], user: CustomUser = None, blocked_users: list[int] = None) -> None:
+        """최상위 댓글마다 대댓글 미리보기와 전체 대댓글 수를 한 번의 쿼리로 조회"""
+        root_ids = [root.id for root in roots]
+        replies = Comment.objects.filter(root_id__in=root_ids, depth__gt=0).exclude(self.get_blocked_thread_filter(root_ids, blocked_users))
+        replies = (
+            self.annotate_user_liked(replies.select_related("author"), user)
+            .annotate(
+                row_number=Window(RowNumber(), partition_by=F("root_id"), order_by=F("path").asc()),
+                thread_reply_count=Window(Count("id"), partition_by=F("root_id")),
+            )
+            .filter(row_number__lte=REPLY_PREVIEW_SIZE)
+            .order_by("root_id", "path")
+        )
+
+        replies_by_root: dict[int, list[Comment]] = {root_id: [] for root_id in root_ids}
+        reply_counts: dict[int, int] = {}
+        for reply in replies:
+            replies_by_root[reply.root_id].append(reply)
+            reply_counts[reply.root_id] = reply.thread_reply_count
+
+        for root in roots:
+            root.replies_list = replies_by_root[root.id]
+            root.reply_count = reply_counts.get(root.id, 0)
+
+    def get_thread_page_for_anonymous(self, serializer_class, cursor: int = None, size: int = COMMENT_PAGE_SIZE) -> dict:
+        """
+        비회원 댓글 스레드 페이지 조회 (직렬화된 페이지 캐싱)
+        - 댓글 작성, 수정, 삭제 시 캐시 버전을 바꿔 무효화
+        """
+        try:
+            cache_key = f"{self.thread_cache_prefix}:{cache.get(self.thread_cache_version_key, 0)}:{cursor}:{size}"
+            data = cache.get(cache_key)
+        except ConnectionError as e:
+            logger.error(f"Redis 연결 실패 comment_thread: {str(e)}", exc_info=True)
+            cache_key, data = None, None
 
-        for comment in comments:
-            comment.is_user_liked = False
+        if data is None:
+            page = self.get_thread_page(None, cursor, size)
+            data = {"count": page.count, "next_cursor": page.next_cursor, "results": serializer_class(page.comments, many=True).data}
+            if cache_key:
+                cache.set(cache_key, data, timeout=THREAD_CACHE_TTL)
 
-            if comment.parent_id:
-                child_comments_dict[comment.parent_id].append(comment)
-            else:
-                root_comments.append(comment)
+        return data
 
-        for parent in root_comments:
-            parent.replies_list = self.get_replies_to_one_depths_by_dfs(parent, child_comments_dict)
+    @property
+    def thread_cache_prefix(self) -> str:
+        return f"comment_thread:{self.object_type}:{self.object_id}"
 
-        return root_comments
+    @property
+    def thread_cache_version_key(self) -> str:
+        return f"{self.thread_cache_prefix}:version"
 
-    def get_replies_to_one_depths_by_dfs(self, parent: Comment, child_dict: dict[int, list[Comment]]) -> list[Comment]:
-        """재귀참조하는 부모 댓글의 대댓글들의 깊이를 제거하고 DFS 순서대로 정렬 (부모 댓글 제외)"""
-        result: list[Comment] = []
-        stack = child_dict.get(parent.id, [])[::-1]  # 부모 댓글의 대댓글들
+    @classmethod
+    def invalidate_thread_cache(cls, comment: Comment) -> None:
+        """댓글이 달린 대상의 비회원 스레드 캐시 무효화 (커밋 이후 캐시 버전 변경)"""
+        if comment.post_id:
+            version_key = f"comment_thread:post:{comment.post_id}:version"
+        elif comment.tasted_record_id:
+            version_key = f"comment_thread:tasted_record:{comment.tasted_record_id}:version"
+        else:
+            return
 
-        while stack:
-            curr_comment = stack.pop()
-            result.append(curr_comment)
-            cur_commnet_child = child_dict.get(curr_comment.id, [])[::-1]
-            stack.extend(cur_commnet_child)
+        def bump_version():
+            try:
+                cache.set(version_key, time.time_ns(), timeout=THREAD_CACHE_VERSION_TTL)
+            except ConnectionError as e:
+                logger.error(f"Redis 연결 실패 comment_thread: {str(e)}", exc_info=True)
 
-        return result
+        transaction.on_commit(bump_version)
@@ -1,13 +1,18 @@
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
 from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 from rest_framework.views import APIView
 
 from repo.common.permissions import IsAuthorOrOwner, IsOwnerOrReadOnly
-from repo.common.utils import get_paginated_response_with_class
+from repo.common.utils import render_relative_times
 
 from .schemas import CommentDetailSchema, CommentSchema
-from .serializers import CommentInputSerializer, CommentOutputSerializer
+from .serializers import (
+    CommentCursorSerializer,
+    CommentInputSerializer,
+    CommentOutputSerializer,
+)
 from .services import CommentService
 
 
@@ -26,13 +31,28 @@ class CommentApiView(APIView):
     permission_classes = [IsAuthenticatedOrReadOnly]
 
     def get(self, request, object_type, object_id):
+        cursor_serializer = CommentCursorSerializer(data=request.query_params)
+        cursor_serializer.is_valid(raise_exception=True)
+        cursor = cursor_serializer.validated_data.get("cursor")
+        size = cursor_serializer.validated_data["size"]
+
         comment_service = CommentService(object_type, object_id)
         if not request.user.is_authenticated:
-            comments = comment_service.get_comment_list_for_annonymouse()
+            data = comment_service.get_thread_page_for_anonymous(CommentOutputSerializer, cursor, size)
+            render_relative_times(data["results"])  # 캐시된 페이지의 상대 시간을 응답 시점 기준으로 갱신
         else:
-            comments = comment_service.get_comment_list(request.user)
-
-        return get_paginated_response_with_class(request, comments, CommentOutputSerializer)
+            page = comment_service.get_thread_page(request.user, cursor, size)
+            results = CommentOutputSerializer(page.comments, many=True, context={"request": request}).data
+            data = {"count": page.count, "next_cursor": page.next_cursor, "results": results}
+
+        next_url = None
+        if data["next_cursor"]:
+            next_url = replace_query_param(request.build_absolute_uri(), "cursor", data["next_cursor"])
+
+        return Response(
+            {"count": data["count"], "next": next_url, "previous": None, "next_cursor": data["next_cursor"], "results": data["results"]},
+            status=status.HTTP_200_OK,
+        )
 
     def post(self, request, object_type, object_id):
         valid_serializer = CommentInputSerializer(data=request.data, context={"request": request})
@@ -0,0 +1,94 @@
+"""
+게시글, 시음기록 상세 캐시 (버전 키 방식)
+- 조회자와 무관한 상세 본문(직렬화 결과)을 detail:{content_type}:{pk}:{version} 키에 저장
+- 수정, 사진 변경, 댓글, 좋아요 시 버전만 올려 이전 본문은 TTL로 만료 (삭제 경합 없이 무효화)
+- 조회수, 상대 작성일, 조회자별 상호작용 여부는 캐시하지 않고 응답 시 덮어씀
+"""
+
+import logging
+import time
+from typing import Callable
+
+from django.core.cache import cache
+from django.db import transaction
+
+from repo.common.utils import get_time_difference
+
+logger = logging.getLogger(__name__)
+
+# 작성자 프로필, 원두 정보 변경은 버전을 올리지 않으므로 최대 캐시 유지 시간만큼 지연 반영
+DETAIL_CACHE_TIMEOUT = 60 * 60  # 상세 본문 캐시 유지 시간
+DETAIL_VERSION_TIMEOUT = DETAIL_CACHE_TIMEOUT * 2  # 버전 키는 본문보다 오래 유지
+INTERACTION_FIELDS = ("is_user_liked", "is_user_noted", "is_user_following")
+
+
+def get_version_key(content_type: str, pk: int) -> str:
+    return f"detail:version:{content_type}:{pk}"
+
+
+def get_body_key(content_type: str, pk: int, version: int) -> str:
+    return f"detail:{content_type}:{pk}:{version}"
+
+
+def get_detail_version(content_type: str, pk: int) -> int:
+    """
+    현재 상세 본문 버전
+    - 버전 키가 없으면(만료, 캐시 초기화) 현재 시각으로 시작해 이전 버전의 본문과 겹치지 않도록 함
+    """
+    key = get_version_key(content_type, pk)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), timeout=DETAIL_VERSION_TIMEOUT)
+        version = cache.get(key)
+    return version
+
+
+def bump_detail_version(content_type: str, pk: int) -> None:
+    """
+    상세 본문 버전 올리기
+    - 트랜잭션 중이면 커밋 전에 다른 요청이 이전 데이터로 새 버전 본문을 만들 수 있으므로 커밋 후 한 번 더 올림
+    """
+
+    def bump():
+        key = get_version_key(content_type, pk)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time.time_ns(), timeout=DETAIL_VERSION_TIMEOUT)
+        except Exception as e:
+            logger.warning(f"상세 캐시 버전 갱신 실패 ({content_type}:{pk}): {str(e)}")
+
+    bump()
+    transaction.on_commit(bump)
+
+
+def get_or_set_detail_body(content_type: str, pk: int, build: Callable[[], dict]) -> dict:
+    """
+    조회자와 무관한 상세 본문 반환 (없으면 build()로 생성 후 캐시)
+    - 캐시 장애 시 매번 생성
+    """
+    try:
+        key = get_body_key(content_type, pk, get_detail_version(content_type, pk))
+        body = cache.get(key)
+    except Exception as e:
+        logger.warning(f"상세 캐시 조회 실패 ({content_type}:{pk}): {str(e)}")
+        return build()
+
+    if body is None:
+        body = build()
+        cache.set(key, body, timeout=DETAIL_CACHE_TIMEOUT)
+    return body
+
+
+def overlay_detail_state(body: dict, state: dict) -> dict:
+    """
+    캐시된 본문에 조회 시점 정보 덮어쓰기
+    Args:
+        state: {"view_cnt", "created_at", 상호작용 여부(로그인 사용자만)}
+    """
+    return {
+        **body,
+        "view_cnt": state["view_cnt"],
+        "created_at": get_time_difference(state["created_at"]),
+        "interaction": {field: state.get(field, False) for field in INTERACTION_FIELDS},
+    }
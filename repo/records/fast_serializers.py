@@ -0,0 +1,182 @@
+from operator import attrgetter, methodcaller
+from typing import Any, Callable, Iterable
+
+from django.db.models import Manager
+from rest_framework import serializers
+
+from repo.common.utils import get_time_difference
+from repo.records.models import Photo, Post, TastedRecord
+
+# 필드 정의: (응답 필드명, 값 조회 함수, 값 변환 함수)
+# - 값이 None이면 DRF와 동일하게 변환 없이 None 반환
+# - 변환 함수가 None이면 조회한 값을 그대로 사용 (SerializerMethodField 대응)
+FieldSpec = tuple[str, Callable[[Any], Any], Callable[[Any], Any] | None]
+
+
+def image_url(file) -> str | None:
+    """DRF ImageField(use_url=True, request 없음)와 동일한 URL 변환"""
+    if not file:
+        return None
+    try:
+        return file.url
+    except AttributeError:
+        return None
+
+
+iso_datetime = serializers.DateTimeField().to_representation  # DRF DateTimeField와 같은 ISO 8601 변환
+
+
+def boolean(value) -> bool:
+    """DRF BooleanField.to_representation"""
+    if value in ("t", "T", "y", "Y", "yes", "Yes", "YES", "true", "True", "TRUE", "on", "On", "ON", "1", 1, True):
+        return True
+    if value in ("f", "F", "n", "N", "no", "No", "NO", "false", "False", "FALSE", "off", "Off", "OFF", "0", 0, 0.0, False):
+        return False
+    return bool(value)
+
+
+def related(name: str) -> Callable[[Any], Iterable]:
+    """역참조, M2M 매니저는 prefetch 캐시를 사용하도록 all() 호출"""
+    getter = attrgetter(name)
+
+    def get_related(obj):
+        value = getter(obj)
+        return value.all() if isinstance(value, Manager) else value
+
+    return get_related
+
+
+def field_or_default(name: str, default: Any) -> Callable[[Any], Any]:
+    """annotate 되지 않은 필드는 기본값 사용 (DRF 필드 default 대응)"""
+    return lambda obj: getattr(obj, name, default)
+
+
+class CompiledSerializer:
+    """
+    피드, 리스트 응답용 경량 직렬화 클래스
+    - DRF 직렬화 클래스와 같은 필드 순서, 같은 값으로 dict 생성
+    - 필드 조회, 변환 함수를 클래스 정의 시점에 한 번만 준비해 객체마다 직렬화 인스턴스를 만들지 않음
+    - DRF 직렬화 클래스와의 출력 일치 여부는 golden 테스트로 검증
+    """
+
+    fields: tuple[FieldSpec, ...] = ()
+
+    def __init__(self):
+        self._fields = tuple(self.fields)
+
+    def to_representation(self, obj) -> dict:
+        ret = {}
+        for name, getter, to_representation in self._fields:
+            value = getter(obj)
+            ret[name] = value if value is None or to_representation is None else to_representation(value)
+        return ret
+
+    def many(self, objs: Iterable) -> list[dict]:
+        to_representation = self.to_representation
+        return [to_representation(obj) for obj in objs]
+
+
+class UserSimpleFastSerializer(CompiledSerializer):
+    """UserSimpleSerializer 대응"""
+
+    fields = (
+        ("id", attrgetter("id"), int),
+        ("nickname", attrgetter("nickname"), str),
+        ("profile_image", attrgetter("profile_image"), image_url),
+    )
+
+
+class PhotoFastSerializer(CompiledSerializer):
+    """PhotoSerializer 대응"""
+
+    fields = (
+        ("photo_url", attrgetter("photo_url"), image_url),
+        ("thumbnail_url", Photo.get_thumbnail_url, None),
+    )
+
+
+class InteractionFastSerializer(CompiledSerializer):
+    """InteractionSerializer 대응"""
+
+    fields = (
+        ("is_user_liked", field_or_default("is_user_liked", False), boolean),
+        ("is_user_noted", field_or_default("is_user_noted", False), boolean),
+        ("is_user_following", field_or_default("is_user_following", False), boolean),
+    )
+
+
+user_serializer = UserSimpleFastSerializer()
+photo_serializer = PhotoFastSerializer()
+interaction_serializer = InteractionFastSerializer()
+
+
+class TastedRecordInPostFastSerializer(CompiledSerializer):
+    """TastedRecordInPostSerializer 대응"""
+
+    fields = (
+        ("id", attrgetter("id"), int),
+        ("content", attrgetter("content"), str),
+        ("bean_name", attrgetter("bean.name"), str),
+        ("bean_type", lambda obj: obj.bean.get_bean_type_display(), str),
+        ("star_rating", attrgetter("taste_review.star"), float),
+        ("flavor", attrgetter("taste_review.flavor"), str),
+        ("photos", related("photo_set"), photo_serializer.many),
+    )
+
+
+tasted_record_in_post_serializer = TastedRecordInPostFastSerializer()
+
+
+class PostListFastSerializer(CompiledSerializer):
+    """PostListSerializer 대응"""
+
+    fields = (
+        ("id", attrgetter("id"), int),
+        ("author", attrgetter("author"), user_serializer.to_representation),
+        ("photos", related("photo_set"), photo_serializer.many),
+        ("tasted_records", related("tasted_records"), tasted_record_in_post_serializer.many),
+        ("created_at", lambda obj: get_time_difference(obj.created_at), None),
+        ("created_at_iso", attrgetter("created_at"), iso_datetime),
+        ("subject", methodcaller("get_subject_display"), str),
+        ("likes", attrgetter("likes"), int),
+        ("comments", lambda obj: obj.comment_set.count(), int),
+        ("interaction", interaction_serializer.to_representation, None),
+        ("title", attrgetter("title"), str),
+        ("content", attrgetter("content"), str),
+        ("view_cnt", attrgetter("view_cnt"), int),
+        ("tag", attrgetter("tag"), str),
+    )
+
+
+class TastedRecordListFastSerializer(CompiledSerializer):
+    """TastedRecordListSerializer 대응"""
+
+    fields = (
+        ("id", attrgetter("id"), int),
+        ("author", attrgetter("author"), user_serializer.to_representation),
+        ("photos", related("photo_set"), photo_serializer.many),
+        ("bean_name", attrgetter("bean.name"), str),
+        ("bean_type", lambda obj: obj.bean.get_bean_type_display(), str),
+        ("star_rating", attrgetter("taste_review.star"), float),
+        ("flavor", attrgetter("taste_review.flavor"), str),
+        ("created_at", lambda obj: get_time_difference(obj.created_at), None),
+        ("created_at_iso", attrgetter("created_at"), iso_datetime),
+        ("likes", attrgetter("likes"), int),
+        ("comments", lambda obj: obj.comment_set.count(), int),
+        ("interaction", interaction_serializer.to_representation, None),
+        ("content", attrgetter("content"), str),
+        ("view_cnt", attrgetter("view_cnt"), int),
+        ("is_private", attrgetter("is_private"), boolean),
+        ("tag", attrgetter("tag"), str),
+    )
+
+
+post_list_serializer = PostListFastSerializer()
+tasted_record_list_serializer = TastedRecordListFastSerializer()
+
+
+def serialize_feed_item(instance: Post | TastedRecord) -> dict:
+    """피드 아이템(게시글, 시음기록) 직렬화"""
+    if isinstance(instance, Post):
+        return post_list_serializer.to_representation(instance)
+    return tasted_record_list_serializer.to_representation(instance)
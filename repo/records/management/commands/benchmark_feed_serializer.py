@@ -0,0 +1,54 @@
+import timeit
+from itertools import chain
+
+from django.core.management.base import BaseCommand
+
+from repo.records.posts.serializers import PostListSerializer
+from repo.records.serializers import FeedSerializer
+from repo.records.services import get_feed_service
+from repo.records.tasted_record.serializers import TastedRecordListSerializer
+
+
+class Command(BaseCommand):
+    help = "피드 아이템 직렬화 성능 비교 (DRF 직렬화 클래스 vs 경량 직렬화 클래스)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--items",
+            default=200,
+            type=int,
+            help="직렬화할 피드 아이템 수 (게시글, 시음기록 각각)",
+        )
+        parser.add_argument(
+            "--repeat",
+            default=5,
+            type=int,
+            help="측정 반복 횟수 (가장 빠른 결과 사용)",
+        )
+
+    def handle(self, *args, **kwargs):
+        items = kwargs["items"]
+        repeat = kwargs["repeat"]
+
+        feed_service = get_feed_service()
+        posts = feed_service.post_service.get_base_record_list_queryset()[:items]
+        tasted_records = feed_service.tasted_record_service.get_base_record_list_queryset()[:items]
+        feed = list(chain(posts, tasted_records))  # prefetch 완료된 객체로 직렬화 시간만 측정
+        if not feed:
+            self.stdout.write(self.style.WARNING("피드 데이터가 없습니다. seed_posts, seed_tasted_records 실행 후 다시 시도해주세요."))
+            return
+
+        def drf_serialize():
+            return [PostListSerializer(item).data if item in posts_set else TastedRecordListSerializer(item).data for item in feed]
+
+        def fast_serialize():
+            return FeedSerializer(feed, many=True).data
+
+        posts_set = set(posts)
+        drf_time = min(timeit.repeat(drf_serialize, number=1, repeat=repeat))
+        fast_time = min(timeit.repeat(fast_serialize, number=1, repeat=repeat))
+
+        self.stdout.write(f"피드 아이템 {len(feed)}개")
+        self.stdout.write(f"DRF 직렬화: {drf_time / len(feed) * 1_000_000:.1f}µs/item")
+        self.stdout.write(f"경량 직렬화: {fast_time / len(feed) * 1_000_000:.1f}µs/item")
+        self.stdout.write(self.style.SUCCESS(f"{drf_time / fast_time:.1f}배 빠름"))
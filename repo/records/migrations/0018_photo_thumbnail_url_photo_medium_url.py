@@ -0,0 +1,23 @@
+# Generated by Django 5.1.4 on 2026-10-19 18:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("records", "0017_exceptionlogrecord"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="photo",
+            name="medium_url",
+            field=models.ImageField(blank=True, null=True, upload_to="", verbose_name="중간 크기 사진"),
+        ),
+        migrations.AddField(
+            model_name="photo",
+            name="thumbnail_url",
+            field=models.ImageField(blank=True, null=True, upload_to="", verbose_name="썸네일 사진"),
+        ),
+    ]
@@ -0,0 +1,88 @@
+# Generated by Django 5.1.4 on 2026-10-19 18:38
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def fill_comment_thread(apps, schema_editor, batch_size=1000):
+    """기존 댓글의 root, path, depth 채우기 (id 기준 keyset 배치)"""
+    Comment = apps.get_model("records", "Comment")  # noqa: N806
+    threads = {}  # 댓글 ID: (root_id, path, depth)
+
+    def get_thread(comment_id, parent_id):
+        if comment_id not in threads:
+            if parent_id is None:
+                threads[comment_id] = (comment_id, f"{comment_id:010d}/", 0)
+            else:
+                if parent_id not in threads:  # 부모가 자식보다 나중에 생성된 예외 케이스
+                    get_thread(parent_id, Comment.objects.filter(id=parent_id).values_list("parent_id", flat=True).first())
+                root_id, parent_path, parent_depth = threads[parent_id]
+                threads[comment_id] = (root_id, f"{parent_path}{comment_id:010d}/", parent_depth + 1)
+        return threads[comment_id]
+
+    last_id = 0
+    while True:
+        comments = list(Comment.objects.filter(id__gt=last_id).order_by("id").only("id", "parent_id")[:batch_size])
+        if not comments:
+            break
+        last_id = comments[-1].id
+
+        for comment in comments:
+            comment.root_id, comment.path, comment.depth = get_thread(comment.id, comment.parent_id)
+        Comment.objects.bulk_update(comments, ["root", "path", "depth"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("records", "0018_photo_thumbnail_url_photo_medium_url"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="comment",
+            name="depth",
+            field=models.PositiveSmallIntegerField(default=0, editable=False, verbose_name="댓글 깊이"),
+        ),
+        migrations.AddField(
+            model_name="comment",
+            name="path",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                max_length=255,
+                verbose_name="댓글 경로",
+            ),
+        ),
+        migrations.AddField(
+            model_name="comment",
+            name="root",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="thread_comments",
+                to="records.comment",
+                verbose_name="최상위 댓글",
+            ),
+        ),
+        migrations.RunPython(fill_comment_thread, reverse_code=migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="comment",
+            index=models.Index(fields=["post", "depth", "id"], name="comment_post_id_59b7f8_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="comment",
+            index=models.Index(
+                fields=["tasted_record", "depth", "id"],
+                name="comment_tasted__fcbca9_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="comment",
+            index=models.Index(fields=["root", "path"], name="comment_root_id_c31fc7_idx"),
+        ),
+    ]
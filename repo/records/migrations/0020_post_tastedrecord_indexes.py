@@ -0,0 +1,36 @@
+# Generated by Django 5.1.4 on 2026-10-19 20:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("beans", "0011_bean_fingerprint"),
+        ("records", "0019_comment_thread"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(fields=["subject", "id"], name="post_subject_d0620d_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(fields=["author", "id"], name="post_author__28db07_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="tastedrecord",
+            index=models.Index(fields=["is_private", "id"], name="tasted_reco_is_priv_c393f3_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="tastedrecord",
+            index=models.Index(fields=["author", "created_at"], name="tasted_reco_author__87d4df_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="tastedrecord",
+            index=models.Index(fields=["bean", "created_at"], name="tasted_reco_bean_id_72679e_idx"),
+        ),
+    ]
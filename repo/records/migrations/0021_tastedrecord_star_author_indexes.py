@@ -0,0 +1,50 @@
+# Generated by Django 5.1.4 on 2026-10-19 20:16
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def fill_tasted_record_star(apps, schema_editor, batch_size=1000):
+    """기존 시음기록의 star를 맛&평가 별점으로 채우기 (id 기준 keyset 배치)"""
+    TastedRecord = apps.get_model("records", "TastedRecord")  # noqa: N806
+    BeanTasteReview = apps.get_model("beans", "BeanTasteReview")  # noqa: N806
+    star = Subquery(BeanTasteReview.objects.filter(id=OuterRef("taste_review_id")).values("star")[:1])
+
+    last_id = 0
+    while True:
+        ids = list(TastedRecord.objects.filter(id__gt=last_id).order_by("id").values_list("id", flat=True)[:batch_size])
+        if not ids:
+            break
+        last_id = ids[-1]
+        TastedRecord.objects.filter(id__in=ids).update(star=star)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("beans", "0011_bean_fingerprint"),
+        ("records", "0020_post_tastedrecord_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="tastedrecord",
+            name="star",
+            field=models.FloatField(default=0, verbose_name="별점"),
+        ),
+        migrations.RunPython(fill_tasted_record_star, reverse_code=migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(fields=["author", "likes", "id"], name="post_author__85ac97_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="tastedrecord",
+            index=models.Index(fields=["author", "star", "id"], name="tasted_reco_author__9dae6c_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="tastedrecord",
+            index=models.Index(fields=["author", "likes", "id"], name="tasted_reco_author__8eb60c_idx"),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.1.4 on 2026-10-19 20:31
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("beans", "0011_bean_fingerprint"),
+        ("records", "0021_tastedrecord_star_author_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="client_key",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                max_length=64,
+                null=True,
+                verbose_name="클라이언트 멱등 키",
+            ),
+        ),
+        migrations.AddField(
+            model_name="tastedrecord",
+            name="client_key",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                max_length=64,
+                null=True,
+                verbose_name="클라이언트 멱등 키",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="post",
+            constraint=models.UniqueConstraint(fields=("author", "client_key"), name="unique_post_client_key"),
+        ),
+        migrations.AddConstraint(
+            model_name="tastedrecord",
+            constraint=models.UniqueConstraint(fields=("author", "client_key"), name="unique_tasted_record_client_key"),
+        ),
+    ]
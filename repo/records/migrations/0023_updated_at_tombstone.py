@@ -0,0 +1,94 @@
+# Generated by Django 5.1.4 on 2026-10-19 20:38
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import F
+
+
+def fill_updated_at(apps, schema_editor):
+    """기존 게시물 수정일은 작성일로 설정 (추가 시점으로 채워지면 첫 변경 피드 순서가 작성 순서와 달라짐)"""
+    for model_name in ("Post", "TastedRecord"):
+        apps.get_model("records", model_name).objects.update(updated_at=F("created_at"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("beans", "0011_bean_fingerprint"),
+        ("records", "0022_post_tastedrecord_client_key"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Tombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "content_type",
+                    models.CharField(
+                        choices=[
+                            ("tasted_record", "시음 기록"),
+                            ("post", "게시글"),
+                            ("note", "노트"),
+                        ],
+                        max_length=20,
+                        verbose_name="삭제된 항목 유형",
+                    ),
+                ),
+                ("object_id", models.IntegerField(verbose_name="삭제된 항목 ID")),
+                (
+                    "deleted_at",
+                    models.DateTimeField(auto_now_add=True, db_index=True, verbose_name="삭제일"),
+                ),
+            ],
+            options={
+                "verbose_name": "삭제 기록",
+                "verbose_name_plural": "삭제 기록",
+                "db_table": "tombstone",
+            },
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, verbose_name="수정일"),
+        ),
+        migrations.AddField(
+            model_name="tastedrecord",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, verbose_name="수정일"),
+        ),
+        migrations.RunPython(fill_updated_at, reverse_code=migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(fields=["author", "updated_at"], name="post_author__b6b12d_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="tastedrecord",
+            index=models.Index(fields=["author", "updated_at"], name="tasted_reco_author__94e484_idx"),
+        ),
+        migrations.AddField(
+            model_name="tombstone",
+            name="user",
+            field=models.ForeignKey(
+                db_constraint=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="+",
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="소유자",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="tombstone",
+            index=models.Index(fields=["user", "deleted_at"], name="tombstone_user_id_59a5b0_idx"),
+        ),
+    ]
@@ -0,0 +1,76 @@
+# Generated by Django 5.1.4 on 2026-10-19 20:51
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("records", "0023_updated_at_tombstone"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PhotoFile",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "content_hash",
+                    models.CharField(max_length=64, verbose_name="원본 SHA-256 해시"),
+                ),
+                (
+                    "is_main",
+                    models.BooleanField(default=False, verbose_name="대표 사진 여부"),
+                ),
+                ("photo_url", models.ImageField(upload_to="", verbose_name="사진")),
+                (
+                    "thumbnail_url",
+                    models.ImageField(upload_to="", verbose_name="썸네일 사진"),
+                ),
+                (
+                    "medium_url",
+                    models.ImageField(upload_to="", verbose_name="중간 크기 사진"),
+                ),
+                (
+                    "size",
+                    models.PositiveBigIntegerField(default=0, verbose_name="파일 크기 합계(bytes)"),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="업로드 일자"),
+                ),
+            ],
+            options={
+                "verbose_name": "사진 파일",
+                "verbose_name_plural": "사진 파일",
+                "db_table": "photo_file",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("content_hash", "is_main"),
+                        name="unique_photo_file_content",
+                    )
+                ],
+            },
+        ),
+        migrations.AddField(
+            model_name="photo",
+            name="stored_file",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="photos",
+                to="records.photofile",
+                verbose_name="저장된 파일",
+            ),
+        ),
+    ]
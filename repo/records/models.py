@@ -1,3 +1,5 @@
+from datetime import timedelta
+
 from django.db import models
 
 from repo.beans.models import Bean, BeanTasteReview
@@ -13,16 +15,41 @@ class TastedRecord(models.Model):
     like_cnt = models.ManyToManyField(CustomUser, blank=True, related_name="like_tasted_records")
     is_private = models.BooleanField(default=False, verbose_name="비공개 여부")
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="작성일")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")  # 변경 피드 기준 (조회수, 좋아요 수 변경은 제외)
     tag = models.TextField(null=True, blank=True, verbose_name="태그")  # 여러 태그 가능
     likes = models.IntegerField(default=0, verbose_name="좋아요 수")
+    star = models.FloatField(default=0, verbose_name="별점")  # 맛&평가 별점 복사본 (작성자별 별점순 목록 인덱스 정렬용)
+    client_key = models.CharField(
+        max_length=64, null=True, blank=True, editable=False, verbose_name="클라이언트 멱등 키"
+    )  # 일괄 동기화 재시도 시 중복 생성 방지
 
     def __str__(self):
         return f"{self.bean.id} - {self.bean.name}"
 
+    def save(self, *args, **kwargs):
+        """저장 시 맛&평가 별점을 star에 복사 (update_fields에 star가 없으면 생략)"""
+        update_fields = kwargs.get("update_fields")
+        if self.taste_review_id and (update_fields is None or "star" in update_fields):
+            self.star = self.taste_review.star
+        super().save(*args, **kwargs)
+
     class Meta:
         db_table = "tasted_record"
         verbose_name = "시음 기록"
         verbose_name_plural = "시음 기록"
+        indexes = [
+            models.Index(fields=["is_private", "id"]),  # 공개 시음기록 최신순 피드
+            models.Index(
+                fields=["author", "created_at"]
+            ),  # 프로필 시음기록 최신순 목록(PK가 뒤에 붙어 (author, created_at, id)로 동작), 캘린더
+            models.Index(fields=["author", "star", "id"]),  # 프로필 시음기록 별점순 목록
+            models.Index(fields=["author", "likes", "id"]),  # 프로필 시음기록 좋아요순 목록
+            models.Index(fields=["bean", "created_at"]),  # 원두 상세 시음기록 목록
+            models.Index(fields=["author", "updated_at"]),  # 작성자 변경 피드 ((author, updated_at, id) 순서로 동작)
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=["author", "client_key"], name="unique_tasted_record_client_key"),
+        ]
 
 
 class Post(models.Model):
@@ -41,8 +68,12 @@ class Post(models.Model):
     view_cnt = models.IntegerField(default=0, verbose_name="조회수")
     like_cnt = models.ManyToManyField(CustomUser, blank=True, related_name="like_posts")
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="작성일")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")  # 변경 피드 기준 (조회수, 좋아요 수 변경은 제외)
     tag = models.TextField(null=True, blank=True, verbose_name="태그")  # 여러 태그 가능
     likes = models.IntegerField(default=0, verbose_name="좋아요 수")
+    client_key = models.CharField(
+        max_length=64, null=True, blank=True, editable=False, verbose_name="클라이언트 멱등 키"
+    )  # 일괄 동기화 재시도 시 중복 생성 방지
 
     def is_saved(self, user):
         return user.not_set.filter(post=self).exists()
@@ -57,14 +88,72 @@ class Post(models.Model):
         db_table = "post"
         verbose_name = "게시글"
         verbose_name_plural = "게시글"
+        indexes = [
+            models.Index(fields=["subject", "id"]),  # 주제별 게시글 최신순 목록
+            models.Index(fields=["author", "id"]),  # 프로필 게시글 최신순 목록
+            models.Index(fields=["author", "likes", "id"]),  # 프로필 게시글 좋아요순 목록
+            models.Index(fields=["author", "updated_at"]),  # 작성자 변경 피드 ((author, updated_at, id) 순서로 동작)
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=["author", "client_key"], name="unique_post_client_key"),
+        ]
+
+
+class PhotoFile(models.Model):
+    """
+    저장된 사진 파일 (원본 내용 해시 기준으로 여러 Photo가 공유)
+    - 같은 내용의 사진을 다시 업로드하면 S3에 올리지 않고 기존 파일을 재사용
+    - 대표 사진 여부는 파일 이름(main_ 접두사)으로 저장되므로 해시와 함께 식별값으로 사용
+    - 참조하는 Photo가 없어진 파일만 삭제 (release_photo_files)
+    """
+
+    FILE_FIELDS = ("photo_url", "thumbnail_url", "medium_url")
+
+    content_hash = models.CharField(max_length=64, verbose_name="원본 SHA-256 해시")
+    is_main = models.BooleanField(default=False, verbose_name="대표 사진 여부")
+    photo_url = models.ImageField(verbose_name="사진")
+    thumbnail_url = models.ImageField(verbose_name="썸네일 사진")
+    medium_url = models.ImageField(verbose_name="중간 크기 사진")
+    size = models.PositiveBigIntegerField(default=0, verbose_name="파일 크기 합계(bytes)")  # 원본 + 변형 이미지
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="업로드 일자")
+
+    def get_file_names(self) -> list[str]:
+        """원본, 변형 이미지 파일 이름 목록 반환"""
+        return [getattr(self, field).name for field in self.FILE_FIELDS if getattr(self, field)]
+
+    def __str__(self):
+        return f"PhotoFile: {self.content_hash}"
+
+    class Meta:
+        db_table = "photo_file"
+        verbose_name = "사진 파일"
+        verbose_name_plural = "사진 파일"
+        constraints = [
+            models.UniqueConstraint(fields=["content_hash", "is_main"], name="unique_photo_file_content"),
+        ]
 
 
 class Photo(models.Model):
     post = models.ForeignKey(Post, on_delete=models.CASCADE, null=True, blank=True, verbose_name="관련 게시글")
     tasted_record = models.ForeignKey(TastedRecord, on_delete=models.CASCADE, null=True, blank=True, verbose_name="관련 시음 기록")
+    stored_file = models.ForeignKey(
+        PhotoFile, on_delete=models.PROTECT, null=True, blank=True, related_name="photos", verbose_name="저장된 파일"
+    )  # 없으면 파일을 단독으로 소유하는 기존 사진
     photo_url = models.ImageField(upload_to="records/%Y/%m/%d/", null=True, blank=True, verbose_name="사진")
+    thumbnail_url = models.ImageField(null=True, blank=True, verbose_name="썸네일 사진")
+    medium_url = models.ImageField(null=True, blank=True, verbose_name="중간 크기 사진")
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="업로드 일자")
 
+    def get_thumbnail_url(self) -> str | None:
+        """썸네일 URL 반환 (썸네일이 없는 기존 사진은 원본 URL)"""
+        if self.thumbnail_url:
+            return self.thumbnail_url.url
+        return self.photo_url.url if self.photo_url else None
+
+    def get_file_names(self) -> list[str]:
+        """원본, 변형 이미지 파일 이름 목록 반환"""
+        return [file.name for file in (self.photo_url, self.thumbnail_url, self.medium_url) if file]
+
     def __str__(self):
         return f"Photo: {self.id}"
 
@@ -75,7 +164,15 @@ class Photo(models.Model):
 
 
 class Comment(models.Model):
+    PATH_SEGMENT_LENGTH = 10  # 경로 한 단계 = 0으로 채운 댓글 ID 10자리 + "/"
+    MAX_DEPTH = 255 // (PATH_SEGMENT_LENGTH + 1) - 1  # path 최대 길이 내 허용 깊이
+
     parent = models.ForeignKey("self", null=True, blank=True, on_delete=models.SET_NULL, related_name="replies", verbose_name="상위 댓글")
+    root = models.ForeignKey(
+        "self", null=True, blank=True, on_delete=models.CASCADE, related_name="thread_comments", verbose_name="최상위 댓글"
+    )
+    path = models.CharField(max_length=255, default="", blank=True, editable=False, verbose_name="댓글 경로")
+    depth = models.PositiveSmallIntegerField(default=0, editable=False, verbose_name="댓글 깊이")
     author = models.ForeignKey(CustomUser, on_delete=models.CASCADE, verbose_name="작성자")
     post = models.ForeignKey(Post, null=True, blank=True, on_delete=models.CASCADE, verbose_name="게시글")
     tasted_record = models.ForeignKey(TastedRecord, null=True, blank=True, on_delete=models.CASCADE, verbose_name="시음 기록")
@@ -88,10 +185,60 @@ class Comment(models.Model):
     def __str__(self):
         return f"삭제된 댓글 ID: {self.id}" if self.is_deleted else f"{self.author.nickname} - {self.content[:20]}"
 
+    def save(self, *args, **kwargs):
+        """
+        댓글 생성 시 스레드 정보(root, path, depth) 저장
+        - path는 최상위 댓글부터 자신까지의 ID 경로로, path 순 정렬이 곧 DFS 순서
+        """
+        is_new = self.pk is None
+        if is_new and self.parent_id:
+            self.root_id = self.parent.root_id or self.parent_id
+            self.depth = self.parent.depth + 1
+
+        super().save(*args, **kwargs)
+
+        if is_new:
+            parent_path = self.parent.path if self.parent_id else ""
+            self.path = f"{parent_path}{self.pk:0{self.PATH_SEGMENT_LENGTH}d}/"
+            self.root_id = self.root_id or self.pk
+            Comment.objects.filter(pk=self.pk).update(path=self.path, root_id=self.root_id)
+
     class Meta:
         db_table = "comment"
         verbose_name = "댓글"
         verbose_name_plural = "댓글"
+        indexes = [
+            models.Index(fields=["post", "depth", "id"]),
+            models.Index(fields=["tasted_record", "depth", "id"]),
+            models.Index(fields=["root", "path"]),
+        ]
+
+
+class Tombstone(models.Model):
+    """
+    삭제 기록 (변경 피드에서 클라이언트가 삭제된 항목을 알 수 있도록 일정 기간 보관)
+    - user: 삭제된 항목의 소유자 (시음기록, 게시글 작성자 or 노트 저장한 사용자)
+    - 소유자 탈퇴 후에도 남아 있을 수 있으므로 DB 외래키 제약 없이 저장 (보관 기간 후 삭제)
+    """
+
+    CONTENT_TYPE_CHOICES = (("tasted_record", "시음 기록"), ("post", "게시글"), ("note", "노트"))
+    RETENTION = timedelta(days=30)  # 보관 기간 (이보다 오래전에 받은 워터마크는 전체 다시 동기화)
+
+    user = models.ForeignKey(CustomUser, on_delete=models.CASCADE, db_constraint=False, related_name="+", verbose_name="소유자")
+    content_type = models.CharField(max_length=20, choices=CONTENT_TYPE_CHOICES, verbose_name="삭제된 항목 유형")
+    object_id = models.IntegerField(verbose_name="삭제된 항목 ID")
+    deleted_at = models.DateTimeField(auto_now_add=True, db_index=True, verbose_name="삭제일")
+
+    def __str__(self):
+        return f"Tombstone: {self.content_type} {self.object_id}"
+
+    class Meta:
+        db_table = "tombstone"
+        verbose_name = "삭제 기록"
+        verbose_name_plural = "삭제 기록"
+        indexes = [
+            models.Index(fields=["user", "deleted_at"]),  # 사용자 변경 피드 ((user, deleted_at, id) 순서로 동작)
+        ]
 
 
 class ExceptionLogRecord(models.Model):
@@ -13,6 +13,7 @@ from repo.records.posts.serializers import (
     PostDetailSerializer,
     PostListSerializer,
     TopPostSerializer,
+    UserPostCursorSerializer,
     UserPostSerializer,
 )
 
@@ -112,20 +113,19 @@ class PostSchema:
     )
 
     user_post_list_get_schema = extend_schema(
-        parameters=[
-            PageNumberSerializer,
-            OpenApiParameter(
-                name="subject",
-                type=str,
-                enum=[choice[0] for choice in Post.SUBJECT_TYPE_CHOICES],
-                description="게시글 주제",
-            ),
-        ],
+        parameters=[UserPostCursorSerializer],
         summary="유저 게시글 조회",
-        description="특정 사용자의 게시글을 주제별로 조회합니다. (정렬 기준: 최신순)",
+        description="""
+            특정 사용자의 게시글을 주제별로 조회합니다.
+            - 정렬 (ordering): latest(최신순, 기본값), likes(좋아요순)
+            - cursor : 다음 페이지 조회 시 이전 응답의 next_cursor (없으면 첫 페이지)
+
+            notice:
+            - page 파라미터 대신 cursor 기반으로 변경되었습니다. 응답의 next 주소로 다음 페이지를 조회해주세요.
+        """,
         responses={
             200: UserPostSerializer(many=True),
-            400: OpenApiResponse(description="Invalid subject parameter"),
+            400: OpenApiResponse(description="Invalid subject, ordering or cursor parameter"),
             404: OpenApiResponse(description="Not Found"),
         },
         tags=[Post_Tag],
@@ -8,6 +8,7 @@ from repo.interactions.serializers import (
 )
 from repo.profiles.serializers import UserSimpleSerializer
 from repo.records.models import Photo, Post, TastedRecord
+from repo.records.serializers import UserRecordCursorSerializer
 from repo.records.tasted_record.serializers import TastedRecordInPostSerializer
 
 
@@ -18,6 +19,7 @@ class PostListSerializer(serializers.ModelSerializer):
     photos = PhotoSerializer(many=True, source="photo_set", read_only=True)
     tasted_records = TastedRecordInPostSerializer("tasted_records", many=True, read_only=True)
     created_at = serializers.SerializerMethodField()
+    created_at_iso = serializers.DateTimeField(source="created_at", read_only=True)
     subject = serializers.CharField(source="get_subject_display")
     likes = serializers.IntegerField()
     comments = serializers.IntegerField(source="comment_set.count")
@@ -32,7 +34,7 @@ class PostListSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Post
-        exclude = ["like_cnt"]
+        exclude = ["like_cnt", "client_key", "updated_at"]
 
 
 class TopPostSerializer(PostListSerializer):
@@ -56,6 +58,20 @@ class PostCreateUpdateSerializer(serializers.ModelSerializer):
         fields = ["title", "content", "subject", "tag", "tasted_records", "photos"]
 
 
+class PostSyncSerializer(PostCreateUpdateSerializer):
+    """
+    일괄 동기화 게시글 항목 (생성 전용)
+    - 시음기록, 사진 존재 여부는 서비스에서 요청 전체를 한 번에 확인하므로 id 목록만 검증
+    """
+
+    client_key = serializers.CharField(max_length=64, help_text="클라이언트 멱등 키 (재시도 시 같은 값 전송)")
+    tasted_records = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False, max_length=10)
+    photos = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False, max_length=10)
+
+    class Meta(PostCreateUpdateSerializer.Meta):
+        fields = ["client_key", *PostCreateUpdateSerializer.Meta.fields]
+
+
 class PostDetailSerializer(serializers.ModelSerializer):
     """단일 게시글 조회용"""
 
@@ -64,6 +80,7 @@ class PostDetailSerializer(serializers.ModelSerializer):
     tasted_records = TastedRecordInPostSerializer("post.tasted_records", many=True)
     subject = serializers.CharField(source="get_subject_display")
     created_at = serializers.SerializerMethodField()
+    created_at_iso = serializers.DateTimeField(source="created_at", read_only=True)
     interaction = serializers.SerializerMethodField(read_only=True)
 
     def get_interaction(self, obj):
@@ -75,7 +92,15 @@ class PostDetailSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Post
-        exclude = ["like_cnt"]
+        exclude = ["like_cnt", "client_key", "updated_at"]
+
+
+class UserPostCursorSerializer(UserRecordCursorSerializer):
+    """특정 사용자의 게시글 리스트 조회 파라미터"""
+
+    ORDERING_CHOICES = ["latest", "likes"]
+
+    subject = serializers.ChoiceField(choices=Post.SUBJECT_TYPE_CHOICES, required=False, help_text="게시글 주제")
 
 
 class UserPostSerializer(serializers.ModelSerializer):
@@ -86,20 +111,21 @@ class UserPostSerializer(serializers.ModelSerializer):
     represent_post_photo = serializers.SerializerMethodField()
     tasted_records_photo = serializers.SerializerMethodField()
     created_at = serializers.SerializerMethodField()
+    created_at_iso = serializers.DateTimeField(source="created_at", read_only=True)
 
     def get_represent_post_photo(self, obj):
-        """게시글의 첫번째 사진 URL 반환"""
+        """게시글의 첫번째 사진 썸네일 URL 반환"""
         if photos := obj.photo_set.all():
-            return photos[0].photo_url.url
+            return photos[0].get_thumbnail_url()
         return None
 
     def get_tasted_records_photo(self, obj):
-        """게시글에 연결된 시음기록의 첫번째 사진 URL 반환"""
+        """게시글에 연결된 시음기록의 첫번째 사진 썸네일 URL 반환"""
         if not (tasted_records := obj.tasted_records.all()):
             return None
 
         if photos := tasted_records[0].photo_set.all():
-            return photos[0].photo_url.url
+            return photos[0].get_thumbnail_url()
         return None
 
     def get_created_at(self, obj):
@@ -107,4 +133,4 @@ class UserPostSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Post
-        fields = ["id", "author", "title", "subject", "created_at", "represent_post_photo", "tasted_records_photo"]
+        fields = ["id", "author", "title", "subject", "created_at", "created_at_iso", "represent_post_photo", "tasted_records_photo"]
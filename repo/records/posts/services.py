@@ -5,7 +5,17 @@ from typing import Optional
 
 from django.core.cache import cache
 from django.db import transaction
-from django.db.models import BooleanField, Count, Exists, Prefetch, Q, QuerySet, Value
+from django.db.models import (
+    BooleanField,
+    Count,
+    Exists,
+    F,
+    Prefetch,
+    Q,
+    QuerySet,
+    Value,
+)
+from django.http import Http404
 from django.utils import timezone
 from redis.exceptions import ConnectionError
 
@@ -16,8 +26,9 @@ from repo.interactions.note.services import NoteService
 from repo.interactions.relationship.services import RelationshipService
 from repo.profiles.models import CustomUser
 from repo.records.base import BaseRecordService
+from repo.records.detail_cache import get_or_set_detail_body, overlay_detail_state
 from repo.records.models import Post, TastedRecord
-from repo.records.posts.serializers import PostListSerializer
+from repo.records.posts.serializers import PostDetailSerializer, PostListSerializer
 from repo.records.posts.tasks import cache_top_posts
 
 logger = logging.getLogger(__name__)
@@ -40,6 +51,9 @@ def get_top_post_service():
 class PostService(BaseRecordService):
     """게시글 관련 비즈니스 로직을 처리하는 서비스"""
 
+    content_type = "post"
+    user_record_orderings = {"latest": "id", "likes": "likes"}
+
     def __init__(self, relationship_service, like_service, note_service):
         super().__init__(relationship_service, like_service, note_service)
         self.tracker = RedisViewTracker()
@@ -53,19 +67,37 @@ class PostService(BaseRecordService):
             post = Post.objects.get(id=pk)
             self.tracker.update_view_count(post)
 
-        return (
-            Post.objects.filter(pk=pk)
-            .select_related("author")
-            .prefetch_related(Prefetch("tasted_records", queryset=TastedRecord.objects.select_related("bean", "taste_review")), "photo_set")
-            .first()
+        return self.get_detail_queryset().filter(pk=pk).first()
+
+    def get_cached_record_detail(self, request, pk: int) -> dict:
+        """
+        게시글 상세 조회 (캐시 사용)
+        - 조회자와 무관한 본문은 버전 캐시에서 조회하고, 조회수와 상호작용 여부만 한 번의 쿼리로 조회
+        Raises:
+            Http404: 게시글이 없는 경우
+        """
+        state = self.get_detail_state(Post, pk, request.user)
+        if state is None:
+            raise Http404("No Post matches the given query.")
+
+        if self.tracker.track_view(request, "post", pk):
+            Post.objects.filter(pk=pk).update(view_cnt=F("view_cnt") + 1)
+            state["view_cnt"] += 1
+
+        body = get_or_set_detail_body("post", pk, lambda: dict(PostDetailSerializer(self.get_detail_queryset().get(pk=pk)).data))
+        return overlay_detail_state(body, state)
+
+    @staticmethod
+    def get_detail_queryset() -> QuerySet[Post]:
+        return Post.objects.select_related("author").prefetch_related(
+            Prefetch("tasted_records", queryset=TastedRecord.objects.select_related("bean", "taste_review")), "photo_set"
         )
 
     def get_user_records(self, user_id: int, **kwargs) -> QuerySet[Post]:
         """유저가 작성한 게시글 조회"""
-        user = CustomUser.objects.get(id=user_id)
         subject = kwargs.get("subject", None)
 
-        filters = Q(author=user)
+        filters = Q(author_id=user_id)
         if subject:
             filters &= Q(subject=subject)
 
@@ -102,7 +134,7 @@ class PostService(BaseRecordService):
         filters = Q(subject=subject) if subject else Q()
         blocked_users_list = self.relationship_service.get_unique_blocked_user_list(user.id)
 
-        posts = self.get_base_record_list_queryset().filter(filters).exclude(author_id__in=blocked_users_list)
+        posts = self.get_base_record_list_queryset().filter(filters).exclude(author_id__in=blocked_users_list).order_by("-id")
         posts = self.annotate_user_interactions(posts, user)
         posts = self.tracker.filter_not_viewed_contents(request, "post", posts)
         return posts
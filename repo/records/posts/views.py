@@ -1,12 +1,15 @@
 from django.shortcuts import get_object_or_404
 from rest_framework import status
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import AllowAny, IsAuthenticatedOrReadOnly
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from repo.common.permissions import IsOwnerOrReadOnly
-from repo.common.utils import get_paginated_response_with_class
+from repo.common.utils import (
+    get_cursor_paginated_response,
+    get_paginated_cached_response,
+    get_paginated_response_with_class,
+)
 from repo.records.posts.schemas import PostSchema
 from repo.records.posts.serializers import *
 from repo.records.posts.services import *
@@ -27,9 +30,7 @@ class PostListCreateAPIView(APIView):
 
         if not user.is_authenticated:
             posts = self.post_service.get_record_list_for_anonymous(subject)
-            paginator = PageNumberPagination()
-            paginated_posts = paginator.paginate_queryset(posts, request)
-            return paginator.get_paginated_response(paginated_posts)
+            return get_paginated_cached_response(request, posts)
 
         posts = self.post_service.get_record_list_v2(user, subject=subject, request=request)
         return get_paginated_response_with_class(request, posts, PostListSerializer)
@@ -64,11 +65,9 @@ class PostDetailAPIView(APIView):
         return post
 
     def get(self, request, pk):
-        post = self.get_object(pk)
-        post_detail = self.post_service.get_record_detail(request, post.id)
-
-        serializer = PostDetailSerializer(post_detail, context={"request": request})
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        # 조회는 모든 사용자에게 허용되므로 객체 권한 확인 없이 캐시된 상세 정보 반환
+        post_detail = self.post_service.get_cached_record_detail(request, pk)
+        return Response(post_detail, status=status.HTTP_200_OK)
 
     def put(self, request, pk):
         post = self.get_object(pk)
@@ -100,11 +99,21 @@ class UserPostListAPIView(APIView):
         self.post_service = get_post_service()
 
     def get(self, request, id):
-        subject = request.query_params.get("subject", None)
+        params = UserPostCursorSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        subject = params.validated_data.get("subject")
 
         posts = self.post_service.get_user_records(id, subject=subject)
-
-        return get_paginated_response_with_class(request, posts, UserPostSerializer)
+        data = self.post_service.get_user_records_page(
+            id,
+            posts,
+            UserPostSerializer,
+            ordering=params.validated_data["ordering"],
+            cursor=params.validated_data.get("cursor"),
+            size=params.validated_data["size"],
+            cache_variant=subject or "",
+        )
+        return get_cursor_paginated_response(request, data)
 
 
 @PostSchema.top_posts_schema_view
@@ -134,6 +143,4 @@ class TopSubjectPostsAPIView(APIView):
         if isinstance(posts, QuerySet):  # 캐싱 서버 연결 실패시 직접 DB 조회
             return get_paginated_response_with_class(request, posts, TopPostSerializer)
 
-        paginator = PageNumberPagination()
-        paginated_posts = paginator.paginate_queryset(posts, request)
-        return paginator.get_paginated_response(paginated_posts)
+        return get_paginated_cached_response(request, posts)
@@ -7,11 +7,19 @@ from drf_spectacular.utils import (
 )
 
 from repo.common.serializers import PageNumberSerializer, PhotoDetailSerializer
+from repo.records.models import Tombstone
 from repo.records.posts.serializers import PostListSerializer
+from repo.records.serializers import (
+    RecordChangeQuerySerializer,
+    RecordSyncResponseSerializer,
+    RecordSyncSerializer,
+)
+from repo.records.services import RecordChangeService
 from repo.records.tasted_record.serializers import TastedRecordListSerializer
 
 Feed_Tag = "Feed"
 Photo_Tag = "Photo"
+Sync_Tag = "Sync"
 
 
 class FeedSchema:
@@ -67,6 +75,12 @@ class FeedSchemaV2:
                 description="feed type",
                 enum=["refresh"],
             ),
+            OpenApiParameter(
+                name="seed",
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description="새로고침 세션 시드 (feed_type=refresh, 다음 페이지 링크에 포함, 없으면 새로 섞음)",
+            ),
         ],
         responses={200: [TastedRecordListSerializer, PostListSerializer]},
         summary="홈 [전체] 피드 (v2)",
@@ -80,6 +94,7 @@ class FeedSchemaV2:
 
             refresh:
             - 홈 [전체] 시음기록과 게시글을 랜덤순으로 반환하는 API
+            - 다음 페이지 링크(next)의 seed로 요청하면 같은 순서를 유지해 페이지 간 중복, 누락 없음
 
             response:
             TastedRecordListSerializer or PostListSerializer
@@ -211,6 +226,85 @@ class PhotoSchema:
     photo_schema_view = extend_schema_view(post=photo_post_schema, put=photo_put_schema, delete=photo_delete_schema)
 
 
+class RecordSyncSchema:
+    record_sync_post_schema = extend_schema(
+        request=RecordSyncSerializer,
+        responses={
+            200: RecordSyncResponseSerializer,
+            400: OpenApiResponse(description="항목이 없거나 최대 항목 수 초과"),
+            401: OpenApiResponse(description="인증되지 않은 사용자"),
+            409: OpenApiResponse(description="같은 항목을 동시에 동기화하는 중"),
+        },
+        summary="시음기록, 게시글 일괄 동기화 API",
+        description=f"""
+            오프라인에서 작성한 시음기록, 게시글을 한 번에 생성하는 API (최대 {RecordSyncSerializer.MAX_ITEMS}개)
+            - tasted_records 항목: 시음기록 생성 데이터(bean 필수) + client_key
+            - posts 항목: 게시글 생성 데이터 + client_key
+            - 항목마다 client_key(멱등 키)를 보내야 하며, 재시도 시 같은 키를 보내면 다시 생성하지 않고 기존 id를 반환합니다.
+            - 항목별 결과 status: created(생성), existing(이미 생성됨), invalid(검증 실패, errors 참조)
+            - 잘못된 항목이 있어도 나머지 항목은 생성됩니다.
+            - 사진은 다른 게시물에 연결되지 않은 업로드 사진만 사용할 수 있습니다.
+        """,
+        tags=[Sync_Tag],
+    )
+
+    record_sync_schema_view = extend_schema_view(post=record_sync_post_schema)
+
+
+class RecordChangeSchema:
+    record_change_get_schema = extend_schema(
+        parameters=[RecordChangeQuerySerializer],
+        responses={
+            200: OpenApiResponse(
+                response={
+                    "type": "object",
+                    "properties": {
+                        "tasted_records": {
+                            "type": "array",
+                            "items": {"type": "object"},
+                            "description": "id, bean_name, star, is_private, photo_url, created_at, updated_at",
+                        },
+                        "posts": {
+                            "type": "array",
+                            "items": {"type": "object"},
+                            "description": "id, title, subject, photo_url, created_at, updated_at",
+                        },
+                        "notes": {
+                            "type": "array",
+                            "items": {"type": "object"},
+                            "description": "id, type(post, tasted_record, bean), target_id, title, created_at",
+                        },
+                        "deleted": {
+                            "type": "object",
+                            "properties": {
+                                key: {"type": "array", "items": {"type": "integer"}} for key in ["tasted_records", "posts", "notes"]
+                            },
+                        },
+                        "watermark": {"type": "string"},
+                        "has_more": {"type": "boolean"},
+                    },
+                },
+                description="워터마크 이후 변경된 항목",
+            ),
+            400: OpenApiResponse(description="유효하지 않거나 만료된 워터마크 (만료 시 code: sync_watermark_expired)"),
+            401: OpenApiResponse(description="인증되지 않은 사용자"),
+        },
+        summary="내 시음기록, 게시글, 저장 목록 변경 피드 API",
+        description=f"""
+            워터마크 이후 생성, 수정, 삭제된 본인 시음기록, 게시글, 저장한 노트(게시글, 시음기록, 원두)만 반환하는 API
+            - 처음 요청 시 watermark 없이 요청하면 전체 항목을 반환합니다.
+            - 응답의 watermark를 저장해 다음 요청에 보내면 그 이후 변경분만 받습니다.
+            - 한 번에 최대 {RecordChangeService.PAGE_SIZE}개까지 반환하며, has_more가 true이면 받은 watermark로 바로 이어서 요청합니다.
+            - 늦게 커밋된 변경을 놓치지 않도록 최근 {int(RecordChangeService.COMMIT_LAG.total_seconds() // 60)}분 동안의 변경은 다음 요청에서 다시 전달될 수 있으므로, 받은 항목은 id 기준으로 덮어씁니다.
+            - 조회수, 좋아요 수 변경은 포함되지 않습니다.
+            - 삭제 기록은 {Tombstone.RETENTION.days}일간 보관하므로, 그보다 오래된 watermark는 400(sync_watermark_expired) 응답을 받으며 전체 목록을 다시 받아야 합니다.
+        """,
+        tags=[Sync_Tag],
+    )
+
+    record_change_schema_view = extend_schema_view(get=record_change_get_schema)
+
+
 class ProfilePhotoSchema:
     profile_photo_post_schema = extend_schema(
         request={
@@ -1,21 +1,103 @@
 from rest_framework import serializers
 
+from repo.common.querysets import decode_cursor, decode_watermark
 from repo.common.utils import get_time_difference
 from repo.interactions.note.models import Note
+from repo.records.fast_serializers import serialize_feed_item
 from repo.records.models import Post, TastedRecord
-from repo.records.posts.serializers import PostListSerializer
-from repo.records.tasted_record.serializers import TastedRecordListSerializer
 
 
 class FeedSerializer(serializers.Serializer):
+    """
+    피드 아이템(게시글, 시음기록) 직렬화
+    - PostListSerializer, TastedRecordListSerializer와 같은 응답을 경량 직렬화 클래스로 생성
+    """
+
     def to_representation(self, instance):
-        if isinstance(instance, Post):
-            return PostListSerializer(instance).data
-        elif isinstance(instance, TastedRecord):
-            return TastedRecordListSerializer(instance).data
+        if isinstance(instance, (Post, TastedRecord)):
+            return serialize_feed_item(instance)
         return super().to_representation(instance)
 
 
+class UserRecordCursorSerializer(serializers.Serializer):
+    """
+    작성자별 게시물 목록 파라미터
+    - ORDERING_CHOICES: 정렬 이름 (서비스의 user_record_orderings와 같은 값)
+    - LEGACY_ORDERINGS: 이전 ordering 값 -> 정렬 이름 (기존 클라이언트 호환)
+    """
+
+    ORDERING_CHOICES: list[str] = ["latest"]
+    LEGACY_ORDERINGS: dict[str, str] = {}
+
+    cursor = serializers.CharField(required=False, help_text="이전 페이지 응답의 next_cursor")
+    size = serializers.IntegerField(required=False, min_value=1, max_value=50, default=12, help_text="페이지 크기")
+    ordering = serializers.CharField(required=False, default="latest", help_text="정렬 기준")
+
+    def validate_cursor(self, value):
+        try:
+            decode_cursor(value)
+        except ValueError as e:
+            raise serializers.ValidationError("유효하지 않은 커서입니다.") from e
+        return value
+
+    def validate_ordering(self, value):
+        value = self.LEGACY_ORDERINGS.get(value, value)
+        if value not in self.ORDERING_CHOICES:
+            raise serializers.ValidationError(f"정렬 기준은 {', '.join(self.ORDERING_CHOICES)} 중 하나여야 합니다.")
+        return value
+
+
+class RecordSyncSerializer(serializers.Serializer):
+    """
+    시음기록, 게시글 일괄 동기화 요청
+    - 항목별 검증은 서비스에서 처리 (잘못된 항목이 있어도 나머지 항목은 생성)
+    """
+
+    MAX_ITEMS = 20  # 요청당 최대 항목 수 (시음기록 + 게시글)
+
+    tasted_records = serializers.ListField(child=serializers.DictField(), required=False, default=list, help_text="시음기록 생성 항목")
+    posts = serializers.ListField(child=serializers.DictField(), required=False, default=list, help_text="게시글 생성 항목")
+
+    def validate(self, attrs):
+        total = len(attrs["tasted_records"]) + len(attrs["posts"])
+        if total == 0:
+            raise serializers.ValidationError("동기화할 항목이 없습니다.")
+        if total > self.MAX_ITEMS:
+            raise serializers.ValidationError(f"한 번에 최대 {self.MAX_ITEMS}개까지 동기화할 수 있습니다.")
+        return attrs
+
+
+class RecordSyncResultSerializer(serializers.Serializer):
+    """일괄 동기화 항목별 결과"""
+
+    client_key = serializers.CharField(allow_null=True, help_text="요청 항목의 멱등 키")
+    status = serializers.ChoiceField(
+        choices=["created", "existing", "invalid"], help_text="created: 생성, existing: 이미 생성됨, invalid: 검증 실패"
+    )
+    id = serializers.IntegerField(required=False, help_text="생성된(또는 이미 생성된) 게시물 id")
+    errors = serializers.DictField(required=False, help_text="검증 실패 사유")
+
+
+class RecordSyncResponseSerializer(serializers.Serializer):
+    """일괄 동기화 응답 (요청 순서와 같은 항목별 결과)"""
+
+    tasted_records = RecordSyncResultSerializer(many=True)
+    posts = RecordSyncResultSerializer(many=True)
+
+
+class RecordChangeQuerySerializer(serializers.Serializer):
+    """변경 피드 파라미터"""
+
+    watermark = serializers.CharField(required=False, help_text="이전 응답의 watermark (없으면 전체 목록)")
+
+    def validate_watermark(self, value):
+        try:
+            decode_watermark(value)
+        except ValueError as e:
+            raise serializers.ValidationError("유효하지 않은 워터마크입니다.") from e
+        return value
+
+
 class UserNoteSerializer(serializers.Serializer):
     def to_representation(self, instance):
         if isinstance(instance, Note):
@@ -31,6 +113,7 @@ class NotePostSimpleSerializer(serializers.ModelSerializer):
     title = serializers.CharField(source="post.title")
     subject = serializers.CharField(source="post.subject")
     created_at = serializers.SerializerMethodField()
+    created_at_iso = serializers.DateTimeField(source="post.created_at", read_only=True)
     nickname = serializers.CharField(source="post.author.nickname", read_only=True)
     photo_url = serializers.SerializerMethodField()
 
@@ -45,7 +128,7 @@ class NotePostSimpleSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Note
-        fields = ["post_id", "title", "subject", "created_at", "nickname", "photo_url"]
+        fields = ["post_id", "title", "subject", "created_at", "created_at_iso", "nickname", "photo_url"]
 
 
 class NoteTastedRecordSimpleSerializer(serializers.ModelSerializer):
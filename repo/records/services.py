@@ -1,15 +1,49 @@
 import random
+from datetime import timedelta
 from itertools import chain
+from uuid import uuid4
 
 from django.core.cache import cache
-
+from django.core.files.storage import default_storage
+from django.db import IntegrityError, transaction
+from django.db.models import (
+    Case,
+    F,
+    IntegerField,
+    OuterRef,
+    Q,
+    QuerySet,
+    Subquery,
+    Value,
+    When,
+)
+from django.utils import timezone
+
+from repo.beans.models import BeanTasteReview
+from repo.beans.services import BeanService
+from repo.common.exception.exceptions import BadRequestException, ConflictException
+from repo.common.querysets import (
+    MergedQuerySet,
+    SampledQuerySet,
+    bulk_create_with_pk,
+    decode_watermark,
+    encode_watermark,
+)
 from repo.common.view_tracker import RedisViewTracker
+from repo.interactions.note.models import Note
+from repo.profiles.models import CustomUser
+from repo.records.base import invalidate_user_records_cache
+from repo.records.models import Photo, Post, TastedRecord, Tombstone
+from repo.records.posts.serializers import PostSyncSerializer
 from repo.records.posts.services import PostService, get_post_service
+from repo.records.serializers import FeedSerializer
+from repo.records.tasted_record.serializers import TastedRecordSyncSerializer
 from repo.records.tasted_record.services import (
     TastedRecordService,
     get_tasted_record_service,
 )
-from repo.records.views import FeedSerializer
+
+REFRESH_FEED_TIMEOUT = 60 * 30  # 새로고침 세션(섞은 id 풀) 유지 시간
 
 
 def get_feed_service():
@@ -34,14 +68,13 @@ class FeedService:
         - 차단한 사용자의 컨텐츠 제외
         - 결과는 최신순으로 정렬
         - following + common 두개의 api를 대체 가능
+        - 페이지네이션 시 현재 페이지 항목만 조회 (MergedQuerySet)
         """
 
         tasted_records = self.tasted_record_service.get_record_list_v2(user, request=request)
         posts = self.post_service.get_record_list_v2(user, request=request)
 
-        combined_data = list(chain(tasted_records, posts))
-        combined_data.sort(key=lambda x: x.created_at, reverse=True)  # 최신순
-        return combined_data
+        return MergedQuerySet([tasted_records, posts])  # 최신순
 
     def get_following_feed(self, request, user):
         """
@@ -55,7 +88,7 @@ class FeedService:
             user: 사용자 객체
 
         Returns:
-            list: 시음기록과 게시글이 최신순으로 정렬된 피드 리스트
+            MergedQuerySet: 시음기록과 게시글이 최신순으로 정렬된 피드
         """
 
         # 1. 팔로우한 유저의 시음기록, 게시글
@@ -67,9 +100,7 @@ class FeedService:
         not_viewed_posts = self.tracker.filter_not_viewed_contents(request, "post", following_posts)
 
         # 3. 1+2 최신순으로 정렬
-        combined_data = list(chain(not_viewed_tasted_records, not_viewed_posts))
-        combined_data.sort(key=lambda x: x.created_at, reverse=True)
-        return combined_data
+        return MergedQuerySet([not_viewed_tasted_records, not_viewed_posts])
 
     def get_common_feed(self, request, user):
         """
@@ -85,7 +116,7 @@ class FeedService:
             user: 사용자 객체
 
         Returns:
-            list: 시음기록과 게시글이 최신순으로 정렬된 피드 리스트
+            MergedQuerySet: 시음기록과 게시글이 최신순으로 정렬된 피드
         """
 
         # 1. 팔로우하지 않고 차단하지 않은 유저들의 시음기록, 게시글
@@ -96,35 +127,32 @@ class FeedService:
         not_viewed_tasted_records = self.tracker.filter_not_viewed_contents(request, "tasted_record", common_tasted_records)
         not_viewed_posts = self.tracker.filter_not_viewed_contents(request, "post", common_posts)
 
-        # 3. 1 + 2
-        combined_data = list(chain(not_viewed_tasted_records, not_viewed_posts))
+        # 3. 1 + 2 최신순으로 정렬
+        return MergedQuerySet([not_viewed_tasted_records, not_viewed_posts])
 
-        # 4. 최신순으로 정렬
-        combined_data.sort(key=lambda x: x.created_at, reverse=True)
-
-        return combined_data
-
-    def get_refresh_feed(self, user):
+    def get_refresh_feed(self, user, seed: int | None = None):
         """
         새로고침용 랜덤 피드를 반환합니다.
 
         - 모든 공개 시음기록과 게시글 포함
         - 차단한 사용자의 컨텐츠 제외
-        - 랜덤 순서로 정렬
+        - 시드로 섞은 랜덤 순서로 정렬 (같은 시드는 페이지를 넘겨도 같은 순서)
+        - 페이지네이션 시 현재 페이지 항목만 조회 (SampledQuerySet)
 
         Args:
             user: 사용자 객체
+            seed: 새로고침 세션 시드 (없으면 새로 생성)
 
         Returns:
-            list: 시음기록과 게시글이 랜덤으로 정렬된 피드 리스트
+            SampledQuerySet: 시음기록과 게시글이 랜덤으로 정렬된 피드
         """
+        if seed is None:
+            seed = random.randrange(2**31)
+
         tasted_records = self.tasted_record_service.get_refresh_feed(user)
         posts = self.post_service.get_refresh_feed(user)
 
-        combined_data = list(chain(tasted_records, posts))
-
-        random.shuffle(combined_data)
-        return combined_data
+        return SampledQuerySet([tasted_records, posts], seed, f"feed:refresh:{user.id}:{seed}", REFRESH_FEED_TIMEOUT)
 
     def get_anonymous_feed(self):
         """
@@ -149,3 +177,338 @@ class FeedService:
             cache.set(cache_key, feeds, timeout=60 * 5)
 
         return feeds
+
+
+def get_record_sync_service():
+    return RecordSyncService(BeanService())
+
+
+class RecordSyncService:
+    """
+    시음기록, 게시글 일괄 동기화 (오프라인에서 작성한 항목을 한 번에 생성)
+
+    - 항목별 client_key로 이미 생성된 항목은 다시 만들지 않고 기존 id 반환 (재시도 안전)
+    - 원두는 식별값 기준 일괄 조회/생성, 맛&평가, 시음기록, 게시글은 bulk_create, 사진 연결은 종류별 UPDATE 한 번
+    - PK를 반환하지 않는 DB(MySQL)는 맛&평가는 batch_key, 시음기록, 게시글은 client_key로 생성된 id를 한 번에 다시 조회
+    - 항목 수와 무관하게 쿼리 수 고정
+    - bulk_create, update()는 저장 시그널이 없으므로 작성자별 목록 캐시는 직접 무효화
+    """
+
+    CREATED, EXISTING, INVALID = "created", "existing", "invalid"
+
+    def __init__(self, bean_service: BeanService):
+        self.bean_service = bean_service
+
+    def sync(self, user: CustomUser, tasted_records: list[dict], posts: list[dict], retry: bool = True) -> dict:
+        """
+        일괄 동기화
+        Returns:
+            dict: {"tasted_records": 항목별 결과, "posts": 항목별 결과} (요청 순서와 같음)
+        Raises:
+            ConflictException: 같은 키로 동시에 요청되어 재시도 후에도 충돌한 경우
+        """
+        tasted_record_results, pending_tasted_records = self._prepare_items(TastedRecord, TastedRecordSyncSerializer, user, tasted_records)
+        post_results, pending_posts = self._prepare_items(Post, PostSyncSerializer, user, posts)
+
+        photo_ids = self._get_related_ids(chain(pending_tasted_records.values(), pending_posts.values()), "photos")
+        available_photo_ids = set(
+            Photo.objects.filter(id__in=photo_ids, post__isnull=True, tasted_record__isnull=True).values_list("id", flat=True)
+        )
+        self._reject_unavailable(pending_tasted_records, "photos", available_photo_ids, "사용할 수 없는 사진입니다.")
+        self._reject_unavailable(pending_posts, "photos", available_photo_ids, "사용할 수 없는 사진입니다.")
+
+        tasted_record_ids = self._get_related_ids(pending_posts.values(), "tasted_records")
+        existing_tasted_record_ids = set(TastedRecord.objects.filter(id__in=tasted_record_ids).values_list("id", flat=True))
+        self._reject_unavailable(pending_posts, "tasted_records", existing_tasted_record_ids, "존재하지 않는 시음기록입니다.")
+
+        try:
+            with transaction.atomic():
+                self._create_tasted_records(user, pending_tasted_records)
+                self._create_posts(user, pending_posts)
+        except IntegrityError as e:
+            # 같은 키로 동시에 재시도된 요청이 먼저 생성한 경우, 다시 확인하면 existing으로 반환됨
+            if retry:
+                return self.sync(user, tasted_records, posts, retry=False)
+            raise ConflictException(detail="동시에 같은 항목을 동기화하고 있습니다.", code="sync_conflict") from e
+
+        return {"tasted_records": tasted_record_results, "posts": post_results}
+
+    def _prepare_items(self, model, serializer_class, user: CustomUser, items: list[dict]) -> tuple[list[dict], dict]:
+        """
+        항목별 검증 및 이미 생성된 항목 확인 (쿼리 1번)
+        Returns:
+            tuple: (항목별 결과, 생성할 항목 {client_key: (결과, 검증된 데이터)})
+        """
+        results, pending = [], {}
+        for item in items:
+            serializer = serializer_class(data=item)
+            if not serializer.is_valid():
+                results.append({"client_key": item.get("client_key"), "status": self.INVALID, "errors": serializer.errors})
+                continue
+
+            client_key = serializer.validated_data["client_key"]
+            if client_key in pending:
+                results.append({"client_key": client_key, "status": self.INVALID, "errors": {"client_key": ["요청 내 중복된 키입니다."]}})
+                continue
+
+            result = {"client_key": client_key, "status": self.CREATED}
+            results.append(result)
+            pending[client_key] = (result, serializer.validated_data)
+
+        if pending:
+            existing = model.objects.filter(author=user, client_key__in=pending).values_list("client_key", "id")
+            for client_key, pk in existing:
+                result, _ = pending.pop(client_key)
+                result.update(status=self.EXISTING, id=pk)
+
+        return results, pending
+
+    @staticmethod
+    def _get_related_ids(entries, field: str) -> set[int]:
+        return {pk for _, data in entries for pk in data.get(field, [])}
+
+    def _reject_unavailable(self, pending: dict, field: str, available_ids: set[int], message: str) -> None:
+        """
+        사용할 수 없는 id를 포함한 항목을 검증 실패로 처리
+        - 사진은 한 항목에만 연결되므로 먼저 나온 항목이 사용한 사진은 이후 항목에서 사용 불가
+        """
+        for client_key, (result, data) in list(pending.items()):
+            ids = data.get(field, [])
+            if all(pk in available_ids for pk in ids):
+                if field == "photos":
+                    available_ids.difference_update(ids)
+                continue
+            result.update(status=self.INVALID, errors={field: [message]})
+            del pending[client_key]
+
+    def _create_tasted_records(self, user: CustomUser, pending: dict) -> None:
+        if not pending:
+            return
+
+        items = [data for _, data in pending.values()]
+        beans = self.bean_service.get_or_create_many([data["bean"] for data in items])
+        taste_reviews = bulk_create_with_pk(
+            BeanTasteReview, [BeanTasteReview(**data["taste_review"], batch_key=uuid4().hex) for data in items], key_field="batch_key"
+        )
+
+        TastedRecord.objects.bulk_create(
+            [
+                TastedRecord(
+                    author=user,
+                    bean=bean,
+                    taste_review=taste_review,
+                    star=taste_review.star,  # bulk_create는 save()를 거치지 않으므로 별점 복사본 직접 설정
+                    content=data["content"],
+                    is_private=data.get("is_private", False),
+                    tag=data.get("tag"),
+                    client_key=client_key,
+                )
+                for client_key, bean, taste_review, data in zip(pending, beans, taste_reviews, items)
+            ]
+        )
+        self._set_created_ids(TastedRecord, user, pending)
+        self._link_photos("tasted_record", pending)
+        invalidate_user_records_cache("tasted_record", user.id)
+
+    def _create_posts(self, user: CustomUser, pending: dict) -> None:
+        if not pending:
+            return
+
+        Post.objects.bulk_create(
+            [
+                Post(
+                    author=user,
+                    title=data["title"],
+                    content=data["content"],
+                    subject=data["subject"],
+                    tag=data.get("tag"),
+                    client_key=client_key,
+                )
+                for client_key, (_, data) in pending.items()
+            ]
+        )
+        self._set_created_ids(Post, user, pending)
+
+        through = Post.tasted_records.through
+        through.objects.bulk_create(
+            [
+                through(post_id=result["id"], tastedrecord_id=tasted_record_id)
+                for result, data in pending.values()
+                for tasted_record_id in dict.fromkeys(data.get("tasted_records", []))
+            ]
+        )
+        self._link_photos("post", pending)
+        invalidate_user_records_cache("post", user.id)
+
+    @staticmethod
+    def _set_created_ids(model, user: CustomUser, pending: dict) -> None:
+        """생성된 id를 결과에 저장 (MySQL bulk_create는 PK를 반환하지 않으므로 client_key로 다시 조회)"""
+        created = dict(model.objects.filter(author=user, client_key__in=pending).values_list("client_key", "id"))
+        for client_key, (result, _) in pending.items():
+            result["id"] = created[client_key]
+
+    @staticmethod
+    def _link_photos(field: str, pending: dict) -> None:
+        """항목별 사진을 UPDATE 한 번으로 연결"""
+        photo_record_ids = {photo_id: result["id"] for result, data in pending.values() for photo_id in data.get("photos", [])}
+        if not photo_record_ids:
+            return
+
+        record_id = Case(*[When(id=photo_id, then=Value(pk)) for photo_id, pk in photo_record_ids.items()], output_field=IntegerField())
+        Photo.objects.filter(id__in=photo_record_ids, post__isnull=True, tasted_record__isnull=True).update(**{field: record_id})
+
+
+def get_record_change_service():
+    return RecordChangeService()
+
+
+class RecordChangeService:
+    """
+    사용자 본인의 시음기록, 게시글, 저장한 노트(게시글, 시음기록, 원두) 변경 피드
+
+    - 클라이언트가 보관한 워터마크 이후 생성, 수정, 삭제된 항목만 반환 (워터마크가 없으면 전체)
+    - 종류별로 (수정 시각, id) keyset 조회 후 시각순으로 병합하고, 워터마크에 종류별 마지막 위치 저장
+    - 목록 화면에 필요한 필드만 values()로 조회 (조회수, 좋아요 수는 변경 피드 대상이 아님)
+    - 삭제는 Tombstone(보관 기간 Tombstone.RETENTION)으로 전달
+    - 수정, 삭제 시각은 커밋이 아닌 저장 시점이므로 마지막 페이지의 위치는 COMMIT_LAG 이전으로 되돌려 저장
+      (먼저 저장되고 늦게 커밋된 항목을 다시 조회, 재전달된 항목은 클라이언트가 id로 덮어씀)
+    """
+
+    PAGE_SIZE = 200  # 한 응답의 최대 항목 수 (고정, has_more이면 받은 워터마크로 이어서 요청)
+    COMMIT_LAG = timedelta(minutes=5)  # 저장 후 커밋까지 허용하는 최대 지연 (이 구간의 변경은 다음 요청에서 다시 전달)
+    SOURCES = ("tasted_records", "posts", "notes", "deleted")
+    DELETED_KEYS = {"tasted_record": "tasted_records", "post": "posts", "note": "notes"}
+
+    def get_changes(self, user: CustomUser, watermark: str | None = None) -> dict:
+        """
+        변경 피드 조회
+        Returns:
+            dict: {"tasted_records", "posts", "notes": 변경 항목, "deleted": 종류별 삭제 id, "watermark", "has_more"}
+        Raises:
+            ValueError: 형식이 잘못된 워터마크
+            BadRequestException: 삭제 기록 보관 기간보다 오래된 워터마크 (전체 다시 동기화 필요)
+        """
+        now = timezone.now()
+        positions = {}
+        if watermark:
+            positions, issued_at = decode_watermark(watermark)
+            positions = {source: position for source, position in positions.items() if source in self.SOURCES}
+            if issued_at < now - Tombstone.RETENTION:
+                raise BadRequestException(
+                    detail="동기화 기간이 만료되었습니다. 전체 목록을 다시 받아주세요.", code="sync_watermark_expired"
+                )
+
+        rows = []
+        for order, (source, (queryset, field)) in enumerate(self.get_sources(user).items()):
+            queryset = self.get_changed_queryset(queryset, field, positions.get(source))
+            rows += [(row[field], order, row["id"], source, row) for row in queryset[: self.PAGE_SIZE + 1]]
+        rows.sort(key=lambda row: row[:3])
+
+        changes = {"tasted_records": [], "posts": [], "notes": [], "deleted": {key: [] for key in self.DELETED_KEYS.values()}}
+        for changed_at, _, pk, source, row in rows[: self.PAGE_SIZE]:
+            positions[source] = [changed_at, pk]
+            if source == "deleted":
+                changes["deleted"][self.DELETED_KEYS[row["content_type"]]].append(row["object_id"])
+            else:
+                changes[source].append(getattr(self, f"serialize_{source}")(row))
+
+        has_more = len(rows) > self.PAGE_SIZE
+        if not has_more:  # 이어서 요청하는 중간 페이지는 그대로 진행해야 같은 페이지를 반복하지 않음
+            safe_position = [now - self.COMMIT_LAG, 0]
+            positions = {source: min(position, safe_position) for source, position in positions.items()}
+        return {**changes, "watermark": encode_watermark(positions, now), "has_more": has_more}
+
+    @staticmethod
+    def get_sources(user: CustomUser) -> dict[str, tuple[QuerySet, str]]:
+        """종류별 (변경 항목 values 쿼리셋, 변경 시각 필드)"""
+        photos = Photo.objects.order_by("id")
+        tasted_record_photos = photos.filter(tasted_record=OuterRef("pk"))
+        post_photos = photos.filter(post=OuterRef("pk"))
+
+        return {
+            "tasted_records": (
+                TastedRecord.objects.filter(author=user).values(
+                    "id",
+                    "star",
+                    "is_private",
+                    "created_at",
+                    "updated_at",
+                    bean_name=F("bean__name"),
+                    thumbnail_name=Subquery(tasted_record_photos.values("thumbnail_url")[:1]),
+                    photo_name=Subquery(tasted_record_photos.values("photo_url")[:1]),
+                ),
+                "updated_at",
+            ),
+            "posts": (
+                Post.objects.filter(author=user).values(
+                    "id",
+                    "title",
+                    "subject",
+                    "created_at",
+                    "updated_at",
+                    thumbnail_name=Subquery(post_photos.values("thumbnail_url")[:1]),
+                    photo_name=Subquery(post_photos.values("photo_url")[:1]),
+                ),
+                "updated_at",
+            ),
+            "notes": (
+                Note.objects.filter(author=user).values(
+                    "id",
+                    "post_id",
+                    "tasted_record_id",
+                    "bean_id",
+                    "created_at",
+                    post_title=F("post__title"),
+                    tasted_record_bean_name=F("tasted_record__bean__name"),
+                    bean_name=F("bean__name"),
+                ),
+                "created_at",
+            ),
+            "deleted": (Tombstone.objects.filter(user=user).values("id", "content_type", "object_id", "deleted_at"), "deleted_at"),
+        }
+
+    @staticmethod
+    def get_changed_queryset(queryset: QuerySet, field: str, position: list | None) -> QuerySet:
+        """field 오름차순, 같은 값은 id 오름차순으로 position 다음 항목부터 조회하는 쿼리셋 ((조건 컬럼, field, id) 인덱스 범위 조회)"""
+        if position:
+            value, pk = position
+            queryset = queryset.filter(Q(**{f"{field}__gt": value}) | Q(**{field: value, "id__gt": pk}))
+        return queryset.order_by(field, "id")
+
+    @staticmethod
+    def get_photo_url(row: dict) -> str | None:
+        """대표 사진 썸네일 URL (썸네일이 없는 기존 사진은 원본 URL)"""
+        name = row["thumbnail_name"] or row["photo_name"]
+        return default_storage.url(name) if name else None
+
+    def serialize_tasted_records(self, row: dict) -> dict:
+        return {
+            "id": row["id"],
+            "bean_name": row["bean_name"],
+            "star": row["star"],
+            "is_private": row["is_private"],
+            "photo_url": self.get_photo_url(row),
+            "created_at": row["created_at"].isoformat(),
+            "updated_at": row["updated_at"].isoformat(),
+        }
+
+    def serialize_posts(self, row: dict) -> dict:
+        return {
+            "id": row["id"],
+            "title": row["title"],
+            "subject": row["subject"],
+            "photo_url": self.get_photo_url(row),
+            "created_at": row["created_at"].isoformat(),
+            "updated_at": row["updated_at"].isoformat(),
+        }
+
+    @staticmethod
+    def serialize_notes(row: dict) -> dict:
+        """저장 항목 종류, id와 목록 표시용 제목(게시글 제목 or 원두명)"""
+        if row["post_id"]:
+            note_type, target_id, title = "post", row["post_id"], row["post_title"]
+        elif row["tasted_record_id"]:
+            note_type, target_id, title = "tasted_record", row["tasted_record_id"], row["tasted_record_bean_name"]
+        else:
+            note_type, target_id, title = "bean", row["bean_id"], row["bean_name"]
+        return {"id": row["id"], "type": note_type, "target_id": target_id, "title": title, "created_at": row["created_at"].isoformat()}
@@ -0,0 +1,72 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from repo.interactions.note.models import Note
+from repo.profiles.models import CustomUser
+from repo.records.base import invalidate_user_records_cache
+from repo.records.detail_cache import bump_detail_version
+from repo.records.models import Comment, Photo, Post, TastedRecord, Tombstone
+
+TOMBSTONE_CONTENT_TYPES = {TastedRecord: "tasted_record", Post: "post", Note: "note"}
+
+
+def bump_record_versions(post_id: int | None = None, tasted_record_id: int | None = None) -> None:
+    if post_id:
+        bump_detail_version("post", post_id)
+    if tasted_record_id:
+        bump_detail_version("tasted_record", tasted_record_id)
+
+
+@receiver([post_save, post_delete], sender=Post)
+def invalidate_post_detail(sender, instance: Post, **kwargs):
+    """게시글 작성, 수정, 삭제 시 상세 캐시, 작성자별 목록 캐시 무효화"""
+    bump_record_versions(post_id=instance.id)
+    invalidate_user_records_cache("post", instance.author_id)
+
+
+@receiver([post_save, post_delete], sender=TastedRecord)
+def invalidate_tasted_record_detail(sender, instance: TastedRecord, **kwargs):
+    """시음기록 작성, 수정, 삭제 시 상세 캐시, 작성자별 목록 캐시 무효화"""
+    bump_record_versions(tasted_record_id=instance.id)
+    invalidate_user_records_cache("tasted_record", instance.author_id)
+
+
+@receiver([post_save, post_delete], sender=Photo)
+@receiver([post_save, post_delete], sender=Comment)
+def invalidate_parent_detail(sender, instance: Photo | Comment, **kwargs):
+    """사진, 댓글 변경 시 연결된 게시글 or 시음기록 상세 캐시 무효화"""
+    bump_record_versions(post_id=instance.post_id, tasted_record_id=instance.tasted_record_id)
+
+
+@receiver(m2m_changed, sender=Post.like_cnt.through)
+@receiver(m2m_changed, sender=Post.tasted_records.through)
+@receiver(m2m_changed, sender=TastedRecord.like_cnt.through)
+def invalidate_detail_on_m2m_change(sender, instance, action: str, reverse: bool, model, pk_set: set | None, **kwargs):
+    """
+    좋아요, 게시글-시음기록 연결 변경 시 상세 캐시 무효화
+    - reverse: 사용자(or 시음기록) 쪽에서 변경한 경우 model, pk_set이 변경된 게시물 모델, id
+    """
+    if not action.startswith("post_"):
+        return
+
+    if reverse:
+        record_model, record_ids = model, pk_set or []  # 역방향 clear는 변경된 게시물을 알 수 없으므로 TTL로 만료
+    else:
+        record_model, record_ids = type(instance), [instance.id]
+
+    content_type = "post" if record_model is Post else "tasted_record"
+    for record_id in record_ids:
+        bump_detail_version(content_type, record_id)
+
+
+@receiver(post_delete, sender=TastedRecord)
+@receiver(post_delete, sender=Post)
+@receiver(post_delete, sender=Note)
+def create_tombstone(sender, instance: TastedRecord | Post | Note, origin=None, **kwargs):
+    """
+    시음기록, 게시글, 노트 삭제 기록 저장 (변경 피드의 삭제 항목)
+    - 소유자 탈퇴로 함께 삭제되는 항목은 받을 클라이언트가 없으므로 제외
+    """
+    if isinstance(origin, CustomUser) and origin.pk == instance.author_id:
+        return
+    Tombstone.objects.create(user_id=instance.author_id, content_type=TOMBSTONE_CONTENT_TYPES[sender], object_id=instance.pk)
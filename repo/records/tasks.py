@@ -0,0 +1,119 @@
+import logging
+from datetime import timedelta
+
+from celery import shared_task
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.utils import timezone
+
+from repo.common.bucket import release_photo_files, remove_media_files
+from repo.records.models import Photo, PhotoFile, Tombstone
+
+logger = logging.getLogger(__name__)
+
+TOMBSTONE_PURGE_BATCH_SIZE = 1000
+ORPHAN_PHOTO_BATCH_SIZE = 1000
+ORPHAN_PHOTO_GRACE_HOURS = 24  # 임시 업로드 후 게시글, 시음기록 작성까지 기다리는 시간
+
+
+@shared_task(name="repo.records.tasks.purge_tombstones", bind=True, default_retry_delay=10, max_retries=3)
+def purge_tombstones(self, batch_size: int = TOMBSTONE_PURGE_BATCH_SIZE) -> int:
+    """
+    보관 기간이 지난 삭제 기록 삭제 (변경 피드 워터마크도 같은 기간 후 만료)
+    - 한 번에 큰 범위를 잠그지 않도록 batch_size개씩 삭제
+    Returns:
+        int: 삭제한 삭제 기록 수
+    """
+    try:
+        cutoff = timezone.now() - Tombstone.RETENTION
+        deleted = 0
+        while ids := list(Tombstone.objects.filter(deleted_at__lt=cutoff).values_list("id", flat=True)[:batch_size]):
+            deleted += Tombstone.objects.filter(id__in=ids).delete()[0]
+        logger.info(f"삭제 기록 {deleted}개 정리 완료")
+        return deleted
+    except Exception as e:
+        logger.error(f"삭제 기록 정리 실패: {str(e)}", exc_info=True)
+        raise
+
+
+@shared_task(name="repo.records.tasks.collect_orphan_photos", bind=True, default_retry_delay=10, max_retries=3)
+def collect_orphan_photos(
+    self, grace_hours: int = ORPHAN_PHOTO_GRACE_HOURS, batch_size: int = ORPHAN_PHOTO_BATCH_SIZE, dry_run: bool = False
+) -> dict:
+    """
+    고아 사진 정리
+    - 게시글, 시음기록에 연결되지 않은 채 grace_hours가 지난 사진 (작성하지 않은 임시 업로드)
+    - 참조하는 사진 없이 grace_hours가 지난 공유 파일 (게시글, 시음기록 삭제로 사진 행만 함께 삭제된 경우)
+    - id 기준 keyset으로 batch_size개씩 행을 삭제하고, 파일은 커밋 이후 S3 1000개 단위 일괄 삭제
+    - dry_run이면 삭제하지 않고 정리 대상만 집계
+    Returns:
+        dict: {"photos": 사진 수, "files": 공유 파일 수, "bytes": 회수한 용량, "failed_files": 삭제 실패 파일 수, "dry_run": dry_run}
+    """
+    try:
+        cutoff = timezone.now() - timedelta(hours=grace_hours)
+        report = {"photos": 0, "files": 0, "bytes": 0, "failed_files": 0, "dry_run": dry_run}
+
+        orphan_photos = Photo.objects.filter(post__isnull=True, tasted_record__isnull=True, created_at__lt=cutoff)
+        last_id = 0
+        while ids := list(orphan_photos.filter(id__gt=last_id).order_by("id").values_list("id", flat=True)[:batch_size]):
+            last_id = ids[-1]
+            collect_photos(orphan_photos, ids, report)
+
+        orphan_files = PhotoFile.objects.filter(photos__isnull=True, created_at__lt=cutoff)
+        last_id = 0
+        while ids := list(orphan_files.filter(id__gt=last_id).order_by("id").values_list("id", flat=True)[:batch_size]):
+            last_id = ids[-1]
+            collect_files(ids, report)
+
+        logger.info(f"고아 사진 정리 완료: {report}")
+        return report
+    except Exception as e:
+        logger.error(f"고아 사진 정리 실패: {str(e)}", exc_info=True)
+        raise
+
+
+def collect_photos(orphan_photos, ids: list[int], report: dict) -> None:
+    """고아 사진 한 배치 삭제 (조회 이후 게시글, 시음기록에 연결된 사진은 잠금 후 다시 확인해 제외)"""
+    with transaction.atomic():
+        photos = list(
+            orphan_photos.select_for_update().filter(id__in=ids).only("id", "stored_file_id", "photo_url", "thumbnail_url", "medium_url")
+        )
+        file_ids = {photo.stored_file_id for photo in photos if photo.stored_file_id}
+        if report["dry_run"]:
+            referenced = set(Photo.objects.filter(stored_file_id__in=file_ids).exclude(id__in=ids).values_list("stored_file_id", flat=True))
+            released = list(PhotoFile.objects.filter(id__in=file_ids - referenced))
+        else:
+            Photo.objects.filter(id__in=[photo.id for photo in photos]).delete()
+            released = release_photo_files(file_ids)
+
+    report["photos"] += len(photos)
+    names = [name for photo in photos if photo.stored_file_id is None for name in photo.get_file_names()]
+    remove_files(names, released, report)
+
+
+def collect_files(ids: list[int], report: dict) -> None:
+    """참조하는 사진이 없는 공유 파일 한 배치 삭제"""
+    released = list(PhotoFile.objects.filter(id__in=ids)) if report["dry_run"] else release_photo_files(ids)
+    remove_files([], released, report)
+
+
+def remove_files(names: list[str], released: list[PhotoFile], report: dict) -> None:
+    """
+    커밋된 배치의 파일 삭제 및 회수 용량 집계
+    Args:
+        names: 공유 파일이 아닌 기존 사진의 파일 이름 (크기를 저장하지 않으므로 저장소에서 조회)
+        released: 삭제한 공유 파일
+    """
+    report["files"] += len(released)
+    report["bytes"] += sum(get_file_size(name) for name in names) + sum(stored_file.size for stored_file in released)
+    if not report["dry_run"]:
+        names += [name for stored_file in released for name in stored_file.get_file_names()]
+        report["failed_files"] += len(remove_media_files(names))
+
+
+def get_file_size(name: str) -> int:
+    """저장소의 파일 크기 (조회 실패 시 0)"""
+    try:
+        return default_storage.size(name)
+    except Exception:
+        return 0
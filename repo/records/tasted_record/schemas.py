@@ -10,6 +10,7 @@ from repo.records.tasted_record.serializers import (
     TastedRecordCreateUpdateSerializer,
     TastedRecordDetailSerializer,
     TastedRecordListSerializer,
+    UserTastedRecordCursorSerializer,
     UserTastedRecordSerializer,
 )
 
@@ -134,14 +135,22 @@ class UserTastedRecordListSchema:
             OpenApiParameter(name="is_decaf", type=bool, enum=[True, False], required=False),
             OpenApiParameter(name="roast_point_min", type=float, required=False),
             OpenApiParameter(name="roast_point_max", type=float, required=False),
-            OpenApiParameter(name="ordering", type=str, enum=["-created_at", "-taste_review__star", "-likes"], required=False),
+            UserTastedRecordCursorSerializer,
         ],
         responses={
             200: UserTastedRecordSerializer(many=True),
             404: OpenApiResponse(description="Not Found"),
         },
         summary="유저 시음기록 리스트 조회",
-        description="특정 사용자의 시음기록 리스트를 필터링하여 조회합니다.",
+        description="""
+            특정 사용자의 시음기록 리스트를 필터링하여 조회합니다.
+            - 정렬 (ordering): latest(최신순, 기본값), star(별점순), likes(좋아요순)
+            - cursor : 다음 페이지 조회 시 이전 응답의 next_cursor (없으면 첫 페이지)
+
+            notice:
+            - page 파라미터 대신 cursor 기반으로 변경되었습니다. 응답의 next 주소로 다음 페이지를 조회해주세요.
+            - 기존 ordering 값(-created_at, -taste_review__star, -likes)도 당분간 지원합니다.
+        """,
         tags=[TastedRecord_Tag],
     )
 
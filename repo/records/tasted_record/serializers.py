@@ -9,6 +9,7 @@ from repo.interactions.serializers import (
 )
 from repo.profiles.serializers import UserSimpleSerializer
 from repo.records.models import Photo, TastedRecord
+from repo.records.serializers import UserRecordCursorSerializer
 
 
 class TastedRecordListSerializer(serializers.ModelSerializer):
@@ -23,6 +24,7 @@ class TastedRecordListSerializer(serializers.ModelSerializer):
     flavor = serializers.CharField(source="taste_review.flavor")
     # 기타 정보
     created_at = serializers.SerializerMethodField()
+    created_at_iso = serializers.DateTimeField(source="created_at", read_only=True)
     likes = serializers.IntegerField()
     comments = serializers.IntegerField(source="comment_set.count")
     interaction = serializers.SerializerMethodField(read_only=True)
@@ -36,7 +38,7 @@ class TastedRecordListSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = TastedRecord
-        exclude = ["like_cnt", "bean", "taste_review"]
+        exclude = ["like_cnt", "bean", "taste_review", "star", "client_key", "updated_at"]
 
 
 class TastedRecordDetailSerializer(serializers.ModelSerializer):
@@ -57,7 +59,7 @@ class TastedRecordDetailSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = TastedRecord
-        exclude = ["like_cnt"]
+        exclude = ["like_cnt", "star", "client_key", "updated_at"]  # star: 정렬용 별점 복사본 (taste_review.star와 같은 값)
 
 
 class TastedRecordCreateUpdateSerializer(serializers.ModelSerializer):
@@ -74,6 +76,20 @@ class TastedRecordCreateUpdateSerializer(serializers.ModelSerializer):
         fields = ["content", "is_private", "tag", "bean", "taste_review", "photos"]
 
 
+class TastedRecordSyncSerializer(TastedRecordCreateUpdateSerializer):
+    """
+    일괄 동기화 시음기록 항목 (생성 전용)
+    - 사진 존재 여부는 서비스에서 요청 전체를 한 번에 확인하므로 id 목록만 검증
+    """
+
+    client_key = serializers.CharField(max_length=64, help_text="클라이언트 멱등 키 (재시도 시 같은 값 전송)")
+    bean = BeanSerializer("bean")
+    photos = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False, max_length=10)
+
+    class Meta(TastedRecordCreateUpdateSerializer.Meta):
+        fields = ["client_key", *TastedRecordCreateUpdateSerializer.Meta.fields]
+
+
 class TastedRecordInPostSerializer(serializers.ModelSerializer):
     bean_name = serializers.CharField(source="bean.name")
     bean_type = serializers.CharField(source="bean.get_bean_type_display")
@@ -86,6 +102,13 @@ class TastedRecordInPostSerializer(serializers.ModelSerializer):
         fields = ["id", "content", "bean_name", "bean_type", "star_rating", "flavor", "photos"]
 
 
+class UserTastedRecordCursorSerializer(UserRecordCursorSerializer):
+    """특정 사용자의 시음기록 리스트 조회 파라미터"""
+
+    ORDERING_CHOICES = ["latest", "star", "likes"]
+    LEGACY_ORDERINGS = {"-created_at": "latest", "-taste_review__star": "star", "-likes": "likes"}
+
+
 class UserTastedRecordSerializer(serializers.ModelSerializer):
     bean_name = serializers.CharField(source="bean.name")
     star = serializers.FloatField(source="taste_review.star")
@@ -94,7 +117,7 @@ class UserTastedRecordSerializer(serializers.ModelSerializer):
 
     def get_photo_url(self, obj):
         if obj.tasted_record_photos:
-            return obj.tasted_record_photos[0].photo_url.url
+            return obj.tasted_record_photos[0].get_thumbnail_url()
         return None
 
     class Meta:
@@ -3,7 +3,8 @@ from typing import Optional
 
 from django.core.cache import cache
 from django.db import transaction
-from django.db.models import BooleanField, Exists, Prefetch, Q, QuerySet, Value
+from django.db.models import BooleanField, Exists, F, Prefetch, Q, QuerySet, Value
+from django.http import Http404
 
 from repo.beans.services import BeanService
 from repo.common.view_tracker import RedisViewTracker
@@ -11,10 +12,13 @@ from repo.interactions.like.services import LikeService
 from repo.interactions.note.services import NoteService
 from repo.interactions.relationship.services import RelationshipService
 from repo.profiles.models import CustomUser
-from repo.profiles.services import UserService
 from repo.records.base import BaseRecordService
+from repo.records.detail_cache import get_or_set_detail_body, overlay_detail_state
 from repo.records.models import BeanTasteReview, Photo, TastedRecord
-from repo.records.tasted_record.serializers import TastedRecordListSerializer
+from repo.records.tasted_record.serializers import (
+    TastedRecordDetailSerializer,
+    TastedRecordListSerializer,
+)
 
 
 def get_tasted_record_service():
@@ -26,10 +30,12 @@ def get_tasted_record_service():
 
 class TastedRecordService(BaseRecordService):
 
+    content_type = "tasted_record"
+    user_record_orderings = {"latest": "created_at", "star": "star", "likes": "likes"}
+
     def __init__(self, relationship_service, like_service, note_service):
         super().__init__(relationship_service, like_service, note_service)
         self.bean_service = BeanService()
-        self.user_service = UserService()
         self.tracker = RedisViewTracker()
 
     @transaction.atomic
@@ -41,23 +47,45 @@ class TastedRecordService(BaseRecordService):
             tasted_record = TastedRecord.objects.get(id=pk)
             self.tracker.update_view_count(tasted_record)
 
-        return TastedRecord.objects.select_related("author", "bean", "taste_review").prefetch_related("photo_set").get(pk=pk)
+        return self.get_detail_queryset().get(pk=pk)
+
+    def get_cached_record_detail(self, request, pk: int) -> dict:
+        """
+        시음기록 상세 조회 (캐시 사용)
+        - 조회자와 무관한 본문은 버전 캐시에서 조회하고, 조회수와 상호작용 여부만 한 번의 쿼리로 조회
+        Raises:
+            Http404: 시음기록이 없는 경우
+        """
+        state = self.get_detail_state(TastedRecord, pk, request.user)
+        if state is None:
+            raise Http404("No TastedRecord matches the given query.")
+
+        if self.tracker.track_view(request, "tasted_record", pk):
+            TastedRecord.objects.filter(pk=pk).update(view_cnt=F("view_cnt") + 1)
+            state["view_cnt"] += 1
+
+        body = get_or_set_detail_body(
+            "tasted_record", pk, lambda: dict(TastedRecordDetailSerializer(self.get_detail_queryset().get(pk=pk)).data)
+        )
+        return overlay_detail_state(body, state)
+
+    @staticmethod
+    def get_detail_queryset() -> QuerySet[TastedRecord]:
+        return TastedRecord.objects.select_related("author", "bean", "taste_review").prefetch_related("photo_set")
 
     def get_user_records(self, user_id: int, **kwargs) -> QuerySet[TastedRecord]:
         """유저가 작성한 시음기록 조회"""
-        user = self.user_service.get_user_by_id(user_id)
-
         return (
-            TastedRecord.objects.filter(author=user)
+            TastedRecord.objects.filter(author_id=user_id)
             .select_related("bean", "taste_review")
             .prefetch_related(
                 Prefetch(
                     "photo_set",
-                    queryset=Photo.objects.only("photo_url", "tasted_record_id"),
+                    queryset=Photo.objects.only("photo_url", "thumbnail_url", "tasted_record_id"),
                     to_attr="tasted_record_photos",
                 )
             )
-            .only("id", "bean__name", "taste_review__star", "created_at", "likes")
+            .only("id", "bean__name", "taste_review__star", "created_at", "likes", "star")
         )
 
     def get_record_list(self, user: CustomUser, **kwargs) -> QuerySet[TastedRecord]:
@@ -76,7 +104,7 @@ class TastedRecordService(BaseRecordService):
 
         blocked_users_list = self.relationship_service.get_unique_blocked_user_list(user.id)
 
-        tasted_records = self.get_base_record_list_queryset().exclude(author_id__in=blocked_users_list)
+        tasted_records = self.get_base_record_list_queryset().exclude(author_id__in=blocked_users_list).order_by("-id")
         tasted_records = self.annotate_user_interactions(tasted_records, user)
         tasted_records = self.tracker.filter_not_viewed_contents(request, "tasted_record", tasted_records)
         return tasted_records
@@ -1,14 +1,17 @@
 from django.shortcuts import get_object_or_404
 from django_filters import rest_framework as filters
 from rest_framework import generics, status
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from repo.common.filters import TastedRecordFilter
 from repo.common.permissions import IsOwnerOrReadOnly
-from repo.common.utils import get_paginated_response_with_class
+from repo.common.utils import (
+    get_cursor_paginated_response,
+    get_paginated_cached_response,
+    get_paginated_response_with_class,
+)
 from repo.records.models import TastedRecord
 from repo.records.tasted_record.schemas import (
     TastedRecordSchema,
@@ -18,6 +21,7 @@ from repo.records.tasted_record.serializers import (
     TastedRecordCreateUpdateSerializer,
     TastedRecordDetailSerializer,
     TastedRecordListSerializer,
+    UserTastedRecordCursorSerializer,
     UserTastedRecordSerializer,
 )
 from repo.records.tasted_record.services import get_tasted_record_service
@@ -51,9 +55,7 @@ class TastedRecordListCreateAPIView(APIView):
 
         if not user.is_authenticated:
             tasted_records = self.tasted_record_service.get_record_list_for_anonymous()
-            paginator = PageNumberPagination()
-            paginated_tasted_records = paginator.paginate_queryset(tasted_records, request)
-            return paginator.get_paginated_response(paginated_tasted_records)
+            return get_paginated_cached_response(request, tasted_records)
 
         tasted_records = self.tasted_record_service.get_record_list_v2(user, request=request)
         return get_paginated_response_with_class(request, tasted_records, serializer_class)
@@ -96,10 +98,9 @@ class TastedRecordDetailApiView(APIView):
         return tasted_record
 
     def get(self, request, pk):
-        tasted_record = self.get_object(pk)
-        tasted_record_detail = self.tasted_record_service.get_record_detail(request, tasted_record.id)
-        serializer = self.response_serializer_class(tasted_record_detail, context={"request": request})
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        # 조회는 모든 사용자에게 허용되므로 객체 권한 확인 없이 캐시된 상세 정보 반환
+        tasted_record_detail = self.tasted_record_service.get_cached_record_detail(request, pk)
+        return Response(tasted_record_detail, status=status.HTTP_200_OK)
 
     def put(self, request, pk):
         tasted_record = self.get_object(pk)
@@ -129,16 +130,35 @@ class TastedRecordDetailApiView(APIView):
 
 @UserTastedRecordListSchema.user_tasted_record_list_schema_view
 class UserTastedRecordListView(generics.ListAPIView):
+    """
+    특정 사용자의 시음기록 리스트 조회 API
+    - 정렬: latest(최신순), star(별점순), likes(좋아요순), 정렬별 keyset 커서 페이지네이션
+    - 필터가 없는 첫 페이지는 작성자, 정렬별로 캐시
+    """
+
     serializer_class = UserTastedRecordSerializer
     filter_backends = [filters.DjangoFilterBackend]
     filterset_class = TastedRecordFilter
-    ordering_fields = ["-created_at", "-taste_review__star", "-likes"]
 
     def __init__(self, **kwargs):
         self.tasted_record_service = get_tasted_record_service()
 
     def get_queryset(self):
-        user_id = self.kwargs.get("id")
-        queryset = self.tasted_record_service.get_user_records(user_id)
-        ordering = self.request.query_params.get("ordering", "-created_at")
-        return queryset.order_by(ordering)
+        return self.tasted_record_service.get_user_records(self.kwargs.get("id"))
+
+    def list(self, request, *args, **kwargs):
+        params = UserTastedRecordCursorSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        is_filtered = any(name in request.query_params for name in self.filterset_class.base_filters)
+        data = self.tasted_record_service.get_user_records_page(
+            self.kwargs.get("id"),
+            queryset,
+            self.serializer_class,
+            ordering=params.validated_data["ordering"],
+            cursor=params.validated_data.get("cursor"),
+            size=params.validated_data["size"],
+            cache_variant=None if is_filtered else "",
+        )
+        return get_cursor_paginated_response(request, data)
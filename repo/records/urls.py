@@ -8,6 +8,8 @@ urlpatterns = [
     path("feed/", views.FeedAPIView.as_view(), name="feed"),
     path("feed/v2/", views.FeedAPIViewV2.as_view(), name="feed-v2"),
     path("comment/", include("repo.records.comment.urls")),
+    path("sync/", views.RecordSyncAPIView.as_view(), name="record-sync"),
+    path("sync/changes/", views.RecordChangeAPIView.as_view(), name="record-changes"),
     path("photo/", views.PhotoApiView.as_view(), name="photo-upload"),
     path("photo/profile/", views.ProfilePhotoAPIView.as_view(), name="profile-photo"),
     path("logs/", views.ExceptionLogRecordAPIView.as_view()),
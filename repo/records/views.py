@@ -1,11 +1,12 @@
 from django.db import transaction
 from django.http import Http404
+from django.utils import timezone
 from drf_spectacular.utils import OpenApiExample, OpenApiResponse
 from rest_framework import serializers, status
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 from rest_framework.views import APIView
 
 from repo.common.bucket import (
@@ -13,6 +14,9 @@ from repo.common.bucket import (
     delete_photos,
     delete_profile_photo,
 )
+from repo.common.db_router import ReplicaReadMixin
+from repo.common.exception.exceptions import BaseAPIException
+from repo.common.image_pipeline import PhotoUploadPipeline
 from repo.common.serializers import (
     ObjectSerializer,
     PhotoDetailSerializer,
@@ -21,16 +25,41 @@ from repo.common.serializers import (
 )
 from repo.common.utils import (
     get_object_by_type,
+    get_paginated_cached_response,
     get_paginated_response_with_class,
 )
+from repo.records.base import invalidate_user_records_cache
+from repo.records.detail_cache import bump_detail_version
 from repo.records.models import ExceptionLogRecord, Photo
 from repo.records.schemas import *
-from repo.records.serializers import FeedSerializer
-from repo.records.services import get_feed_service
+from repo.records.serializers import (
+    FeedSerializer,
+    RecordChangeQuerySerializer,
+    RecordSyncSerializer,
+)
+from repo.records.services import (
+    get_feed_service,
+    get_record_change_service,
+    get_record_sync_service,
+)
+
+REFRESH_SEED_PARAM = "seed"
+
+
+def get_refresh_feed_response(request, feed_service, serializer_class) -> Response:
+    """새로고침 피드 응답 (다음, 이전 페이지 링크에 새로고침 세션 시드 포함)"""
+    seed = request.query_params.get(REFRESH_SEED_PARAM, "")
+    queryset = feed_service.get_refresh_feed(request.user, int(seed) if seed.isdigit() else None)
+
+    response = get_paginated_response_with_class(request, queryset, serializer_class)
+    for key in ("next", "previous"):
+        if response.data.get(key):
+            response.data[key] = replace_query_param(response.data[key], REFRESH_SEED_PARAM, queryset.seed)
+    return response
 
 
 @FeedSchema.feed_schema_view
-class FeedAPIView(APIView):
+class FeedAPIView(ReplicaReadMixin, APIView):
 
     def __init__(self, **kwargs):
         self.feed_service = get_feed_service()
@@ -41,26 +70,25 @@ class FeedAPIView(APIView):
 
         if not request.user.is_authenticated:  # 비회원
             feed_data = self.feed_service.get_anonymous_feed()
-            paginator = PageNumberPagination()
-            paginated_queryset = paginator.paginate_queryset(feed_data, request)
-            return paginator.get_paginated_response(paginated_queryset)
+            return get_paginated_cached_response(request, feed_data)
 
         feed_type = request.query_params.get("feed_type")
         if feed_type not in ["following", "common", "refresh"]:
             return Response({"error": "invalid feed type"}, status=status.HTTP_400_BAD_REQUEST)
 
+        if feed_type == "refresh":
+            return get_refresh_feed_response(request, self.feed_service, serializer_class)
+
         if feed_type == "following":
             queryset = self.feed_service.get_following_feed(request, user)
-        elif feed_type == "common":
+        else:  # common
             queryset = self.feed_service.get_common_feed(request, user)
-        else:  # refresh
-            queryset = self.feed_service.get_refresh_feed(user)
 
         return get_paginated_response_with_class(request, queryset, serializer_class)
 
 
 @FeedSchemaV2.feed_schema_view_v2
-class FeedAPIViewV2(APIView):
+class FeedAPIViewV2(ReplicaReadMixin, APIView):
     REFRESH_FEED_TYPE = "refresh"
 
     def __init__(self, **kwargs):
@@ -82,9 +110,7 @@ class FeedAPIViewV2(APIView):
     def _handle_anonymous_user(self, request):
         """비회원 피드 처리"""
         feed_data = self.feed_service.get_anonymous_feed()
-        paginator = PageNumberPagination()
-        paginated_queryset = paginator.paginate_queryset(feed_data, request)
-        return paginator.get_paginated_response(paginated_queryset)
+        return get_paginated_cached_response(request, feed_data)
 
     def _handle_authenticated_user(self, request):
         """회원 피드 처리"""
@@ -92,10 +118,9 @@ class FeedAPIViewV2(APIView):
         feed_type = request.query_params.get("feed_type")
 
         if feed_type == self.REFRESH_FEED_TYPE:
-            queryset = self.feed_service.get_refresh_feed(user)
-        else:
-            queryset = self.feed_service.get_feed(request, user)
+            return get_refresh_feed_response(request, self.feed_service, self.serializer_class)
 
+        queryset = self.feed_service.get_feed(request, user)
         return get_paginated_response_with_class(request, queryset, self.serializer_class)
 
 
@@ -104,29 +129,18 @@ class PhotoApiView(APIView):
     permission_classes = [IsAuthenticated]
     parser_classes = (MultiPartParser, FormParser)
 
-    @transaction.atomic
     def post(self, request):
-        """임시 사진 업로드 API"""
+        """임시 사진 업로드 API (원본과 썸네일 등 변형 이미지를 동시 업로드)"""
         serializer = PhotoUploadSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
         files = serializer.validated_data["photo_url"]
-        try:
-            photos = []  # 업로드할 사진 목록
-            for i, file in enumerate(files):
-                file.name = create_unique_filename(file.name, is_main=(i == 0))
-                photo = Photo(photo_url=file)
-                photo.save()
-                photos.append(photo)
-
-            return Response(PhotoDetailSerializer(photos, many=True).data, status=status.HTTP_201_CREATED)
-        except Exception as e:
-            delete_photos(photos)
-            return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        photos = PhotoUploadPipeline().upload(files)
+
+        return Response(PhotoDetailSerializer(photos, many=True).data, status=status.HTTP_201_CREATED)
 
-    @transaction.atomic
     def put(self, request):
-        """사진 수정 API (기존 사진 삭제 후 새로운 사진 업로드)"""
+        """사진 수정 API (변경된 사진만 업로드 후 기존 사진 중 빠진 사진 삭제)"""
         serializer = PhotoUpdateSerializer(
             data={
                 "photo_url": request.FILES.getlist("photo_url"),
@@ -146,20 +160,26 @@ class PhotoApiView(APIView):
             if obj.author != request.user:  # 작성자 권한 체크
                 return Response({"error": "권한이 없습니다"}, status=status.HTTP_403_FORBIDDEN)
 
-            delete_photos(obj)  # 기존 사진 삭제
+            # 내용이 같은 기존 사진은 유지하고 나머지만 업로드 (업로드는 트랜잭션 밖에서 처리)
+            pipeline = PhotoUploadPipeline()
+            kept, files = pipeline.match_photos(list(obj.photo_set.select_related("stored_file").order_by("id")), files)
+            photos = pipeline.upload(files, first_is_main=not kept) if files else []
 
-            photos = []  # 업로드할 사진 목록
-            for i, file in enumerate(files):
-                file.name = create_unique_filename(file.name, is_main=(i == 0))
-                photo = Photo(**{object_type: obj, "photo_url": file})
-                photo.save()
-                photos.append(photo)
+            with transaction.atomic():
+                delete_photos(obj, exclude_ids=[photo.id for photo in kept])  # 변경된 기존 사진 삭제
+                Photo.objects.filter(id__in=[photo.id for photo in photos]).update(**{object_type: obj})
+                if object_type in ("post", "tasted_record"):  # update()는 저장 시그널이 없으므로 직접 캐시 무효화
+                    bump_detail_version(object_type, obj.id)
+                    invalidate_user_records_cache(object_type, obj.author_id)
+                    type(obj).objects.filter(id=obj.id).update(updated_at=timezone.now())  # 변경 피드에 대표 사진 변경 반영
 
-            return Response(PhotoDetailSerializer(photos, many=True).data, status=status.HTTP_200_OK)
+            return Response(PhotoDetailSerializer(kept + photos, many=True).data, status=status.HTTP_200_OK)
         except ValueError:
             return Response({"error": "invalid object_type"}, status=status.HTTP_400_BAD_REQUEST)
         except Http404:
             return Response({"error": "object not found"}, status=status.HTTP_404_NOT_FOUND)
+        except BaseAPIException:
+            raise
         except Exception as e:
             return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
@@ -179,6 +199,10 @@ class PhotoApiView(APIView):
                 return Response({"error": "권한이 없습니다"}, status=status.HTTP_403_FORBIDDEN)
 
             delete_photos(obj)
+            if object_type in ("post", "tasted_record"):  # 사진 삭제는 저장 시그널이 없으므로 직접 캐시 무효화
+                bump_detail_version(object_type, obj.id)
+                invalidate_user_records_cache(object_type, obj.author_id)
+                type(obj).objects.filter(id=obj.id).update(updated_at=timezone.now())  # 변경 피드에 대표 사진 변경 반영
 
             return Response(status=status.HTTP_204_NO_CONTENT)
         except ValueError:
@@ -189,6 +213,47 @@ class PhotoApiView(APIView):
             return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+@RecordSyncSchema.record_sync_schema_view
+class RecordSyncAPIView(APIView):
+    """
+    시음기록, 게시글 일괄 동기화 API
+    - 오프라인에서 작성한 여러 시음기록, 게시글을 한 번의 요청으로 생성
+    - 항목별 client_key로 재시도 시 중복 생성되지 않고, 항목별 결과를 요청 순서대로 반환
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def __init__(self, **kwargs):
+        self.sync_service = get_record_sync_service()
+
+    def post(self, request):
+        serializer = RecordSyncSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        results = self.sync_service.sync(request.user, **serializer.validated_data)
+        return Response(results, status=status.HTTP_200_OK)
+
+
+@RecordChangeSchema.record_change_schema_view
+class RecordChangeAPIView(APIView):
+    """
+    본인 시음기록, 게시글, 저장한 노트 변경 피드 API
+    - 워터마크 이후 생성, 수정, 삭제된 항목만 반환 (앱 실행 시 전체 목록 대신 변경분만 동기화)
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def __init__(self, **kwargs):
+        self.change_service = get_record_change_service()
+
+    def get(self, request):
+        serializer = RecordChangeQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        changes = self.change_service.get_changes(request.user, serializer.validated_data.get("watermark"))
+        return Response(changes, status=status.HTTP_200_OK)
+
+
 @ProfilePhotoSchema.profile_photo_schema_view
 class ProfilePhotoAPIView(APIView):
     permission_classes = [IsAuthenticated]
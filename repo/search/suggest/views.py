@@ -4,6 +4,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from repo.beans.models import Bean
+from repo.common.db_router import ReplicaReadMixin
 from repo.profiles.models import CustomUser
 from repo.records.models import Post, TastedRecord
 from repo.search.suggest.schemas import SuggestSchema
@@ -11,7 +12,7 @@ from repo.search.suggest.serializers import *
 
 
 @SuggestSchema.buddy_suggest_schema_view
-class BuddySuggestView(APIView):
+class BuddySuggestView(ReplicaReadMixin, APIView):
     """
     사용자 이름 검색어 12개 추천 API
     Args:
@@ -34,7 +35,7 @@ class BuddySuggestView(APIView):
 
 
 @SuggestSchema.bean_suggest_schema_view
-class BeanSuggestView(APIView):
+class BeanSuggestView(ReplicaReadMixin, APIView):
     """
     공식 원두 이름 검색어 12개 추천 API
     Args:
@@ -59,7 +60,7 @@ class BeanSuggestView(APIView):
 
 
 @SuggestSchema.tastedrecord_suggest_schema_view
-class TastedRecordSuggestView(APIView):
+class TastedRecordSuggestView(ReplicaReadMixin, APIView):
     """
     시음 기록 검색어 12개 추천 API
     Args:
@@ -83,7 +84,7 @@ class TastedRecordSuggestView(APIView):
 
 
 @SuggestSchema.post_suggest_schema_view
-class PostSuggestView(APIView):
+class PostSuggestView(ReplicaReadMixin, APIView):
     """
     게시글 검색어 12개 추천 API
     Args:
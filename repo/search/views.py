@@ -13,6 +13,7 @@ from django.db.models.functions import Coalesce, Round
 from rest_framework.views import APIView
 
 from repo.beans.models import Bean
+from repo.common.db_router import ReplicaReadMixin
 from repo.common.utils import get_paginated_response_with_class
 from repo.interactions.relationship.models import Relationship
 from repo.interactions.relationship.services import RelationshipService
@@ -24,7 +25,7 @@ from repo.search.serializers import *
 
 
 @SearchSchema.buddy_search_schema_view
-class BuddySearchView(APIView):
+class BuddySearchView(ReplicaReadMixin, APIView):
     """
     사용자 검색 API
     Args:
@@ -65,7 +66,7 @@ class BuddySearchView(APIView):
 
 
 @SearchSchema.bean_search_schema_view
-class BeanSearchView(APIView):
+class BeanSearchView(ReplicaReadMixin, APIView):
     """
     공식 원두 검색 API
     Args:
@@ -94,7 +95,7 @@ class BeanSearchView(APIView):
 
 
 @SearchSchema.tastedrecord_search_schema_view
-class TastedRecordSearchView(APIView):
+class TastedRecordSearchView(ReplicaReadMixin, APIView):
     """
     시음 기록 검색 API
     Args:
@@ -128,7 +129,7 @@ class TastedRecordSearchView(APIView):
 
 
 @SearchSchema.post_search_schema_view
-class PostSearchView(APIView):
+class PostSearchView(ReplicaReadMixin, APIView):
     """
     게시글 검색 API
     Args:
@@ -11,19 +11,7 @@ python manage.py migrate
 echo "Collecting static files"
 python manage.py collectstatic --noinput
 
-# Start the Gunicorn server
+# Start the Gunicorn server (celery worker, beat는 celery 컨테이너에서 supervisord로 실행)
+# exec로 gunicorn을 PID 1로 실행해 docker stop 시그널을 직접 받아 graceful shutdown
 echo "Starting Gunicorn"
-gunicorn config.wsgi.prod:application --bind 0.0.0.0:8000
-
-# start celery worker
-echo "Starting celery worker"
-celery -A config worker -l info &
-
-# start celery beat
-echo "Starting celery beat"
-celery -A config beat -l info &
-
-# Wait for all background processes to complete
-# print background jobs
-jobs -l
-wait
+exec gunicorn -c python:config.gunicorn config.wsgi.prod:application
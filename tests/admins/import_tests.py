@@ -0,0 +1,186 @@
+import json
+
+import pandas as pd
+import pytest
+from django.core.files.storage import InMemoryStorage
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from PIL import Image
+
+from repo.admins.importer import BulkImporter, ImportProgress
+from repo.admins.utils import read_csv_rows
+from repo.beans.models import Bean, BeanTaste
+from repo.profiles.models import CustomUser, UserDetail
+from repo.records.models import Photo, Post, TastedRecord
+from tests.factorys import BeanFactory, CustomUserFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def tasted_record_row(author: str, bean_name: str) -> dict:
+    return {
+        "맛": "베리,꽃향",
+        "바디감": 3,
+        "산미": 4,
+        "쓴맛": 2,
+        "단맛": 3,
+        "별점": 4.5,
+        "시음 날짜": "2024-01-01",
+        "시음 장소": "집",
+        "원두 유형": "싱글 오리진",
+        "원두 이름": bean_name,
+        "원산지": "에티오피아",
+        "디카페인 여부": False,
+        "추출 방식": "핸드드립",
+        "로스팅 포인트": 2,
+        "가공 방식": "워시드",
+        "생산 지역": "예가체프",
+        "음료 유형": "핫",
+        "로스터리": "브루버즈",
+        "품종": "헤어룸",
+        "공식원두 여부": False,
+        "작성자": author,
+        "시음 내용": "산미가 좋아요",
+        "태그": "핸드드립",
+        "작성 일시": "2024-01-01 10:00:00",
+    }
+
+
+def write_csv(tmp_path, rows: list[dict]) -> str:
+    file_path = tmp_path / "data.csv"
+    pd.DataFrame(rows).to_csv(file_path, index=False)
+    return str(file_path)
+
+
+def write_photo(photos_dir, name: str) -> None:
+    photos_dir.mkdir(exist_ok=True)
+    Image.new("RGB", (100, 100), "white").save(photos_dir / name, "JPEG")
+
+
+class TestBulkImporter:
+    """
+    관리자 CSV 일괄 등록 테스트 (InMemoryStorage를 로컬 S3 대용으로 사용)
+    작성한 테스트 케이스
+    - [일반] 시음기록 일괄 등록 (작성자, 원두 재사용 및 일괄 생성, 사진 업로드) 테스트
+    - [일반] 사진이 없는 행은 건너뛰고 실패 행으로 기록 테스트
+    - [일반] 진행 상황 파일로 중단된 위치부터 이어서 등록 테스트
+    - [일반] dry-run은 데이터를 생성하지 않고 생성 예정 수만 집계 테스트
+    - [일반] 게시글, 공식 원두 일괄 등록 테스트
+    """
+
+    @pytest.mark.parametrize("can_return_pk", [True, False])  # False: bulk_create가 PK를 반환하지 않는 MySQL
+    def test_import_tasted_records(self, tmp_path, monkeypatch, can_return_pk):
+        """시음기록 일괄 등록 (작성자, 원두 재사용 및 일괄 생성, 사진 업로드) 테스트"""
+        # Given
+        monkeypatch.setattr(type(connection.features), "can_return_rows_from_bulk_insert", can_return_pk)
+        CustomUserFactory(nickname="기존작성자")
+        bean_data = {"name": "예가체프 G1", "roastery": "브루버즈", "origin_country": "에티오피아", "bean_type": "single"}
+        existing_bean = BeanFactory(**bean_data, fingerprint=None)  # 식별값이 없는 기존 원두
+        rows = [
+            tasted_record_row("기존작성자", "예가체프 G1"),
+            tasted_record_row("새작성자", "예가체프 G1"),
+            tasted_record_row("새작성자", "시다모 G2"),
+            tasted_record_row("기존작성자", "시다모 G2"),
+        ]
+        photos_dir = tmp_path / "photos"
+        for name in ["review_1_1.jpg", "review_1_2.jpg", "review_3_1.jpg", "review_4_1.jpg"]:
+            write_photo(photos_dir, name)
+        storage = InMemoryStorage()
+        progress_file = tmp_path / "progress.json"
+
+        # When
+        importer = BulkImporter(ImportProgress(str(progress_file), "data.csv"), chunk_size=2, storage=storage)
+        with CaptureQueriesContext(connection) as queries:
+            stats = importer.import_tasted_records(read_csv_rows(write_csv(tmp_path, rows)), str(photos_dir))
+
+        # Then
+        assert stats["users"] == 1 and stats["beans"] == 1 and stats["tasted_records"] == 3 and stats["failed"] == 1
+        for table in ["taste_review", "tasted_record"]:  # 행별 INSERT 없이 청크마다 한 번
+            assert sum(query["sql"].startswith(f"INSERT INTO {connection.ops.quote_name(table)}") for query in queries) == 2
+        new_user = CustomUser.objects.get(nickname="새작성자")
+        assert UserDetail.objects.filter(user=new_user).exists()
+        assert Bean.objects.count() == 2
+
+        tasted_records = TastedRecord.objects.order_by("id")
+        assert [(tr.author.nickname, tr.bean.name) for tr in tasted_records] == [
+            ("기존작성자", "예가체프 G1"),
+            ("새작성자", "시다모 G2"),
+            ("기존작성자", "시다모 G2"),
+        ]
+        assert tasted_records[0].bean_id == existing_bean.id
+        assert tasted_records[0].taste_review.star == 4.5
+        assert all(tr.star == tr.taste_review.star for tr in tasted_records)  # bulk_create로 생성해도 별점 복사본 설정
+        assert Photo.objects.filter(tasted_record=tasted_records[0]).count() == 2
+        for photo in Photo.objects.all():
+            assert storage.exists(photo.photo_url.name) and storage.exists(photo.thumbnail_url.name)
+
+        # 사진이 없는 2번째 행은 실패 행으로 기록
+        assert json.loads(progress_file.read_text()) == {"source": "data.csv", "next_row": 4, "failed_rows": [2]}
+
+    def test_import_resumes_from_progress(self, tmp_path):
+        """진행 상황 파일로 중단된 위치부터 이어서 등록 테스트"""
+        # Given
+        rows = [
+            {"작성 일시": "", "작성자": f"작성자{i}", "주제": "일반", "제목": f"제목{i}", "내용": "내용", "태그": "태그"} for i in range(5)
+        ]
+        file_path = write_csv(tmp_path, rows)
+        progress_file = tmp_path / "progress.json"
+        progress_file.write_text(json.dumps({"source": file_path, "next_row": 3, "failed_rows": []}))
+
+        # When
+        BulkImporter(ImportProgress(str(progress_file), file_path), chunk_size=2).import_posts(read_csv_rows(file_path))
+
+        # Then
+        assert list(Post.objects.order_by("id").values_list("title", flat=True)) == ["제목3", "제목4"]
+        assert json.loads(progress_file.read_text())["next_row"] == 5
+
+    def test_dry_run(self, tmp_path):
+        """dry-run은 데이터를 생성하지 않고 생성 예정 수만 집계 테스트"""
+        # Given
+        photos_dir = tmp_path / "photos"
+        write_photo(photos_dir, "review_1_1.jpg")
+        rows = read_csv_rows(write_csv(tmp_path, [tasted_record_row("새작성자", "예가체프 G1")]))
+
+        # When
+        stats = BulkImporter(ImportProgress(None, "data.csv"), dry_run=True).import_tasted_records(rows, str(photos_dir))
+
+        # Then
+        assert stats["users"] == 1 and stats["beans"] == 1 and stats["tasted_records"] == 1 and stats["photos"] == 1
+        assert not CustomUser.objects.exists()
+        assert not Bean.objects.exists()
+        assert not TastedRecord.objects.exists()
+
+    def test_import_posts_and_official_beans(self, tmp_path):
+        """게시글, 공식 원두 일괄 등록 테스트"""
+        # Given
+        post_rows = [
+            {"작성 일시": "", "작성자": "작성자", "주제": "카페", "제목": f"제목{i}", "내용": "내용", "태그": None} for i in range(3)
+        ]
+        bean_row = {
+            "원두 유형": "블렌드",
+            "원두 이름": "공식 블렌드",
+            "원산지": "브라질",
+            "디카페인 여부": False,
+            "로스팅 포인트": 4,
+            "가공 방식": None,
+            "생산 지역": None,
+            "로스터리": "브루버즈",
+            "품종": None,
+            "공식원두 여부": True,
+            "맛": "초콜릿",
+            "바디감": 4,
+            "산미": 2,
+            "쓴맛": 3,
+            "단맛": 3,
+        }
+
+        # When
+        BulkImporter(ImportProgress(None, "posts.csv")).import_posts(read_csv_rows(write_csv(tmp_path, post_rows)))
+        for _ in range(2):  # 같은 원두를 두 번 등록해도 한 번만 생성
+            BulkImporter(ImportProgress(None, "beans.csv")).import_official_beans(read_csv_rows(write_csv(tmp_path, [bean_row])))
+
+        # Then
+        assert Post.objects.filter(author__nickname="작성자", subject="cafe").count() == 3
+        bean = Bean.objects.get()
+        assert bean.is_official and bean.bean_type == "blend" and bean.fingerprint
+        assert BeanTaste.objects.get(bean=bean).flavor == "초콜릿"
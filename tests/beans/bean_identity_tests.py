@@ -0,0 +1,81 @@
+import pytest
+from django.core.management import call_command
+
+from repo.beans.models import Bean
+from repo.beans.services import BeanService
+from repo.interactions.note.models import Note
+from repo.records.models import TastedRecord
+from tests.factorys import BeanFactory, CustomUserFactory, TastedRecordFactory
+
+pytestmark = pytest.mark.django_db
+
+
+class TestBeanIdentity:
+    """
+    원두 식별값 및 중복 원두 병합 테스트
+    작성한 테스트 케이스
+    - [일반] 원두명 대소문자, 공백 차이는 같은 식별값으로 처리 테스트
+    - [일반] 같은 식별값의 원두 생성 시 기존 원두 재사용 테스트
+    - [일반] 중복 원두 병합 시 시음기록, 노트 재연결 테스트
+    - [일반] dry-run 시 원두 병합 미수행 테스트
+    """
+
+    bean_data = {"bean_type": "single", "name": "Ethiopia  Yirgacheffe", "origin_country": "에티오피아", "roastery": "브루버즈"}
+
+    def test_fingerprint_normalized(self):
+        """원두명 대소문자, 공백 차이는 같은 식별값으로 처리 테스트"""
+        # Given
+        other_data = {**self.bean_data, "name": " ethiopia yirgacheffe "}
+
+        # When
+        fingerprint = Bean.make_fingerprint(self.bean_data)
+        other_fingerprint = Bean.make_fingerprint(other_data)
+
+        # Then
+        assert fingerprint == other_fingerprint
+        assert fingerprint != Bean.make_fingerprint({**self.bean_data, "bean_type": "blend"})
+
+    def test_create_reuses_existing_bean(self):
+        """같은 식별값의 원두 생성 시 기존 원두 재사용 테스트"""
+        # Given
+        bean_service = BeanService()
+        bean = bean_service.create(self.bean_data)
+
+        # When
+        same_bean = bean_service.create({**self.bean_data, "name": "ETHIOPIA YIRGACHEFFE", "roast_point": 3})
+
+        # Then
+        assert same_bean.id == bean.id
+        assert Bean.objects.count() == 1
+
+    def test_merge_duplicate_beans(self):
+        """중복 원두 병합 시 시음기록, 노트 재연결 테스트"""
+        # Given
+        user = CustomUserFactory()
+        bean = BeanFactory(**self.bean_data, is_official=False)
+        duplicate_bean = BeanFactory(**{**self.bean_data, "name": "ethiopia yirgacheffe"}, is_official=True)
+        tasted_record = TastedRecordFactory(bean=bean)
+        Note.objects.create(author=user, bean=bean)
+        Note.objects.create(author=user, bean=duplicate_bean)
+
+        # When
+        call_command("merge_duplicate_beans", batch_size=1)
+
+        # Then
+        assert list(Bean.objects.values_list("id", flat=True)) == [duplicate_bean.id]  # 공식 원두 우선 유지
+        assert Bean.objects.get().fingerprint == Bean.make_fingerprint(self.bean_data)
+        assert TastedRecord.objects.get(id=tasted_record.id).bean_id == duplicate_bean.id
+        assert Note.objects.filter(author=user, bean=duplicate_bean).count() == 1
+
+    def test_merge_duplicate_beans_dry_run(self):
+        """dry-run 시 원두 병합 미수행 테스트"""
+        # Given
+        BeanFactory(**self.bean_data)
+        BeanFactory(**self.bean_data)
+
+        # When
+        call_command("merge_duplicate_beans", dry_run=True)
+
+        # Then
+        assert Bean.objects.count() == 2
+        assert not Bean.objects.filter(fingerprint__isnull=False).exists()
@@ -0,0 +1,100 @@
+import json
+
+import pytest
+from django.core.management import call_command
+from django.db.models import Count, F
+
+from repo.common.benchmark import compare_reports, percentile, summarize
+from repo.common.benchmark_data import BenchmarkDataGenerator
+from repo.interactions.relationship.models import Relationship
+from repo.profiles.models import CustomUser
+from repo.records.models import Comment, Post, TastedRecord
+
+pytestmark = pytest.mark.django_db
+
+
+class TestBenchmark:
+    """
+    벤치마크 데이터 생성, 측정 테스트
+    작성한 테스트 케이스
+    - [일반] 같은 시드로 같은 규모의 데이터 생성 및 댓글 경로, 좋아요 수, 별점 복사본 정합성 테스트
+    - [일반] 벤치마크 실행 후 리포트 저장 및 기준 리포트와 비교 테스트
+    - [일반] 백분위수, 리포트 비교 변화율 계산 테스트
+    """
+
+    def test_generate_benchmark_data(self):
+        """같은 시드로 같은 규모의 데이터 생성 및 댓글 경로, 좋아요 수, 별점 복사본 정합성 테스트"""
+        # When
+        counts = BenchmarkDataGenerator(20, seed=1, batch_size=50).generate()
+
+        # Then
+        assert CustomUser.objects.count() == counts["customuser"] == 20
+        assert Post.objects.count() == counts["post"] == 30
+        assert TastedRecord.objects.count() == counts["tastedrecord"] == 60
+        assert Relationship.objects.filter(relationship_type="follow").exists()
+
+        for comment in Comment.objects.select_related("parent"):
+            parent_path = comment.parent.path if comment.parent else ""
+            assert comment.path == f"{parent_path}{comment.id:010d}/"
+            assert comment.depth == comment.path.count("/") - 1
+            assert comment.root_id == int(comment.path[:10])
+            if comment.parent:
+                assert (comment.post_id, comment.tasted_record_id) == (comment.parent.post_id, comment.parent.tasted_record_id)
+
+        for post in Post.objects.annotate(like_count=Count("like_cnt")):
+            assert post.likes == post.like_count
+
+        assert not TastedRecord.objects.exclude(star=F("taste_review__star")).exists()  # 별점 복사본 정합성
+
+        # 같은 시드면 같은 데이터 (삭제 후 재생성)
+        titles = list(Post.objects.order_by("id").values_list("title", flat=True))
+        BenchmarkDataGenerator.clear()
+        BenchmarkDataGenerator(20, seed=1, batch_size=50).generate()
+        assert [title.rsplit(" ", 1)[0] for title in Post.objects.order_by("id").values_list("title", flat=True)] == [
+            title.rsplit(" ", 1)[0] for title in titles
+        ]
+
+    def test_run_benchmark(self, tmp_path):
+        """벤치마크 실행 후 리포트 저장 및 기준 리포트와 비교 테스트"""
+        # Given
+        fixture_file, report_file = tmp_path / "fixture.json", tmp_path / "report.json"
+        call_command("generate_benchmark_data", users=10, token_users=2, fixture_file=str(fixture_file), stdout=None)
+
+        # When
+        options = {"fixture_file": str(fixture_file), "requests": 2, "warmup": 0, "output": str(report_file)}
+        call_command("run_benchmark", scenario=["feed_v2", "post_detail", "like_post"], **options)
+        call_command(
+            "run_benchmark",
+            scenario=["feed_v2"],
+            compare=str(report_file),
+            close_connections=True,
+            **options | {"output": str(tmp_path / "next.json")},
+        )
+
+        # Then
+        report = json.loads(report_file.read_text(encoding="utf-8"))
+        assert report["dataset"]["users"] == 10
+        assert set(report["scenarios"]) == {"feed_v2", "post_detail", "like_post"}
+        for result in report["scenarios"].values():
+            assert result["requests"] == 2
+            assert result["errors"] == 0
+            assert result["queries_mean"] > 0
+        assert json.loads((tmp_path / "next.json").read_text(encoding="utf-8"))["options"]["close_connections"] is True
+
+    def test_summarize_and_compare(self):
+        """백분위수, 리포트 비교 변화율 계산 테스트"""
+        # Given
+        durations = [float(ms) for ms in range(1, 101)]
+        base = {"scenarios": {"feed_v2": summarize(durations, [10] * 100, 0), "removed": summarize([1.0], [1], 0)}}
+        current = {"scenarios": {"feed_v2": summarize([ms / 2 for ms in durations], [5] * 100, 0), "added": summarize([1.0], [1], 0)}}
+
+        # When
+        rows = compare_reports(base, current)
+
+        # Then
+        assert percentile(durations, 50) == 50.0
+        assert percentile(durations, 95) == 95.0
+        assert percentile([], 50) == 0.0
+        assert rows == [
+            {"name": "feed_v2", "p50_ms": (50.0, 25.0, -50.0), "p95_ms": (95.0, 47.5, -50.0), "queries_mean": (10.0, 5.0, -50.0)}
+        ]
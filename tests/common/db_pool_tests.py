@@ -0,0 +1,92 @@
+import pytest
+from django.db import OperationalError, connections
+
+from repo.common.db_pool import ConnectionPool, get_connection_stats
+
+
+class FakeConnection:
+    def __init__(self):
+        self.usable = True
+        self.closed = False
+
+    def ping(self):
+        if not self.usable:
+            raise OSError("MySQL server has gone away")
+
+    def close(self):
+        self.closed = True
+
+
+class TestConnectionPool:
+    """
+    DB 커넥션 풀 테스트
+    작성한 테스트 케이스
+    - [일반] 반납한 연결 재사용, 끊긴 연결과 오래된 연결은 새 연결로 교체 테스트
+    - [일반] 최대 연결 수 초과 시 대기 후 시간 초과, 버린 연결 자리는 다시 사용 가능 테스트
+    - [일반] 프로세스 DB 연결 지표 조회 테스트
+    """
+
+    def test_reuse_and_replace(self):
+        """반납한 연결 재사용, 끊긴 연결과 오래된 연결은 새 연결로 교체 테스트"""
+        # Given
+        pool = ConnectionPool("test", max_size=2, timeout=0, recycle=3600)
+
+        # When
+        first = pool.acquire(FakeConnection)
+        pool.release(first)
+        reused = pool.acquire(FakeConnection)
+        reused.usable = False
+        pool.release(reused)
+        replaced = pool.acquire(FakeConnection)
+        pool.recycle = -1
+        pool.release(replaced)
+        recycled = pool.acquire(FakeConnection)
+
+        # Then
+        assert reused is first
+        assert replaced is not first and first.closed
+        assert recycled is not replaced and replaced.closed
+        assert pool.get_stats() == {
+            "size": 1,
+            "idle": 0,
+            "in_use": 1,
+            "max_size": 2,
+            "created": 3,
+            "reused": 1,
+            "broken": 1,
+            "recycled": 1,
+        }
+
+    def test_max_size(self):
+        """최대 연결 수 초과 시 대기 후 시간 초과, 버린 연결 자리는 다시 사용 가능 테스트"""
+        # Given
+        pool = ConnectionPool("test", max_size=1, timeout=0.01)
+        used = pool.acquire(FakeConnection)
+
+        # When
+        with pytest.raises(OperationalError):
+            pool.acquire(FakeConnection)
+        pool.discard(used)
+        new = pool.acquire(FakeConnection)
+
+        # Then
+        assert used.closed
+        assert new is not used
+        assert pool.get_stats()["timeouts"] == 1
+        assert pool.get_stats()["discarded"] == 1
+
+    @pytest.mark.django_db
+    def test_connection_stats(self):
+        """프로세스 DB 연결 지표 조회 테스트"""
+        # Given
+        before = get_connection_stats()["databases"].get("default", {"connects": 0})["connects"]
+
+        # When
+        new_connection = connections.create_connection("default")
+        new_connection.ensure_connection()
+        new_connection.close()
+        stats = get_connection_stats()
+
+        # Then
+        assert stats["databases"]["default"]["connects"] == before + 1
+        assert stats["databases"]["default"]["pool"] is None
@@ -0,0 +1,83 @@
+import pytest
+from django.core.cache import cache
+from django.db import transaction
+
+from repo.common import db_router
+from repo.common.db_router import PrimaryReplicaRouter, is_primary_pinned, use_replica
+from repo.records.models import Post
+from tests.factorys import CustomUserFactory, PostFactory
+
+# 테스트 트랜잭션 안에서는 라우터가 항상 primary를 사용하므로 실제 커밋되는 트랜잭션 DB 사용
+pytestmark = pytest.mark.django_db(transaction=True, databases=["default", "replica"])
+
+
+class TestReplicaRouting:
+    """
+    읽기 복제본 DB 라우팅 테스트 (replica alias는 테스트에서 default DB를 미러링)
+    작성한 테스트 케이스
+    - [일반] use_replica 범위 안의 읽기만 복제본 사용, 트랜잭션 중이거나 쓰기 이후에는 primary 사용 테스트
+    - [일반] 조회 API는 복제본에서 읽고, 쓰기 요청 직후 같은 사용자의 조회는 primary에서 읽는지 테스트
+    - [일반] 복제본에는 마이그레이션하지 않는지 테스트
+    """
+
+    @pytest.fixture
+    def read_aliases(self, monkeypatch):
+        """라우터가 선택한 읽기 DB alias 기록"""
+        aliases = []
+        db_for_read = PrimaryReplicaRouter.db_for_read
+
+        def record_db_for_read(router, model, **hints):
+            alias = db_for_read(router, model, **hints)
+            aliases.append(alias)
+            return alias
+
+        monkeypatch.setattr(PrimaryReplicaRouter, "db_for_read", record_db_for_read)
+        return aliases
+
+    def test_use_replica_scope(self):
+        """use_replica 범위 안의 읽기만 복제본 사용, 트랜잭션 중이거나 쓰기 이후에는 primary 사용 테스트"""
+        # Then
+        assert Post.objects.all().db == "default"
+
+        with use_replica():
+            assert Post.objects.all().db == "replica"
+            assert PostFactory().id in Post.objects.values_list("id", flat=True)  # 같은 범위에서 쓰기 후에는 primary
+            assert Post.objects.all().db == "default"
+
+        with use_replica(), transaction.atomic():
+            assert Post.objects.all().db == "default"
+
+        assert Post.objects.all().db == "default"
+
+    def test_sticky_primary_after_write(self, api_client, read_aliases):
+        """조회 API는 복제본에서 읽고, 쓰기 요청 직후 같은 사용자의 조회는 primary에서 읽는지 테스트"""
+        # Given
+        cache.clear()
+        user = CustomUserFactory()
+        post = PostFactory()
+        api_client.force_authenticate(user=user)
+
+        # When
+        api_client.get("/records/feed/v2/")
+        feed_aliases = set(read_aliases)
+        read_aliases.clear()
+
+        like_response = api_client.post(f"/interactions/like/post/{post.id}/")
+        read_aliases.clear()
+        api_client.get("/records/feed/v2/")
+
+        # Then
+        assert feed_aliases == {"replica"}
+        assert like_response.status_code < 400
+        assert is_primary_pinned(user)
+        assert set(read_aliases) == {"default"}
+
+    def test_no_migrate_on_replica(self, monkeypatch):
+        """복제본에는 마이그레이션하지 않는지 테스트"""
+        # Given
+        monkeypatch.setattr(db_router, "REPLICA_DATABASES", ["replica"])
+        router = PrimaryReplicaRouter()
+
+        # Then
+        assert router.allow_migrate("default", "records") is True
+        assert router.allow_migrate("replica", "records") is False
@@ -0,0 +1,109 @@
+import socket
+
+import pytest
+from django_redis.client import DefaultClient
+
+from repo.common.instrumentation import (
+    InstrumentedRedisClient,
+    StatsDClient,
+    collect_request_metrics,
+    fingerprint_sql,
+)
+from repo.common.middleware import performance
+from repo.common.middleware.performance import is_suspicious_request
+from repo.records.models import Post
+from tests.factorys import PostFactory
+
+pytestmark = pytest.mark.django_db
+
+
+class TestInstrumentation:
+    """
+    요청 지표 수집 테스트
+    작성한 테스트 케이스
+    - [일반] 파라미터 값만 다른 쿼리는 같은 fingerprint 테스트
+    - [일반] DEBUG=False에서 쿼리 수 집계 및 N+1 의심 쿼리 탐지 테스트
+    - [일반] 캐시 hit/miss 집계 테스트
+    - [일반] 공격 시도 경로, 확장자 판별 테스트
+    - [일반] Server-Timing 헤더 추가 및 StatsD 지표 전송 테스트
+    """
+
+    def test_fingerprint_sql(self):
+        """파라미터 값만 다른 쿼리는 같은 fingerprint 테스트"""
+        # When
+        fingerprint = fingerprint_sql("SELECT * FROM post WHERE id IN (%s, %s, %s) AND title = 'a''b' LIMIT 10")
+        other_fingerprint = fingerprint_sql("SELECT  *  FROM post WHERE id IN (%s) AND title = 'c' LIMIT 20")
+
+        # Then
+        assert fingerprint == other_fingerprint == "SELECT * FROM post WHERE id IN (...) AND title = ? LIMIT ?"
+
+    def test_collect_query_metrics(self, settings):
+        """DEBUG=False에서 쿼리 수 집계 및 N+1 의심 쿼리 탐지 테스트"""
+        # Given
+        settings.DEBUG = False
+        PostFactory.create_batch(5)
+
+        # When
+        with collect_request_metrics(sampled=True) as metrics:
+            nicknames = [post.author.nickname for post in Post.objects.all()]  # 작성자 조회 N+1
+
+        # Then
+        assert len(nicknames) == 5
+        assert metrics.query_count == 6
+        assert metrics.db_time > 0
+        [(fingerprint, count)] = metrics.duplicate_queries()
+        assert count == 5
+        assert 'FROM "user"' in fingerprint
+
+    def test_cache_metrics(self, monkeypatch):
+        """캐시 hit/miss 집계 테스트"""
+        # Given
+        stored = {"feed": [1, 2]}
+        monkeypatch.setattr(DefaultClient, "__init__", lambda self, *args: None)
+        monkeypatch.setattr(DefaultClient, "get", lambda self, key, default=None, version=None, client=None: stored.get(key, default))
+        monkeypatch.setattr(
+            DefaultClient, "get_many", lambda self, keys, version=None, client=None: {k: stored[k] for k in keys if k in stored}
+        )
+        client = InstrumentedRedisClient()
+
+        # When
+        with collect_request_metrics() as metrics:
+            client.get("feed")
+            client.get("missing")
+            client.get_many(["feed", "missing"])
+
+        # Then
+        assert metrics.cache_hits == 2
+        assert metrics.cache_misses == 2
+
+    @pytest.mark.parametrize(
+        "path, expected",
+        [("/wp-login.php", True), ("/api/.env", True), ("/shell.jsp", True), ("/robots.txt", True), ("/records/feed/", False)],
+    )
+    def test_suspicious_request(self, path, expected):
+        """공격 시도 경로, 확장자 판별 테스트"""
+        assert is_suspicious_request(path) is expected
+
+    def test_server_timing_and_statsd(self, api_client, monkeypatch):
+        """Server-Timing 헤더 추가 및 StatsD 지표 전송 테스트"""
+        # Given
+        receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        receiver.bind(("127.0.0.1", 0))
+        receiver.settimeout(2)
+        statsd = StatsDClient("127.0.0.1", receiver.getsockname()[1], "test")
+        monkeypatch.setattr(performance, "get_statsd_client", lambda: statsd)
+        monkeypatch.setattr(performance, "should_sample", lambda: True)
+        monkeypatch.setattr(performance, "SERVER_TIMING_ENABLED", True)
+        monkeypatch.setattr(performance, "METRICS_SAMPLE_RATE", 1.0)
+        PostFactory.create_batch(2)
+
+        # When
+        response = api_client.get("/records/feed/?feed_type=common")
+
+        # Then
+        assert response.status_code == 200
+        assert response["Server-Timing"].startswith("db;dur=")
+        payload = receiver.recv(65535).decode()
+        assert "test.request." in payload
+        assert ".duration:" in payload and "|ms" in payload
+        receiver.close()
@@ -0,0 +1,44 @@
+from config import gunicorn
+from repo.common import instrumentation, storage
+from repo.common.prefork import reset_clients
+from repo.notifications.services import FCMService
+
+
+class TestPreforkServer:
+    """
+    운영 앱 서버(gunicorn) 설정, fork 이후 클라이언트 초기화 테스트
+    작성한 테스트 케이스
+    - [일반] CPU, 메모리에 따른 워커, 스레드 수 계산 테스트
+    - [일반] fork 이후 공용 클라이언트 초기화 테스트
+    """
+
+    def test_compute_workers_and_threads(self):
+        """CPU, 메모리에 따른 워커, 스레드 수 계산 테스트"""
+        # When: 메모리가 충분한 경우 CPU 기준, 부족한 경우 메모리 기준으로 워커 수 결정
+        cpu_bound_workers = gunicorn.compute_workers(cpu_count=2, memory_mb=8192)
+        memory_bound_workers = gunicorn.compute_workers(cpu_count=4, memory_mb=2048)
+        low_memory_workers = gunicorn.compute_workers(cpu_count=1, memory_mb=256)
+
+        # Then
+        assert cpu_bound_workers == 5
+        assert memory_bound_workers == (2048 - gunicorn.MEMORY_RESERVED_MB) // gunicorn.WORKER_MEMORY_MB
+        assert low_memory_workers == 1
+        assert gunicorn.compute_threads(cpu_count=2, workers=5) == 2
+        assert gunicorn.compute_threads(cpu_count=4, workers=3) == 6
+        assert gunicorn.compute_threads(cpu_count=2, workers=1) == gunicorn.MAX_THREADS
+        assert gunicorn.workers >= 1 and gunicorn.threads >= 2
+
+    def test_reset_clients(self, monkeypatch):
+        """fork 이후 공용 클라이언트 초기화 테스트"""
+        # Given
+        monkeypatch.setattr(storage, "_s3_client", object())
+        monkeypatch.setattr(instrumentation, "_statsd_client", object())
+        monkeypatch.setattr(FCMService, "_instance", object())
+
+        # When
+        reset_clients()
+
+        # Then
+        assert storage._s3_client is None
+        assert instrumentation._statsd_client is None
+        assert FCMService._instance is None
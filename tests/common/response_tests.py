@@ -0,0 +1,153 @@
+import gzip
+import io
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django_redis.serializers.json import JSONSerializer
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+from repo.common.cache_serializers import FastJSONSerializer
+from repo.common.middleware.compression import CompressionMiddleware
+from repo.common.parsers import FastJSONParser
+from repo.common.renderers import FastJSONRenderer
+from tests.factorys import PostFactory, TastedRecordFactory
+
+pytestmark = pytest.mark.django_db
+
+brotli = pytest.importorskip("brotli")
+
+
+class TestFastJSON:
+    """
+    JSON 렌더러, 파서, 캐시 직렬화 테스트
+    작성한 테스트 케이스
+    - [일반] DRF JSONRenderer와 JSON 바이트 일치 테스트
+    - [일반] JSON 파싱 및 잘못된 JSON 요청 시 ParseError 테스트
+    - [일반] 캐시 직렬화 결과가 JSONSerializer와 호환되는지 테스트
+    - [일반] 성능 비교 커맨드 실행 테스트
+    """
+
+    data = {
+        "id": 1,
+        "title": "에티오피아 예가체프\u2028",
+        "created_at": datetime(2025, 3, 1, 12, 30, 15, 123456),
+        "price": Decimal("12.50"),
+        "uuid": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        "photos": [{"photo_url": None, "star": 4.5, "is_private": False}],
+    }
+
+    def test_render_identical(self):
+        """DRF JSONRenderer와 JSON 바이트 일치 테스트"""
+        # When
+        content = FastJSONRenderer().render(self.data)
+
+        # Then
+        assert content == JSONRenderer().render(self.data)
+        assert b"\\u2028" in content
+
+    def test_parse(self):
+        """JSON 파싱 및 잘못된 JSON 요청 시 ParseError 테스트"""
+        # Given
+        parser = FastJSONParser()
+
+        # When
+        data = parser.parse(io.BytesIO('{"content": "고소한 맛", "star": 4.5}'.encode()))
+
+        # Then
+        assert data == {"content": "고소한 맛", "star": 4.5}
+        with pytest.raises(ParseError):
+            parser.parse(io.BytesIO(b'{"content": NaN}'))
+
+    def test_cache_serializer_compatible(self):
+        """캐시 직렬화 결과가 JSONSerializer와 호환되는지 테스트"""
+        # Given
+        serializer, json_serializer = FastJSONSerializer({}), JSONSerializer({})
+
+        # When
+        value = serializer.dumps(self.data)
+
+        # Then
+        assert serializer.loads(value) == json_serializer.loads(json_serializer.dumps(self.data))
+        assert serializer.loads(json_serializer.dumps(self.data)) == json_serializer.loads(value)
+
+    def test_benchmark_command(self, capsys):
+        """성능 비교 커맨드 실행 테스트"""
+        # Given
+        PostFactory.create_batch(2)
+        TastedRecordFactory.create_batch(2)
+
+        # When
+        call_command("benchmark_json", items=5, repeat=1)
+
+        # Then
+        out = capsys.readouterr().out
+        assert "FastJSONRenderer" in out
+        assert "FastJSONSerializer + zlib" in out
+
+
+class TestCompressionMiddleware:
+    """
+    응답 압축 미들웨어 테스트
+    작성한 테스트 케이스
+    - [일반] brotli 지원 클라이언트에 br 압축 응답 테스트
+    - [일반] brotli 미지원 클라이언트에 gzip 압축 응답 테스트
+    - [예외] 작은 응답, 압축 미지원 클라이언트는 압축하지 않음 테스트
+    - [일반] 피드 API 응답 압축 테스트
+    """
+
+    content = b'{"results":[' + b",".join(b'{"id":%d,"content":"coffee"}' % i for i in range(100)) + b"]}"
+
+    def get_response(self, accept_encoding, content=None):
+        request = RequestFactory().get("/", HTTP_ACCEPT_ENCODING=accept_encoding)
+        middleware = CompressionMiddleware(lambda request: HttpResponse(content or self.content, content_type="application/json"))
+        return middleware(request)
+
+    def test_brotli(self):
+        """brotli 지원 클라이언트에 br 압축 응답 테스트"""
+        # When
+        response = self.get_response("gzip, deflate, br")
+
+        # Then
+        assert response["Content-Encoding"] == "br"
+        assert response["Vary"] == "Accept-Encoding"
+        assert brotli.decompress(response.content) == self.content
+        assert int(response["Content-Length"]) == len(response.content)
+
+    def test_gzip(self):
+        """brotli 미지원 클라이언트에 gzip 압축 응답 테스트"""
+        # When
+        response = self.get_response("gzip, deflate")
+
+        # Then
+        assert response["Content-Encoding"] == "gzip"
+        assert gzip.decompress(response.content) == self.content
+
+    def test_not_compressed(self):
+        """작은 응답, 압축 미지원 클라이언트는 압축하지 않음 테스트"""
+        # When
+        small_response = self.get_response("br", content=b'{"id":1}')
+        identity_response = self.get_response("")
+
+        # Then
+        assert not small_response.has_header("Content-Encoding")
+        assert not identity_response.has_header("Content-Encoding")
+        assert identity_response.content == self.content
+
+    def test_feed_response_compressed(self, api_client):
+        """피드 API 응답 압축 테스트"""
+        # Given
+        PostFactory.create_batch(12)
+
+        # When
+        response = api_client.get("/records/feed/?feed_type=common", HTTP_ACCEPT_ENCODING="br")
+
+        # Then
+        assert response.status_code == 200
+        assert response["Content-Encoding"] == "br"
+        assert brotli.decompress(response.content).startswith(b'{"count":')
@@ -8,6 +8,7 @@ from rest_framework_simplejwt.tokens import RefreshToken
 
 from repo.profiles.models import CustomUser, UserDetail
 from tests.factorys import CustomUserFactory
+from tests.query_budget import load_budgets, save_budgets
 
 
 @pytest.fixture
@@ -107,3 +108,24 @@ def create_test_image():
 @pytest.fixture(autouse=True)
 def debug_setting(settings):
     settings.DEBUG = True
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--update-query-budgets",
+        action="store_true",
+        default=False,
+        help="API 쿼리 예산 파일(tests/query_budgets.json)을 측정한 쿼리 수로 갱신",
+    )
+
+
+@pytest.fixture(scope="session")
+def query_budgets(request):
+    """
+    API 쿼리 예산 조회 및 갱신
+    - --update-query-budgets 옵션 사용 시 측정한 쿼리 수를 세션 종료 후 예산 파일에 저장
+    """
+    budgets = load_budgets()
+    yield budgets
+    if request.config.getoption("--update-query-budgets"):
+        save_budgets(budgets)
@@ -1,7 +1,21 @@
+import csv
+import io
+
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from openpyxl import load_workbook
 from rest_framework import status
 
-from tests.factorys import PostFactory
+from repo.interactions.note.models import Note
+from repo.interactions.report.admin_services import get_users_activity_report
+from repo.interactions.report.tasks import export_users_activity_report
+from tests.factorys import (
+    BeanFactory,
+    CustomUserFactory,
+    PostFactory,
+    TastedRecordFactory,
+)
 
 pytestmark = pytest.mark.django_db
 
@@ -125,3 +139,108 @@ class TestReportAPIView:
         # Then
         print(response.data)
         assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+class TestAdminReport:
+    """
+    관리자 사용자 활동 보고서 테스트
+    작성한 테스트 케이스
+    - [일반] 모델별 집계 결과 병합 및 사용자 배치 수와 무관한 쿼리 수 테스트
+    - [일반] CSV 스트리밍, XLSX 다운로드 테스트
+    - [일반] 백그라운드 보고서 요청 시 Celery 작업만 등록하고 202 응답 테스트
+    - [일반] 보고서 생성 작업의 스토리지 저장 및 관리자 메일 전송 테스트
+    - [예외] 관리자가 아닌 사용자 접근 시 403 에러 반환 테스트
+    """
+
+    url = "/interactions/report/admin/"
+
+    @pytest.fixture
+    def admin_client(self, api_client):
+        admin = CustomUserFactory(is_staff=True, email="admin@brewbuds.com")
+        api_client.force_authenticate(user=admin)
+        return api_client, admin
+
+    def test_activity_metrics(self):
+        """모델별 집계 결과 병합 및 사용자 배치 수와 무관한 쿼리 수 테스트"""
+        # Given
+        user, inactive_user = CustomUserFactory(), CustomUserFactory()
+        tasted_records = TastedRecordFactory.create_batch(3, author=user)
+        posts = PostFactory.create_batch(2, author=user)
+        Note.objects.create(author=user, post=posts[0])
+        Note.objects.create(author=user, bean=BeanFactory())
+        Note.objects.create(author=user, bean=BeanFactory())
+
+        # When
+        with CaptureQueriesContext(connection) as queries:
+            reports = {report["ID"]: report for report in get_users_activity_report()}
+
+        # Then
+        report = reports[user.id]
+        assert (report["시음기록 작성 개수"], report["게시물 작성 개수"]) == (3, 2)
+        assert (report["원두정보 저장 개수"], report["시음기록 저장 개수"], report["게시물 저장 개수"]) == (2, 0, 1)
+        created_ats = sorted(tasted_record.created_at for tasted_record in tasted_records)
+        assert report["두번째 시음기록 작성일"] == created_ats[1].strftime("%Y-%m-%d %H:%M:%S")
+        assert report["첫 시음기록 저장일"] is None
+        assert reports[inactive_user.id]["시음기록 작성 개수"] == 0
+        assert reports[inactive_user.id]["두번째 게시물 작성일"] is None
+        assert len(queries) == 7  # 사용자 배치 조회 + 지표 집계 5회 + 다음 배치 조회
+
+    def test_download_csv_and_xlsx(self, admin_client):
+        """CSV 스트리밍, XLSX 다운로드 테스트"""
+        # Given
+        client, admin = admin_client
+        PostFactory(author=admin)
+
+        # When
+        csv_response = client.get(self.url, {"file_type": "csv"})
+        xlsx_response = client.get(self.url)
+
+        # Then
+        assert csv_response.status_code == xlsx_response.status_code == status.HTTP_200_OK
+        assert csv_response.streaming and xlsx_response.streaming
+        rows = list(csv.DictReader(io.StringIO(b"".join(csv_response.streaming_content).decode("utf-8-sig"))))
+        assert [(row["ID"], row["게시물 작성 개수"]) for row in rows] == [(str(admin.id), "1")]
+
+        sheet = load_workbook(io.BytesIO(b"".join(xlsx_response.streaming_content))).active
+        header, row = list(sheet.iter_rows(values_only=True))
+        assert row[header.index("게시물 작성 개수")] == 1
+
+    def test_background_export(self, admin_client, monkeypatch, mailoutbox):
+        """백그라운드 보고서 요청 시 Celery 작업만 등록하고 202 응답 테스트"""
+        # Given
+        client, admin = admin_client
+        enqueued = []
+        monkeypatch.setattr(export_users_activity_report, "delay", lambda *args: enqueued.append(args))
+
+        # When
+        response = client.get(self.url, {"file_type": "csv", "background": "true"})
+
+        # Then
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert enqueued == [(admin.id, "csv")]
+        assert mailoutbox == []
+
+    def test_export_report_task(self, admin_client, mailoutbox, settings):
+        """보고서 생성 작업의 스토리지 저장 및 관리자 메일 전송 테스트"""
+        # Given
+        _, admin = admin_client
+        settings.STORAGES = {**settings.STORAGES, "default": {"BACKEND": "django.core.files.storage.InMemoryStorage"}}
+
+        # When
+        url = export_users_activity_report.apply(args=(admin.id, "csv")).get()
+
+        # Then
+        assert "reports/Admin_Report_" in url
+        assert [mail.to for mail in mailoutbox] == [["admin@brewbuds.com"]]
+        assert url in mailoutbox[0].body
+
+    def test_non_admin_forbidden(self, authenticated_client):
+        """관리자가 아닌 사용자 접근 시 403 에러 반환 테스트"""
+        # Given
+        client, _ = authenticated_client()
+
+        # When
+        response = client.get(self.url)
+
+        # Then
+        assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -1,21 +1,43 @@
-from locust import HttpUser, between, task
+"""
+벤치마크 시나리오 부하 테스트
+- generate_benchmark_data로 생성한 fixture 파일의 id, 토큰 사용
+- 실행: BENCHMARK_FIXTURE_FILE=benchmark_fixture.json locust -f tests/locustfile.py --host https://...
+"""
 
+import json
+import os
+import random
 
-class BrewBudsUser(HttpUser):
-    wait_time = between(1, 3)  # 각 태스크 사이의 대기 시간
+from locust import HttpUser, between
+
+from repo.common.benchmark import SCENARIOS, build_path
+
+FIXTURE_FILE = os.environ.get("BENCHMARK_FIXTURE_FILE", "benchmark_fixture.json")
+
+with open(FIXTURE_FILE, encoding="utf-8") as f:
+    FIXTURE = json.load(f)
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.token = ""  # 토큰 값 입력
 
-        self.headers = {"Authorization": f"Bearer {self.token}", "Content-Type": "application/json"}
-        self.page_size = 10
-        self.current_page = 1
+def make_task(scenario):
+    def run(user):
+        headers = user.auth_headers if scenario.auth else {}
+        method = scenario.method.lower()
+        path = build_path(scenario, FIXTURE, user.rng)
+        if scenario.method == "GET":
+            user.client.get(path, params=scenario.params, headers=headers, name=scenario.name)
+        else:
+            getattr(user.client, method)(path, json=scenario.params, headers=headers, name=scenario.name)
+
+    run.__name__ = scenario.name
+    return run
+
+
+class BrewBudsUser(HttpUser):
+    wait_time = between(1, 3)  # 각 태스크 사이의 대기 시간
 
-    @task(1)
-    def get_following_user_list(self):
-        self.client.get("/records/feed/", params={"feed_type": "following", "page": 1}, headers=self.headers)
+    def on_start(self):
+        self.rng = random.Random()
+        token = self.rng.choice(FIXTURE["tokens"]) if FIXTURE["tokens"] else None
+        self.auth_headers = {"Authorization": f"Bearer {token}"} if token else {}
 
-    @task(1)
-    def get_following_user_list_2(self):
-        self.client.get("/records/feed/", params={"feed_type": "following", "page": 2}, headers=self.headers)
+    tasks = {make_task(scenario): scenario.weight for scenario in SCENARIOS}  # 시나리오 weight를 태스크 가중치로 사용
@@ -0,0 +1,74 @@
+from types import SimpleNamespace
+
+import pytest
+
+from config.celery import app as celery_app
+from repo.interactions.relationship.models import Relationship
+from repo.notifications import tasks
+from repo.notifications.tasks import send_notification_comment, send_notification_follow
+from tests.factorys import CommentFactory, CustomUserFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def enqueued(monkeypatch):
+    """Celery 작업 등록 기록 (브로커 없이 등록된 작업과 인자만 확인)"""
+    calls = []
+    for task in [send_notification_comment, send_notification_follow]:
+        monkeypatch.setattr(task, "apply_async", lambda args, task=task, **kwargs: calls.append((task.name, args)))
+    return calls
+
+
+class TestNotificationSignal:
+    """
+    댓글, 팔로우 알림 작업 등록 테스트
+    작성한 테스트 케이스
+    - [댓글] 커밋 이후 댓글 ID만 전달해 작업 등록, 커밋 전에는 등록하지 않음 테스트
+    - [팔로우] 팔로우만 커밋 이후 사용자 ID를 전달해 작업 등록 (차단은 제외) 테스트
+    - [예외] 브로커 연결 실패 시 로컬 큐에서 작업 실행 테스트
+    """
+
+    def test_comment_enqueued_on_commit(self, enqueued, django_capture_on_commit_callbacks):
+        """커밋 이후 댓글 ID만 전달해 작업 등록, 커밋 전에는 등록하지 않음 테스트"""
+        # When
+        with django_capture_on_commit_callbacks(execute=True):
+            comment = CommentFactory()
+            before_commit = list(enqueued)
+
+        # Then
+        assert before_commit == []
+        assert enqueued == [(send_notification_comment.name, (comment.id,))]
+
+    def test_follow_enqueued_on_commit(self, enqueued, django_capture_on_commit_callbacks):
+        """팔로우만 커밋 이후 사용자 ID를 전달해 작업 등록 (차단은 제외) 테스트"""
+        # Given
+        follower, followee = CustomUserFactory.create_batch(2)
+
+        # When
+        with django_capture_on_commit_callbacks(execute=True):
+            Relationship.objects.create(from_user=follower, to_user=followee, relationship_type="follow")
+            Relationship.objects.create(from_user=followee, to_user=follower, relationship_type="block")
+
+        # Then
+        assert enqueued == [(send_notification_follow.name, (follower.id, followee.id))]
+
+    def test_broker_down_runs_locally(self, settings, monkeypatch, django_capture_on_commit_callbacks):
+        """브로커 연결 실패 시 로컬 큐에서 작업 실행 테스트"""
+        # Given: 연결할 수 없는 브로커, 결과 저장소 주소 (재연결 대기 없이 바로 실패)
+        settings.CELERY_TASK_ALWAYS_EAGER = False
+        settings.CELERY_BROKER_URL = "redis://127.0.0.1:1/0"
+        settings.CELERY_RESULT_BACKEND = "redis://127.0.0.1:1/0"
+        settings.CELERY_BROKER_TRANSPORT_OPTIONS = {"max_retries": 0}
+        monkeypatch.setattr(celery_app, "_pool", None)
+        applied = []
+        monkeypatch.setattr(send_notification_follow, "apply", lambda args: applied.append(args))
+        monkeypatch.setattr(tasks, "_local_executor", SimpleNamespace(submit=lambda func, *args: func(*args)))
+        follower, followee = CustomUserFactory.create_batch(2)
+
+        # When
+        with django_capture_on_commit_callbacks(execute=True):
+            Relationship.objects.create(from_user=follower, to_user=followee, relationship_type="follow")
+
+        # Then
+        assert applied == [(follower.id, followee.id)]
@@ -0,0 +1,83 @@
+"""
+API 쿼리 예산(query budget) 도구
+- 등록된 API GET 경로 조회, 경로별 쿼리 예산 파일(query_budgets.json) 로드/저장
+- 요청 단위 쿼리 수 측정 (repo.common.instrumentation 사용, DEBUG 설정과 무관)
+
+예산 파일은 경로 패턴을 키로 사용 (search 앱처럼 URL name이 중복되는 경로가 있어 name 대신 경로 사용)
+    {
+        "records/post/<int:pk>/": {
+            "name": "post-detail",
+            "kwargs": {"pk": "$post"},  # $로 시작하면 시드 데이터 객체 id, 그 외는 값 그대로 사용
+            "query": "",  # 쿼리스트링
+            "budget": 12,  # 10N 데이터 기준 최대 쿼리 수
+            "tolerance": 0,  # N -> 10N 데이터 증가 시 허용하는 쿼리 수 증가량
+            "skip": "",  # 측정 제외 사유
+        }
+    }
+예산 갱신: pytest tests/query_budget_tests.py --update-query-budgets
+"""
+
+import json
+import re
+from pathlib import Path
+
+from django.urls import URLPattern, URLResolver, get_resolver
+from rest_framework.views import APIView
+
+from repo.common.instrumentation import collect_request_metrics
+
+BUDGET_FILE = Path(__file__).parent / "query_budgets.json"
+API_VIEW_MODULE_PREFIX = "repo."  # 외부 패키지(allauth, spectacular 등) 경로 제외
+
+_re_route_param = re.compile(r"<(?:\w+:)?(\w+)>")
+
+
+def iter_api_routes(patterns=None, prefix: str = ""):
+    """
+    GET을 지원하는 API 경로 조회
+    Yields:
+        tuple[str, str, type]: (경로 패턴, URL name, 뷰 클래스)
+    """
+    if patterns is None:
+        patterns = get_resolver().url_patterns
+
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from iter_api_routes(pattern.url_patterns, prefix + str(pattern.pattern))
+        elif isinstance(pattern, URLPattern):
+            view_class = getattr(pattern.callback, "cls", None)
+            if view_class is None or not issubclass(view_class, APIView) or not hasattr(view_class, "get"):
+                continue
+            if not view_class.__module__.startswith(API_VIEW_MODULE_PREFIX):
+                continue
+            yield prefix + str(pattern.pattern), pattern.name, view_class
+
+
+def load_budgets() -> dict:
+    with open(BUDGET_FILE, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_budgets(budgets: dict) -> None:
+    with open(BUDGET_FILE, "w", encoding="utf-8") as f:
+        json.dump(dict(sorted(budgets.items())), f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+
+def build_url(route: str, entry: dict, objects: dict) -> str:
+    """경로 패턴의 파라미터를 시드 데이터 객체 id 또는 지정 값으로 채워 URL 생성"""
+    kwargs = entry.get("kwargs", {})
+
+    def resolve(match):
+        value = kwargs[match.group(1)]
+        return str(objects[value[1:]].id if value.startswith("$") else value)
+
+    url = "/" + _re_route_param.sub(resolve, route)
+    return f"{url}?{entry['query']}" if entry.get("query") else url
+
+
+def count_queries(client, url: str):
+    """요청 처리 중 실행된 쿼리 수 측정"""
+    with collect_request_metrics(sampled=True) as metrics:
+        response = client.get(url)
+    return response, metrics
@@ -0,0 +1,109 @@
+import pytest
+from django.core.cache import cache
+
+from repo.interactions.note.models import Note
+from repo.interactions.relationship.models import Relationship
+from repo.notifications.models import PushNotification
+from repo.records.models import Photo
+from tests.factorys import (
+    BeanFactory,
+    CommentFactory,
+    CustomUserFactory,
+    PostFactory,
+    TastedRecordFactory,
+)
+from tests.query_budget import build_url, count_queries, iter_api_routes, load_budgets
+
+pytestmark = pytest.mark.django_db
+
+SMALL_SIZE = 2  # N
+LARGE_SIZE = SMALL_SIZE * 10  # 10N (페이지 크기 12보다 크게 설정해 한 페이지가 가득 찬 상태로 측정)
+
+BUDGETS = load_budgets()
+
+
+def seed_records(objects: dict, start: int, size: int) -> None:
+    """
+    API 측정용 시드 데이터 생성 (데이터 수에 비례해 늘어나는 목록 데이터)
+    - user: 요청 사용자, other: 게시글, 시음기록 작성자
+    """
+    user, other, bean = objects["user"], objects["other"], objects["bean"]
+
+    for i in range(start, start + size):
+        buddy = CustomUserFactory(nickname=f"buddy{i}", profile_image="profiles/buddy.jpg")
+        Relationship.objects.create(from_user=user, to_user=buddy, relationship_type="follow")
+        Relationship.objects.create(from_user=buddy, to_user=other, relationship_type="follow")
+
+        tasted_record = TastedRecordFactory(author=other, bean=bean, is_private=False, like_cnt=[user, buddy])
+        post = PostFactory(author=other, title=f"coffee {i}", subject="normal", tasted_records=[tasted_record])
+        post.like_cnt.add(user, buddy)
+        Photo.objects.create(photo_url=f"records/post_{i}.jpg", post=post)
+        Photo.objects.create(photo_url=f"records/tasted_record_{i}.jpg", tasted_record=tasted_record)
+
+        comment = CommentFactory(post=post, author=buddy, is_deleted=False)
+        CommentFactory(post=post, author=other, parent=comment, is_deleted=False)
+        CommentFactory(tasted_record=tasted_record, author=buddy, is_deleted=False)
+        CommentFactory(post=objects.get("post", post), author=buddy, is_deleted=False)
+
+        saved_bean = BeanFactory(name=f"Ethiopia {i}", is_official=True, is_decaf=False)
+        Note.objects.create(author=user, bean=saved_bean)
+        Note.objects.create(author=user, post=post)
+        Note.objects.create(author=user, tasted_record=tasted_record)
+        PushNotification.objects.create(user=user, notification_type="like", title="좋아요", body=f"buddy{i}님이 좋아합니다.")
+
+        objects.setdefault("post", post)
+        objects.setdefault("tasted_record", tasted_record)
+        objects.setdefault("comment", comment)
+
+
+class TestQueryBudget:
+    """
+    API 쿼리 예산 테스트
+    작성한 테스트 케이스
+    - [일반] 등록된 모든 API GET 경로의 쿼리 예산 등록 여부 테스트
+    - [일반] 데이터가 N -> 10N으로 늘어날 때 쿼리 수가 늘지 않고 예산 이내인지 테스트 (경로별)
+    """
+
+    def test_all_routes_have_budget(self):
+        """등록된 모든 API GET 경로의 쿼리 예산 등록 여부 테스트"""
+        # Given
+        routes = {route for route, _, _ in iter_api_routes()}
+
+        # Then
+        assert sorted(routes - BUDGETS.keys()) == [], "tests/query_budgets.json에 쿼리 예산이 없는 경로"
+        assert sorted(BUDGETS.keys() - routes) == [], "tests/query_budgets.json에 더 이상 없는 경로"
+
+    @pytest.mark.parametrize("route", [route for route, entry in BUDGETS.items() if not entry.get("skip")])
+    def test_query_budget(self, route, api_client, query_budgets, request):
+        """데이터가 N -> 10N으로 늘어날 때 쿼리 수가 늘지 않고 예산 이내인지 테스트 (경로별)"""
+        # Given
+        entry = query_budgets[route]
+        if entry.get("xfail"):  # 알려진 N+1 문제 (수정되면 xfail 제거 후 예산 갱신)
+            request.applymarker(pytest.mark.xfail(reason=entry["xfail"], strict=True))
+        objects = {
+            "user": CustomUserFactory(profile_image="profiles/user.jpg"),
+            "other": CustomUserFactory(profile_image="profiles/other.jpg"),
+            "bean": BeanFactory(name="Ethiopia Yirgacheffe", is_official=True, is_decaf=False),
+        }
+        api_client.force_authenticate(user=objects["user"])
+        seed_records(objects, 0, SMALL_SIZE)
+        url = build_url(route, entry, objects)
+
+        # When
+        cache.clear()
+        small_response, small_metrics = count_queries(api_client, url)
+        seed_records(objects, SMALL_SIZE, LARGE_SIZE - SMALL_SIZE)
+        cache.clear()
+        large_response, large_metrics = count_queries(api_client, url)
+
+        # Then
+        assert small_response.status_code < 500 and large_response.status_code < 500
+        if request.config.getoption("--update-query-budgets"):
+            entry["budget"] = large_metrics.query_count
+
+        growth = large_metrics.query_count - small_metrics.query_count
+        assert growth <= entry.get("tolerance", 0), (
+            f"{route}: 데이터 {SMALL_SIZE} -> {LARGE_SIZE}개에서 쿼리 {small_metrics.query_count} -> {large_metrics.query_count}회 "
+            f"(N+1 의심: {large_metrics.duplicate_queries()})"
+        )
+        assert large_metrics.query_count <= entry["budget"], f"{route}: 쿼리 예산 초과 ({large_metrics.query_count} > {entry['budget']})"
@@ -0,0 +1,179 @@
+import pytest
+from django.db import connection
+
+from repo.common.querysets import encode_cursor, get_keyset_queryset
+from repo.interactions.note.models import Note
+from repo.interactions.relationship.models import Relationship
+from repo.notifications.models import PushNotification
+from repo.records.models import Post, TastedRecord
+from repo.records.posts.services import get_post_service
+from repo.records.services import RecordChangeService
+from repo.records.tasted_record.services import get_tasted_record_service
+from tests.factorys import (
+    BeanFactory,
+    CustomUserFactory,
+    PostFactory,
+    TastedRecordFactory,
+)
+
+pytestmark = pytest.mark.django_db
+
+SEED_SIZE = 30  # 테이블이 너무 작으면 MySQL 옵티마이저가 인덱스 대신 전체 스캔을 선택하므로 일정 수 이상 생성
+
+
+def explain(queryset) -> list[dict]:
+    """
+    쿼리 실행 계획 (DB별 결과를 테이블 단위로 정규화)
+    Returns:
+        list[dict]: [{"table": 테이블, "full_scan": 인덱스 없이 전체 스캔 여부, "filesort": 정렬용 임시 정렬 여부}]
+    """
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        if connection.vendor == "mysql":
+            cursor.execute(f"EXPLAIN {sql}", params)
+            columns = [column[0].lower() for column in cursor.description]
+            rows = [dict(zip(columns, row, strict=True)) for row in cursor.fetchall()]
+            return [
+                {"table": row["table"], "full_scan": row["type"] == "ALL", "filesort": "filesort" in (row["extra"] or "").lower()}
+                for row in rows
+            ]
+
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+        details = [row[-1] for row in cursor.fetchall()]
+        plans = []
+        for detail in details:
+            if detail.startswith(("SCAN ", "SEARCH ")):
+                plans.append(
+                    {"table": detail.split()[1], "full_scan": detail.startswith("SCAN ") and "INDEX" not in detail, "filesort": False}
+                )
+            elif "TEMP B-TREE FOR ORDER BY" in detail and plans:
+                plans[0]["filesort"] = True
+        return plans
+
+
+def assert_uses_index(queryset, table: str, sorted_by_index: bool = False, full_scan_ok: bool = False) -> None:
+    """
+    table을 전체 스캔하지 않는지, sorted_by_index이면 ORDER BY를 인덱스 순서로 처리하는지 확인
+    - full_scan_ok: 대부분의 행이 조건을 만족하는 경우 옵티마이저가 PK 순서 스캔을 선택할 수 있으므로 정렬만 확인
+    """
+    plans = explain(queryset)
+    table_plans = [plan for plan in plans if plan["table"] == table]
+    assert table_plans, f"{table} 실행 계획 없음: {plans}"
+    if not full_scan_ok:
+        assert not any(plan["full_scan"] for plan in table_plans), f"{table} 전체 스캔: {plans}"
+    if sorted_by_index:
+        assert not any(plan["filesort"] for plan in plans), f"{table} 정렬에 인덱스 미사용: {plans}"
+
+
+@pytest.fixture
+def seeded():
+    """사용자, 관계, 게시글, 시음기록, 노트, 알림 시드 데이터"""
+    users = CustomUserFactory.create_batch(SEED_SIZE)
+    user = users[0]
+    bean = BeanFactory()
+    for i, other in enumerate(users[1:]):
+        relationship_type = "block" if i % 5 == 0 else "follow"
+        Relationship.objects.create(from_user=user, to_user=other, relationship_type=relationship_type)
+        Relationship.objects.create(from_user=other, to_user=user, relationship_type="follow")
+        post = PostFactory(author=other if i % 2 else user)
+        tasted_record = TastedRecordFactory(author=other if i % 2 else user, bean=bean if i % 3 == 0 else BeanFactory())
+        Note.objects.create(author=user, post=post)
+        Note.objects.create(author=user, tasted_record=tasted_record)
+        PushNotification.objects.create(user=user if i % 2 else other, notification_type="like", title="좋아요", body="좋아요")
+
+    if connection.vendor == "mysql":
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE TABLE post, tasted_record, note, relationship, notifications_pushnotification")
+    return {"user": user, "bean": bean, "post": post, "tasted_record": tasted_record}
+
+
+class TestQueryIndex:
+    """
+    주요 조회 쿼리 인덱스 사용 테스트 (EXPLAIN 실행 계획 기준)
+    작성한 테스트 케이스
+    - [게시글] 주제별, 작성자별 최신순 목록이 인덱스 순서로 조회되는지 테스트
+    - [시음기록] 공개 목록, 작성자별, 원두별 최신순 목록이 인덱스 순서로 조회되는지 테스트
+    - [작성자별 목록] 정렬별(최신순, 별점순, 좋아요순) keyset 페이지가 인덱스 순서로 조회되는지 테스트
+    - [변경 피드] 시음기록, 게시글, 노트 변경 항목이 인덱스 순서로 조회되는지 테스트
+    - [노트] 피드의 저장 여부 확인, 프로필 저장 목록이 인덱스를 사용하는지 테스트
+    - [관계] 팔로잉, 팔로워, 차단 목록이 인덱스를 사용하는지 테스트
+    - [알림] 알림 최신순 목록, 중복 알림 확인이 인덱스를 사용하는지 테스트
+    """
+
+    def test_post_queries(self, seeded):
+        """주제별, 작성자별 최신순 목록이 인덱스 순서로 조회되는지 테스트"""
+        user = seeded["user"]
+
+        assert_uses_index(Post.objects.filter(subject="cafe").order_by("-id"), "post", sorted_by_index=True)
+        assert_uses_index(get_post_service().get_user_records(user.id), "post", sorted_by_index=True)
+        assert_uses_index(Post.objects.filter(author_id=user.id), "post")
+
+    def test_tasted_record_queries(self, seeded):
+        """공개 목록, 작성자별, 원두별 최신순 목록이 인덱스 순서로 조회되는지 테스트"""
+        user, bean = seeded["user"], seeded["bean"]
+
+        assert_uses_index(
+            TastedRecord.objects.filter(is_private=False).order_by("-id"), "tasted_record", sorted_by_index=True, full_scan_ok=True
+        )
+        assert_uses_index(
+            get_tasted_record_service().get_user_records(user.id).order_by("-created_at"), "tasted_record", sorted_by_index=True
+        )
+        assert_uses_index(TastedRecord.objects.filter(bean=bean).order_by("-created_at"), "tasted_record", sorted_by_index=True)
+        assert_uses_index(
+            TastedRecord.objects.filter(author=user, created_at__year=2024, created_at__month=1).order_by("created_at"), "tasted_record"
+        )
+
+    def test_user_record_keyset_queries(self, seeded):
+        """정렬별(최신순, 별점순, 좋아요순) keyset 페이지가 인덱스 순서로 조회되는지 테스트"""
+        user = seeded["user"]
+
+        for service, table in [(get_post_service(), "post"), (get_tasted_record_service(), "tasted_record")]:
+            for field in service.user_record_orderings.values():
+                queryset = service.get_user_records(user.id)
+                first = get_keyset_queryset(queryset, field, None).first()
+                cursor = encode_cursor(getattr(first, field), first.id)
+
+                assert_uses_index(get_keyset_queryset(queryset, field, None), table, sorted_by_index=True)
+                assert_uses_index(get_keyset_queryset(queryset, field, cursor), table, sorted_by_index=True)
+
+    def test_change_feed_queries(self, seeded):
+        """시음기록, 게시글, 노트 변경 항목이 인덱스 순서로 조회되는지 테스트"""
+        user, tasted_record = seeded["user"], seeded["tasted_record"]
+        sources = RecordChangeService.get_sources(user)
+
+        for source, table in [("tasted_records", "tasted_record"), ("posts", "post"), ("notes", "note")]:
+            queryset, field = sources[source]
+            position = [tasted_record.updated_at, tasted_record.id]
+
+            assert_uses_index(RecordChangeService.get_changed_queryset(queryset, field, None), table, sorted_by_index=True)
+            assert_uses_index(RecordChangeService.get_changed_queryset(queryset, field, position), table)
+
+    def test_note_queries(self, seeded):
+        """피드의 저장 여부 확인, 프로필 저장 목록이 인덱스를 사용하는지 테스트"""
+        user, post, tasted_record = seeded["user"], seeded["post"], seeded["tasted_record"]
+
+        assert_uses_index(Note.objects.filter(author=user, post=post), "note")
+        assert_uses_index(Note.objects.filter(author=user, tasted_record=tasted_record), "note")
+        assert_uses_index(Note.objects.filter(author=user, bean__isnull=False), "note")
+
+    def test_relationship_queries(self, seeded):
+        """팔로잉, 팔로워, 차단 목록이 인덱스를 사용하는지 테스트"""
+        user = seeded["user"]
+
+        assert_uses_index(Relationship.objects.filter(from_user=user, relationship_type="follow"), "relationship")
+        assert_uses_index(Relationship.objects.filter(to_user=user, relationship_type="follow"), "relationship")
+        assert_uses_index(
+            Relationship.objects.filter(from_user=user, relationship_type="block").values_list("to_user", flat=True), "relationship"
+        )
+
+    def test_notification_queries(self, seeded):
+        """알림 최신순 목록, 중복 알림 확인이 인덱스를 사용하는지 테스트"""
+        user = seeded["user"]
+
+        assert_uses_index(
+            PushNotification.objects.filter(user=user).order_by("-id"), "notifications_pushnotification", sorted_by_index=True
+        )
+        assert_uses_index(
+            PushNotification.objects.filter(user=user, notification_type="like", created_at__gte="2024-01-01"),
+            "notifications_pushnotification",
+        )
@@ -1,10 +1,13 @@
 import pytest
 from rest_framework import status
 
+from repo.records.comment.services import REPLY_PREVIEW_SIZE
 from repo.records.models import Comment
 from tests.factorys import (
     CommentFactory,
+    CustomUserFactory,
     PostFactory,
+    RelationshipFactory,
     TastedRecordFactory,
 )
 
@@ -329,3 +332,93 @@ class TestCommentDetailAPIView:
         # Then
         assert response.status_code == status.HTTP_403_FORBIDDEN
         assert Comment.objects.filter(id=other_user_comment.id).exists()
+
+
+class TestCommentThread:
+    """
+    댓글 스레드 조회 테스트
+    작성한 테스트 케이스
+    - [일반] 최상위 댓글 keyset 페이지네이션 테스트
+    - [일반] 최상위 댓글마다 대댓글 미리보기 개수 제한 및 전체 대댓글 수 반환 테스트
+    - [일반] 차단한 유저의 대댓글과 하위 대댓글 제외 테스트
+    - [일반] 비회원 스레드 캐시가 댓글 작성 시 무효화 테스트
+    """
+
+    def setup_method(self):
+        self.base_url = "/records/comment/"
+
+    def test_root_comments_keyset_pagination(self, authenticated_client):
+        """최상위 댓글 keyset 페이지네이션 테스트"""
+        # Given
+        client, user = authenticated_client()
+        post = PostFactory()
+        roots = [CommentFactory(post=post) for _ in range(5)]
+        url = f"{self.base_url}post/{post.id}/?size=2"
+
+        # When
+        pages = []
+        while url:
+            response = client.get(url)
+            pages.append([comment["id"] for comment in response.data["results"]])
+            url = response.data["next"]
+
+        # Then
+        assert response.data["count"] == 5
+        assert pages == [[roots[0].id, roots[1].id], [roots[2].id, roots[3].id], [roots[4].id]]
+
+    def test_reply_previews_bounded(self, authenticated_client):
+        """최상위 댓글마다 대댓글 미리보기 개수 제한 및 전체 대댓글 수 반환 테스트"""
+        # Given
+        client, user = authenticated_client()
+        post = PostFactory()
+        root = CommentFactory(post=post)
+        reply = CommentFactory(post=post, parent=root)
+        nested_reply = CommentFactory(post=post, parent=reply)
+        other_replies = [CommentFactory(post=post, parent=root) for _ in range(REPLY_PREVIEW_SIZE + 1)]
+
+        # When
+        response = client.get(f"{self.base_url}post/{post.id}/")
+
+        # Then
+        result = response.data["results"][0]
+        assert result["reply_count"] == len(other_replies) + 2
+        assert [comment["id"] for comment in result["replies"]] == [reply.id, nested_reply.id, other_replies[0].id]  # DFS 순서
+
+    def test_blocked_user_replies_excluded(self, authenticated_client):
+        """차단한 유저의 대댓글과 하위 대댓글 제외 테스트"""
+        # Given
+        client, user = authenticated_client()
+        blocked_user = CustomUserFactory()
+        RelationshipFactory(from_user=user, to_user=blocked_user, relationship_type="block")
+        post = PostFactory()
+        root = CommentFactory(post=post)
+        blocked_reply = CommentFactory(post=post, parent=root, author=blocked_user)
+        CommentFactory(post=post, parent=blocked_reply)
+        visible_reply = CommentFactory(post=post, parent=root)
+
+        # When
+        response = client.get(f"{self.base_url}post/{post.id}/")
+        detail_response = client.get(f"{self.base_url}{root.id}/")
+
+        # Then
+        assert [comment["id"] for comment in response.data["results"][0]["replies"]] == [visible_reply.id]
+        assert [comment["id"] for comment in detail_response.data["replies"]] == [visible_reply.id]
+
+    def test_anonymous_thread_cache_invalidated_on_write(self, api_client, authenticated_client, django_capture_on_commit_callbacks):
+        """비회원 스레드 캐시가 댓글 작성 시 무효화 테스트"""
+        # Given
+        post = PostFactory()
+        CommentFactory(post=post)
+        url = f"{self.base_url}post/{post.id}/"
+        assert api_client.get(url).data["count"] == 1  # 캐시 생성
+        CommentFactory(post=post)  # 서비스를 거치지 않은 변경은 캐시에 반영되지 않음
+        assert api_client.get(url).data["count"] == 1
+
+        # When
+        client, user = authenticated_client()
+        with django_capture_on_commit_callbacks(execute=True):
+            client.post(url, {"content": "new comment"}, format="json")
+        client.credentials()
+
+        # Then
+        assert client.get(url).data["count"] == 3
@@ -0,0 +1,118 @@
+import pytest
+from django.core.cache import cache
+from rest_framework import status
+
+from repo.records.detail_cache import get_detail_version
+from tests.factorys import (
+    CommentFactory,
+    PhotoFactory,
+    PostFactory,
+    TastedRecordFactory,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()  # 테스트 간 같은 id의 상세 캐시, 조회 이력 공유 방지
+    yield
+    cache.clear()
+
+
+class TestRecordDetailCache:
+    """
+    게시글, 시음기록 상세 캐시 테스트
+    작성한 테스트 케이스
+    - [조회] 캐시된 상세 조회 시 조회자별 정보 조회 쿼리 1개만 실행 테스트
+    - [조회] 같은 캐시 본문에 조회자별 상호작용 여부를 덮어써서 반환 테스트
+    - [조회] 재조회 시에도 조회수는 최신 값 반환 테스트
+    - [조회] 존재하지 않는 게시물 조회 시 404 에러 반환 테스트
+    - [무효화] 수정, 좋아요, 댓글, 사진 변경 시 버전 증가 및 변경 내용 반영 테스트
+    """
+
+    @pytest.mark.parametrize("object_type", ["post", "tasted_record"])
+    def test_cached_detail_single_query(self, authenticated_client, django_assert_num_queries, object_type):
+        """캐시된 상세 조회 시 조회자별 정보 조회 쿼리 1개만 실행 테스트"""
+        # Given
+        client, user = authenticated_client()
+        obj = PostFactory() if object_type == "post" else TastedRecordFactory()
+        url = f"/records/{object_type}/{obj.id}/"
+        client.get(url)  # 본문 캐시, 조회 이력 생성
+
+        # When
+        with django_assert_num_queries(2):  # 인증 사용자 조회 + 조회자별 정보 조회
+            response = client.get(url)
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["id"] == obj.id
+
+    def test_interaction_overlay_per_viewer(self, authenticated_client):
+        """같은 캐시 본문에 조회자별 상호작용 여부를 덮어써서 반환 테스트"""
+        # Given
+        post = PostFactory()
+        client, liker = authenticated_client()
+        post.like_cnt.add(liker)
+        liked_response = client.get(f"/records/post/{post.id}/")
+
+        # When
+        client, other = authenticated_client()
+        response = client.get(f"/records/post/{post.id}/")
+
+        # Then
+        assert liked_response.data["interaction"]["is_user_liked"] is True
+        assert response.data["interaction"]["is_user_liked"] is False
+        assert response.data["title"] == liked_response.data["title"]
+
+    def test_view_count_not_cached(self, authenticated_client):
+        """재조회 시에도 조회수는 최신 값 반환 테스트"""
+        # Given
+        tasted_record = TastedRecordFactory(view_cnt=0)
+        client, user = authenticated_client()
+        client.get(f"/records/tasted_record/{tasted_record.id}/")
+
+        # When
+        client, other = authenticated_client()
+        response = client.get(f"/records/tasted_record/{tasted_record.id}/")
+
+        # Then
+        assert response.data["view_cnt"] == 2
+
+    def test_not_found(self, authenticated_client):
+        """존재하지 않는 게시물 조회 시 404 에러 반환 테스트"""
+        # Given
+        client, user = authenticated_client()
+
+        # When
+        response = client.get("/records/post/999999/")
+
+        # Then
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_invalidate_on_changes(self, authenticated_client):
+        """수정, 좋아요, 댓글, 사진 변경 시 버전 증가 및 변경 내용 반영 테스트"""
+        # Given
+        client, user = authenticated_client()
+        post = PostFactory(author=user, subject="normal")
+        url = f"/records/post/{post.id}/"
+        client.get(url)
+        versions = [get_detail_version("post", post.id)]
+
+        # When
+        client.patch(url, {"title": "수정된 제목"}, format="json")
+        versions.append(get_detail_version("post", post.id))
+        client.post(f"/interactions/like/post/{post.id}/")
+        versions.append(get_detail_version("post", post.id))
+        CommentFactory(post=post)
+        versions.append(get_detail_version("post", post.id))
+        PhotoFactory(post=post)
+        versions.append(get_detail_version("post", post.id))
+        response = client.get(url)
+
+        # Then
+        assert versions == sorted(set(versions))  # 변경마다 버전 증가
+        assert response.data["title"] == "수정된 제목"
+        assert response.data["likes"] == 1
+        assert response.data["interaction"]["is_user_liked"] is True
+        assert len(response.data["photos"]) == 1
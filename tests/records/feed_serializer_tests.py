@@ -0,0 +1,161 @@
+from datetime import datetime, timedelta
+from itertools import chain
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from repo.common.utils import get_time_difference, render_relative_times
+from repo.records.models import Photo
+from repo.records.posts.serializers import PostListSerializer
+from repo.records.serializers import FeedSerializer
+from repo.records.services import get_feed_service
+from repo.records.tasted_record.serializers import TastedRecordListSerializer
+from tests.factorys import (
+    CommentFactory,
+    CustomUserFactory,
+    PostFactory,
+    TastedRecordFactory,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+class TestFeedSerializer:
+    """
+    피드 경량 직렬화 테스트
+    작성한 테스트 케이스
+    - [일반] 비회원 피드 DRF 직렬화 결과와 JSON 바이트 일치 테스트
+    - [일반] 회원 피드(좋아요, 노트, 팔로우 여부 포함) DRF 직렬화 결과와 JSON 바이트 일치 테스트
+    - [일반] 성능 비교 커맨드 실행 테스트
+    """
+
+    @pytest.fixture
+    def feed_data(self):
+        author = CustomUserFactory(profile_image="profiles/author.jpg")
+        tasted_records = TastedRecordFactory.create_batch(2, author=author)
+        Photo.objects.create(photo_url="records/tr_main.jpg", thumbnail_url="records/tr_main_thumb.webp", tasted_record=tasted_records[0])
+        Photo.objects.create(photo_url="records/tr_sub.jpg", tasted_record=tasted_records[0])
+
+        post = PostFactory(author=author, tasted_records=tasted_records)
+        Photo.objects.create(photo_url="records/post.jpg", medium_url="records/post_medium.jpg", post=post)
+        CommentFactory.create_batch(2, post=post)
+        PostFactory(tag=None)  # 사진, 시음기록, 태그 없는 게시글
+        CommentFactory(tasted_record=tasted_records[1])
+
+    @staticmethod
+    def render_drf(feed):
+        data = [
+            TastedRecordListSerializer(item).data if hasattr(item, "taste_review_id") else PostListSerializer(item).data for item in feed
+        ]
+        return JSONRenderer().render(data)
+
+    def get_feed(self, user=None):
+        feed_service = get_feed_service()
+        if user:
+            return feed_service.get_refresh_feed(user)
+
+        tasted_records = feed_service.tasted_record_service.get_base_record_list_queryset()
+        posts = feed_service.post_service.get_base_record_list_queryset()
+        return list(chain(tasted_records, posts))
+
+    def test_anonymous_feed_identical(self, feed_data):
+        """비회원 피드 DRF 직렬화 결과와 JSON 바이트 일치 테스트"""
+        # Given
+        feed = self.get_feed()
+
+        # When
+        fast_json = JSONRenderer().render(FeedSerializer(feed, many=True).data)
+
+        # Then
+        assert fast_json == self.render_drf(feed)
+
+    def test_user_feed_identical(self, feed_data):
+        """회원 피드(좋아요, 노트, 팔로우 여부 포함) DRF 직렬화 결과와 JSON 바이트 일치 테스트"""
+        # Given
+        user = CustomUserFactory()
+        feed = self.get_feed(user)
+        feed[0].like_cnt.add(user)
+        feed = self.get_feed(user)
+
+        # When
+        fast_json = JSONRenderer().render(FeedSerializer(feed, many=True).data)
+
+        # Then
+        assert b'"is_user_following":false' in fast_json
+        assert fast_json == self.render_drf(feed)
+
+    def test_benchmark_command(self, feed_data, capsys):
+        """성능 비교 커맨드 실행 테스트"""
+        # When
+        call_command("benchmark_feed_serializer", items=10, repeat=1)
+
+        # Then
+        assert "µs/item" in capsys.readouterr().out
+
+
+class TestRelativeTime:
+    """
+    상대 시간 변환 테스트
+    작성한 테스트 케이스
+    - [일반] 기준 시간에 따른 상대 시간 문자열 변환 테스트
+    - [일반] 캐시된 데이터의 상대 시간을 중첩 목록까지 응답 시점 기준으로 갱신 테스트
+    - [일반] 비회원 피드 캐시 응답의 상대 시간 갱신 테스트
+    """
+
+    @pytest.mark.parametrize(
+        "delta, expected",
+        [
+            (timedelta(seconds=59), "방금 전"),
+            (timedelta(minutes=3), "3분 전"),
+            (timedelta(hours=23, minutes=59), "23시간 전"),
+            (timedelta(days=29), "29일 전"),
+            (timedelta(days=64), "2개월 전"),
+            (timedelta(days=800), "2년 전"),
+            (timedelta(seconds=-10), "방금 전"),
+        ],
+    )
+    def test_get_time_difference(self, delta, expected):
+        """기준 시간에 따른 상대 시간 문자열 변환 테스트"""
+        # Given
+        now = datetime(2025, 3, 1, 12, 0, 0)
+
+        # When
+        result = get_time_difference(now - delta, now)
+
+        # Then
+        assert result == expected
+
+    def test_render_relative_times(self):
+        """캐시된 데이터의 상대 시간을 중첩 목록까지 응답 시점 기준으로 갱신 테스트"""
+        # Given
+        now = datetime(2025, 3, 1, 12, 0, 0)
+        data = [
+            {
+                "id": 1,
+                "created_at": "방금 전",
+                "created_at_iso": (now - timedelta(minutes=10)).isoformat(),
+                "replies": [{"id": 2, "created_at": "방금 전", "created_at_iso": (now - timedelta(minutes=5)).isoformat()}],
+            }
+        ]
+
+        # When
+        render_relative_times(data, now)
+
+        # Then
+        assert data[0]["created_at"] == "10분 전"
+        assert data[0]["replies"][0]["created_at"] == "5분 전"
+
+    def test_anonymous_feed_cache_rendered_at_response(self, api_client):
+        """비회원 피드 캐시 응답의 상대 시간 갱신 테스트"""
+        # Given
+        created_at = timezone.now() - timedelta(hours=2)
+        cache.set("anonymous_feed", [{"id": 1, "created_at": "방금 전", "created_at_iso": created_at.isoformat()}])
+
+        # When
+        response = api_client.get("/records/feed/v2/")
+
+        # Then
+        assert response.data["results"][0]["created_at"] == "2시간 전"
@@ -1,10 +1,14 @@
-from datetime import timedelta
+from datetime import datetime, timedelta
 
 import pytest
 from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from rest_framework import status
 
+from repo.records.models import Post
 from tests.factorys import (
     CustomUserFactory,
     PostFactory,
@@ -264,3 +268,119 @@ class TestFeedAPIView:
         assert response.status_code == status.HTTP_200_OK
         assert response.data["count"] == 0
         assert len(response.data["results"]) == 0
+
+
+class TestFeedV2Pagination:
+    """
+    회원 통합 피드(v2) 페이지네이션 테스트
+    작성한 테스트 케이스
+    - [일반] 조회한 컨텐츠를 제외하고 게시글, 시음기록을 최신순으로 합쳐 페이지별 조회 테스트
+    - [일반] 전체 컨텐츠 수와 무관하게 현재 페이지 항목만 조회하는지(쿼리 수 일정) 테스트
+    """
+
+    url = "/records/feed/v2/"
+
+    @pytest.fixture(autouse=True)
+    def clear_view_history(self):
+        cache.clear()
+
+    @staticmethod
+    def create_feed(count: int, start: datetime) -> list:
+        """시음기록, 게시글을 번갈아 1분 간격으로 생성 (오래된 순)"""
+        records = []
+        for i in range(count):
+            record = TastedRecordFactory(is_private=False) if i % 2 else PostFactory()
+            type(record).objects.filter(id=record.id).update(created_at=start + timedelta(minutes=i))
+            records.append(record)
+        return records
+
+    def test_merged_pages_exclude_viewed(self, authenticated_client):
+        """조회한 컨텐츠를 제외하고 게시글, 시음기록을 최신순으로 합쳐 페이지별 조회 테스트"""
+        # Given
+        client, user = authenticated_client()
+        records = self.create_feed(20, timezone.now() - timedelta(days=1))
+        viewed = [record for record in records if isinstance(record, Post)][:3]
+        cache.set(f"user:{user.id}:viewed:post", [str(post.id) for post in viewed])
+
+        # When
+        first_page = client.get(self.url)
+        second_page = client.get(self.url, {"page": 2})
+
+        # Then
+        expected = [(type(record).__name__, record.id) for record in reversed(records) if record not in viewed]
+        results = first_page.data["results"] + second_page.data["results"]
+        assert first_page.data["count"] == 17
+        assert len(first_page.data["results"]) == settings.REST_FRAMEWORK["PAGE_SIZE"]
+        assert [("Post" if "subject" in item else "TastedRecord", item["id"]) for item in results] == expected
+
+    def test_fetch_current_page_only(self, authenticated_client, django_assert_max_num_queries):
+        """전체 컨텐츠 수와 무관하게 현재 페이지 항목만 조회하는지(쿼리 수 일정) 테스트"""
+        # Given
+        client, user = authenticated_client()
+        self.create_feed(14, timezone.now() - timedelta(days=2))
+        with CaptureQueriesContext(connection) as small_feed:
+            client.get(self.url)
+        self.create_feed(40, timezone.now() - timedelta(days=1))
+
+        # When
+        with django_assert_max_num_queries(len(small_feed)):
+            response = client.get(self.url)
+
+        # Then
+        assert response.data["count"] == 54
+        assert len(response.data["results"]) == settings.REST_FRAMEWORK["PAGE_SIZE"]
+
+
+class TestRefreshFeedSampling:
+    """
+    새로고침 피드 랜덤 샘플링 테스트
+    작성한 테스트 케이스
+    - [일반] 같은 새로고침 세션(시드)의 페이지는 중복, 누락 없이 전체 항목을 한 번씩 반환하는지 테스트
+    - [일반] 같은 시드는 같은 순서, 다른 시드는 다른 순서로 반환하는지 테스트
+    """
+
+    url = "/records/feed/v2/"
+
+    @pytest.fixture(autouse=True)
+    def clear_refresh_session(self):
+        cache.clear()
+
+    def get_keys(self, response) -> list[tuple[str, int]]:
+        return [("Post" if "subject" in item else "TastedRecord", item["id"]) for item in response.data["results"]]
+
+    def test_pages_cover_all_items_once(self, authenticated_client):
+        """같은 새로고침 세션(시드)의 페이지는 중복, 누락 없이 전체 항목을 한 번씩 반환하는지 테스트"""
+        # Given
+        client, user = authenticated_client()
+        posts = PostFactory.create_batch(15)
+        tasted_records = TastedRecordFactory.create_batch(15, is_private=False)
+
+        # When
+        keys, url = [], f"{self.url}?feed_type=refresh"
+        while url:
+            response = client.get(url)
+            keys += self.get_keys(response)
+            url = response.data["next"]
+
+        # Then
+        expected = {("Post", post.id) for post in posts} | {("TastedRecord", record.id) for record in tasted_records}
+        assert len(keys) == len(expected) == 30
+        assert set(keys) == expected
+
+    def test_same_seed_same_order(self, authenticated_client):
+        """같은 시드는 같은 순서, 다른 시드는 다른 순서로 반환하는지 테스트"""
+        # Given
+        client, user = authenticated_client()
+        PostFactory.create_batch(10)
+        TastedRecordFactory.create_batch(10, is_private=False)
+
+        # When
+        first = client.get(self.url, {"feed_type": "refresh", "seed": 1})
+        cache.clear()  # 캐시가 만료되어도 같은 시드면 같은 순서
+        again = client.get(self.url, {"feed_type": "refresh", "seed": 1})
+        other = client.get(self.url, {"feed_type": "refresh", "seed": 2})
+
+        # Then
+        assert "seed=1" in first.data["next"]
+        assert self.get_keys(first) == self.get_keys(again)
+        assert self.get_keys(first) != self.get_keys(other)
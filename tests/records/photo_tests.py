@@ -1,8 +1,21 @@
+import io
+from datetime import timedelta
+from types import SimpleNamespace
+
 import pytest
+from django.core.cache import cache
+from django.core.files.storage import InMemoryStorage, default_storage
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.utils import timezone
+from PIL import Image
 from rest_framework import status
 
-from repo.records.models import Photo
+from repo.common import storage
+from repo.common.bucket import delete_photos
+from repo.common.exception.exceptions import S3Exception
+from repo.common.image_pipeline import PhotoUploadPipeline
+from repo.records.models import Photo, PhotoFile
+from repo.records.tasks import collect_orphan_photos
 from tests.factorys import PhotoFactory, PostFactory
 
 pytestmark = pytest.mark.django_db
@@ -16,6 +29,7 @@ class TestPhotoUploadAPI:
     - [예외] 이미지가 없는 경우 400 에러 반환 테스트
     - [예외] 잘못된 파일 형식 업로드 시 400 에러 반환 테스트
     - [예외] 미인증 사용자의 업로드 시도시 401 에러 반환 테스트
+    - [일반] 사진 업로드 시 썸네일, 중간 크기 이미지 생성 테스트
     """
 
     def setup_method(self):
@@ -72,6 +86,266 @@ class TestPhotoUploadAPI:
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
         assert Photo.objects.count() == 0
 
+    def test_photo_upload_creates_variants(self, authenticated_client, create_test_image):
+        """사진 업로드 시 썸네일, 중간 크기 이미지 생성 테스트"""
+        # Given
+        client, user = authenticated_client()
+
+        # When
+        response = client.post(self.url, {"photo_url": [create_test_image]}, format="multipart")
+
+        # Then
+        assert response.status_code == status.HTTP_201_CREATED
+        photo = Photo.objects.get()
+        assert photo.thumbnail_url.name.endswith("_thumb.webp")
+        assert photo.medium_url.name.endswith("_medium.jpg")
+        assert response.data[0]["thumbnail_url"] == photo.thumbnail_url.url
+        assert response.data[0]["is_representative"] is True
+
+
+class TestPhotoUploadPipeline:
+    """
+    사진 업로드 파이프라인 테스트 (InMemoryStorage를 로컬 S3 대용으로 사용)
+    작성한 테스트 케이스
+    - [일반] 원본, 변형 이미지 저장 및 썸네일 크기 제한 테스트
+    - [예외] 업로드 실패 시 업로드된 파일 정리 및 503 예외 테스트
+    """
+
+    def test_upload_saves_all_variants(self, create_test_image):
+        """원본, 변형 이미지 저장 및 썸네일 크기 제한 테스트"""
+        # Given
+        storage = InMemoryStorage()
+        file = io.BytesIO()
+        Image.new("RGB", (2000, 1000), "white").save(file, "JPEG")
+        large_image = SimpleUploadedFile("large.jpg", file.getvalue(), content_type="image/jpeg")
+
+        # When
+        photos = PhotoUploadPipeline(storage=storage).upload([large_image, create_test_image])
+
+        # Then
+        assert len(photos) == 2
+        for photo in photos:
+            for name in [photo.photo_url.name, photo.thumbnail_url.name, photo.medium_url.name]:
+                assert storage.exists(name)
+        with storage.open(photos[0].thumbnail_url.name) as f:
+            assert Image.open(f).size == (400, 200)
+
+    def test_upload_failure_cleans_up(self, create_test_image):
+        """업로드 실패 시 업로드된 파일 정리 및 503 예외 테스트"""
+
+        # Given
+        class FailingThumbnailStorage(InMemoryStorage):
+            saved_names = []
+
+            def _save(self, name, content):
+                if name.endswith(".webp"):
+                    raise OSError("upload failed")
+                self.saved_names.append(name)
+                return super()._save(name, content)
+
+        storage = FailingThumbnailStorage()
+
+        # When
+        with pytest.raises(S3Exception):
+            PhotoUploadPipeline(storage=storage).upload([create_test_image])
+
+        # Then
+        assert Photo.objects.count() == 0
+        assert storage.saved_names  # 원본, 중간 크기 이미지는 업로드된 뒤
+        assert not any(storage.exists(name) for name in storage.saved_names)  # 모두 삭제
+
+
+class TestPhotoStorage:
+    """
+    사진 파일 삭제 테스트
+    작성한 테스트 케이스
+    - [일반] S3 객체 1000개 단위 일괄 삭제 및 실패 키 반환 테스트
+    - [일반] 사진 삭제 시 파일은 커밋 이후 백그라운드 큐에서 삭제 테스트
+    """
+
+    def test_delete_objects_batched(self, monkeypatch):
+        """S3 객체 1000개 단위 일괄 삭제 및 실패 키 반환 테스트"""
+
+        # Given
+        class FakeS3Client:
+            calls = []
+
+            def delete_objects(self, Bucket, Delete):  # noqa: N803
+                self.calls.append(Delete["Objects"])
+                return {"Errors": [{"Key": "media/0"}]} if len(self.calls) == 1 else {}
+
+        client = FakeS3Client()
+        monkeypatch.setattr(storage, "get_s3_client", lambda: client)
+        keys = [f"media/{i}" for i in range(2500)]
+
+        # When
+        failed_keys = storage.delete_objects(keys + ["media/1"], bucket="test-bucket")
+
+        # Then
+        assert [len(objects) for objects in client.calls] == [1000, 1000, 500]  # 중복 키 제외
+        assert failed_keys == ["media/0"]
+
+    def test_delete_photos_after_commit(self, monkeypatch, django_capture_on_commit_callbacks, create_test_image):
+        """사진 삭제 시 파일은 커밋 이후 백그라운드 큐에서 삭제 테스트"""
+        # Given
+        submitted = []
+        monkeypatch.setattr(storage, "_delete_executor", SimpleNamespace(submit=lambda func, *args: submitted.append(func(*args))))
+        post = PostFactory()
+        photo = PhotoUploadPipeline().upload([create_test_image], post=post)[0]
+        names = photo.get_file_names()
+
+        # When
+        with django_capture_on_commit_callbacks() as callbacks:
+            delete_photos(post)
+            assert not Photo.objects.filter(post=post).exists()
+            assert all(default_storage.exists(name) for name in names)  # 커밋 전에는 파일 유지
+
+        for callback in callbacks:
+            callback()
+
+        # Then
+        assert len(names) == 3
+        assert len(submitted) == 1  # 파일은 한 번에 일괄 삭제
+        assert not any(default_storage.exists(name) for name in names)
+
+
+def make_image(color: str, name: str = "test.jpeg") -> SimpleUploadedFile:
+    file = io.BytesIO()
+    Image.new("RGB", (100, 100), color).save(file, "JPEG")
+    return SimpleUploadedFile(name=name, content=file.getvalue(), content_type="image/jpeg")
+
+
+class CountingStorage(InMemoryStorage):
+    """저장 호출 수를 기록하는 로컬 S3 대용 저장소"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.saved_names = []
+
+    def _save(self, name, content):
+        self.saved_names.append(name)
+        return super()._save(name, content)
+
+
+class TestPhotoDedup:
+    """
+    원본 내용 기준 사진 파일 재사용 테스트
+    작성한 테스트 케이스
+    - [업로드] 같은 사진 재업로드 시 업로드 없이 저장 파일 재사용, 대표 사진 여부는 구분 테스트
+    - [수정] 사진 수정 시 바뀌지 않은 사진은 유지하고 바뀐 사진만 업로드 테스트
+    - [삭제] 공유 파일은 마지막으로 참조하는 사진 삭제 시에만 삭제 테스트
+    """
+
+    def test_upload_reuses_stored_file(self):
+        """같은 사진 재업로드 시 업로드 없이 저장 파일 재사용, 대표 사진 여부는 구분 테스트"""
+        # Given
+        storage = CountingStorage()
+        pipeline = PhotoUploadPipeline(storage=storage)
+        first = pipeline.upload([make_image("white"), make_image("black")])
+        saved_count = len(storage.saved_names)
+
+        # When
+        second = PhotoUploadPipeline(storage=storage).upload([make_image("white"), make_image("black", name="retry.jpeg")])
+        swapped = PhotoUploadPipeline(storage=storage).upload([make_image("black")])
+
+        # Then
+        assert saved_count == 6  # 사진별 원본, 중간 크기, 썸네일
+        assert len(storage.saved_names) == saved_count + 3  # 대표 사진으로 바뀐 사진만 새로 업로드
+        assert [photo.stored_file_id for photo in second] == [photo.stored_file_id for photo in first]
+        assert [photo.photo_url.name for photo in second] == [photo.photo_url.name for photo in first]
+        assert swapped[0].stored_file_id != first[1].stored_file_id
+        assert swapped[0].photo_url.name.split("/")[-1].startswith("main_")
+        assert PhotoFile.objects.count() == 3
+
+    def test_update_keeps_unchanged_photos(self, authenticated_client):
+        """사진 수정 시 바뀌지 않은 사진은 유지하고 바뀐 사진만 업로드 테스트"""
+        # Given
+        client, user = authenticated_client()
+        post = PostFactory(author=user)
+        kept, removed = PhotoUploadPipeline().upload([make_image("white"), make_image("black")], post=post)
+        files = PhotoFile.objects.count()
+
+        # When
+        response = client.put(
+            f"/records/photo/?object_type=post&object_id={post.id}",
+            {"photo_url": [make_image("white"), make_image("red")]},
+            format="multipart",
+        )
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK
+        photos = list(post.photo_set.order_by("id"))
+        assert [photo["id"] for photo in response.data] == [photo.id for photo in photos]
+        assert photos[0].id == kept.id
+        assert [photo["is_representative"] for photo in response.data] == [True, False]
+        assert not Photo.objects.filter(id=removed.id).exists()
+        assert not PhotoFile.objects.filter(id=removed.stored_file_id).exists()  # 참조가 없어진 파일 삭제
+        assert PhotoFile.objects.count() == files
+
+    def test_delete_shared_file(self, monkeypatch, django_capture_on_commit_callbacks):
+        """공유 파일은 마지막으로 참조하는 사진 삭제 시에만 삭제 테스트"""
+        # Given
+        monkeypatch.setattr(storage, "_delete_executor", SimpleNamespace(submit=lambda func, *args: func(*args)))
+        posts = PostFactory.create_batch(2)
+        photos = [PhotoUploadPipeline().upload([make_image("white")], post=post)[0] for post in posts]
+        names = photos[0].get_file_names()
+
+        # When
+        with django_capture_on_commit_callbacks(execute=True):
+            delete_photos(posts[0])
+        shared_exists = all(default_storage.exists(name) for name in names)
+        with django_capture_on_commit_callbacks(execute=True):
+            delete_photos(posts[1])
+
+        # Then
+        assert photos[0].stored_file_id == photos[1].stored_file_id
+        assert shared_exists
+        assert not PhotoFile.objects.exists()
+        assert not any(default_storage.exists(name) for name in names)
+
+
+class TestOrphanPhotoCollection:
+    """
+    고아 사진 정리 작업 테스트
+    작성한 테스트 케이스
+    - [정리] 연결되지 않은 오래된 사진, 참조가 없는 공유 파일 삭제 및 회수 용량 보고 테스트 (dry_run이면 집계만)
+    """
+
+    @pytest.mark.parametrize("dry_run", [False, True])
+    def test_collect_orphan_photos(self, dry_run):
+        """연결되지 않은 오래된 사진, 참조가 없는 공유 파일 삭제 및 회수 용량 보고 테스트"""
+        # Given
+        pipeline = PhotoUploadPipeline()
+        legacy_orphan = PhotoFactory()
+        orphan = pipeline.upload([make_image("white")])[0]
+        shared_orphan = pipeline.upload([make_image("black")])[0]
+        shared_linked = pipeline.upload([make_image("black")], post=PostFactory())[0]
+        post = PostFactory()
+        leftover_file = pipeline.upload([make_image("red")], post=post)[0].stored_file
+        post.delete()  # 사진 행만 함께 삭제되고 공유 파일은 남음
+        linked = PhotoFactory(post=PostFactory())
+        old = timezone.now() - timedelta(days=2)
+        Photo.objects.update(created_at=old)
+        PhotoFile.objects.update(created_at=old)
+        recent_orphan = PhotoFactory()
+        names = legacy_orphan.get_file_names() + orphan.get_file_names() + leftover_file.get_file_names()
+        reclaimed = default_storage.size(legacy_orphan.photo_url.name) + orphan.stored_file.size + leftover_file.size
+
+        # When
+        report = collect_orphan_photos.apply(kwargs={"batch_size": 1, "dry_run": dry_run}).get()
+
+        # Then
+        assert report == {"photos": 3, "files": 2, "bytes": reclaimed, "failed_files": 0, "dry_run": dry_run}
+        remaining = set(Photo.objects.values_list("id", flat=True))
+        if dry_run:
+            assert {legacy_orphan.id, orphan.id, shared_orphan.id} <= remaining
+            assert all(default_storage.exists(name) for name in names)
+        else:
+            assert remaining == {shared_linked.id, linked.id, recent_orphan.id}
+            assert list(PhotoFile.objects.values_list("id", flat=True)) == [shared_linked.stored_file_id]
+            assert not any(default_storage.exists(name) for name in names)
+            assert all(default_storage.exists(name) for name in shared_linked.get_file_names())
+
 
 class TestPhotoUpdateAPI:
     """
@@ -150,6 +424,7 @@ class TestPhotoDeleteAPI:
     사진 삭제 API 테스트
     작성한 테스트 케이스
     - [일반] 사진 삭제 성공 테스트
+    - [일반] 사진 삭제 시 작성자별 목록 캐시 무효화 테스트
     - [예외] 존재하지 않는 사진 삭제 시도시 404 에러 반환 테스트
     - [예외] 다른 사용자의 사진 삭제 시도시 403 에러 반환 테스트
     """
@@ -173,6 +448,24 @@ class TestPhotoDeleteAPI:
         assert response.status_code == status.HTTP_204_NO_CONTENT
         assert Photo.objects.count() == 0
 
+    def test_photo_delete_invalidates_user_records_cache(self, authenticated_client, django_capture_on_commit_callbacks):
+        """사진 삭제 시 작성자별 목록 캐시 무효화 테스트"""
+        # Given
+        cache.clear()
+        client, user = authenticated_client()
+        post = PostFactory(author=user)
+        PhotoFactory(post=post)
+        list_url = f"/records/post/user/{user.id}/"
+        assert client.get(list_url).data["results"][0]["represent_post_photo"] is not None  # 첫 페이지 캐시
+
+        # When
+        with django_capture_on_commit_callbacks(execute=True):
+            response = client.delete(f"{self.url}?object_type=post&object_id={post.id}")
+
+        # Then
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert client.get(list_url).data["results"][0]["represent_post_photo"] is None
+
     def test_photo_delete_not_found(self, authenticated_client):
         """존재하지 않는 사진 삭제 시도시 404 에러 반환 테스트"""
         # Given
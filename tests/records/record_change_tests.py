@@ -0,0 +1,214 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from rest_framework import status
+
+from repo.common.querysets import encode_watermark
+from repo.interactions.note.models import Note
+from repo.records.models import Post, TastedRecord, Tombstone
+from repo.records.services import RecordChangeService
+from repo.records.tasks import purge_tombstones
+from tests.factorys import (
+    BeanFactory,
+    CustomUserFactory,
+    PhotoFactory,
+    PostFactory,
+    TastedRecordFactory,
+)
+
+pytestmark = pytest.mark.django_db
+
+URL = "/records/sync/changes/"
+
+
+def get_all_changes(client, watermark: str | None = None) -> tuple[dict, str, int]:
+    """has_more가 false가 될 때까지 이어서 요청한 변경 항목, 마지막 워터마크, 요청 수"""
+    merged = {"tasted_records": [], "posts": [], "notes": [], "deleted": {"tasted_records": [], "posts": [], "notes": []}}
+    requests = 0
+    while True:
+        response = client.get(URL, {"watermark": watermark} if watermark else {})
+        assert response.status_code == status.HTTP_200_OK
+        requests += 1
+        for key in ["tasted_records", "posts", "notes"]:
+            merged[key] += response.data[key]
+            merged["deleted"][key] += response.data["deleted"][key]
+        watermark = response.data["watermark"]
+        if not response.data["has_more"]:
+            return merged, watermark, requests
+
+
+def backdate(user) -> None:
+    """본인 항목의 변경 시각을 커밋 지연 구간(COMMIT_LAG) 이전으로 이동 (커밋이 끝난 지 오래된 변경)"""
+    past = timezone.now() - RecordChangeService.COMMIT_LAG - timedelta(minutes=1)
+    TastedRecord.objects.filter(author=user).update(updated_at=past)
+    Post.objects.filter(author=user).update(updated_at=past)
+    Note.objects.filter(author=user).update(created_at=past)
+    Tombstone.objects.filter(user=user).update(deleted_at=past)
+
+
+class TestRecordChange:
+    """
+    본인 시음기록, 게시글, 저장 목록 변경 피드 API 테스트
+    작성한 테스트 케이스
+    - [조회] 워터마크 없이 요청 시 본인 항목 전체 조회 테스트
+    - [조회] 워터마크 이후 수정, 삭제된 항목만 조회 테스트
+    - [조회] 페이지 크기를 넘으면 has_more로 이어서 중복, 누락 없이 조회 테스트
+    - [조회] 워터마크 발급 이후 더 이른 변경 시각으로 커밋된 항목도 조회 테스트
+    - [조회] 항목 수와 무관하게 쿼리 수 고정 테스트
+    - [삭제 기록] 탈퇴로 함께 삭제된 본인 항목은 삭제 기록을 남기지 않음 테스트
+    - [삭제 기록] 보관 기간이 지난 삭제 기록 정리 테스트
+    - [예외] 잘못된 워터마크, 만료된 워터마크 요청 시 400 에러 반환 테스트
+    """
+
+    def test_initial_sync(self, authenticated_client):
+        """워터마크 없이 요청 시 본인 항목 전체 조회 테스트"""
+        # Given
+        client, user = authenticated_client()
+        tasted_record = TastedRecordFactory(author=user)
+        PhotoFactory(tasted_record=tasted_record)
+        post = PostFactory(author=user)
+        TastedRecordFactory()  # 다른 사용자 항목
+        other_post = PostFactory()
+        bean = BeanFactory()
+        Note.objects.create(author=user, post=other_post)
+        Note.objects.create(author=user, bean=bean)
+
+        # When
+        response = client.get(URL)
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.data["tasted_records"]] == [tasted_record.id]
+        assert response.data["tasted_records"][0]["bean_name"] == tasted_record.bean.name
+        assert response.data["tasted_records"][0]["photo_url"] is not None
+        assert [item["id"] for item in response.data["posts"]] == [post.id]
+        assert [(item["type"], item["target_id"], item["title"]) for item in response.data["notes"]] == [
+            ("post", other_post.id, other_post.title),
+            ("bean", bean.id, bean.name),
+        ]
+        assert response.data["has_more"] is False
+
+    def test_incremental_sync(self, authenticated_client):
+        """워터마크 이후 수정, 삭제된 항목만 조회 테스트"""
+        # Given
+        client, user = authenticated_client()
+        tasted_records = TastedRecordFactory.create_batch(2, author=user)
+        posts = PostFactory.create_batch(2, author=user)
+        note = Note.objects.create(author=user, post=PostFactory())
+        backdate(user)
+        _, watermark, _ = get_all_changes(client)
+
+        # When
+        deleted_tasted_record_id, deleted_note_id = tasted_records[1].id, note.id
+        client.patch(f"/records/post/{posts[0].id}/", {"title": "수정된 제목"}, format="json")
+        tasted_records[1].delete()
+        note.delete()
+        new_note = Note.objects.create(author=user, tasted_record=TastedRecordFactory())
+        changes, _, _ = get_all_changes(client, watermark)
+
+        # Then
+        assert [(item["id"], item["title"]) for item in changes["posts"]] == [(posts[0].id, "수정된 제목")]
+        assert changes["tasted_records"] == []
+        assert [item["id"] for item in changes["notes"]] == [new_note.id]
+        assert changes["deleted"] == {"tasted_records": [deleted_tasted_record_id], "posts": [], "notes": [deleted_note_id]}
+
+    def test_paginated_sync(self, authenticated_client, monkeypatch):
+        """페이지 크기를 넘으면 has_more로 이어서 중복, 누락 없이 조회 테스트"""
+        # Given
+        monkeypatch.setattr(RecordChangeService, "PAGE_SIZE", 3)
+        client, user = authenticated_client()
+        tasted_records = TastedRecordFactory.create_batch(4, author=user)
+        posts = PostFactory.create_batch(3, author=user)
+        deleted_id = tasted_records[0].id
+        tasted_records[0].delete()
+        backdate(user)
+
+        # When
+        changes, watermark, requests = get_all_changes(client)
+        empty_response = client.get(URL, {"watermark": watermark})
+
+        # Then
+        assert requests == 3
+        assert sorted(item["id"] for item in changes["tasted_records"]) == sorted(record.id for record in tasted_records[1:])
+        assert sorted(item["id"] for item in changes["posts"]) == sorted(post.id for post in posts)
+        assert changes["deleted"]["tasted_records"] == [deleted_id]
+        assert empty_response.data["tasted_records"] == empty_response.data["posts"] == empty_response.data["notes"] == []
+
+    def test_late_commit_delivered(self, authenticated_client):
+        """워터마크 발급 이후 더 이른 변경 시각으로 커밋된 항목도 조회 테스트"""
+        # Given: 시음기록, 삭제 기록까지 받은 워터마크
+        client, user = authenticated_client()
+        synced_record = TastedRecordFactory(author=user)
+        synced_tombstone = Tombstone.objects.create(user=user, content_type="post", object_id=1)
+        _, watermark, _ = get_all_changes(client)
+
+        # When: 워터마크 발급 전에 저장됐지만 이후에 커밋된 시음기록, 삭제 기록
+        late_record = TastedRecordFactory(author=user)
+        TastedRecord.objects.filter(id=late_record.id).update(updated_at=synced_record.updated_at - timedelta(seconds=1))
+        late_tombstone = Tombstone.objects.create(user=user, content_type="post", object_id=2)
+        Tombstone.objects.filter(id=late_tombstone.id).update(deleted_at=synced_tombstone.deleted_at - timedelta(seconds=1))
+        changes, _, _ = get_all_changes(client, watermark)
+
+        # Then: 커밋 지연 구간의 이미 받은 항목은 다시 전달될 수 있음 (클라이언트가 id로 덮어씀)
+        assert late_record.id in [item["id"] for item in changes["tasted_records"]]
+        assert 2 in changes["deleted"]["posts"]
+
+    def test_query_count_constant(self, authenticated_client, django_assert_num_queries):
+        """항목 수와 무관하게 쿼리 수 고정 테스트"""
+        # Given
+        client, user = authenticated_client()
+        for _ in range(5):
+            tasted_record = TastedRecordFactory(author=user)
+            PhotoFactory(tasted_record=tasted_record)
+            Note.objects.create(author=user, tasted_record=TastedRecordFactory())
+        PostFactory.create_batch(5, author=user)
+
+        # When
+        with django_assert_num_queries(5):  # 인증 사용자 + 시음기록, 게시글, 노트, 삭제 기록
+            response = client.get(URL)
+
+        # Then
+        assert len(response.data["tasted_records"]) == 5
+
+    def test_no_tombstone_for_deleted_owner(self):
+        """탈퇴로 함께 삭제된 본인 항목은 삭제 기록을 남기지 않음 테스트"""
+        # Given
+        user, other = CustomUserFactory(), CustomUserFactory()
+        post = PostFactory(author=user)
+        TastedRecordFactory(author=user)
+        saved_note = Note.objects.create(author=other, post=post)
+
+        # When
+        user.delete()
+
+        # Then
+        assert list(Tombstone.objects.values_list("user_id", "content_type", "object_id")) == [(other.id, "note", saved_note.id)]
+
+    def test_purge_tombstones(self):
+        """보관 기간이 지난 삭제 기록 정리 테스트"""
+        # Given
+        user = CustomUserFactory()
+        old = Tombstone.objects.create(user=user, content_type="post", object_id=1)
+        Tombstone.objects.filter(id=old.id).update(deleted_at=timezone.now() - Tombstone.RETENTION - timedelta(days=1))
+        recent = Tombstone.objects.create(user=user, content_type="post", object_id=2)
+
+        # When
+        deleted = purge_tombstones.apply(kwargs={"batch_size": 1}).get()
+
+        # Then
+        assert deleted == 1
+        assert list(Tombstone.objects.values_list("id", flat=True)) == [recent.id]
+
+    @pytest.mark.parametrize("expired", [False, True])
+    def test_invalid_watermark(self, authenticated_client, expired):
+        """잘못된 워터마크, 만료된 워터마크 요청 시 400 에러 반환 테스트"""
+        # Given
+        client, user = authenticated_client()
+        watermark = encode_watermark({}, timezone.now() - Tombstone.RETENTION - timedelta(days=1)) if expired else "invalid"
+
+        # When
+        response = client.get(URL, {"watermark": watermark})
+
+        # Then
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
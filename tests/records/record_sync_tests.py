@@ -0,0 +1,198 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
+from repo.beans.models import Bean
+from repo.records.models import Photo, Post, TastedRecord
+from tests.factorys import BeanFactory, PhotoFactory, TastedRecordFactory
+
+pytestmark = pytest.mark.django_db
+
+URL = "/records/sync/"
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()  # 테스트 간 같은 작성자 id의 목록 캐시 공유 방지
+    yield
+    cache.clear()
+
+
+def make_tasted_record_item(client_key: str, bean_name: str = "에티오피아 예가체프", star: float = 4.5, photos=None) -> dict:
+    item = {
+        "client_key": client_key,
+        "bean": {"name": bean_name, "bean_type": "single", "origin_country": "에티오피아"},
+        "taste_review": {"flavor": "꽃,시트러스", "star": star, "body": 3, "acidity": 4, "bitterness": 2, "sweetness": 3},
+        "content": f"{client_key} 시음 노트",
+    }
+    if photos is not None:
+        item["photos"] = photos
+    return item
+
+
+def make_post_item(client_key: str, tasted_records=None, photos=None) -> dict:
+    return {
+        "client_key": client_key,
+        "title": f"{client_key} 제목",
+        "content": "게시글 내용",
+        "subject": "normal",
+        "tasted_records": tasted_records or [],
+        "photos": photos or [],
+    }
+
+
+class TestRecordSync:
+    """
+    시음기록, 게시글 일괄 동기화 API 테스트
+    작성한 테스트 케이스
+    - [생성] 여러 시음기록, 게시글 일괄 생성 및 원두 재사용, 사진 연결 테스트
+    - [생성] 항목 수와 무관하게 쿼리 수 고정 테스트
+    - [재시도] 같은 client_key 재요청 시 중복 생성 없이 기존 id 반환 테스트
+    - [검증] 잘못된 항목, 중복 키, 사용할 수 없는 사진은 항목별 실패로 반환하고 나머지는 생성 테스트
+    - [예외] 빈 요청, 최대 항목 수 초과, 비로그인 요청 에러 테스트
+    """
+
+    def test_sync_creates_records(self, authenticated_client):
+        """여러 시음기록, 게시글 일괄 생성 및 원두 재사용, 사진 연결 테스트"""
+        # Given
+        client, user = authenticated_client()
+        existing_bean = BeanFactory(name="케냐 AA", bean_type="single", origin_country="케냐", roastery=None)
+        photos = PhotoFactory.create_batch(3)
+        tasted_record = TastedRecordFactory(author=user)
+        data = {
+            "tasted_records": [
+                make_tasted_record_item("t1", photos=[photos[0].id]),
+                make_tasted_record_item("t2", star=3.0),
+                {**make_tasted_record_item("t3"), "bean": {"name": "케냐 AA", "bean_type": "single", "origin_country": "케냐"}},
+            ],
+            "posts": [make_post_item("p1", tasted_records=[tasted_record.id], photos=[photos[1].id, photos[2].id])],
+        }
+
+        # When
+        response = client.post(URL, data, format="json")
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK
+        assert [result["status"] for result in response.data["tasted_records"] + response.data["posts"]] == ["created"] * 4
+        records = {record.client_key: record for record in TastedRecord.objects.filter(author=user, client_key__isnull=False)}
+        assert [result["id"] for result in response.data["tasted_records"]] == [records[key].id for key in ["t1", "t2", "t3"]]
+        assert records["t1"].bean_id == records["t2"].bean_id  # 같은 원두는 한 번만 생성
+        assert records["t3"].bean_id == existing_bean.id
+        assert Bean.objects.filter(name="에티오피아 예가체프").count() == 1
+        assert records["t2"].star == records["t2"].taste_review.star == 3.0
+
+        post = Post.objects.get(id=response.data["posts"][0]["id"])
+        assert list(post.tasted_records.values_list("id", flat=True)) == [tasted_record.id]
+        assert set(post.photo_set.values_list("id", flat=True)) == {photos[1].id, photos[2].id}
+        assert list(records["t1"].photo_set.values_list("id", flat=True)) == [photos[0].id]
+
+    @pytest.mark.parametrize("can_return_pk", [True, False])  # False: bulk_create가 PK를 반환하지 않는 MySQL
+    def test_sync_query_count_constant(self, authenticated_client, monkeypatch, can_return_pk):
+        """항목 수와 무관하게 쿼리 수 고정 테스트"""
+        # Given
+        monkeypatch.setattr(type(connection.features), "can_return_rows_from_bulk_insert", can_return_pk)
+        client, user = authenticated_client()
+        photos = PhotoFactory.create_batch(12)
+
+        def count_sync_queries(indexes: range) -> int:
+            data = {
+                "tasted_records": [make_tasted_record_item(f"t{i}", bean_name=f"원두 {i}", photos=[photos[2 * i].id]) for i in indexes],
+                "posts": [make_post_item(f"p{i}", photos=[photos[2 * i + 1].id]) for i in indexes],
+            }
+            with CaptureQueriesContext(connection) as queries:
+                response = client.post(URL, data, format="json")
+            assert [result["status"] for result in response.data["tasted_records"] + response.data["posts"]] == ["created"] * len(
+                indexes
+            ) * 2
+            return len(queries)
+
+        # When
+        single_count = count_sync_queries(range(1))
+        batch_count = count_sync_queries(range(1, 6))
+
+        # Then
+        assert batch_count == single_count <= 20
+        assert Photo.objects.filter(id__in=[photo.id for photo in photos], post__isnull=True, tasted_record__isnull=True).count() == 0
+        records = TastedRecord.objects.filter(author=user).select_related("taste_review")
+        assert len(records) == 6
+        assert all(record.star == record.taste_review.star for record in records)
+
+    def test_sync_retry_is_idempotent(self, authenticated_client):
+        """같은 client_key 재요청 시 중복 생성 없이 기존 id 반환 테스트"""
+        # Given
+        client, user = authenticated_client()
+        data = {"tasted_records": [make_tasted_record_item("t1")], "posts": [make_post_item("p1")]}
+        first_response = client.post(URL, data, format="json")
+
+        # When
+        data["posts"].append(make_post_item("p2"))
+        response = client.post(URL, data, format="json")
+
+        # Then
+        assert [result["status"] for result in response.data["tasted_records"]] == ["existing"]
+        assert [result["status"] for result in response.data["posts"]] == ["existing", "created"]
+        assert response.data["tasted_records"][0]["id"] == first_response.data["tasted_records"][0]["id"]
+        assert TastedRecord.objects.filter(author=user).count() == 1
+        assert Post.objects.filter(author=user).count() == 2
+
+    def test_sync_item_errors(self, authenticated_client):
+        """잘못된 항목, 중복 키, 사용할 수 없는 사진은 항목별 실패로 반환하고 나머지는 생성 테스트"""
+        # Given
+        client, user = authenticated_client()
+        photo = PhotoFactory()
+        linked_photo = PhotoFactory(tasted_record=TastedRecordFactory())
+        data = {
+            "tasted_records": [
+                make_tasted_record_item("t1", photos=[photo.id]),
+                make_tasted_record_item("t1"),  # 요청 내 중복 키
+                {**make_tasted_record_item("t2"), "bean": None},  # 원두 누락
+                make_tasted_record_item("t3", photos=[linked_photo.id]),  # 다른 시음기록의 사진
+            ],
+            "posts": [
+                make_post_item("p1", photos=[photo.id]),  # 앞 항목이 사용한 사진
+                make_post_item("p2", tasted_records=[999999]),
+                make_post_item("p3"),
+            ],
+        }
+
+        # When
+        response = client.post(URL, data, format="json")
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK
+        assert [result["status"] for result in response.data["tasted_records"]] == ["created", "invalid", "invalid", "invalid"]
+        assert [result["status"] for result in response.data["posts"]] == ["invalid", "invalid", "created"]
+        assert "bean" in response.data["tasted_records"][2]["errors"]
+        assert "photos" in response.data["posts"][0]["errors"]
+        assert "tasted_records" in response.data["posts"][1]["errors"]
+        assert set(TastedRecord.objects.filter(author=user).values_list("client_key", flat=True)) == {"t1"}
+        assert set(Post.objects.filter(author=user).values_list("client_key", flat=True)) == {"p3"}
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"tasted_records": [], "posts": []},
+            {"posts": [make_post_item(f"p{i}") for i in range(21)]},
+        ],
+    )
+    def test_sync_invalid_request(self, authenticated_client, data):
+        """빈 요청, 최대 항목 수 초과 요청 시 400 에러 반환 테스트"""
+        # Given
+        client, user = authenticated_client()
+
+        # When
+        response = client.post(URL, data, format="json")
+
+        # Then
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not Post.objects.filter(author=user).exists()
+
+    def test_sync_unauthenticated(self, api_client):
+        """비로그인 요청 시 401 에러 반환 테스트"""
+        # When
+        response = api_client.post(URL, {"posts": [make_post_item("p1")]}, format="json")
+
+        # Then
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
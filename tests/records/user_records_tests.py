@@ -0,0 +1,129 @@
+import pytest
+from django.core.cache import cache
+from rest_framework import status
+
+from tests.factorys import (
+    BeanTasteReviewFactory,
+    CustomUserFactory,
+    PostFactory,
+    TastedRecordFactory,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()  # 테스트 간 같은 작성자 id의 첫 페이지 캐시 공유 방지
+    yield
+    cache.clear()
+
+
+def get_all_pages(client, url: str) -> tuple[list[int], list[dict]]:
+    """next 주소를 따라 모든 페이지 조회"""
+    ids, responses = [], []
+    while url:
+        response = client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        ids += [item["id"] for item in response.data["results"]]
+        responses.append(response.data)
+        url = response.data["next"]
+    return ids, responses
+
+
+class TestUserRecordList:
+    """
+    작성자별 게시글, 시음기록 목록 API 테스트 (keyset 커서 페이지네이션)
+    작성한 테스트 케이스
+    - [조회] 게시글 최신순, 좋아요순 목록을 커서로 끝까지 조회 시 중복, 누락 없이 정렬 순서대로 조회 테스트
+    - [조회] 시음기록 별점순 목록이 맛&평가 별점 순서대로 조회 테스트
+    - [조회] 시음기록 기존 ordering 값 호환 테스트
+    - [캐시] 첫 페이지 캐시 조회 및 작성자의 새 게시물 작성 시 무효화 테스트
+    - [예외] 지원하지 않는 정렬, 잘못된 커서 요청 시 400 에러 반환 테스트
+    - [예외] 존재하지 않는 사용자 조회 시 404 에러 반환 테스트
+    """
+
+    def test_post_list_keyset_pages(self, api_client):
+        """게시글 최신순, 좋아요순 목록을 커서로 끝까지 조회 시 중복, 누락 없이 정렬 순서대로 조회 테스트"""
+        # Given
+        author = CustomUserFactory()
+        posts = [PostFactory(author=author, likes=likes) for likes in [3, 1, 3, 0, 2]]
+        PostFactory()  # 다른 작성자
+
+        # When
+        latest_ids, latest_pages = get_all_pages(api_client, f"/records/post/user/{author.id}/?size=2")
+        likes_ids, _ = get_all_pages(api_client, f"/records/post/user/{author.id}/?size=2&ordering=likes")
+
+        # Then
+        assert latest_ids == [post.id for post in sorted(posts, key=lambda post: post.id, reverse=True)]
+        assert likes_ids == [post.id for post in sorted(posts, key=lambda post: (post.likes, post.id), reverse=True)]
+        assert [page["count"] for page in latest_pages] == [5, 5, 5]
+        assert latest_pages[-1]["next_cursor"] is None
+
+    def test_tasted_record_star_ordering(self, api_client):
+        """시음기록 별점순 목록이 맛&평가 별점 순서대로 조회 테스트"""
+        # Given
+        author = CustomUserFactory()
+        records = [
+            TastedRecordFactory(author=author, taste_review=BeanTasteReviewFactory(star=star), like_cnt=[author])
+            for star in [4.5, 2.0, 4.5, 5.0]
+        ]
+
+        # When
+        ids, _ = get_all_pages(api_client, f"/records/tasted_record/user/{author.id}/?size=3&ordering=star")
+
+        # Then
+        assert ids == [record.id for record in sorted(records, key=lambda record: (record.taste_review.star, record.id), reverse=True)]
+
+    def test_tasted_record_legacy_ordering(self, api_client):
+        """시음기록 기존 ordering 값 호환 테스트"""
+        # Given
+        author = CustomUserFactory()
+        records = [TastedRecordFactory(author=author, likes=likes, like_cnt=[author]) for likes in [1, 5, 3]]
+
+        # When
+        response = api_client.get(f"/records/tasted_record/user/{author.id}/?ordering=-likes")
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.data["results"]] == [records[1].id, records[2].id, records[0].id]
+
+    def test_first_page_cache_invalidated_on_write(self, api_client, django_assert_num_queries, django_capture_on_commit_callbacks):
+        """첫 페이지 캐시 조회 및 작성자의 새 게시물 작성 시 무효화 테스트"""
+        # Given
+        author = CustomUserFactory()
+        PostFactory.create_batch(2, author=author)
+        url = f"/records/post/user/{author.id}/"
+        api_client.get(url)
+
+        # When
+        with django_assert_num_queries(0):
+            cached_response = api_client.get(url)
+        with django_capture_on_commit_callbacks(execute=True):
+            new_post = PostFactory(author=author)
+        response = api_client.get(url)
+
+        # Then
+        assert cached_response.data["count"] == 2
+        assert response.data["count"] == 3
+        assert response.data["results"][0]["id"] == new_post.id
+
+    @pytest.mark.parametrize("query", ["ordering=star", "ordering=-id", "cursor=invalid"])
+    def test_invalid_params(self, api_client, query):
+        """지원하지 않는 정렬, 잘못된 커서 요청 시 400 에러 반환 테스트"""
+        # Given
+        author = CustomUserFactory()
+
+        # When
+        response = api_client.get(f"/records/post/user/{author.id}/?{query}")
+
+        # Then
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_user_not_found(self, api_client, non_existent_user_id):
+        """존재하지 않는 사용자 조회 시 404 에러 반환 테스트"""
+        # When
+        response = api_client.get(f"/records/tasted_record/user/{non_existent_user_id}/")
+
+        # Then
+        assert response.status_code == status.HTTP_404_NOT_FOUND